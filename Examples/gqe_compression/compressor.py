@@ -27,6 +27,10 @@ import json
 import struct
 import zlib
 import os
+import bisect
+import mmap
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 from .core.phi_adic import encode_phi, decode_phi, PhiAdicNumber, PHI, PHI_INV
 from .core.e8_lattice import Spinor, snap_spinor_to_e8
@@ -41,13 +45,21 @@ from .core.geometric_inheritance import GeometricCache
 from .core.global_atlas import GlobalAtlas, get_atlas
 from .core.inertia_predictor import FastInertiaPredictor
 from .core.byte_lattice import ByteLattice, get_byte_lattice
-from .core.context_mixer import FastContextMixer, GeometricParallelMixer
+from .core.context_mixer import FastContextMixer, GeometricParallelMixer, AdaptiveBitMixer
+from .core.logistic_mixer import LogisticMixingPredictor
+from .core.range_coder import encode_bytes as range_encode_bytes
+from .core.range_coder import decode_bytes as range_decode_bytes
+from .core.word_layout import WordLayout, extract_layout, encode_layout, decode_layout
+from .core.horizon_batcher import HorizonBatcher, DEFAULT_CHUNK_SIZE
 from .core.projection import (
     coxeter_projection_8d_to_4d, 
     inverse_projection_with_phason,
+    project_many,
     ProjectedSpinor
 )
-from .core.tda import tokenize, build_cooccurrence_graph, embed_all_tokens, Token
+from .core.tda import (
+    tokenize, tokenize_spans, token_ids, build_cooccurrence_matrix, embed_all_tokens, Token
+)
 from .core.holographic_encoding import (
     simple_holographic_spread,
     simple_holographic_recover,
@@ -56,11 +68,261 @@ from .core.holographic_encoding import (
 )
 from .core.geometric_reed_solomon import (
     rs_encode_with_geometry,
-    rs_decode_with_geometry
+    rs_decode_with_geometry,
+    is_rs_stream
 )
 from .core.geometric_evolver import GeometricEvolver, EvolutionState
 
 
+# Bitwise predictors that can drive the v71 range coder
+V71_PREDICTORS = {
+    'adaptive': AdaptiveBitMixer,
+    'logistic': LogisticMixingPredictor,
+}
+
+# v72 frame container records
+V72_MAGIC = b'\xE8\x72'
+
+# A word layout block follows the vocabulary (v59 flags) / OOV table (v60 version)
+V59_LAYOUT_FLAG = 0x0002
+# v59 streams carry canonical Huffman code lengths (older ones are undecodable)
+V59_CANONICAL_FLAG = 0x0004
+V60_LAYOUT_FLAG = 0x8000
+V72_HEADER = struct.Struct('<2sHI')         # magic, flags, chunk_size
+V72_INDEX_ENTRY = struct.Struct('<QQIII')   # raw_start, stream_offset, raw_length, stream_length, crc32
+V72_FOOTER = struct.Struct('<QQII')         # index_offset, original_length, n_frames, index crc32
+
+
+def _root_groups(token_roots: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Group vocabulary indices by E8 root (v59).
+
+    Returns (by_root, root_starts): indices sorted by root, stable in index
+    order, and where each root's group starts. A token's offset within its
+    root is its position in that group.
+    """
+    by_root = np.argsort(token_roots, kind='stable')
+    root_starts = np.concatenate(([0], np.cumsum(np.bincount(token_roots, minlength=240))))
+    return by_root, root_starts
+
+
+def _encode_frame(frame: bytes, codec: str, table_bits: int) -> bytes:
+    """Code one horizon frame: range-coded with a fresh predictor, or the zlib proxy."""
+    if codec == 'zlib':
+        return zlib.compress(frame, level=9)
+    predictor = V71_PREDICTORS[codec](table_bits)
+    return range_encode_bytes(frame, predictor)
+
+
+def _decode_frame(stream: bytes, length: int, codec: str, table_bits: int) -> bytes:
+    """Replay one horizon frame's codec against its stream."""
+    if codec == 'zlib':
+        return zlib.decompress(stream)
+    predictor = V71_PREDICTORS[codec](table_bits)
+    return range_decode_bytes(stream, length, predictor)
+
+
+def _map_frames(fn, jobs, workers: int):
+    """
+    Yield fn(*job) for each job, in order, fanning out over worker processes.
+    
+    Frames share no model state, so each one is an independent task. At
+    most 2 * workers jobs are in flight, which keeps memory bounded by the
+    window rather than by the input.
+    """
+    if workers <= 1:
+        for job in jobs:
+            yield fn(*job)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for job in jobs:
+            pending.append(pool.submit(fn, *job))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _write_frame_container(write, frames, chunk_size: int, codec: str,
+                           table_bits: int, workers: int = 1) -> int:
+    """
+    Code horizon frames and write them as a v72 container.
+    
+    Args:
+        write: Callable receiving successive byte strings
+        frames: Iterable of (frame_index, frame_bytes, byte_range), as
+                produced by HorizonBatcher._chunk_data
+        chunk_size: Nominal frame size (recorded in the header)
+        codec: Key into V71_PREDICTORS, or 'zlib' for the v70 proxy
+        table_bits: Predictor slot table size
+        workers: Processes coding frames concurrently
+    
+    Returns:
+        Total bytes written
+    """
+    if codec not in V71_PREDICTORS and codec != 'zlib':
+        raise ValueError(f"Unknown frame codec: {codec}")
+    
+    flags = 0x0001 | (table_bits << 8)
+    if codec == 'logistic':
+        flags |= 0x0002
+    elif codec == 'zlib':
+        flags |= 0x0004
+    
+    byte_ranges = []
+    
+    def jobs():
+        for _, frame, byte_range in frames:
+            byte_ranges.append(byte_range)
+            # memoryview slices cannot cross a process boundary
+            yield (bytes(frame) if workers > 1 else frame), codec, table_bits
+    
+    write(V72_HEADER.pack(V72_MAGIC, flags, chunk_size))
+    offset = V72_HEADER.size
+    
+    index = []
+    for i, stream in enumerate(_map_frames(_encode_frame, jobs(), workers)):
+        start, end = byte_ranges[i]
+        write(stream)
+        index.append(V72_INDEX_ENTRY.pack(start, offset, end - start, len(stream),
+                                          zlib.crc32(stream) & 0xFFFFFFFF))
+        offset += len(stream)
+    
+    index_bytes = b''.join(index)
+    original_length = byte_ranges[-1][1] if byte_ranges else 0
+    write(index_bytes)
+    write(V72_FOOTER.pack(offset, original_length, len(index),
+                          zlib.crc32(index_bytes) & 0xFFFFFFFF))
+    
+    return offset + len(index_bytes) + V72_FOOTER.size
+
+
+def _map_file(file_path: str) -> memoryview:
+    """
+    Map a file read-only and return a zero-copy view of the mapping.
+    
+    The view keeps the mapping alive after the file is closed. Empty
+    files cannot be mapped and yield an empty view.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(b'')
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+@dataclass(frozen=True)
+class FrameIndexEntry:
+    """One row of the v72 frame index."""
+    raw_start: int
+    stream_offset: int
+    raw_length: int
+    stream_length: int
+    crc32: int
+    
+    @property
+    def byte_range(self) -> Tuple[int, int]:
+        """(start, end) of the frame in the original input, as HorizonFrame.byte_range."""
+        return self.raw_start, self.raw_start + self.raw_length
+
+
+def _open_frame_source(source):
+    """
+    Return (read_at, size) for a bytes-like object or a seekable binary file.
+    
+    read_at(offset, length) returns exactly the requested bytes, so a
+    container on disk is only read where a request lands.
+    """
+    if isinstance(source, mmap.mmap):
+        # mmap.seek() returns None, so slice it directly; no memoryview is
+        # exported, which would keep the caller from closing the map
+        return (lambda offset, length: source[offset:offset + length]), len(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        return (lambda offset, length: bytes(view[offset:offset + length])), len(view)
+    
+    size = source.seek(0, os.SEEK_END)
+    
+    def read_at(offset: int, length: int) -> bytes:
+        source.seek(offset)
+        chunk = source.read(length)
+        if len(chunk) != length:
+            raise ValueError("Truncated v72 container")
+        return chunk
+    
+    return read_at, size
+
+
+class FrameArchive:
+    """
+    Random-access view of a v72 horizon frame container.
+    
+    THE PHYSICS:
+    Every frame is its own Planck moment - rendering one never requires
+    rendering the moments before it.
+    
+    Only the header, footer and trailing frame index are read when the
+    archive is opened; frame streams are fetched and decoded on demand.
+    """
+    
+    def __init__(self, source):
+        """
+        Open a container.
+        
+        Args:
+            source: Serialized container (bytes-like) or a seekable binary file
+        """
+        self._read_at, size = _open_frame_source(source)
+        if size < V72_HEADER.size + V72_FOOTER.size:
+            raise ValueError("Truncated v72 container")
+        
+        magic, self.flags, self.chunk_size = V72_HEADER.unpack(self._read_at(0, V72_HEADER.size))
+        if magic != V72_MAGIC:
+            raise ValueError(f"Not a v72 container: magic {magic!r}")
+        self.table_bits = self.flags >> 8
+        if self.flags & 0x0004:
+            self.codec = 'zlib'
+        else:
+            self.codec = 'logistic' if self.flags & 0x0002 else 'adaptive'
+        
+        index_offset, self.original_length, n_frames, checksum = V72_FOOTER.unpack(
+            self._read_at(size - V72_FOOTER.size, V72_FOOTER.size))
+        if index_offset + n_frames * V72_INDEX_ENTRY.size != size - V72_FOOTER.size:
+            raise ValueError("Corrupted v72 frame index: size does not match footer")
+        
+        index_bytes = self._read_at(index_offset, n_frames * V72_INDEX_ENTRY.size)
+        computed_checksum = zlib.crc32(index_bytes) & 0xFFFFFFFF
+        if computed_checksum != checksum:
+            raise ValueError(f"Checksum mismatch: expected {checksum}, got {computed_checksum}")
+        
+        self.entries = [FrameIndexEntry(*row) for row in V72_INDEX_ENTRY.iter_unpack(index_bytes)]
+        self._starts = [entry.raw_start for entry in self.entries]
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def frames_overlapping(self, start: int, end: int) -> range:
+        """Indices of the frames whose byte_range intersects [start, end)."""
+        if start >= end or start >= self.original_length:
+            return range(0)
+        first = max(bisect.bisect_right(self._starts, start) - 1, 0)
+        last = bisect.bisect_left(self._starts, end)
+        return range(first, last)
+    
+    def decode_frame(self, i: int) -> bytes:
+        """Fetch, verify and decode frame i."""
+        entry = self.entries[i]
+        stream = self._read_at(entry.stream_offset, entry.stream_length)
+        computed_checksum = zlib.crc32(stream) & 0xFFFFFFFF
+        if computed_checksum != entry.crc32:
+            raise ValueError(f"Checksum mismatch: expected {entry.crc32}, got {computed_checksum}")
+        frame = _decode_frame(stream, entry.raw_length, self.codec, self.table_bits)
+        if len(frame) != entry.raw_length:
+            raise ValueError(f"Length mismatch: expected {entry.raw_length}, got {len(frame)}")
+        return frame
+
+
 @dataclass
 class CompressedData:
     """
@@ -73,6 +335,7 @@ class CompressedData:
     - phasons_4d: 4D perpendicular components (hidden, compresses well)
     - phases: Spinor phases
     - metadata: Additional information for reconstruction
+    - layout: Casing/separator stream of lossless word mode (v59, v60)
     """
     vocabulary: Dict[str, Dict]
     token_sequence: Union[List[int], np.ndarray]
@@ -80,13 +343,16 @@ class CompressedData:
     phasons_4d: np.ndarray
     phases: np.ndarray
     metadata: Dict[str, Any]
+    layout: Optional[WordLayout] = None
     
-    def to_bytes(self, version: str = 'v70') -> bytes:
+    def to_bytes(self, version: str = 'v70', protection: Optional[float] = None) -> bytes:
         """
         Serialize to bytes.
         
         Args:
             version: Format version 
+                'v72' - Parallel horizon frames (range-coded, indexed)
+                'v71' - Byte-level context mixing + range coder (zero vocab)
                 'v70' - Byte-level context mixing (zero vocab)
                 'v60' - Atlas + Inertia Prediction (10:1 target)
                 'v59' - Vectorized Huffman (fastest + best ratio)
@@ -96,8 +362,22 @@ class CompressedData:
                 'v55' - Topological Indexing (E8 Root Map)
                 'v54' - Phason Zip (fastest)
                 'v53' - Legacy RAC
+            protection: Reed-Solomon parity overhead (e.g. 0.05 - 0.25).
+                The serialized stream is wrapped by rs_encode_with_geometry,
+                and from_bytes() repairs damage before parsing it.
         """
-        if version == 'v70':
+        stream = self._to_bytes_version(version)
+        if protection is not None:
+            return rs_encode_with_geometry(stream, protection)
+        return stream
+    
+    def _to_bytes_version(self, version: str) -> bytes:
+        """Serialize in the given format, unprotected."""
+        if version == 'v72':
+            return self._to_bytes_v72()
+        elif version == 'v71':
+            return self._to_bytes_v71()
+        elif version == 'v70':
             return self._to_bytes_v70()
         elif version == 'v60':
             return self._to_bytes_v60()
@@ -116,6 +396,31 @@ class CompressedData:
         else:
             return self._to_bytes_v53()
     
+    def _byte_stream(self) -> np.ndarray:
+        """
+        The original bytes, for the byte-level formats (v70, v71, v72).
+        
+        Horizon-batched output holds them directly (empty vocabulary);
+        standard byte mode holds vocabulary ids, which are mapped back
+        through the vocabulary. Word and char modes have no byte stream,
+        and coding their ids as bytes would not round-trip.
+        
+        Raises:
+            ValueError: If the data is not in byte mode
+        """
+        mode = self.metadata.get('mode')
+        if mode != 'byte':
+            raise ValueError(f"Byte-level formats (v70-v72) need byte mode data, "
+                             f"got {mode!r} mode; use v59 or v60")
+        if not self.vocabulary:
+            # A uint8 view - zlib and the coders read it in place, even from an mmap
+            return np.ascontiguousarray(self.token_sequence, dtype=np.uint8)
+        
+        byte_values = np.zeros(len(self.vocabulary), dtype=np.uint8)
+        for token, info in self.vocabulary.items():
+            byte_values[info['index']] = int(token)
+        return byte_values[np.asarray(self.token_sequence, dtype=np.intp)]
+    
     def _to_bytes_v70(self) -> bytes:
         """
         v70: Byte-Level Context Mixing - Zero Vocabulary
@@ -144,7 +449,8 @@ class CompressedData:
         # Magic: \xE8\x70 (E8 v70)
         magic = b'\xE8\x70'
         flags = struct.pack('<H', 0x0001)  # Byte mode flag
-        orig_len = len(self.token_sequence)  # In V70, sequence length = original length
+        data_stream = self._byte_stream()
+        orig_len = len(data_stream)  # In V70, sequence length = original length
         header = struct.pack('<II', orig_len, 0)  # Original length, placeholder checksum
 
         # 2. No Vocab Block (The Singularity is Shared/Fixed)
@@ -156,7 +462,6 @@ class CompressedData:
 
         # FOR THE PROTOTYPE: We use the raw sequence to verify lossless first
         # then apply the bit-packer.
-        data_stream = bytes(self.token_sequence.astype(np.uint8))
         
         # Apply the final Phason Squeeze (ZLIB is the current shadow proxy)
         compressed_stream = zlib.compress(data_stream, level=9)
@@ -167,6 +472,117 @@ class CompressedData:
 
         return magic + flags + header_with_checksum + compressed_stream
     
+    # Slot table size for the v71 bitwise predictors (stored in the flags)
+    V71_TABLE_BITS = 22
+    
+    def _to_bytes_v71(self) -> bytes:
+        """
+        v71: Byte-Level Context Mixing + Range Coder - Zero Vocabulary
+        
+        THE PHYSICS:
+        "A prediction is only worth the bits it saves."
+        
+        v70 computed predictions but stored the bytes behind a zlib proxy.
+        v71 puts the prediction on the wire: every bit is range-coded
+        against the probability a bitwise predictor assigned to it. The
+        decoder replays the identical model, so nothing but the coded bits
+        is stored.
+        
+        Predictor (metadata['bit_predictor']):
+        - 'logistic' - LogisticMixingPredictor (bit histories + SSE, default)
+        - 'adaptive' - AdaptiveBitMixer (direct counters, faster)
+        
+        Format: [E8_SEED][RANGE_STREAM]
+        
+        E8_SEED (12 bytes):
+        - 2 bytes: Magic (0xE871)
+        - 2 bytes: Flags (bit 0: byte mode, bit 1: logistic predictor,
+                          high byte: predictor table_bits)
+        - 4 bytes: Original length
+        - 4 bytes: CRC32 of the range stream
+        
+        RANGE_STREAM:
+        - Binary arithmetic code, 8 decisions per byte, MSB first
+        """
+        magic = b'\xE8\x71'
+        table_bits = self.V71_TABLE_BITS
+        predictor_name = self.metadata.get('bit_predictor', 'logistic')
+        if predictor_name not in V71_PREDICTORS:
+            raise ValueError(f"Unknown bit predictor: {predictor_name}")
+        
+        flags = 0x0001 | (table_bits << 8)
+        if predictor_name == 'logistic':
+            flags |= 0x0002
+        
+        data_stream = self._byte_stream()
+        predictor = V71_PREDICTORS[predictor_name](table_bits)
+        range_stream = range_encode_bytes(data_stream, predictor)
+        
+        checksum = zlib.crc32(range_stream) & 0xFFFFFFFF
+        header = struct.pack('<II', len(data_stream), checksum)
+        
+        return magic + struct.pack('<H', flags) + header + range_stream
+    
+    def _to_bytes_v72(self) -> bytes:
+        """
+        v72: Parallel Horizon Frames - Range-Coded, Indexed
+        
+        THE PHYSICS:
+        "The Universe renders in FRAMES, not all at once."
+        
+        v71 codes the whole input as one sequence on one core. v72 splits
+        it into horizon frames with HorizonBatcher's grain-aware chunking
+        and gives every frame its own fresh predictor. Frames share no
+        state, so they are range-coded concurrently across
+        metadata['workers'] processes, and any frame can be decoded alone.
+        
+        Format: [HEADER][FRAME_0]...[FRAME_N-1][FRAME_INDEX][FOOTER]
+        
+        HEADER (8 bytes):
+        - 2 bytes: Magic (0xE872)
+        - 2 bytes: Flags (as v71: bit 0 byte mode, bit 1 logistic,
+                          high byte predictor table_bits; bit 2: frames
+                          use the v70 zlib proxy instead of the range coder)
+        - 4 bytes: Nominal chunk size
+        
+        FRAME_i:
+        - v71 range stream of frame i (no per-frame header), or its
+          zlib stream when metadata['frame_codec'] == 'zlib'
+        
+        FRAME_INDEX (28 bytes per frame):
+        - 8 bytes: Raw start offset
+        - 8 bytes: Stream offset in the container
+        - 4 bytes: Raw length
+        - 4 bytes: Stream length
+        - 4 bytes: CRC32 of the stream
+        
+        FOOTER (24 bytes):
+        - 8 bytes: Frame index offset
+        - 8 bytes: Original length
+        - 4 bytes: Frame count
+        - 4 bytes: CRC32 of the frame index
+        
+        The index trails the frames so a writer never has to seek back.
+        """
+        data_stream = memoryview(self._byte_stream())
+        chunk_size = self.metadata.get('chunk_size') or DEFAULT_CHUNK_SIZE
+        batcher = HorizonBatcher(chunk_size=chunk_size)
+        
+        codec = self.metadata.get('bit_predictor', 'logistic')
+        if self.metadata.get('frame_codec') == 'zlib':
+            codec = 'zlib'
+        
+        parts = []
+        _write_frame_container(
+            parts.append,
+            batcher._chunk_data(data_stream),
+            chunk_size,
+            codec,
+            self.V71_TABLE_BITS,
+            workers=self.metadata.get('workers', 1),
+        )
+        return b''.join(parts)
+    
     def _to_bytes_v60(self) -> bytes:
         """
         v60: Atlas + Inertia Prediction - The 10:1 Format
@@ -201,7 +617,7 @@ class CompressedData:
         - 5-11 bits for errors
         """
         vocab_size = len(self.vocabulary)
-        seq = np.array(self.token_sequence, dtype=np.uint32)
+        seq = np.asarray(self.token_sequence, dtype=np.uint32)
         seq_len = len(seq)
         
         # Get global atlas
@@ -291,14 +707,19 @@ class CompressedData:
         atlas_id = zlib.crc32(b"GlobalAtlas_v1") & 0xFFFFFFFF
         
         magic = b'\xE8\x60'  # v60
-        atlas_version = struct.pack('<H', 1)
-        
-        e8_seed = magic + atlas_version + struct.pack('<II', seq_len, checksum)
+        atlas_version = 1
+        layout_block = b''
+        if self.layout is not None:
+            atlas_version |= V60_LAYOUT_FLAG
+            layout_data = encode_layout(self.layout)
+            layout_block = struct.pack('<I', len(layout_data)) + layout_data
+        
+        e8_seed = magic + struct.pack('<H', atlas_version) + struct.pack('<II', seq_len, checksum)
         atlas_block = struct.pack('<I', atlas_id)
         oov_block = struct.pack('<HI', len(oov_tokens), len(oov_compressed)) + oov_compressed
         error_block = struct.pack('<I', len(error_stream)) + error_stream
         
-        return e8_seed + atlas_block + oov_block + error_block + bytes(token_stream)
+        return e8_seed + atlas_block + oov_block + layout_block + error_block + bytes(token_stream)
     
     def _to_bytes_v59(self) -> bytes:
         """
@@ -309,14 +730,16 @@ class CompressedData:
         
         Uses vectorized numpy operations for parallel encoding:
         1. Compute all displacements in one vectorized operation
-        2. Build Huffman table from displacement frequencies
-        3. Encode with adaptive Huffman codes
+        2. Build a length-limited canonical Huffman table from displacement
+           frequencies (only the code lengths are stored)
+        3. Scatter all codes into the bitstream at cumsum offsets
         
         Format:
-        [E8_SEED (16 bytes)][VOCAB_BLOCK][HUFFMAN_TABLE][BITSTREAM]
+        [E8_SEED (16 bytes)][VOCAB_BLOCK][LAYOUT_BLOCK?][DISP_BLOCK][OFFSET_BITS]
+        DISP_BLOCK: [u32 len][HUFFMAN_TABLE][BITSTREAM] (see VectorizedRAC)
         """
         vocab_size = len(self.vocabulary)
-        seq = np.array(self.token_sequence, dtype=np.uint32)
+        seq = np.asarray(self.token_sequence, dtype=np.uint32)
         seq_len = len(seq)
         
         # Sort vocabulary by index
@@ -327,18 +750,16 @@ class CompressedData:
         token_list = [k for k, v in sorted_vocab]
         vocab_geometry, _ = geo_cache.process_frame(token_list)
         
-        # Map tokens to roots
-        token_to_root = {}
-        root_to_tokens: Dict[int, List[int]] = {i: [] for i in range(240)}
+        # Map tokens to roots; a token's offset is its rank among the
+        # tokens sharing its root, in index order
+        token_roots = np.array([vocab_geometry[t].root_index for t in token_list], dtype=np.int64)
+        by_root, root_starts = _root_groups(token_roots)
+        token_offsets_by_index = np.empty(vocab_size, dtype=np.int64)
+        token_offsets_by_index[by_root] = np.arange(vocab_size) - root_starts[token_roots[by_root]]
         
-        for token_str, info in sorted_vocab:
-            geom = vocab_geometry[token_str]
-            root_idx = geom.root_index
-            token_to_root[info['index']] = root_idx
-            root_to_tokens[root_idx].append(info['index'])
-        
-        # Build root sequence as numpy array
-        root_sequence = np.array([token_to_root.get(int(idx), 0) for idx in seq], dtype=np.int32)
+        # Build root and offset sequences by gather
+        root_sequence = token_roots[seq].astype(np.int32)
+        token_offsets = token_offsets_by_index[seq]
         
         # Use vectorized RAC for encoding
         rac = VectorizedRAC()
@@ -346,17 +767,8 @@ class CompressedData:
         # Compute displacements (vectorized)
         displacements = rac.compute_displacements(root_sequence)
         
-        # Build Huffman table and encode
+        # Canonical Huffman: code lengths stored, codes scattered by cumsum
         packed_displacements, disp_meta = rac.encode_block_fast(displacements)
-        
-        # Encode token offsets within roots (optimized with dict lookup)
-        # Pre-build token->offset mapping for O(1) lookup
-        token_offset_map: Dict[int, int] = {}
-        for root_idx, tokens_in_root in root_to_tokens.items():
-            for offset, token_idx in enumerate(tokens_in_root):
-                token_offset_map[token_idx] = offset
-        
-        token_offsets = np.array([token_offset_map.get(int(idx), 0) for idx in seq], dtype=np.int32)
         packed_offsets = rac.encode_offsets_vectorized(token_offsets)
         
         # Pack vocabulary minimally
@@ -376,15 +788,20 @@ class CompressedData:
         checksum = zlib.crc32(combined_stream) & 0xFFFFFFFF
         
         magic = b'\xE8\x59'  # v59: Vectorized Huffman
-        flags = struct.pack('<H', 0x0001)  # Flag: uses Huffman
+        flags = 0x0001 | V59_CANONICAL_FLAG  # Flag: uses Huffman
+        layout_block = b''
+        if self.layout is not None:
+            flags |= V59_LAYOUT_FLAG
+            layout_data = encode_layout(self.layout)
+            layout_block = struct.pack('<I', len(layout_data)) + layout_data
         
-        e8_seed = magic + flags + struct.pack('<III', vocab_size, seq_len, checksum)
+        e8_seed = magic + struct.pack('<H', flags) + struct.pack('<III', vocab_size, seq_len, checksum)
         
         # Assemble
         vocab_block = struct.pack('<I', len(vocab_compressed)) + vocab_compressed
         disp_block = struct.pack('<I', len(packed_displacements)) + packed_displacements
         
-        return e8_seed + vocab_block + disp_block + packed_offsets
+        return e8_seed + vocab_block + layout_block + disp_block + packed_offsets
     
     def _to_bytes_v58(self) -> bytes:
         """
@@ -402,7 +819,7 @@ class CompressedData:
         [E8_SEED (16 bytes)][VOCAB_MINIMAL][ANGULAR_STREAM]
         """
         vocab_size = len(self.vocabulary)
-        seq = np.array(self.token_sequence, dtype=np.uint32)
+        seq = np.asarray(self.token_sequence, dtype=np.uint32)
         seq_len = len(seq)
         
         # Sort vocabulary by index
@@ -457,8 +874,7 @@ class CompressedData:
         for i, disp in enumerate(displacements):
             if i == 0:
                 # First root: store directly (8 bits)
-                for j in range(8):
-                    stream.write_bit((disp >> j) & 1)
+                stream.write_bits(disp, 8)
             else:
                 # Encode displacement with variable-length coding
                 # Most displacements are small in coherent text
@@ -473,21 +889,21 @@ class CompressedData:
                     stream.write_bit(0)
                     stream.write_bit(1)
                     stream.write_bit(sign)
-                    stream.write_bits([(abs_disp >> j) & 1 for j in range(2)])
+                    stream.write_bits(abs_disp, 2)
                 elif abs_disp <= 15:
                     # Medium displacement (4-15): 1 + 1 + 1 + 4 = 7 bits
                     stream.write_bit(0)
                     stream.write_bit(0)
                     stream.write_bit(1)
                     stream.write_bit(sign)
-                    stream.write_bits([(abs_disp >> j) & 1 for j in range(4)])
+                    stream.write_bits(abs_disp, 4)
                 else:
                     # Large displacement (16-119): 1 + 1 + 1 + 1 + 7 = 11 bits
                     stream.write_bit(0)
                     stream.write_bit(0)
                     stream.write_bit(0)
                     stream.write_bit(sign)
-                    stream.write_bits([(abs_disp >> j) & 1 for j in range(7)])
+                    stream.write_bits(abs_disp, 7)
         
         # Also encode offsets within roots (usually 0)
         for token_idx in seq:
@@ -544,7 +960,7 @@ class CompressedData:
         - Exploits Gaussian distribution around E8 roots
         """
         vocab_size = len(self.vocabulary)
-        seq = np.array(self.token_sequence, dtype=np.uint32)
+        seq = np.asarray(self.token_sequence, dtype=np.uint32)
         seq_len = len(seq)
         
         # Sort vocabulary by index
@@ -634,16 +1050,15 @@ class CompressedData:
                     # Use fewer bits for common ranks
                     if rank < 4:
                         stream.write_bits([0, 0])
-                        stream.write_bits([(rank >> i) & 1 for i in range(2)])
+                        stream.write_bits(rank, 2)
                     elif rank < 20:
                         stream.write_bits([0, 1])
-                        stream.write_bits([(rank >> i) & 1 for i in range(5)])
+                        stream.write_bits(rank, 5)
                     else:
                         stream.write_bits([1, 0])
                         stream.write_gamma(rank + 1)
             else:
-                for i in range(8):
-                    stream.write_bit((root_idx >> i) & 1)
+                stream.write_bits(root_idx, 8)
             
             # Encode offset (usually small)
             if offset_in_root == 0:
@@ -690,7 +1105,7 @@ class CompressedData:
         [E8_SEED (16 bytes)][VOCAB_BLOCK][LEARNED_TRANSITIONS][INDEX_STREAM]
         """
         vocab_size = len(self.vocabulary)
-        seq = np.array(self.token_sequence, dtype=np.uint32)
+        seq = np.asarray(self.token_sequence, dtype=np.uint32)
         seq_len = len(seq)
         
         # Sort vocabulary by index
@@ -764,8 +1179,7 @@ class CompressedData:
                     stream.write_bit(0)
                     stream.write_gamma(rank)
             else:
-                for i in range(8):
-                    stream.write_bit((root_idx >> i) & 1)
+                stream.write_bits(root_idx, 8)
             
             # Store offset
             stream.write_gamma(offset_in_root + 1)
@@ -819,7 +1233,7 @@ class CompressedData:
         packer = PhiAdicBitPacker()
         
         vocab_size = len(self.vocabulary)
-        seq = np.array(self.token_sequence, dtype=np.uint32)
+        seq = np.asarray(self.token_sequence, dtype=np.uint32)
         seq_len = len(seq)
         
         # Sort vocabulary by index for consistent encoding
@@ -880,8 +1294,7 @@ class CompressedData:
                     stream.write_gamma(rank + 1)
             else:
                 # No prediction - store root directly
-                for i in range(8):
-                    stream.write_bit((root_idx >> i) & 1)
+                stream.write_bits(root_idx, 8)
             
             # Store offset within root (usually small)
             stream.write_gamma(offset_in_root + 1)
@@ -936,7 +1349,7 @@ class CompressedData:
         
         # 1. Prepare vocabulary block (minimal: just tokens and counts)
         vocab_size = len(self.vocabulary)
-        seq = np.array(self.token_sequence, dtype=np.uint32)
+        seq = np.asarray(self.token_sequence, dtype=np.uint32)
         seq_len = len(seq)
         
         # Sort vocabulary by index for consistent encoding
@@ -989,7 +1402,7 @@ class CompressedData:
         # For large sequences, we use block-based RAC to maintain precision
         # BLOCK_SIZE 4 ensures we stay within 53-bit float precision
         BLOCK_SIZE = 4
-        seq = np.array(self.token_sequence, dtype=np.uint32)
+        seq = np.asarray(self.token_sequence, dtype=np.uint32)
         n_blocks = (len(seq) + BLOCK_SIZE - 1) // BLOCK_SIZE
         
         rac = RadialArithmeticCoder(index_probs)
@@ -1033,7 +1446,7 @@ class CompressedData:
         packed += phase_bytes
         
         # Apply GEOMETRIC error correction (RS encoding)
-        geometric_encoded = rs_encode_with_geometry(packed, n_copies=7)
+        geometric_encoded = rs_encode_with_geometry(packed)
         
         # Compressed-only version for fast path
         compressed_only = zlib.compress(packed, level=9)
@@ -1048,7 +1461,21 @@ class CompressedData:
     
     @classmethod
     def from_bytes(cls, data: bytes) -> 'CompressedData':
-        """Deserialize with support for v70, v60, v59, v58, v57, v56, v55, v54, v53, v52, v51, v50."""
+        """Deserialize with support for v72, v71, v70, v60, v59, v58, v57, v56, v55, v54, v53, v52, v51, v50."""
+        # Reed-Solomon protected stream: repair it, then parse what it wraps
+        if is_rs_stream(data):
+            data, _, confidence = rs_decode_with_geometry(data)
+            if confidence < 1.0:
+                raise ValueError("Protected stream is damaged beyond repair")
+        
+        # Check for v72 (Parallel horizon frames) format
+        if len(data) >= 32 and data[:2] == V72_MAGIC:
+            return cls._from_bytes_v72(data)
+        
+        # Check for v71 (Byte-level context mixing + range coder) format
+        if len(data) >= 12 and data[:2] == b'\xE8\x71':
+            return cls._from_bytes_v71(data)
+        
         # Check for v70 (Byte-level context mixing) format first
         if len(data) >= 12 and data[:2] == b'\xE8\x70':
             return cls._from_bytes_v70(data)
@@ -1121,6 +1548,89 @@ class CompressedData:
             metadata=metadata
         )
     
+    @classmethod
+    def _from_bytes_v71(cls, data: bytes) -> 'CompressedData':
+        """
+        Deserialize v71 Byte-level context mixing + range coder format.
+        
+        THE PHYSICS:
+        Replay the same N-Frame predictions and let the coded bits
+        choose between them, one binary decision at a time.
+        """
+        flags, = struct.unpack('<H', data[2:4])
+        orig_len, checksum = struct.unpack('<II', data[4:12])
+        table_bits = flags >> 8
+        
+        range_stream = data[12:]
+        computed_checksum = zlib.crc32(range_stream) & 0xFFFFFFFF
+        if computed_checksum != checksum:
+            raise ValueError(f"Checksum mismatch: expected {checksum}, got {computed_checksum}")
+        
+        predictor_name = 'logistic' if flags & 0x0002 else 'adaptive'
+        predictor = V71_PREDICTORS[predictor_name](table_bits)
+        data_bytes = range_decode_bytes(range_stream, orig_len, predictor)
+        token_sequence = np.frombuffer(data_bytes, dtype=np.uint8)
+        
+        metadata = {
+            'mode': 'byte',
+            'original_length': orig_len,
+            'version': 'v71',
+            'byte_level': True,
+            'bit_predictor': predictor_name,
+        }
+        
+        return cls(
+            vocabulary={},
+            token_sequence=token_sequence,
+            projections_4d=np.zeros((0, 4), dtype=np.float32),
+            phasons_4d=np.zeros((0, 4), dtype=np.float32),
+            phases=np.zeros(0, dtype=np.float32),
+            metadata=metadata
+        )
+    
+    @classmethod
+    def _from_bytes_v72(cls, data: bytes) -> 'CompressedData':
+        """
+        Deserialize v72 Parallel horizon frames format.
+        
+        THE PHYSICS:
+        Each frame carries its own N-Frame history; replay them in
+        order and the frames tile the original sequence.
+        """
+        archive = FrameArchive(data)
+        orig_len = archive.original_length
+        
+        data_bytes = bytearray()
+        for i in range(len(archive)):
+            data_bytes += archive.decode_frame(i)
+        
+        if len(data_bytes) != orig_len:
+            raise ValueError(f"Length mismatch: expected {orig_len}, got {len(data_bytes)}")
+        
+        token_sequence = np.frombuffer(bytes(data_bytes), dtype=np.uint8)
+        
+        metadata = {
+            'mode': 'byte',
+            'original_length': orig_len,
+            'version': 'v72',
+            'byte_level': True,
+            'frame_codec': 'zlib' if archive.codec == 'zlib' else 'range',
+            'horizon_batched': True,
+            'n_frames': len(archive),
+            'chunk_size': archive.chunk_size,
+        }
+        if archive.codec != 'zlib':
+            metadata['bit_predictor'] = archive.codec
+        
+        return cls(
+            vocabulary={},
+            token_sequence=token_sequence,
+            projections_4d=np.zeros((0, 4), dtype=np.float32),
+            phasons_4d=np.zeros((0, 4), dtype=np.float32),
+            phases=np.zeros(0, dtype=np.float32),
+            metadata=metadata
+        )
+    
     @classmethod
     def _from_bytes_v60(cls, data: bytes) -> 'CompressedData':
         """
@@ -1169,6 +1679,12 @@ class CompressedData:
         else:
             offset += oov_compressed_len
         
+        layout = None
+        if atlas_version & V60_LAYOUT_FLAG:
+            layout_len = struct.unpack('<I', data[offset:offset+4])[0]
+            layout = decode_layout(data[offset+4:offset+4+layout_len])
+            offset += 4 + layout_len
+        
         # 4. Parse error stream
         error_len = struct.unpack('<I', data[offset:offset+4])[0]
         offset += 4
@@ -1252,7 +1768,7 @@ class CompressedData:
         phases = np.zeros(vocab_size, dtype=np.float32)
         
         metadata = {
-            'mode': 'word',
+            'mode': 'word' if layout is None else 'word_exact',
             'original_length': 0,
             'n_tokens': seq_len,
             'n_unique': vocab_size,
@@ -1267,7 +1783,8 @@ class CompressedData:
             projections_4d=projections_4d,
             phasons_4d=phasons_4d,
             phases=phases,
-            metadata=metadata
+            metadata=metadata,
+            layout=layout
         )
     
     @classmethod
@@ -1294,8 +1811,7 @@ class CompressedData:
         vocab_data = zlib.decompress(vocab_compressed)
         
         vocabulary = {}
-        token_to_root = {}
-        root_to_tokens: Dict[int, List[int]] = {i: [] for i in range(240)}
+        token_roots = np.zeros(vocab_size, dtype=np.int64)
         
         vocab_offset = 0
         for i in range(vocab_size):
@@ -1309,8 +1825,13 @@ class CompressedData:
             vocab_offset += token_len
             
             vocabulary[token_str] = {'index': i, 'count': count, 'root_index': root_idx}
-            token_to_root[i] = root_idx
-            root_to_tokens[root_idx].append(i)
+            token_roots[i] = root_idx
+        
+        layout = None
+        if flags & V59_LAYOUT_FLAG:
+            layout_len = struct.unpack('<I', data[offset:offset+4])[0]
+            layout = decode_layout(data[offset+4:offset+4+layout_len])
+            offset += 4 + layout_len
         
         # 3. Parse displacement block
         disp_len = struct.unpack('<I', data[offset:offset+4])[0]
@@ -1321,58 +1842,23 @@ class CompressedData:
         # 4. Remaining is offset data
         offset_data = data[offset:]
         
-        # Decode displacements using fixed scheme (same as v58)
-        stream = BitStream.from_bytes(disp_data)
-        displacements = []
-        
-        for i in range(seq_len):
-            if i == 0:
-                # First root: stored directly
-                root_idx = sum(stream.read_bit() << j for j in range(8))
-                displacements.append(root_idx)
-            else:
-                # Decode Huffman-coded displacement
-                # For now, use fixed decoding (matches encode_block_fast fallback)
-                if stream.read_bit() == 1:
-                    disp = 0
-                elif stream.read_bit() == 1:
-                    sign = stream.read_bit()
-                    abs_disp = sum(stream.read_bit() << j for j in range(2))
-                    disp = -abs_disp if sign else abs_disp
-                elif stream.read_bit() == 1:
-                    sign = stream.read_bit()
-                    abs_disp = sum(stream.read_bit() << j for j in range(4))
-                    disp = -abs_disp if sign else abs_disp
-                else:
-                    sign = stream.read_bit()
-                    abs_disp = sum(stream.read_bit() << j for j in range(7))
-                    disp = -abs_disp if sign else abs_disp
-                
-                displacements.append(disp)
+        if not flags & V59_CANONICAL_FLAG:
+            raise ValueError("v59 stream has no Huffman table (written before canonical codes)")
+        computed_checksum = zlib.crc32(disp_data + offset_data) & 0xFFFFFFFF
+        if computed_checksum != checksum:
+            raise ValueError(f"Checksum mismatch: expected {checksum}, got {computed_checksum}")
         
-        # Reconstruct root sequence (vectorized)
+        # Table-driven decode of both streams
         rac = VectorizedRAC()
-        root_sequence = rac.reconstruct_roots(np.array(displacements, dtype=np.int32))
-        
-        # Decode offsets
-        offset_stream = BitStream.from_bytes(offset_data)
-        token_sequence = []
+        displacements = rac.decode_block_fast(disp_data, seq_len)
+        root_sequence = rac.reconstruct_roots(displacements)
+        offsets_in_root = rac.decode_offsets_vectorized(offset_data, seq_len)
         
-        for root_idx in root_sequence:
-            if offset_stream.read_bit() == 1:
-                offset_in_root = 0
-            else:
-                offset_in_root = offset_stream.read_gamma()
-            
-            tokens_in_root = root_to_tokens[int(root_idx)]
-            if offset_in_root < len(tokens_in_root):
-                token_idx = tokens_in_root[offset_in_root]
-            elif tokens_in_root:
-                token_idx = tokens_in_root[0]
-            else:
-                token_idx = 0
-            
-            token_sequence.append(token_idx)
+        # (root, offset) -> token: tokens grouped by root, in index order
+        by_root, root_starts = _root_groups(token_roots)
+        if np.any(offsets_in_root >= np.diff(root_starts)[root_sequence]):
+            raise ValueError("Failed to decode compressed data")
+        token_sequence = by_root[root_starts[root_sequence] + offsets_in_root].astype(np.uint32)
         
         # Reconstruct geometry (empty placeholders)
         projections_4d = np.zeros((vocab_size, 4), dtype=np.float32)
@@ -1380,7 +1866,7 @@ class CompressedData:
         phases = np.zeros(vocab_size, dtype=np.float32)
         
         metadata = {
-            'mode': 'word',
+            'mode': 'word' if layout is None else 'word_exact',
             'original_length': 0,
             'n_tokens': seq_len,
             'n_unique': vocab_size,
@@ -1394,7 +1880,8 @@ class CompressedData:
             projections_4d=projections_4d,
             phasons_4d=phasons_4d,
             phases=phases,
-            metadata=metadata
+            metadata=metadata,
+            layout=layout
         )
     
     @classmethod
@@ -1455,7 +1942,7 @@ class CompressedData:
         for i in range(seq_len):
             if i == 0:
                 # First root: stored directly
-                root_idx = sum(stream.read_bit() << j for j in range(8))
+                root_idx = stream.read_bits(8)
             else:
                 # Decode displacement
                 if stream.read_bit() == 1:
@@ -1464,17 +1951,17 @@ class CompressedData:
                 elif stream.read_bit() == 1:
                     # Small displacement (1-3)
                     sign = stream.read_bit()
-                    abs_disp = sum(stream.read_bit() << j for j in range(2))
+                    abs_disp = stream.read_bits(2)
                     disp = -abs_disp if sign else abs_disp
                 elif stream.read_bit() == 1:
                     # Medium displacement (4-15)
                     sign = stream.read_bit()
-                    abs_disp = sum(stream.read_bit() << j for j in range(4))
+                    abs_disp = stream.read_bits(4)
                     disp = -abs_disp if sign else abs_disp
                 else:
                     # Large displacement
                     sign = stream.read_bit()
-                    abs_disp = sum(stream.read_bit() << j for j in range(7))
+                    abs_disp = stream.read_bits(7)
                     disp = -abs_disp if sign else abs_disp
                 
                 root_idx = (root_sequence[-1] + disp) % 240
@@ -1609,9 +2096,9 @@ class CompressedData:
                     # Decode rank
                     first_two = [stream.read_bit(), stream.read_bit()]
                     if first_two == [0, 0]:
-                        rank = sum(stream.read_bit() << i for i in range(2))
+                        rank = stream.read_bits(2)
                     elif first_two == [0, 1]:
-                        rank = sum(stream.read_bit() << i for i in range(5))
+                        rank = stream.read_bits(5)
                     else:
                         rank = stream.read_gamma() - 1
                     
@@ -1619,7 +2106,7 @@ class CompressedData:
                     sorted_indices = np.argsort(probs)[::-1]
                     root_idx = int(sorted_indices[min(rank, 239)])
             else:
-                root_idx = sum(stream.read_bit() << i for i in range(8))
+                root_idx = stream.read_bits(8)
             
             # Decode offset
             if stream.read_bit() == 1:
@@ -1757,9 +2244,7 @@ class CompressedData:
                     sorted_indices = np.argsort(probs)[::-1]
                     root_idx = int(sorted_indices[rank])
             else:
-                root_idx = 0
-                for i in range(8):
-                    root_idx |= (stream.read_bit() << i)
+                root_idx = stream.read_bits(8)
             
             # Decode offset
             offset_in_root = stream.read_gamma() - 1
@@ -1875,9 +2360,7 @@ class CompressedData:
                     root_idx = int(sorted_indices[rank])
             else:
                 # No context - read root directly
-                root_idx = 0
-                for i in range(8):
-                    root_idx |= (stream.read_bit() << i)
+                root_idx = stream.read_bits(8)
             
             # Decode offset within root
             offset_in_root = stream.read_gamma() - 1
@@ -2079,7 +2562,7 @@ class CompressedData:
         elif recovered_magic == b'\xE8\x52':
             seq_len = struct.unpack('I', packed[offset:offset+4])[0]
             offset += 4
-            token_sequence = np.frombuffer(packed[offset:offset+seq_len], dtype=np.uint32).tolist()
+            token_sequence = np.frombuffer(packed[offset:offset+seq_len], dtype=np.uint32)
             offset += seq_len
         else:
             # Legacy v51/50 stored sequence in JSON
@@ -2138,13 +2621,17 @@ class GQECompressor:
                  use_horizon_batching: bool = True, chunk_size: Optional[int] = None,
                  self_learning: bool = False, evolution_state_path: Optional[str] = None,
                  learning_rate: float = 0.01, mutation_rate: float = 0.001,
-                 enable_geometric_parallelism: bool = False):
+                 enable_geometric_parallelism: bool = False,
+                 bit_predictor: str = 'logistic', workers: int = 1,
+                 frame_codec: str = 'range', topology_accuracy: Optional[float] = None):
         """
         Initialize compressor.
         
         Args:
             window_size: Co-occurrence window for graph building
-            tokenize_mode: Tokenization mode ('auto', 'word', 'char', 'byte')
+            tokenize_mode: Tokenization mode ('auto', 'word', 'char', 'byte',
+                           or 'word_exact' - word mode that also keeps the
+                           casing/separator layout, so decoding is exact)
             use_horizon_batching: Enable Horizon Batching for large inputs
             chunk_size: Custom chunk size for Horizon Batching
             self_learning: Enable geometric self-learning
@@ -2152,12 +2639,33 @@ class GQECompressor:
             learning_rate: How fast nodes move toward co-occurring neighbors
             mutation_rate: Probability of random phason flips
             enable_geometric_parallelism: Enable v71 Geometric Parallelism Context Mixer
+            bit_predictor: Bitwise predictor driving the v71 range coder
+                           ('logistic' or 'adaptive')
+            workers: Processes that range-code horizon frames concurrently
+                     when serializing to the v72 frame container
+            frame_codec: How v72 frames are coded ('range' - v71 range
+                         coder driven by bit_predictor, 'zlib' - the
+                         fast v70 shadow proxy)
+            topology_accuracy: Fidelity of the sparse topological features
+                               in (0, 1]; None keeps a fixed betweenness
+                               pivot budget (see compute_sparse_features)
         """
+        if bit_predictor not in V71_PREDICTORS:
+            raise ValueError(f"Unknown bit predictor: {bit_predictor}")
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        if frame_codec not in ('range', 'zlib'):
+            raise ValueError(f"Unknown frame codec: {frame_codec}")
+        
         self.window_size = window_size
         self.tokenize_mode = tokenize_mode
         self.use_horizon_batching = use_horizon_batching
         self.chunk_size = chunk_size or self.HORIZON_THRESHOLD
         self.enable_geometric_parallelism = enable_geometric_parallelism
+        self.bit_predictor = bit_predictor
+        self.workers = workers
+        self.frame_codec = frame_codec
+        self.topology_accuracy = topology_accuracy
         
         # Self-learning configuration
         self.self_learning = self_learning
@@ -2306,6 +2814,9 @@ class GQECompressor:
             'n_frames': frame_count,
             'chunk_size': self.chunk_size,
             'version': 'v70',  # Byte-singularity uses V70 format
+            'bit_predictor': self.bit_predictor,
+            'workers': self.workers,
+            'frame_codec': self.frame_codec,
             'self_learning': self.self_learning,
             'evolution_stats': {},
         }
@@ -2319,73 +2830,97 @@ class GQECompressor:
             metadata=metadata
         )
     
+    def compress_stream(self, reader, writer) -> int:
+        """
+        Compress a binary stream into a v72 frame container, frame by frame.
+        
+        THE PHYSICS:
+        Render only the Active Horizon. One horizon frame (plus the grain
+        search window) is resident at a time; each frame is coded and
+        written before the next is read, and the frame index is written
+        last. Memory is bounded by chunk_size and workers, not by the
+        input - the output is byte-identical to to_bytes('v72').
+        
+        Args:
+            reader: Binary file-like object with read(n)
+            writer: Binary file-like object with write(b)
+        
+        Returns:
+            Number of bytes written
+        """
+        batcher = HorizonBatcher(chunk_size=self.chunk_size, window_size=self.window_size)
+        return _write_frame_container(
+            writer.write,
+            batcher.stream_chunks(reader),
+            self.chunk_size,
+            'zlib' if self.frame_codec == 'zlib' else self.bit_predictor,
+            CompressedData.V71_TABLE_BITS,
+            workers=self.workers,
+        )
+    
     def compress_file(self, file_path: str) -> CompressedData:
         """
-        Compress a file using true streaming to maintain low RSS.
+        Compress a file through a read-only memory mapping.
+        
+        The file is opened once and mapped. HorizonBatcher, np.frombuffer
+        and the tokenizer all receive zero-copy memoryview slices of the
+        mapping, so the corpus is never duplicated between the page cache
+        and the heap, and no per-frame buffers are allocated. Frames are
+        tokenized into spans over the mapping without decoding UTF-8. In
+        byte mode the returned token_sequence is itself a view of the
+        mapping.
         """
         mode = self.tokenize_mode
         if mode == 'auto':
             mode = 'word' # Default for files
-            
-        from .core.horizon_batcher import HorizonBatcher
+        
+        data = _map_file(file_path)
+        
+        if mode == 'word_exact':
+            return self.compress(data)
+        if mode == 'byte':
+            return self._compress_with_horizon_batching(data, 'byte')
+        
         batcher = HorizonBatcher(chunk_size=self.chunk_size, window_size=self.window_size)
         
-        # 1. First pass: Build Global Singularity (eternal basis)
-        # We read the first chunk to establish the vocabulary
-        with open(file_path, 'rb') as f:
-            first_chunk = f.read(self.chunk_size)
-            singularity = batcher.build_singularity(first_chunk)
-            
-        # 2. Second pass: Process frames and collect indices into a single binary array
-        # We pre-allocate the array if possible, or use a list of arrays
+        # 1. Build Global Singularity (eternal basis) from the first frame
+        singularity = batcher.build_singularity(data[:self.chunk_size])
+        
+        # 2. Process frames and collect indices into a single binary array
         frame_arrays = []
         total_tokens = 0
-        
-        with open(file_path, 'rb') as f:
-            frame_idx = 0
-            while True:
-                chunk = f.read(self.chunk_size)
-                if not chunk: break
-                
-                # Process one frame at a time
-                try:
-                    tokens = tokenize(chunk.decode('utf-8'), mode=mode)
-                except UnicodeDecodeError:
-                    tokens = tokenize(chunk, mode='byte')
-                
-                indices = np.array([singularity.vocabulary.get(t.value, 0) for t in tokens], dtype=np.uint32)
-                frame_arrays.append(indices)
-                total_tokens += len(indices)
-                frame_idx += 1
-                
-        all_indices = np.concatenate(frame_arrays)
+        n_frames = 0
+        
+        for _, chunk, _ in batcher._chunk_data(data):
+            # Process one frame at a time, as spans over the mapping
+            ids, values = token_ids(tokenize_spans(chunk, mode=mode))
+            lookup = np.array([singularity.vocabulary.get(v, 0) for v in values], dtype=np.uint32)
+            indices = lookup[ids]
+            frame_arrays.append(indices)
+            total_tokens += len(indices)
+            n_frames += 1
+        
+        all_indices = np.concatenate(frame_arrays) if frame_arrays else np.zeros(0, dtype=np.uint32)
         del frame_arrays # Immediate GC
         
-        # ... (rest of the logic remains the same)
         n_unique = len(singularity.vocabulary)
         projections_4d = np.zeros((n_unique, 4), dtype=np.float32)
         phasons_4d = np.zeros((n_unique, 4), dtype=np.float32)
         phases = singularity.phases.copy()
         
-        from .core.projection import coxeter_projection_8d_to_4d
-        from .core.e8_lattice import Spinor
-        P_par, P_perp = coxeter_projection_matrices() if 'coxeter_projection_matrices' in dir() else (None, None)
-        
-        for i in range(n_unique):
-            if i < len(singularity.embeddings_8d):
-                spinor = Spinor(position=singularity.embeddings_8d[i], phase=phases[i])
-                projected = coxeter_projection_8d_to_4d(spinor)
-                projections_4d[i] = projected.parallel
-                phasons_4d[i] = projected.phason
+        n_embedded = min(n_unique, len(singularity.embeddings_8d))
+        if n_embedded > 0:
+            projections_4d[:n_embedded], phasons_4d[:n_embedded] = project_many(
+                singularity.embeddings_8d[:n_embedded])
                 
         metadata = {
             'mode': mode,
-            'original_length': os.path.getsize(file_path),
+            'original_length': len(data),
             'n_tokens': total_tokens,
             'n_unique': n_unique,
             'window_size': self.window_size,
             'horizon_batched': True,
-            'n_frames': frame_idx,
+            'n_frames': n_frames,
             'chunk_size': self.chunk_size
         }
         
@@ -2398,7 +2933,7 @@ class GQECompressor:
             metadata=metadata
         )
 
-    def compress(self, data: Union[str, bytes]) -> CompressedData:
+    def compress(self, data: Union[str, bytes, memoryview]) -> CompressedData:
         """
         Compress input data.
         
@@ -2418,58 +2953,68 @@ class GQECompressor:
         # Determine mode
         mode = self.tokenize_mode
         if mode == 'auto':
-            mode = 'byte' if isinstance(data, bytes) else 'word'
+            mode = 'word' if isinstance(data, str) else 'byte'
         
-        # Convert to bytes for size check
+        # Lossless word mode works on text; undecodable bytes fall back to byte mode
+        binary = not isinstance(data, str)
+        if mode == 'word_exact' and binary:
+            try:
+                data = str(data, 'utf-8')
+            except UnicodeDecodeError:
+                mode = 'byte'
+        
+        # Convert to bytes for size check (buffers such as mmap views pass through)
         data_bytes = data.encode('utf-8') if isinstance(data, str) else data
         
-        # Use Horizon Batching for large inputs
-        if self.use_horizon_batching and len(data_bytes) > self.HORIZON_THRESHOLD:
+        # Use Horizon Batching for large inputs (the byte singularity has no words)
+        if (self.use_horizon_batching and mode != 'word_exact'
+                and len(data_bytes) > self.HORIZON_THRESHOLD):
             return self._compress_with_horizon_batching(data_bytes, mode)
         
         # Standard compression for small inputs
-        tokens = tokenize(data, mode=mode)
+        layout = None
+        if mode == 'word_exact':
+            tokens = tokenize_spans(data, mode='word')
+            layout = extract_layout(tokens)
+            layout.binary = binary
+        elif mode in ('byte', 'char', 'word'):
+            tokens = tokenize_spans(data, mode=mode)
+        else:
+            tokens = tokenize(data, mode=mode)
         
         if len(tokens) == 0:
             return CompressedData(
                 vocabulary={},
-                token_sequence=[],
+                token_sequence=np.zeros(0, dtype=np.uint32),
                 projections_4d=np.array([]).reshape(0, 4),
                 phasons_4d=np.array([]).reshape(0, 4),
                 phases=np.array([]),
-                metadata={'mode': mode, 'original_length': 0}
+                metadata={'mode': mode, 'original_length': 0},
+                layout=layout
             )
         
-        # Step 2: Build co-occurrence graph
-        graph = build_cooccurrence_graph(tokens, window_size=self.window_size)
+        # Step 2: Factorize the stream into ids (first-appearance order)
+        ids, values = token_ids(tokens)
         
-        # Step 3: Embed tokens to 8D spinors
-        spinors = embed_all_tokens(tokens, graph)
+        # Step 3: Build sparse co-occurrence matrix
+        matrix = build_cooccurrence_matrix(ids, window_size=self.window_size, values=values)
         
-        # Step 4: Build vocabulary (unique tokens)
-        vocabulary = {}
-        token_to_idx = {}
-        unique_spinors = []
+        # Step 4: Embed tokens to 8D spinors
+        spinors = embed_all_tokens(ids, matrix, accuracy=self.topology_accuracy, values=values)
         
-        for token, spinor in zip(tokens, spinors):
-            token_str = str(token.value)
-            if token_str not in vocabulary:
-                idx = len(vocabulary)
-                vocabulary[token_str] = {
-                    'index': idx,
-                    'count': 1
-                }
-                token_to_idx[token_str] = idx
-                unique_spinors.append(spinor)
-            else:
-                vocabulary[token_str]['count'] += 1
-        
-        # Step 5: Create token sequence (indices)
-        token_sequence = np.array([token_to_idx[str(t.value)] for t in tokens], dtype=np.uint32)
+        # Step 5: Build vocabulary and token sequence from the ids
+        counts = np.bincount(ids, minlength=len(values))
+        _, first_occurrence = np.unique(ids, return_index=True)
+        vocabulary = {
+            str(value): {'index': idx, 'count': count}
+            for idx, (value, count) in enumerate(zip(values, counts.tolist()))
+        }
+        token_sequence = ids.astype(np.uint32)
         
         # SELF-LEARNING: Apply the Möbius Feedback Loop (standard path)
-        embeddings_8d = np.array([s.position for s in unique_spinors], dtype=np.float32)
-        phases = np.array([s.phase for s in unique_spinors], dtype=np.float32)
+        unique_spinors = spinors[first_occurrence]
+        embeddings_8d = unique_spinors.positions
+        phases = unique_spinors.phases
         evolution_stats = {}
         
         if self.self_learning and self.evolver is not None:
@@ -2482,14 +3027,7 @@ class GQECompressor:
         
         # Step 6: Project spinors to 4D + extract phasons (using evolved embeddings)
         n_unique = len(unique_spinors)
-        projections_4d = np.zeros((n_unique, 4))
-        phasons_4d = np.zeros((n_unique, 4))
-        
-        for i in range(n_unique):
-            spinor = Spinor(position=embeddings_8d[i], phase=phases[i])
-            projected = coxeter_projection_8d_to_4d(spinor)
-            projections_4d[i] = projected.parallel
-            phasons_4d[i] = projected.phason
+        projections_4d, phasons_4d = project_many(embeddings_8d[:n_unique])
         
         # Metadata
         metadata = {
@@ -2504,11 +3042,12 @@ class GQECompressor:
         
         return CompressedData(
             vocabulary=vocabulary,
-            token_sequence=token_sequence.tolist(),
+            token_sequence=token_sequence,
             projections_4d=projections_4d,
             phasons_4d=phasons_4d,
             phases=phases,
-            metadata=metadata
+            metadata=metadata,
+            layout=layout
         )
 
 
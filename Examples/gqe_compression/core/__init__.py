@@ -11,10 +11,17 @@ Modules:
 """
 
 from .phi_adic import encode_phi, decode_phi, PHI, PHI_INV
-from .e8_lattice import Spinor, generate_e8_roots, spinor_distance
-from .projection import coxeter_projection_8d_to_4d, inverse_projection_with_phason
+from .e8_lattice import (
+    Spinor, SpinorBatch, generate_e8_roots, spinor_distance, spinor_distance_matrix
+)
+from .projection import (
+    coxeter_projection_8d_to_4d, inverse_projection_with_phason, project_many, lift_many
+)
 from .quasicrystal import compute_power_spectrum, detect_phi_peaks, compute_aperiodicity_score
-from .tda import build_cooccurrence_graph, embed_token_to_spinor
+from .tda import (
+    build_cooccurrence_graph, build_cooccurrence_matrix, CooccurrenceMatrix, embed_token_to_spinor,
+    compute_sparse_features, tokenize_spans, TokenSpans
+)
 
 __all__ = [
     # Constants
@@ -22,11 +29,14 @@ __all__ = [
     # phi_adic
     'encode_phi', 'decode_phi',
     # e8_lattice
-    'Spinor', 'generate_e8_roots', 'spinor_distance',
+    'Spinor', 'SpinorBatch', 'generate_e8_roots', 'spinor_distance',
+    'spinor_distance_matrix',
     # projection
     'coxeter_projection_8d_to_4d', 'inverse_projection_with_phason',
+    'project_many', 'lift_many',
     # quasicrystal
     'compute_power_spectrum', 'detect_phi_peaks', 'compute_aperiodicity_score',
     # tda
-    'build_cooccurrence_graph', 'embed_token_to_spinor',
+    'build_cooccurrence_graph', 'build_cooccurrence_matrix', 'CooccurrenceMatrix',
+    'embed_token_to_spinor', 'compute_sparse_features', 'tokenize_spans', 'TokenSpans',
 ]
@@ -20,7 +20,7 @@ License: Public Domain
 
 import numpy as np
 from typing import List, Tuple, Optional
-from dataclasses import dataclass
+import struct
 
 try:
     from .phi_adic import PhiAdicNumber, PHI, PHI_INV, encode_phi
@@ -28,7 +28,6 @@ except ImportError:
     from phi_adic import PhiAdicNumber, PHI, PHI_INV, encode_phi
 
 
-@dataclass
 class BitStream:
     """
     A mutable bit buffer for efficient packing/unpacking.
@@ -36,22 +35,68 @@ class BitStream:
     THE PHYSICS:
     This is the "Horizon Screen" - the discrete surface where
     continuous angles become pixelated bits.
+    
+    Bits are numbered LSB-first: bit i of the stream is bit (i % 8) of
+    byte i // 8. Writes gather in an integer accumulator and reach the
+    bytearray eight bytes at a time; reads refill their own accumulator
+    a 64-bit word at a time, so multi-bit codes cost a shift and a mask
+    rather than one call per bit. Reads past the end return zeros.
+    Reads and writes may interleave: a write into bits the reader has
+    already loaded re-seeks the reader to its position.
     """
-    bits: List[int]
-    position: int = 0
     
-    def __init__(self):
-        self.bits = []
-        self.position = 0
+    # Bytes moved between buffer and accumulator per refill
+    WORD_BYTES = 8
+    
+    def __init__(self, capacity_bits: int = 0):
+        self._buffer = bytearray(((max(capacity_bits, 0) + 7) >> 3) + self.WORD_BYTES)
+        self._flushed = 0       # Whole bytes committed to the buffer
+        self._acc = 0           # Pending bits after the committed bytes
+        self._acc_bits = 0
+        self._sealed = True     # Pending bits are mirrored in the buffer
+        self._seek(0)
+    
+    def __len__(self) -> int:
+        """Number of bits written."""
+        return 8 * self._flushed + self._acc_bits
+    
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
     
     def write_bit(self, bit: int):
         """Write a single bit (0 or 1)."""
-        self.bits.append(bit & 1)
-    
-    def write_bits(self, bits: List[int]):
-        """Write multiple bits."""
-        for b in bits:
-            self.write_bit(b)
+        stale = self._sealed and self._reads_past_end()
+        self._acc |= (int(bit) & 1) << self._acc_bits
+        self._acc_bits += 1
+        self._sealed = False
+        if self._acc_bits >= 64:
+            self._flush()
+        if stale:
+            self._seek(self._position)
+    
+    def write_bits(self, value, nbits: Optional[int] = None):
+        """
+        Write the low nbits of value, least significant bit first.
+        
+        write_bits(x, n) stores the same bits as writing (x >> i) & 1 for
+        i in range(n). With nbits omitted, value is a sequence of bits
+        (list or array), packed in bulk.
+        """
+        if nbits is None:
+            bits = np.asarray(value, dtype=np.uint8).reshape(-1) & 1
+            nbits = len(bits)
+            value = int.from_bytes(np.packbits(bits, bitorder='little').tobytes(), 'little')
+        if nbits <= 0:
+            return
+        stale = self._sealed and self._reads_past_end()
+        self._acc |= (int(value) & ((1 << nbits) - 1)) << self._acc_bits
+        self._acc_bits += nbits
+        self._sealed = False
+        if self._acc_bits >= 64:
+            self._flush()
+        if stale:
+            self._seek(self._position)
     
     def write_unary(self, n: int):
         """
@@ -59,9 +104,7 @@ class BitStream:
         
         This is optimal for small numbers (Zeckendorf digit counts).
         """
-        for _ in range(n):
-            self.write_bit(1)
-        self.write_bit(0)
+        self.write_bits((1 << n) - 1, n + 1)
     
     def write_gamma(self, n: int):
         """
@@ -74,53 +117,166 @@ class BitStream:
             self.write_bit(0)
             return
             
-        # Number of bits needed
+        # (bits_needed - 1) zeros, then n from its top bit down: in stream
+        # order that is n bit-reversed, shifted past the zeros
         bits_needed = n.bit_length()
+        self.write_bits(_reverse_bits(n, bits_needed) << (bits_needed - 1), 2 * bits_needed - 1)
+    
+    def _flush(self):
+        """Commit the accumulator's whole 64-bit words to the buffer."""
+        nbytes = (self._acc_bits >> 6) * self.WORD_BYTES
+        self._reserve(self._flushed + nbytes)
+        self._buffer[self._flushed:self._flushed + nbytes] = \
+            (self._acc & ((1 << (8 * nbytes)) - 1)).to_bytes(nbytes, 'little')
+        self._flushed += nbytes
+        self._acc >>= 8 * nbytes
+        self._acc_bits -= 8 * nbytes
+    
+    def _seal(self):
+        """Mirror the pending bits into the buffer so it holds every bit."""
+        if self._sealed:
+            return
+        nbytes = (self._acc_bits + 7) >> 3
+        self._reserve(self._flushed + nbytes)
+        self._buffer[self._flushed:self._flushed + nbytes] = self._acc.to_bytes(nbytes, 'little')
+        self._sealed = True
+    
+    def _reads_past_end(self) -> bool:
+        """
+        Whether the read accumulator holds bits past the end of the stream.
         
-        # Write (bits_needed - 1) zeros
-        for _ in range(bits_needed - 1):
-            self.write_bit(0)
-        
-        # Write n in binary (bits_needed bits)
-        for i in range(bits_needed - 1, -1, -1):
-            self.write_bit((n >> i) & 1)
+        Those bits were loaded as zeros; a write that lands there must
+        re-seek the reader, or it would return the stale zeros.
+        """
+        return len(self) < 8 * self._read_byte
+    
+    def _reserve(self, nbytes: int):
+        """Grow the buffer (doubling) to hold nbytes plus a read word of slack."""
+        needed = nbytes + self.WORD_BYTES
+        if needed > len(self._buffer):
+            self._buffer.extend(bytes(max(needed, 2 * len(self._buffer)) - len(self._buffer)))
+    
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    
+    @property
+    def position(self) -> int:
+        """Read cursor, in bits (stops at the end of the stream)."""
+        return min(self._position, len(self))
+    
+    @position.setter
+    def position(self, bit: int):
+        self._seek(bit)
+    
+    def _seek(self, bit: int):
+        self._position = bit
+        self._read_byte = bit >> 3
+        self._read_acc = 0
+        self._read_bits = 0
+        if bit & 7:
+            self._refill()
+            self._read_acc >>= bit & 7
+            self._read_bits -= bit & 7
+    
+    def _refill(self):
+        """Append the next 64-bit word to the read accumulator."""
+        self._seal()
+        start = self._read_byte
+        word = int.from_bytes(self._buffer[start:start + self.WORD_BYTES], 'little')
+        self._read_acc |= word << self._read_bits
+        self._read_bits += 64
+        self._read_byte += self.WORD_BYTES
     
     def read_bit(self) -> int:
         """Read a single bit."""
-        if self.position >= len(self.bits):
-            return 0
-        bit = self.bits[self.position]
-        self.position += 1
+        if self._read_bits == 0:
+            self._refill()
+        bit = self._read_acc & 1
+        self._read_acc >>= 1
+        self._read_bits -= 1
+        self._position += 1
         return bit
     
-    def read_bits(self, count: int) -> List[int]:
-        """Read multiple bits."""
-        return [self.read_bit() for _ in range(count)]
+    def read_bits(self, nbits: int) -> int:
+        """Read nbits as an integer, first bit least significant (inverse of write_bits)."""
+        while self._read_bits < nbits:
+            self._refill()
+        value = self._read_acc & ((1 << nbits) - 1)
+        self._read_acc >>= nbits
+        self._read_bits -= nbits
+        self._position += nbits
+        return value
+    
+    def read_bit_list(self, nbits: int) -> List[int]:
+        """Read nbits as a list of bits."""
+        value = self.read_bits(nbits)
+        return [(value >> i) & 1 for i in range(nbits)]
+    
+    def _count_run(self, bit: int, limit: int) -> int:
+        """Length of the run of `bit` at the cursor (capped at limit), not consumed."""
+        run = 0
+        while run < limit:
+            if self._read_bits <= run:
+                self._refill()
+            window = (self._read_acc if bit == 0 else ~self._read_acc) >> run
+            window &= (1 << (self._read_bits - run)) - 1
+            if window:
+                run += (window & -window).bit_length() - 1
+                break
+            run = self._read_bits
+        return min(run, limit)
     
     def read_unary(self) -> int:
         """Read a unary-encoded number."""
-        count = 0
-        while self.read_bit() == 1:
-            count += 1
+        count = self._count_run(1, 1 << 62)
+        self.read_bits(count + 1)
         return count
     
     def read_gamma(self) -> int:
         """Read an Elias gamma-encoded integer."""
-        # Count leading zeros
-        zeros = 0
-        while self.read_bit() == 0:
-            zeros += 1
-            if zeros > 32:  # Safety limit
-                return 0
+        if self._read_bits < 65:
+            self._refill()
+        
+        # Fast path: the whole code is in the accumulator. The zeros end
+        # at n's top bit; n follows MSB-first, i.e. bit-reversed
+        acc = self._read_acc
+        if acc:
+            zeros = (acc & -acc).bit_length() - 1
+            if zeros <= 32 and 2 * zeros < self._read_bits:
+                code = (acc >> zeros) & ((1 << (zeros + 1)) - 1)
+                self.read_bits(2 * zeros + 1)
+                return _reverse_bits(code, zeros + 1)
         
-        if zeros == 0:
-            return 1
+        # Count leading zeros
+        zeros = self._count_run(0, 33)
+        if zeros > 32:  # Safety limit
+            self.read_bits(zeros)
+            return 0
         
-        # Read the remaining bits
-        n = 1
-        for _ in range(zeros):
-            n = (n << 1) | self.read_bit()
-        return n
+        self.read_bits(zeros)
+        return _reverse_bits(self.read_bits(zeros + 1), zeros + 1)
+    
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+    
+    @property
+    def bits(self) -> List[int]:
+        """The written bits as a list (a copy; for inspection)."""
+        return self.to_bit_array().tolist()
+    
+    def to_bit_array(self) -> np.ndarray:
+        """The written bits as a uint8 array (bulk unpack)."""
+        self._seal()
+        packed = np.frombuffer(bytes(self._buffer[:(len(self) + 7) >> 3]), dtype=np.uint8)
+        return np.unpackbits(packed, count=len(self), bitorder='little')
+    
+    @classmethod
+    def from_bit_array(cls, bits) -> 'BitStream':
+        """Build a stream from a sequence of bits (bulk pack)."""
+        bits = np.asarray(bits, dtype=np.uint8).reshape(-1) & 1
+        return cls._from_packed(np.packbits(bits, bitorder='little').tobytes(), len(bits))
     
     def to_bytes(self) -> bytes:
         """
@@ -128,26 +284,9 @@ class BitStream:
         
         Format: [total_bits (4 bytes)][packed bits]
         """
-        total_bits = len(self.bits)
-        
-        # Pack bits into bytes
-        byte_count = (total_bits + 7) // 8
-        result = bytearray(4 + byte_count)
-        
-        # Store total bit count (little-endian)
-        result[0] = total_bits & 0xFF
-        result[1] = (total_bits >> 8) & 0xFF
-        result[2] = (total_bits >> 16) & 0xFF
-        result[3] = (total_bits >> 24) & 0xFF
-        
-        # Pack bits
-        for i, bit in enumerate(self.bits):
-            byte_idx = 4 + (i // 8)
-            bit_idx = i % 8
-            if bit:
-                result[byte_idx] |= (1 << bit_idx)
-        
-        return bytes(result)
+        total_bits = len(self)
+        self._seal()
+        return struct.pack('<I', total_bits & 0xFFFFFFFF) + bytes(self._buffer[:(total_bits + 7) >> 3])
     
     @classmethod
     def from_bytes(cls, data: bytes) -> 'BitStream':
@@ -156,25 +295,43 @@ class BitStream:
             stream = cls()
             return stream
         
-        # Read total bit count
-        total_bits = (data[0] | (data[1] << 8) | 
-                     (data[2] << 16) | (data[3] << 24))
-        
+        # Read total bit count; missing bytes read as zeros
+        total_bits = struct.unpack('<I', data[:4])[0]
+        nbytes = (total_bits + 7) >> 3
+        packed = bytes(data[4:4 + nbytes])
+        return cls._from_packed(packed + bytes(nbytes - len(packed)), total_bits)
+    
+    @classmethod
+    def _from_packed(cls, packed: bytes, total_bits: int) -> 'BitStream':
+        """Adopt total_bits LSB-first bits from packed bytes."""
         stream = cls()
-        
-        # Unpack bits
-        for i in range(total_bits):
-            byte_idx = 4 + (i // 8)
-            bit_idx = i % 8
-            if byte_idx < len(data):
-                bit = (data[byte_idx] >> bit_idx) & 1
-                stream.bits.append(bit)
-            else:
-                stream.bits.append(0)
-        
+        buffer = bytearray(packed)
+        if total_bits & 7:
+            buffer[-1] &= (1 << (total_bits & 7)) - 1   # Bits past the end read as 0
+        
+        # Whole words stay committed; the tail goes back to the accumulator
+        flushed = (total_bits >> 6) * cls.WORD_BYTES
+        stream._buffer = buffer + bytes(cls.WORD_BYTES)
+        stream._flushed = flushed
+        stream._acc = int.from_bytes(buffer[flushed:], 'little')
+        stream._acc_bits = total_bits - 8 * flushed
+        stream._sealed = True
         return stream
 
 
+# Each byte with its bit order reversed
+_REVERSED_BYTES = [int(f'{b:08b}'[::-1], 2) for b in range(256)]
+
+
+def _reverse_bits(value: int, nbits: int) -> int:
+    """Reverse the order of the low nbits of value (value < 2**nbits)."""
+    if nbits <= 8:
+        return _REVERSED_BYTES[value] >> (8 - nbits)
+    if nbits <= 16:
+        return ((_REVERSED_BYTES[value & 0xFF] << 8) | _REVERSED_BYTES[value >> 8]) >> (16 - nbits)
+    return int(format(value, f'0{nbits}b')[::-1], 2)
+
+
 class PhiAdicBitPacker:
     """
     Converts phi-adic numbers to raw bitstreams.
@@ -233,10 +390,10 @@ class PhiAdicBitPacker:
         frac_count = stream.read_gamma() - 1
         
         # 4. Integer digits
-        digits = stream.read_bits(int_count) if int_count > 0 else [0]
+        digits = stream.read_bit_list(int_count) if int_count > 0 else [0]
         
         # 5. Fractional digits
-        fractional_digits = stream.read_bits(frac_count) if frac_count > 0 else []
+        fractional_digits = stream.read_bit_list(frac_count) if frac_count > 0 else []
         
         return PhiAdicNumber(
             digits=digits,
@@ -302,8 +459,7 @@ class PhiAdicBitPacker:
         if vocab_size <= 256:
             # Fixed 8-bit encoding
             for idx in indices:
-                for i in range(8):
-                    stream.write_bit((idx >> i) & 1)
+                stream.write_bits(idx, 8)
         else:
             # Variable-length encoding with delta compression
             prev = 0
@@ -326,10 +482,7 @@ class PhiAdicBitPacker:
         if vocab_size <= 256:
             # Fixed 8-bit decoding
             for _ in range(count):
-                idx = 0
-                for i in range(8):
-                    idx |= (stream.read_bit() << i)
-                indices.append(idx)
+                indices.append(stream.read_bits(8))
         else:
             # Variable-length delta decoding
             prev = 0
@@ -422,7 +575,7 @@ def run_verification():
     for v in test_values:
         stream.write_gamma(v)
     
-    total_bits = len(stream.bits)
+    total_bits = len(stream)
     print(f"  Values: {test_values}")
     print(f"  Total bits: {total_bits}")
     print(f"  Bits per value: {total_bits / len(test_values):.2f}")
@@ -33,27 +33,186 @@ class PredictionResult:
     bits_needed: float  # Bits to encode the actual byte
 
 
+class SlottedTable:
+    """
+    Fixed-size, checksum-verified hash table of 256-wide rows.
+
+    THE PHYSICS:
+    The crystal has a fixed number of cells. A context hash picks a
+    bucket of `ways` adjacent slots; a 16-bit check value derived from
+    the same hash confirms which slot (if any) belongs to the context.
+    When every slot in the bucket belongs to someone else, the slot with
+    the least evidence (lowest priority) is recycled.
+
+    All storage is preallocated and contiguous:
+    - rows:     (1 << table_bits, 256) compact counters/probabilities
+    - checks:   (1 << table_bits,) uint16, 0 = empty
+    - priority: (1 << table_bits,) uint16 evidence used for replacement
+
+    Memory is fixed by table_bits no matter how many contexts appear.
+    """
+
+    # Fibonacci hashing multiplier (2^32 / phi): decorrelates the check
+    # value from the low bits used for the slot index
+    GOLDEN_MULT = 0x9E3779B1
+
+    def __init__(self, table_bits: int, ways: int = 2, dtype=np.uint8):
+        if ways < 1 or ways & (ways - 1):
+            raise ValueError(f"ways must be a power of two, got {ways}")
+        self.table_bits = table_bits
+        self.table_size = 1 << table_bits
+        self.ways = ways
+        self._bucket_mask = (self.table_size - 1) & ~(ways - 1)
+
+        self.rows = np.zeros((self.table_size, 256), dtype=dtype)
+        self.checks = np.zeros(self.table_size, dtype=np.uint16)
+        self.priority = np.zeros(self.table_size, dtype=np.uint16)
+
+    def _split(self, h: int) -> Tuple[int, int]:
+        """Split a 32-bit context hash into (bucket index, check value)."""
+        check = ((h * self.GOLDEN_MULT) & 0xFFFFFFFF) >> 16
+        return h & self._bucket_mask, check or 1
+
+    def find(self, h: int) -> int:
+        """Return the slot holding context h, or -1 if it is not resident."""
+        base, check = self._split(h)
+        for slot in range(base, base + self.ways):
+            if self.checks[slot] == check:
+                return slot
+        return -1
+
+    def find_or_insert(self, h: int) -> int:
+        """
+        Return the slot for context h, claiming one if needed.
+
+        A claimed slot is cleared: the previous owner's evidence is gone.
+        """
+        base, check = self._split(h)
+        victim = base
+        for slot in range(base, base + self.ways):
+            owner = self.checks[slot]
+            if owner == check:
+                return slot
+            if owner == 0:
+                victim = slot
+                break
+            if self.priority[slot] < self.priority[victim]:
+                victim = slot
+
+        self.rows[victim] = 0
+        self.checks[victim] = check
+        self.priority[victim] = 0
+        return victim
+
+    def _split_many(self, hashes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized _split: (bucket indices as int64, check values as uint16)."""
+        h = np.asarray(hashes, dtype=np.uint64)
+        base = (h & np.uint64(self._bucket_mask)).astype(np.int64)
+        check = ((h * np.uint64(self.GOLDEN_MULT)) & np.uint64(0xFFFFFFFF)) >> np.uint64(16)
+        return base, np.maximum(check, 1).astype(np.uint16)
+
+    def lookup(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Vectorized find() over an array of 32-bit context hashes.
+
+        Returns:
+            int64 array of slots (-1 where the context is not resident)
+        """
+        base, check = self._split_many(hashes)
+
+        slots = np.full(len(base), -1, dtype=np.int64)
+        for way in range(self.ways):
+            candidate = base + way
+            hit = (self.checks[candidate] == check) & (slots < 0)
+            slots[hit] = candidate[hit]
+        return slots
+
+    def insert_many(self, hashes: np.ndarray,
+                    priority: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Vectorized find_or_insert() over an array of distinct context hashes.
+
+        Contexts are claimed in rounds, at most one per bucket per round,
+        with the same victim rule as find_or_insert (first empty way, else
+        least priority). Later claims can evict earlier ones from the same
+        batch when a bucket overflows, exactly as sequential inserts would.
+
+        Args:
+            hashes: Distinct 32-bit context hashes
+            priority: Optional per-hash replacement priority to record
+
+        Returns:
+            int64 array of slots (-1 for contexts evicted within the batch)
+        """
+        base_all, check_all = self._split_many(hashes)
+        n = len(base_all)
+        prio = (np.zeros(n, dtype=np.uint16) if priority is None
+                else np.minimum(priority, 65535).astype(np.uint16))
+
+        slots = self.lookup(hashes)
+        pending = np.flatnonzero(slots < 0)
+        way_offsets = np.arange(self.ways, dtype=np.int64)
+
+        while len(pending):
+            # One claim per bucket this round
+            _, first = np.unique(base_all[pending], return_index=True)
+            claim = pending[first]
+
+            candidates = base_all[claim][:, np.newaxis] + way_offsets
+            rank = self.priority[candidates].astype(np.int64)
+            rank[self.checks[candidates] == 0] = -1  # Empty ways win
+            victims = candidates[np.arange(len(claim)), np.argmin(rank, axis=1)]
+
+            self.rows[victims] = 0
+            self.checks[victims] = check_all[claim]
+            self.priority[victims] = prio[claim]
+
+            keep = np.ones(len(pending), dtype=bool)
+            keep[first] = False
+            pending = pending[keep]
+
+        # Re-resolve: overflowing buckets may have evicted earlier claims
+        slots = self.lookup(hashes)
+        if priority is not None:
+            resident = slots >= 0
+            self.priority[slots[resident]] = prio[resident]
+        return slots
+
+    def __len__(self) -> int:
+        """Number of occupied slots."""
+        return int(np.count_nonzero(self.checks))
+
+    @property
+    def nbytes(self) -> int:
+        """Fixed memory footprint of the table."""
+        return self.rows.nbytes + self.checks.nbytes + self.priority.nbytes
+
+
 class ContextModel:
     """
     Single-context prediction model.
     
-    Uses a hash table to track byte frequencies given a context.
+    Uses a fixed-size slotted table to track byte frequencies given a
+    context. Counters are uint8 and halve on overflow (recent evidence
+    dominates), and the row total doubles as the replacement priority.
+    
+    table_bits is an upper bound: an order-k context takes at most 256**k
+    values, so low orders get a table of 8k + 1 bits (one bit of slack for
+    the 2-way buckets) instead of rows they could never fill.
     """
     
     def __init__(self, context_size: int, table_bits: int = 16):
         self.context_size = context_size
+        table_bits = min(table_bits, 8 * context_size + 1)
+        self.table_bits = table_bits
         self.table_size = 1 << table_bits
         self.mask = self.table_size - 1
         
-        # For each hash bucket: count[256] for each byte
-        # Use sparse storage for memory efficiency
-        self._counts: Dict[int, np.ndarray] = {}
-        
-        # Total count per bucket
-        self._totals: Dict[int, int] = {}
+        # For each slot: count[256] for each byte, total in table.priority
+        self._table = SlottedTable(table_bits) if context_size > 0 else None
     
     def _hash_context(self, context: bytes) -> int:
-        """Hash the context bytes to a table index."""
+        """Hash the context bytes to a 32-bit value (the table picks the slot)."""
         if len(context) < self.context_size:
             context = b'\x00' * (self.context_size - len(context)) + context
         
@@ -63,7 +222,7 @@ class ContextModel:
             h ^= b
             h = (h * 16777619) & 0xFFFFFFFF
         
-        return h & self.mask
+        return h
     
     def predict(self, context: bytes) -> np.ndarray:
         """
@@ -75,11 +234,11 @@ class ContextModel:
             # Order-0: uniform distribution
             return np.ones(256) / 256
         
-        h = self._hash_context(context)
+        slot = self._table.find(self._hash_context(context))
         
-        if h in self._counts:
-            counts = self._counts[h].astype(np.float64)
-            total = self._totals[h]
+        if slot >= 0:
+            counts = self._table.rows[slot].astype(np.float64)
+            total = int(self._table.priority[slot])
             # Laplace smoothing
             return (counts + 1) / (total + 256)
         else:
@@ -91,29 +250,25 @@ class ContextModel:
         if self.context_size == 0:
             return
         
-        h = self._hash_context(context)
-        
-        if h not in self._counts:
-            self._counts[h] = np.zeros(256, dtype=np.uint16)
-            self._totals[h] = 0
+        table = self._table
+        slot = table.find_or_insert(self._hash_context(context))
+        row = table.rows[slot]
         
         # Increment count (with overflow protection)
-        if self._counts[h][actual_byte] < 65535:
-            self._counts[h][actual_byte] += 1
-            self._totals[h] += 1
-        else:
+        if row[actual_byte] == 255:
             # Rescale to prevent overflow
-            self._counts[h] = (self._counts[h] // 2).astype(np.uint16)
-            self._totals[h] = int(np.sum(self._counts[h]))
-            self._counts[h][actual_byte] += 1
-            self._totals[h] += 1
+            row >>= 1
+            table.priority[slot] = int(row.sum(dtype=np.uint32))
+        row[actual_byte] += 1
+        table.priority[slot] += 1
     
     def get_stats(self) -> Dict:
         """Get model statistics."""
         return {
             'context_size': self.context_size,
-            'buckets_used': len(self._counts),
+            'buckets_used': len(self._table) if self._table is not None else 0,
             'table_size': self.table_size,
+            'table_bytes': self._table.nbytes if self._table is not None else 0,
         }
 
 
@@ -300,26 +455,30 @@ class GeometricParallelMixer:
     # Context sizes: The N-Frame windows
     CONTEXT_SIZES = np.array([1, 2, 4, 8], dtype=np.int32)
     
-    # FNV-1a constants
-    FNV_OFFSET = np.uint64(2166136261)
-    FNV_PRIME = np.uint64(16777619)
+    # Working-set ceiling for predict_batch_fast tiles (16 MB)
+    TILE_MEMORY_BYTES = 16 * 1024 * 1024
+    
+    # Tile buffers per position: mixed + weighted probs (uint32) + gathered rows (uint8)
+    _TILE_BYTES_PER_POSITION = 256 * (4 + 4 + 1)
+    
+    # FNV-1a constants (uint32: the multiply wraps mod 2^32 natively)
+    FNV_OFFSET = np.uint32(2166136261)
+    FNV_PRIME = np.uint32(16777619)
     
     def __init__(self, table_bits: int = 18):
         self.table_bits = table_bits
         self.table_size = 1 << table_bits
         self.mask = np.uint32(self.table_size - 1)
         
-        # Quantized probability tables: hash -> uint8[256]
+        # Quantized probability tables: fixed slotted table of uint8[256] rows
         # 8-bit quantization: 0-255 maps to probability 0.0-1.0
-        self._qtables: Dict[int, np.ndarray] = {}
+        self._qtables = SlottedTable(table_bits)
         
         # Mixing weights: 8-bit quantized (sum to 256)
         self._qweights = np.array([64, 64, 64, 64], dtype=np.uint8)  # Equal weights
         
-        # Pre-compute FNV prime powers for vectorized hashing
-        self._prime_powers = np.array([
-            self.FNV_PRIME ** i for i in range(9)
-        ], dtype=np.uint64)
+        # Tile working set of the last predict_batch_fast call
+        self._last_tile_bytes = 0
     
     def _vectorized_multi_hash(self, data: bytes) -> Dict[int, np.ndarray]:
         """
@@ -329,41 +488,38 @@ class GeometricParallelMixer:
         The last 1, 2, 4, and 8 bytes form N-Frame windows.
         We compute hashes for the ENTIRE frame in parallel.
         
-        Returns dict: context_size -> array of hashes for each position.
+        The windows are nested, so the hash walks backwards from the most
+        recent byte: the order-k hash is the FNV-1a state after
+        data[i-1], data[i-2], ..., data[i-k], and order 2k continues from
+        it in place. One sliding_window_view over the (zero-padded) frame
+        supplies every offset without index arrays or copies, and uint32
+        arithmetic wraps mod 2^32 without masking.
+        
+        Position i never sees data[i] itself: the window is strictly
+        the past. Positions i < k hash zero padding for the missing bytes.
+        
+        Returns dict: context_size -> array of 32-bit hashes for each position
+        (the slotted table derives slot and check value from them).
         """
-        n = len(data)
-        data_arr = np.frombuffer(data, dtype=np.uint8).astype(np.uint64)
+        data_arr = np.frombuffer(data, dtype=np.uint8)
+        n = len(data_arr)
+        max_ctx = int(self.CONTEXT_SIZES.max())
+        
+        # Row i of the view is data[i-max_ctx : i] (zero-padded at the start)
+        padded = np.zeros(n + max_ctx, dtype=np.uint8)
+        padded[max_ctx:] = data_arr
+        windows = np.lib.stride_tricks.sliding_window_view(padded, max_ctx)[:n]
         
         result = {}
+        hashes = np.full(n, self.FNV_OFFSET, dtype=np.uint32)
+        wanted = {int(k) for k in self.CONTEXT_SIZES}
         
-        for ctx_size in self.CONTEXT_SIZES:
-            # Create sliding window views
-            hashes = np.full(n, self.FNV_OFFSET, dtype=np.uint64)
-            
-            # Vectorized FNV-1a: process all positions in parallel
-            for offset in range(ctx_size):
-                # Positions where we have enough context
-                valid_start = offset + 1
-                if valid_start > n:
-                    continue
-                
-                # Shift to get the context byte at this offset from current position
-                # For position i, context byte is at i - ctx_size + offset
-                context_indices = np.arange(valid_start - 1, n - ctx_size + offset + 1)
-                target_indices = np.arange(ctx_size - offset, n)
-                
-                if len(context_indices) > 0 and len(target_indices) > 0:
-                    min_len = min(len(context_indices), len(target_indices))
-                    context_indices = context_indices[:min_len]
-                    target_indices = target_indices[:min_len]
-                    
-                    # XOR step
-                    hashes[target_indices] ^= data_arr[context_indices]
-                    # Multiply step (vectorized)
-                    hashes[target_indices] = (hashes[target_indices] * self.FNV_PRIME) & 0xFFFFFFFF
-            
-            # Apply mask
-            result[int(ctx_size)] = (hashes & self.mask).astype(np.uint32)
+        for m in range(1, max_ctx + 1):
+            # Fold in data[i-m] for every position at once
+            np.bitwise_xor(hashes, windows[:, max_ctx - m], out=hashes)
+            np.multiply(hashes, self.FNV_PRIME, out=hashes)
+            if m in wanted:
+                result[m] = hashes.copy()
         
         return result
     
@@ -387,44 +543,50 @@ class GeometricParallelMixer:
         THE PHYSICS:
         The entire 233KB frame is processed as a single operation.
         Byte frequencies are accumulated into 8-bit quantized tables.
+        
+        Counting is sort-based: every (context hash, byte) observation of
+        every order becomes one uint64 key, a single np.unique groups and
+        counts them, and contexts fall out as contiguous runs. Cost is
+        O(n log n) for the frame, independent of how many contexts appear.
         """
-        n = len(data)
         data_arr = np.frombuffer(data, dtype=np.uint8)
         
         # Compute ALL hashes for ALL context sizes at once
         all_hashes = self._vectorized_multi_hash(data)
         
-        # Accumulate frequencies using numpy bincount for speed
-        temp_tables: Dict[int, np.ndarray] = {}
+        # One key per (context, byte) observation: hash high, byte in the low 8 bits.
+        # Positions without a full window are skipped, as in prediction.
+        keys = np.concatenate([
+            (hashes[ctx_size:].astype(np.uint64) << np.uint64(8)) | data_arr[ctx_size:]
+            for ctx_size, hashes in all_hashes.items()
+        ])
+        if len(keys) == 0:
+            return
+        
+        # Sort-based counting: a single pass groups every (context, byte) pair
+        pair_keys, pair_counts = np.unique(keys, return_counts=True)
+        pair_hashes = (pair_keys >> np.uint64(8)).astype(np.uint32)
+        pair_bytes = (pair_keys & np.uint64(0xFF)).astype(np.intp)
         
-        for ctx_size, hashes in all_hashes.items():
-            # Get valid range (positions with enough context)
-            valid_hashes = hashes[ctx_size:]
-            valid_bytes = data_arr[ctx_size:]
-            
-            # Find unique hashes and accumulate counts
-            unique_hashes = np.unique(valid_hashes)
-            
-            for h in unique_hashes:
-                h = int(h)
-                mask = valid_hashes == h
-                byte_vals = valid_bytes[mask]
-                
-                if h not in temp_tables:
-                    temp_tables[h] = np.zeros(256, dtype=np.uint32)
-                
-                # Vectorized counting with bincount
-                counts = np.bincount(byte_vals, minlength=256)
-                temp_tables[h] += counts.astype(np.uint32)
-        
-        # Quantize to 8-bit probabilities
-        for h, counts in temp_tables.items():
-            total = counts.sum()
-            if total > 0:
-                # Laplace smoothing + quantization
-                probs = (counts + 1) / (total + 256)
-                # Quantize to 8-bit (0-255)
-                self._qtables[h] = (probs * 255).astype(np.uint8)
+        # Pairs are sorted by hash, so each context is a contiguous run
+        starts = np.flatnonzero(np.r_[True, pair_hashes[1:] != pair_hashes[:-1]])
+        context_hashes = pair_hashes[starts]
+        totals = np.add.reduceat(pair_counts, starts)
+        group = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(pair_keys)]))
+        
+        # Claim (or refresh) a slot per context; evidence is the priority
+        slots = self._qtables.insert_many(context_hashes, totals)
+        resident = slots >= 0
+        self._qtables.rows[slots[resident]] = 0
+        
+        # Laplace smoothing + quantization to 8-bit (0-255).
+        # Unseen bytes quantize to 0: 255 / (total + 256) < 1.
+        probs = (pair_counts + 1) / (totals[group] + 256)
+        qprobs = (probs * 255).astype(np.uint8)
+        
+        pair_slots = slots[group]
+        keep = pair_slots >= 0
+        self._qtables.rows[pair_slots[keep], pair_bytes[keep]] = qprobs[keep]
     
     def predict_vectorized(self, data: bytes) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -454,7 +616,7 @@ class GeometricParallelMixer:
         for ctx_idx, ctx_size in enumerate(self.CONTEXT_SIZES):
             ctx_size = int(ctx_size)
             weight = self._qweights[ctx_idx]
-            hashes = all_hashes[ctx_size]
+            slots = self._qtables.lookup(all_hashes[ctx_size])
             
             # Positions with enough context
             for i in range(n):
@@ -462,10 +624,10 @@ class GeometricParallelMixer:
                     # Not enough context - add uniform weighted contribution
                     mixed_probs[i] += weight
                 else:
-                    h = int(hashes[i])
-                    if h in self._qtables:
+                    slot = slots[i]
+                    if slot >= 0:
                         # Add weighted quantized probability
-                        mixed_probs[i] += (self._qtables[h].astype(np.uint16) * weight) >> 8
+                        mixed_probs[i] += (self._qtables.rows[slot].astype(np.uint16) * weight) >> 8
                     else:
                         mixed_probs[i] += weight
         
@@ -488,80 +650,92 @@ class GeometricParallelMixer:
         
         return ranks, qprobs
     
-    def predict_batch_fast(self, data: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    def predict_batch_fast(self, data: bytes,
+                           max_tile_bytes: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Ultra-fast batch prediction using precomputed lookup.
         
         THE PHYSICS:
         The 4D projection collapses to pixel coordinates.
         We precompute the probability matrix and vectorize all rank calculations.
+        
+        Only a fixed block (tile) of positions is rendered at a time: the
+        (tile, 256) mixed matrix and its temporaries are allocated once and
+        reused, so peak memory is set by max_tile_bytes rather than by the
+        frame length. Results are identical for any tile size.
+        
+        Args:
+            data: Frame to predict
+            max_tile_bytes: Working-set ceiling for the tile buffers
+                            (default: TILE_MEMORY_BYTES)
+        
+        Returns:
+            ranks: uint8 array of prediction ranks
+            qprobs: uint8 array of quantized probabilities for actual bytes
         """
         n = len(data)
         data_arr = np.frombuffer(data, dtype=np.uint8)
+        ceiling = self.TILE_MEMORY_BYTES if max_tile_bytes is None else max_tile_bytes
+        tile = max(1, min(n, ceiling // self._TILE_BYTES_PER_POSITION))
         
-        # Compute all hashes
+        # Compute all hashes (O(n), not O(n * 256))
         all_hashes = self._vectorized_multi_hash(data)
+        rows = self._qtables.rows
         
-        # Convert qtables to dense array for vectorized lookup
-        # Find all unique hashes across all context sizes
-        unique_hashes = set()
-        for hashes in all_hashes.values():
-            unique_hashes.update(hashes.tolist())
-        
-        # Create hash-to-index mapping for dense storage
-        hash_to_idx = {h: i for i, h in enumerate(unique_hashes)}
-        num_hashes = len(unique_hashes)
-        
-        # Build dense probability array: (num_hashes, 256)
-        dense_probs = np.ones((num_hashes, 256), dtype=np.uint8)  # Default uniform
-        for h, idx in hash_to_idx.items():
-            if h in self._qtables:
-                dense_probs[idx] = self._qtables[h]
-        
-        # Build index arrays for each context size
-        idx_arrays = {}
-        for ctx_size in self.CONTEXT_SIZES:
-            ctx_size = int(ctx_size)
-            hashes = all_hashes[ctx_size]
-            idx_arrays[ctx_size] = np.array([hash_to_idx[int(h)] for h in hashes])
-        
-        # Compute mixed probabilities using advanced indexing
-        mixed_probs = np.zeros((n, 256), dtype=np.uint32)
+        ranks = np.zeros(n, dtype=np.uint8)
+        qprobs = np.zeros(n, dtype=np.uint8)
         
-        for ctx_idx, ctx_size in enumerate(self.CONTEXT_SIZES):
-            ctx_size = int(ctx_size)
-            weight = int(self._qweights[ctx_idx])
-            indices = idx_arrays[ctx_size]
+        # Tile buffers, reused for every block of positions
+        mixed_buf = np.empty((tile, 256), dtype=np.uint32)
+        probs_buf = np.empty((tile, 256), dtype=np.uint32)
+        rows_buf = np.empty((tile, 256), dtype=np.uint8)
+        self._last_tile_bytes = mixed_buf.nbytes + probs_buf.nbytes + rows_buf.nbytes
+        
+        for start in range(0, n, tile):
+            end = min(start + tile, n)
+            t = end - start
+            mixed_probs = mixed_buf[:t]
+            probs = probs_buf[:t]
+            gathered = rows_buf[:t]
+            mixed_probs.fill(0)
+            positions = np.arange(start, end)
             
-            # Lookup and weight - vectorized across all positions
-            # Shape: (n, 256)
-            probs = dense_probs[indices].astype(np.uint32)
+            for ctx_idx, ctx_size in enumerate(self.CONTEXT_SIZES):
+                ctx_size = int(ctx_size)
+                weight = int(self._qweights[ctx_idx])
+                
+                # Resolve this block's slots in the fixed table (-1 = not resident)
+                slots = self._qtables.lookup(all_hashes[ctx_size][start:end])
+                resident = slots >= 0
+                
+                # Lookup and weight, uniform (1) where the context is not
+                # resident or the window is not yet full
+                np.take(rows, np.where(resident, slots, 0), axis=0, out=gathered)
+                probs[...] = gathered
+                probs[~resident | (positions < ctx_size)] = 1
+                probs *= weight
+                mixed_probs += probs
             
-            # Apply context validity mask
-            validity = np.arange(n) >= ctx_size
-            probs[~validity] = 1  # Uniform for positions without enough context
+            # Normalize
+            totals = mixed_probs.sum(axis=1)
+            totals = np.maximum(totals, 1)
             
-            mixed_probs += probs * weight
-        
-        # Normalize
-        totals = mixed_probs.sum(axis=1, keepdims=True)
-        totals = np.maximum(totals, 1)
-        
-        # Get actual byte probabilities
-        actual_probs = mixed_probs[np.arange(n), data_arr]
-        qprobs = ((actual_probs * 255) // totals.flatten()).astype(np.uint8)
-        
-        # Vectorized rank calculation
-        # ranks[i] = number of bytes with probability > actual_probs[i]
-        # Broadcast comparison: (n, 256) > (n, 1)
-        ranks = (mixed_probs > actual_probs[:, np.newaxis]).sum(axis=1).astype(np.uint8)
+            # Get actual byte probabilities
+            actual_probs = mixed_probs[np.arange(t), data_arr[start:end]]
+            qprobs[start:end] = ((actual_probs * 255) // totals).astype(np.uint8)
+            
+            # Vectorized rank calculation
+            # ranks[i] = number of bytes with probability > actual_probs[i]
+            np.greater(mixed_probs, actual_probs[:, np.newaxis], out=gathered.view(bool))
+            ranks[start:end] = gathered.view(bool).sum(axis=1).astype(np.uint8)
         
         return ranks, qprobs
     
-    def get_compression_stats(self, data: bytes, use_fast: bool = True) -> Dict:
+    def get_compression_stats(self, data: bytes, use_fast: bool = True,
+                              max_tile_bytes: Optional[int] = None) -> Dict:
         """Get compression statistics using quantized predictions."""
         if use_fast:
-            ranks, qprobs = self.predict_batch_fast(data)
+            ranks, qprobs = self.predict_batch_fast(data, max_tile_bytes)
         else:
             ranks, qprobs = self.predict_vectorized(data)
         
@@ -584,6 +758,8 @@ class GeometricParallelMixer:
             'quantization_bits': 8,
             'context_sizes': self.CONTEXT_SIZES.tolist(),
             'table_entries': len(self._qtables),
+            'table_bytes': self._qtables.nbytes,
+            'peak_tile_bytes': self._last_tile_bytes if use_fast else None,
         }
 
 
@@ -616,28 +792,30 @@ class FastContextMixer:
     
     def _vectorized_hash(self, data: bytes) -> np.ndarray:
         """
-        Vectorized context hashing using rolling hash.
+        Vectorized context hashing over the whole input.
         
         THE PHYSICS:
         The context forms a "window" that slides across the data.
         We compute all hashes in parallel using NumPy.
-        """
-        n = len(data)
-        hashes = np.zeros(n, dtype=np.uint32)
         
-        # Pre-compute powers of the FNV multiplier
-        mult = 16777619
+        Position i hashes data[max(0, i - context_size):i] in forward order
+        (identical to _hash_context). FNV-1a cannot drop its oldest byte, so
+        instead of a per-position loop we run context_size whole-array
+        passes: pass m folds data[i-m] into every position that has it.
+        Cost is O(n * context_size) in NumPy, with no Python per byte.
+        """
+        data_arr = np.frombuffer(data, dtype=np.uint8)
+        n = len(data_arr)
+        hashes = np.full(n, 2166136261, dtype=np.uint32)
+        prime = np.uint32(16777619)
         
-        # For small context, use direct computation
-        for i in range(n):
-            start = max(0, i - self.context_size)
-            h = 2166136261
-            for j in range(start, i):
-                h ^= data[j]
-                h = (h * mult) & 0xFFFFFFFF
-            hashes[i] = h & self.mask
+        for m in range(min(self.context_size, n), 0, -1):
+            # Positions i >= m receive data[i - m]
+            h = hashes[m:]
+            np.bitwise_xor(h, data_arr[:n - m], out=h)
+            np.multiply(h, prime, out=h)
         
-        return hashes
+        return hashes & np.uint32(self.mask)
     
     def train(self, data: bytes):
         """
@@ -798,6 +976,184 @@ class FastContextMixer:
         return bytes(result[len(seed_context):])
 
 
+# Logistic domain helpers (integer, so encoder and decoder agree bit-for-bit)
+_SQUASH_POINTS = [
+    1, 2, 3, 6, 10, 16, 27, 45, 73, 120, 194, 310, 488, 747, 1101,
+    1546, 2047, 2549, 2994, 3348, 3607, 3785, 3901, 3975, 4024,
+    4050, 4068, 4079, 4085, 4089, 4092, 4093, 4094,
+]
+
+
+def squash(d: int) -> int:
+    """
+    Logistic function 4096 / (1 + e^(-d/256)) in integer arithmetic.
+
+    Maps the stretched domain [-2047, 2047] back to a 12-bit probability.
+    """
+    if d > 2047:
+        return 4095
+    if d < -2047:
+        return 1
+    w = d & 127
+    i = (d >> 7) + 16
+    return (_SQUASH_POINTS[i] * (128 - w) + _SQUASH_POINTS[i + 1] * w + 64) >> 7
+
+
+def _build_stretch_table() -> List[int]:
+    """Invert squash: stretch(p) = ln(p / (1 - p)) scaled by 256."""
+    table = [0] * 4096
+    pi = 0
+    for x in range(-2047, 2048):
+        v = squash(x)
+        for j in range(pi, v + 1):
+            table[j] = x
+        pi = v + 1
+    for j in range(pi, 4096):
+        table[j] = 2047
+    return table
+
+
+_STRETCH_TABLE = _build_stretch_table()
+
+
+def stretch(p: int) -> int:
+    """Inverse of squash for a 12-bit probability."""
+    return _STRETCH_TABLE[p]
+
+
+class AdaptiveBitMixer:
+    """
+    Adaptive bitwise context mixer for the range coder.
+
+    THE PHYSICS:
+    The decompressor cannot see the future, so the crystal must learn
+    exactly as the bytes arrive. Each byte is split into 8 binary
+    decisions; every N-Frame window (the same 1, 2, 4, 8-byte contexts as
+    GeometricParallelMixer, plus order 0) predicts the next bit, and a
+    logistic mixer learns how far to trust each window.
+
+    Encoder and decoder run the identical integer update sequence, so
+    only the range-coded bits travel on the wire.
+
+    Interface (used by core.range_coder):
+    - predict() -> 12-bit probability that the next bit is 1
+    - update(bit) -> learn the actual bit
+    """
+
+    CONTEXT_SIZES = [0] + GeometricParallelMixer.CONTEXT_SIZES.tolist()
+
+    # FNV-1a constants
+    FNV_OFFSET = 2166136261
+    FNV_PRIME = 16777619
+
+    # Fibonacci hashing multiplier (2^32 / phi) spreads (window, partial byte)
+    GOLDEN_MULT = 0x9E3779B1
+
+    # Confidence saturates here: the adaptation rate floors at 1/(LIMIT+1.5)
+    COUNT_LIMIT = 60
+
+    # Mixer learning rate (16.16 fixed point, ~0.01 in the float domain)
+    LEARNING_RATE = 41
+
+    def __init__(self, table_bits: int = 22):
+        if table_bits < 8 or table_bits > 30:
+            raise ValueError(f"table_bits must be in [8, 30], got {table_bits}")
+
+        from array import array
+
+        self.table_bits = table_bits
+        self._shift = 32 - table_bits
+
+        # One shared slot table for all orders: 16-bit P(1) + 8-bit confidence
+        self._probs = array('H', [32768]) * (1 << table_bits)
+        self._counts = array('B', [0]) * (1 << table_bits)
+
+        # Adaptation rates: 65536 / (n + 1.5)
+        self._rates = [int(65536 / (n + 1.5)) for n in range(self.COUNT_LIMIT + 1)]
+
+        # Mixer weights (16.16 fixed point), one per N-Frame window
+        n_inputs = len(self.CONTEXT_SIZES)
+        self._weights = [19661] * n_inputs  # 0.3
+        self._inputs = [0] * n_inputs
+        self._pr = 2048
+
+        self._history = bytearray()
+        self._c0 = 1  # Partial byte with a leading 1 bit
+        self._hashes = [0] * n_inputs
+        self._slots = [0] * n_inputs
+        self._update_hashes()
+        self._select_slots()
+
+    def _update_hashes(self):
+        """Hash each N-Frame window once per byte."""
+        history = self._history
+        for k, ctx_size in enumerate(self.CONTEXT_SIZES):
+            h = self.FNV_OFFSET
+            if ctx_size:
+                for b in history[-ctx_size:]:
+                    h = ((h ^ b) * self.FNV_PRIME) & 0xFFFFFFFF
+            # Salt with the order so equal windows of different size differ
+            self._hashes[k] = ((h ^ ctx_size) * self.FNV_PRIME) & 0xFFFFFFFF
+
+    def _select_slots(self):
+        """Combine each window hash with the partial byte into a table slot."""
+        c0 = self._c0
+        shift = self._shift
+        mult = self.GOLDEN_MULT
+        slots = self._slots
+        for k, h in enumerate(self._hashes):
+            slots[k] = (((h + c0) * mult) & 0xFFFFFFFF) >> shift
+
+    def predict(self) -> int:
+        """Mixed 12-bit probability that the next bit is 1."""
+        probs = self._probs
+        inputs = self._inputs
+        weights = self._weights
+        dot = 0
+        for k, slot in enumerate(self._slots):
+            st = _STRETCH_TABLE[probs[slot] >> 4]
+            inputs[k] = st
+            dot += weights[k] * st
+
+        pr = squash(dot >> 16)
+        self._pr = pr
+        return pr
+
+    def update(self, bit: int):
+        """Learn the actual bit and advance the context."""
+        # 1. Train the mixer on its own error
+        err = ((bit << 12) - self._pr) * self.LEARNING_RATE
+        weights = self._weights
+        for k, st in enumerate(self._inputs):
+            weights[k] += (st * err) >> 16
+
+        # 2. Move every window's counter toward the bit
+        probs = self._probs
+        counts = self._counts
+        rates = self._rates
+        target = 65535 if bit else 0
+        limit = self.COUNT_LIMIT
+
+        for slot in self._slots:
+            n = counts[slot]
+            p = probs[slot]
+            probs[slot] = p + (((target - p) * rates[n]) >> 16)
+            if n < limit:
+                counts[slot] = n + 1
+
+        # 3. Advance the partial byte (and the windows on a byte boundary)
+        c0 = (self._c0 << 1) | bit
+        if c0 >= 256:
+            self._history.append(c0 & 0xFF)
+            if len(self._history) > 8:
+                del self._history[0]
+            self._c0 = 1
+            self._update_hashes()
+        else:
+            self._c0 = c0
+        self._select_slots()
+
+
 def run_verification():
     """Verify the Context Mixer functionality."""
     import time
@@ -808,7 +1164,7 @@ def run_verification():
     
     # Test 1: Basic prediction
     print("\n--- Test 1: Basic Prediction ---")
-    mixer = ContextMixer(table_bits=16)
+    mixer = ContextMixer()
     
     # Train on pattern
     pattern = b"the quick brown fox " * 100
@@ -913,6 +1269,7 @@ def run_verification():
     print(f"    Bits/byte: {stats['bits_per_byte']:.2f}")
     print(f"    Quantization: {stats['quantization_bits']}-bit")
     print(f"    Context sizes: {stats['context_sizes']}")
+    print(f"    Peak tile memory: {stats['peak_tile_bytes'] / 1024:.0f} KB")
     
     # Test 7: 8-bit Quantization verification
     print("\n--- Test 7: 8-bit Quantization Physics ---")
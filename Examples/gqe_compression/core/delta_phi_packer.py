@@ -238,22 +238,19 @@ class DeltaPhiPacker:
         else:
             # No prediction - store root index directly
             # 8 bits for 240 roots (fits in 8 bits)
-            for i in range(8):
-                stream.write_bit((entry.root_index >> i) & 1)
+            stream.write_bits(entry.root_index, 8)
         
         # Pack delta phase (quantized)
         phase_quant = int((entry.delta_phase / (2 * np.pi)) * (2 ** self.config.phase_bits))
         phase_quant = min(phase_quant, (2 ** self.config.phase_bits) - 1)
         
-        for i in range(self.config.phase_bits):
-            stream.write_bit((phase_quant >> i) & 1)
+        stream.write_bits(phase_quant, self.config.phase_bits)
         
         # Pack delta magnitude (quantized)
         mag_quant = int(entry.delta_magnitude * (2 ** self.config.mag_bits))
         mag_quant = min(mag_quant, (2 ** self.config.mag_bits) - 1)
         
-        for i in range(self.config.mag_bits):
-            stream.write_bit((mag_quant >> i) & 1)
+        stream.write_bits(mag_quant, self.config.mag_bits)
     
     def unpack_entries(self, data: bytes, count: int) -> List[LatticeEntry]:
         """
@@ -295,20 +292,14 @@ class DeltaPhiPacker:
                 root_index = int(sorted_indices[rank])
         else:
             # Read root index directly
-            root_index = 0
-            for i in range(8):
-                root_index |= (stream.read_bit() << i)
+            root_index = stream.read_bits(8)
         
         # Read delta phase
-        phase_quant = 0
-        for i in range(self.config.phase_bits):
-            phase_quant |= (stream.read_bit() << i)
+        phase_quant = stream.read_bits(self.config.phase_bits)
         delta_phase = (phase_quant / (2 ** self.config.phase_bits)) * 2 * np.pi
         
         # Read delta magnitude
-        mag_quant = 0
-        for i in range(self.config.mag_bits):
-            mag_quant |= (stream.read_bit() << i)
+        mag_quant = stream.read_bits(self.config.mag_bits)
         delta_magnitude = mag_quant / (2 ** self.config.mag_bits)
         
         return LatticeEntry(
@@ -336,8 +327,7 @@ class DeltaPhiPacker:
                     stream.write_bit(0)
                     stream.write_gamma(rank)
             else:
-                for i in range(8):
-                    stream.write_bit((root_idx >> i) & 1)
+                stream.write_bits(root_idx, 8)
             
             context.append(root_idx)
             if len(context) > self.config.context_size:
@@ -363,9 +353,7 @@ class DeltaPhiPacker:
                     sorted_indices = np.argsort(probs)[::-1]
                     root_idx = int(sorted_indices[rank])
             else:
-                root_idx = 0
-                for i in range(8):
-                    root_idx |= (stream.read_bit() << i)
+                root_idx = stream.read_bits(8)
             
             roots.append(root_idx)
             context.append(root_idx)
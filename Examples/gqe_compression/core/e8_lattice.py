@@ -12,6 +12,7 @@ Key operations:
 - Spinor class with position and phase
 - Spinor distance including angular component
 - Interference computation (constructive vs destructive)
+- SpinorBatch: N spinors as two contiguous arrays (36 bytes per spinor)
 
 Author: The Architect
 License: Public Domain
@@ -19,7 +20,7 @@ License: Public Domain
 
 import numpy as np
 from itertools import combinations, product
-from typing import List, Tuple, Optional, Union
+from typing import List, Tuple, Optional, Union, Sequence
 from dataclasses import dataclass, field
 import heapq
 
@@ -32,7 +33,7 @@ except ImportError:
 EPSILON = 1e-10
 
 
-@dataclass
+@dataclass(slots=True)
 class Spinor:
     """
     The fundamental information unit in The Architect's model.
@@ -44,6 +45,8 @@ class Spinor:
     Two spinors at the same position but different phases are DISTINCT.
     This enables interference-aware compression.
     
+    Slotted: no per-instance __dict__. For many spinors use SpinorBatch.
+    
     Attributes:
         position: 8D numpy array representing position in E8 space
         phase: Phase angle in radians [0, 2π)
@@ -140,6 +143,173 @@ def compute_interference(s1: Spinor, s2: Spinor) -> float:
     return np.cos(phase_diff)
 
 
+# ============================================================================
+# SpinorBatch: structure-of-arrays storage
+# ============================================================================
+
+# Row block for pairwise distances: (block, M, 8) float64 differences
+DISTANCE_BLOCK_BYTES = 1 << 25
+
+
+class SpinorBatch:
+    """
+    N spinors stored as two contiguous arrays.
+    
+    THE PHYSICS:
+    A Spinor object carries a dict-free header, a boxed float and an
+    8-element array of its own: hundreds of bytes to say 36. The batch
+    keeps every position in one (N, 8) float32 block and every phase in
+    one (N,) float32 block, so distance, interference and snapping run
+    over the whole field at once.
+    
+    Indexing with an integer returns a Spinor; slices, masks and index
+    arrays return a SpinorBatch. Iterating yields Spinors, so code that
+    expects a list of spinors keeps working.
+    
+    Attributes:
+        positions: (N, 8) float32 array
+        phases: (N,) float32 array in [0, 2π)
+    """
+    
+    __slots__ = ('positions', 'phases')
+    
+    def __init__(self, positions: np.ndarray, phases: Optional[np.ndarray] = None):
+        positions = np.ascontiguousarray(positions, dtype=np.float32)
+        if positions.ndim != 2 or positions.shape[1] != 8:
+            raise ValueError(f"positions must have shape (N, 8), got {positions.shape}")
+        if phases is None:
+            phases = np.zeros(len(positions), dtype=np.float32)
+        phases = np.asarray(phases, dtype=np.float64)
+        if phases.shape != (len(positions),):
+            raise ValueError(f"phases must have shape ({len(positions)},), got {phases.shape}")
+        
+        self.positions = positions
+        self.phases = np.ascontiguousarray(np.mod(phases, 2 * np.pi), dtype=np.float32)
+    
+    @classmethod
+    def from_spinors(cls, spinors: Sequence[Spinor]) -> 'SpinorBatch':
+        """Pack a sequence of Spinors into a batch."""
+        if isinstance(spinors, SpinorBatch):
+            return spinors
+        positions = np.array([s.position for s in spinors], dtype=np.float32).reshape(-1, 8)
+        phases = np.array([s.phase for s in spinors], dtype=np.float64)
+        return cls(positions, phases)
+    
+    def to_spinors(self) -> List[Spinor]:
+        """Unpack into a list of Spinors (float64 positions)."""
+        return [self[i] for i in range(len(self))]
+    
+    def __len__(self) -> int:
+        return len(self.phases)
+    
+    def __getitem__(self, key) -> Union[Spinor, 'SpinorBatch']:
+        if isinstance(key, (int, np.integer)):
+            return Spinor(self.positions[key].astype(np.float64), float(self.phases[key]))
+        return SpinorBatch(self.positions[key], self.phases[key])
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+    
+    def __repr__(self) -> str:
+        return f"SpinorBatch(n={len(self)})"
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the position and phase arrays."""
+        return self.positions.nbytes + self.phases.nbytes
+    
+    @property
+    def norms(self) -> np.ndarray:
+        """(N,) Euclidean norms of the positions."""
+        return np.linalg.norm(self.positions.astype(np.float64), axis=1)
+    
+    def distance(self, query: Spinor) -> np.ndarray:
+        """
+        spinor_distance from every spinor in the batch to one query.
+        
+        Returns:
+            (N,) float64 distances
+        """
+        return spinor_distance_matrix(
+            (np.asarray(query.position, dtype=np.float64)[None, :], np.array([query.phase])),
+            self
+        )[0]
+    
+    def pairwise_distance(self, other: Optional['SpinorBatch'] = None) -> np.ndarray:
+        """
+        spinor_distance between every pair (self[i], other[j]).
+        
+        Returns:
+            (N, M) float64 distance matrix (M = N when other is None)
+        """
+        return spinor_distance_matrix(self, self if other is None else other)
+    
+    def interference(self, query: Spinor) -> np.ndarray:
+        """
+        compute_interference between every spinor in the batch and a query.
+        
+        Returns:
+            (N,) float64 interference factors in [-1, +1]
+        """
+        return np.cos(query.phase - self.phases.astype(np.float64))
+    
+    def snap_to_e8(self) -> 'SpinorBatch':
+        """Snap every position to the E8 lattice, preserving phases."""
+        return SpinorBatch(snap_many_to_e8(self.positions), self.phases)
+
+
+def _spinor_arrays(spinors) -> Tuple[np.ndarray, np.ndarray]:
+    """(positions, phases) as float64 arrays for a batch, list or array pair."""
+    if isinstance(spinors, SpinorBatch):
+        return spinors.positions.astype(np.float64), spinors.phases.astype(np.float64)
+    if isinstance(spinors, tuple) and len(spinors) == 2 and isinstance(spinors[0], np.ndarray):
+        return (np.asarray(spinors[0], dtype=np.float64).reshape(-1, 8),
+                np.asarray(spinors[1], dtype=np.float64))
+    positions = np.array([s.position for s in spinors], dtype=np.float64).reshape(-1, 8)
+    phases = np.array([s.phase for s in spinors], dtype=np.float64)
+    return positions, phases
+
+
+def spinor_distance_matrix(spinors_a, spinors_b=None) -> np.ndarray:
+    """
+    Vectorized spinor_distance between two collections of spinors.
+    
+    Differences are taken exactly (not through the Gram expansion), in
+    row blocks of at most DISTANCE_BLOCK_BYTES, so coincident spinors
+    come out at exactly zero.
+    
+    Args:
+        spinors_a: SpinorBatch, list of Spinors, or (positions, phases)
+        spinors_b: Same; defaults to spinors_a
+    
+    Returns:
+        (N, M) float64 distance matrix
+    """
+    pos_a, ph_a = _spinor_arrays(spinors_a)
+    if spinors_b is None:
+        pos_b, ph_b = pos_a, ph_a
+    else:
+        pos_b, ph_b = _spinor_arrays(spinors_b)
+    
+    n, m = len(pos_a), len(pos_b)
+    out = np.empty((n, m), dtype=np.float64)
+    block = max(1, DISTANCE_BLOCK_BYTES // max(1, m * 8 * 8))
+    
+    for start in range(0, n, block):
+        stop = min(start + block, n)
+        diff = pos_a[start:stop, None, :] - pos_b[None, :, :]
+        euclid_sq = np.einsum('ijk,ijk->ij', diff, diff)
+        
+        phase_diff = ph_a[start:stop, None] - ph_b[None, :]
+        phase_diff = (phase_diff + np.pi) % (2 * np.pi) - np.pi
+        phase_component = np.abs(phase_diff) / np.pi
+        
+        out[start:stop] = np.sqrt(euclid_sq + phase_component ** 2)
+    
+    return out
+
+
 def generate_e8_roots() -> np.ndarray:
     """
     Generate all 240 roots of the E8 lattice.
@@ -218,30 +388,19 @@ def find_nearest_lattice_spinor(
     
     Args:
         query: Query spinor
-        lattice_spinors: List of lattice spinors to search
+        lattice_spinors: List of lattice spinors (or a SpinorBatch) to search
         prioritize_constructive: Whether to weight constructive interference
     
     Returns:
         (nearest_spinor, distance) tuple
     """
-    best_spinor = None
-    best_score = float('inf')
-    
-    for spinor in lattice_spinors:
-        if prioritize_constructive:
-            # Score combines distance and interference
-            dist = spinor_distance(query, spinor)
-            interference = compute_interference(query, spinor)
-            # Lower score is better; interference bonus when positive
-            score = dist * (2 - interference)  # Score in [dist, 3*dist]
-        else:
-            score = spinor_distance(query, spinor)
-        
-        if score < best_score:
-            best_score = score
-            best_spinor = spinor
+    distances, scores = _score_candidates(query, lattice_spinors, prioritize_constructive)
+    best = int(np.argmin(scores))
     
-    return best_spinor.copy(), spinor_distance(query, best_spinor)
+    nearest = lattice_spinors[best]
+    if not isinstance(lattice_spinors, SpinorBatch):
+        nearest = nearest.copy()
+    return nearest, float(distances[best])
 
 
 def find_k_nearest_spinors(
@@ -255,28 +414,38 @@ def find_k_nearest_spinors(
     
     Args:
         query: Query spinor
-        lattice_spinors: List of lattice spinors to search
+        lattice_spinors: List of lattice spinors (or a SpinorBatch) to search
         k: Number of nearest neighbors
         prioritize_constructive: Whether to weight constructive interference
     
     Returns:
         List of (spinor, distance) tuples, sorted by distance
     """
-    results = []
-    
-    for spinor in lattice_spinors:
-        if prioritize_constructive:
-            dist = spinor_distance(query, spinor)
-            interference = compute_interference(query, spinor)
-            score = dist * (2 - interference)
-        else:
-            score = spinor_distance(query, spinor)
-        
-        results.append((spinor.copy(), score, spinor_distance(query, spinor)))
+    distances, scores = _score_candidates(query, lattice_spinors, prioritize_constructive)
+    order = np.argsort(scores, kind='stable')[:k]
     
     # Sort by score, return with actual distance
-    results.sort(key=lambda x: x[1])
-    return [(r[0], r[2]) for r in results[:k]]
+    if isinstance(lattice_spinors, SpinorBatch):
+        return [(lattice_spinors[int(i)], float(distances[i])) for i in order]
+    return [(lattice_spinors[int(i)].copy(), float(distances[i])) for i in order]
+
+
+def _score_candidates(query: Spinor, candidates, prioritize_constructive: bool
+                      ) -> Tuple[np.ndarray, np.ndarray]:
+    """Distances and ranking scores of every candidate (lower score is better)."""
+    if len(candidates) == 0:
+        raise ValueError("No candidate spinors to search")
+    positions, phases = _spinor_arrays(candidates)
+    distances = spinor_distance_matrix(
+        (np.asarray(query.position, dtype=np.float64)[None, :], np.array([query.phase])),
+        (positions, phases)
+    )[0]
+    if not prioritize_constructive:
+        return distances, distances
+    
+    # Score combines distance and interference; in [dist, 3*dist]
+    interference = np.cos(query.phase - phases)
+    return distances, distances * (2 - interference)
 
 
 def compute_voronoi_neighbors(center: Spinor, lattice_spinors: List[Spinor]) -> List[Spinor]:
@@ -399,6 +568,40 @@ def snap_spinor_to_e8(spinor: Spinor) -> Spinor:
     return Spinor(snapped_pos, spinor.phase)
 
 
+def snap_many_to_e8(positions: np.ndarray) -> np.ndarray:
+    """
+    Vectorized snap_to_e8_lattice over the rows of an (N, 8) array.
+    
+    Row for row identical to snap_to_e8_lattice, including its parity
+    fix (the component with the smallest rounding offset is moved).
+    
+    Args:
+        positions: (N, 8) array
+    
+    Returns:
+        (N, 8) float64 array of E8 lattice points
+    """
+    v = np.asarray(positions, dtype=np.float64)
+    if v.ndim != 2 or v.shape[1] != 8:
+        raise ValueError(f"positions must have shape (N, 8), got {v.shape}")
+    rows = np.arange(len(v))
+    
+    def fix_parity(candidate: np.ndarray) -> np.ndarray:
+        odd = np.sum(candidate, axis=1) % 2 != 0
+        idx = np.argmin(np.abs(v - candidate), axis=1)
+        step = np.where(v[rows, idx] > candidate[rows, idx], 1.0, -1.0)
+        candidate[rows[odd], idx[odd]] += step[odd]
+        return candidate
+    
+    int_v = fix_parity(np.round(v))
+    half_v = fix_parity(np.round(v - 0.5) + 0.5)
+    
+    # Whichever coset is closer (ties go to the integer lattice)
+    dist_int = np.linalg.norm(v - int_v, axis=1)
+    dist_half = np.linalg.norm(v - half_v, axis=1)
+    return np.where((dist_int <= dist_half)[:, None], int_v, half_v)
+
+
 def run_verification() -> None:
     """Run verification tests for E8 spinor module."""
     print("=" * 60)
@@ -454,6 +657,22 @@ def run_verification() -> None:
         snapped = snap_to_e8_lattice(point)
         print(f"  {point} -> {snapped}")
     
+    # Test 7: SpinorBatch
+    print("\n--- Test 7: SpinorBatch (structure of arrays) ---")
+    import sys
+    rng = np.random.default_rng(0)
+    batch = SpinorBatch(rng.normal(size=(1000, 8)), rng.uniform(0, 2 * np.pi, 1000))
+    print(f"  Batch bytes per spinor: {batch.nbytes / len(batch):.0f}")
+    one = batch[0]
+    print(f"  Spinor object bytes (header + array): "
+          f"{sys.getsizeof(one) + sys.getsizeof(one.position) + sys.getsizeof(one.phase)}")
+    d = batch.distance(query)
+    print(f"  Vectorized distance matches scalar: "
+          f"{np.isclose(d[3], spinor_distance(query, batch[3]))}")
+    snapped = batch.snap_to_e8()
+    print(f"  Vectorized snap matches scalar: "
+          f"{np.array_equal(snapped.positions[5], snap_to_e8_lattice(batch.positions[5].astype(np.float64)))}")
+    
     print("\n" + "=" * 60)
     print("VERIFICATION COMPLETE")
     print("=" * 60)
@@ -21,6 +21,8 @@ Mathematical Foundation:
 - Galois Field GF(2^8) for byte-level operations
 - Polynomial evaluation at φ-derived points
 - Syndrome-based decoding with Berlekamp-Massey algorithm
+- Tables as uint8 arrays: thousands of interleaved codewords are encoded
+  and decoded in one batched pass (InterleavedRSCodec)
 - E8 lattice provides geometric interpretation
 
 Aligns with:
@@ -31,9 +33,12 @@ Author: The Architect
 License: Public Domain
 """
 
+import struct
+import zlib
 import numpy as np
 from typing import List, Tuple, Optional
 from dataclasses import dataclass
+from functools import lru_cache
 
 from .phi_adic import PHI, PHI_INV
 
@@ -154,6 +159,289 @@ def poly_scale(poly: List[int], scale: int) -> List[int]:
     return [GF.mul(c, scale) for c in poly]
 
 
+# ============================================================================
+# Vectorized GF(2^8) kernel - every codeword at once
+# ============================================================================
+
+# exp[i] = α^i (doubled, so a sum of two logs needs no mod); log[x] for x != 0
+GF_EXP = np.array(GF.exp_table, dtype=np.uint8)
+GF_LOG = np.array(GF.log_table, dtype=np.uint8)
+
+# Full multiplication table: GF_MUL[a, b] = a * b
+GF_MUL = np.zeros((256, 256), dtype=np.uint8)
+GF_MUL[1:, 1:] = GF_EXP[GF_LOG[1:, None].astype(np.int64) + GF_LOG[None, 1:]]
+
+# Multiplicative inverses (GF_INV[0] = 0 by convention)
+GF_INV = np.zeros(256, dtype=np.uint8)
+GF_INV[1:] = GF_EXP[255 - GF_LOG[1:].astype(np.int64)]
+
+# Codewords processed per pass of gf_matmul (keeps the working set in cache)
+GF_BATCH = 4096
+
+
+def gf_pow_alpha(exponents) -> np.ndarray:
+    """α^e for integer exponents (any sign)."""
+    return GF_EXP[np.mod(exponents, 255)]
+
+
+def gf_matmul(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Matrix product over GF(2^8).
+    
+    Each row of b's multiplication table is gathered once per inner index,
+    so the product costs one table lookup and one XOR per term, applied to
+    a whole batch of rows at a time.
+    
+    Args:
+        a: (R, K) uint8
+        b: (K, C) uint8
+    
+    Returns:
+        (R, C) uint8
+    """
+    a = np.asarray(a, dtype=np.uint8)
+    b = np.asarray(b, dtype=np.uint8)
+    rows, inner = a.shape
+    tables = GF_MUL[b]                            # (K, C, 256): multiples of b[i, j]
+    out = np.zeros((b.shape[1], rows), dtype=np.uint8)
+    for start in range(0, rows, GF_BATCH):
+        block = np.ascontiguousarray(a[start:start + GF_BATCH].T)
+        acc = out[:, start:start + GF_BATCH]
+        for i in range(inner):
+            acc ^= tables[i][:, block[i]]
+    return out.T
+
+
+def gf_poly_eval(coeffs: np.ndarray, exponents: np.ndarray) -> np.ndarray:
+    """
+    Evaluate many low-first polynomials, each at its own point α^e.
+    
+    Args:
+        coeffs: (P, D) uint8, coeffs[p, j] multiplies x^j
+        exponents: (P,) integer exponents of the evaluation points
+    
+    Returns:
+        (P,) uint8 values
+    """
+    if len(coeffs) == 0:
+        return np.zeros(0, dtype=np.uint8)
+    powers = gf_pow_alpha(np.outer(exponents, np.arange(coeffs.shape[1])))
+    return np.bitwise_xor.reduce(GF_MUL[coeffs, powers], axis=1)
+
+
+def berlekamp_massey(syndromes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Error locator polynomials for a batch of syndrome vectors.
+    
+    The classic iteration, run in lockstep over every codeword: each
+    step computes all discrepancies at once and applies the length
+    change only where the row's discrepancy calls for it.
+    
+    Args:
+        syndromes: (E, 2t) uint8
+    
+    Returns:
+        (locators, degrees): (E, 2t+1) low-first Λ(x), and (E,) L
+    """
+    n_words, n_syn = syndromes.shape
+    locator = np.zeros((n_words, n_syn + 1), dtype=np.uint8)
+    locator[:, 0] = 1
+    previous = locator.copy()
+    degree = np.zeros(n_words, dtype=np.int64)
+    
+    for i in range(n_syn):
+        # Discrepancy: Σ_j Λ_j S_(i-j)
+        delta = np.bitwise_xor.reduce(GF_MUL[locator[:, :i + 1], syndromes[:, i::-1]], axis=1)
+        previous = np.concatenate((np.zeros((n_words, 1), dtype=np.uint8), previous[:, :-1]), axis=1)
+        
+        grow = (delta != 0) & (2 * degree <= i)
+        updated = locator ^ GF_MUL[delta[:, None], previous]
+        previous = np.where(grow[:, None], GF_MUL[GF_INV[delta][:, None], locator], previous)
+        degree = np.where(grow, i + 1 - degree, degree)
+        locator = updated
+    
+    return locator, degree
+
+
+@lru_cache(maxsize=None)
+def _rs_tables(n: int, n_parity: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Generator, parity and syndrome matrices of RS(n, n - n_parity).
+    
+    Codewords are high-first: symbol i is the coefficient of x^(n-1-i),
+    data first, parity last. The generator's roots are α^0 ... α^(2t-1).
+    
+    Returns:
+        (generator, parity_matrix (k, 2t), syndrome_matrix (n, 2t))
+    """
+    # g(x) = Π (x + α^j), high-first
+    generator = [1]
+    for j in range(n_parity):
+        generator = poly_mul(generator, [1, GF.exp_table[j]])
+    generator = np.array(generator, dtype=np.uint8)
+    
+    # Row for exponent e: x^e mod g(x), built by repeated multiply-by-x
+    remainders = np.zeros((n, n_parity), dtype=np.uint8)
+    remainder = np.zeros(n_parity, dtype=np.uint8)
+    remainder[-1] = 1                               # x^0
+    for e in range(n):
+        remainders[e] = remainder
+        top = remainder[0]
+        remainder = np.append(remainder[1:], 0) ^ GF_MUL[top, generator[1:]]
+    parity_matrix = remainders[n - 1:n_parity - 1:-1]   # Data symbol i has exponent n-1-i
+    
+    # S_j = C(α^j) = Σ_i c_i α^(j(n-1-i))
+    exponents = np.arange(n - 1, -1, -1)
+    syndrome_matrix = gf_pow_alpha(np.outer(exponents, np.arange(n_parity)))
+    return generator, parity_matrix, syndrome_matrix
+
+
+class InterleavedRSCodec:
+    """
+    Systematic RS(n, k) over GF(2^8), interleaved across many codewords.
+    
+    THE PHYSICS:
+    "The curve connects the dots" - thousands of curves at once.
+    
+    A payload of m bytes is split over B = ceil(m / k) codewords with
+    byte i going to codeword i % B, so a burst of damage is spread thin
+    across all of them. The payload itself is stored unchanged; parity
+    follows, interleaved the same way. Encoding is one GF(2^8) matrix
+    product of all data rows with the parity matrix; decoding computes
+    every syndrome the same way and runs Berlekamp-Massey, Chien and
+    Forney only over the damaged codewords, all batched.
+    
+    Each codeword corrects up to n_parity // 2 symbol errors.
+    """
+    
+    def __init__(self, n_parity: int = 32, n: int = 255):
+        """
+        Args:
+            n_parity: Parity symbols per codeword (2t)
+            n: Codeword length, at most 255 (shorter codes are shortened)
+        """
+        if not 0 < n_parity < n <= 255:
+            raise ValueError(f"Need 0 < n_parity < n <= 255, got n_parity={n_parity}, n={n}")
+        self.n = n
+        self.n_parity = n_parity
+        self.k = n - n_parity
+        self.generator, self._parity_matrix, self._syndrome_matrix = _rs_tables(n, n_parity)
+    
+    def n_codewords(self, n_data: int) -> int:
+        """Codewords needed for n_data bytes."""
+        return -(-n_data // self.k)
+    
+    def encoded_length(self, n_data: int) -> int:
+        """Bytes written by encode() for n_data bytes."""
+        return n_data + self.n_codewords(n_data) * self.n_parity
+    
+    def encode_blocks(self, blocks: np.ndarray) -> np.ndarray:
+        """(B, k) data rows -> (B, 2t) parity rows."""
+        return gf_matmul(blocks, self._parity_matrix)
+    
+    def decode_blocks(self, codewords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Correct a batch of codewords.
+        
+        Args:
+            codewords: (B, n) uint8 received codewords
+        
+        Returns:
+            (corrected, n_errors): corrected (B, n) copy, and per-codeword
+            error counts (-1 where the damage exceeds the code; those rows
+            are returned as received)
+        """
+        corrected = np.array(codewords, dtype=np.uint8)
+        n_errors = np.zeros(len(corrected), dtype=np.int64)
+        syndromes = gf_matmul(corrected, self._syndrome_matrix)
+        damaged = np.flatnonzero(syndromes.any(axis=1))
+        if len(damaged) == 0:
+            return corrected, n_errors
+        syndromes = syndromes[damaged]
+        
+        # Error locators, then their roots over every position (Chien)
+        locator, degree = berlekamp_massey(syndromes)
+        width = int(degree.max()) + 1
+        locator = locator[:, :width]
+        positions = np.arange(self.n)
+        chien = gf_pow_alpha(-np.outer(np.arange(width), self.n - 1 - positions))
+        roots = gf_matmul(locator, chien) == 0
+        ok = (degree <= self.n_parity // 2) & (roots.sum(axis=1) == degree)
+        
+        # Forney: Ω(x) = S(x) Λ(x) mod x^2t, e = X Ω(X^-1) / Λ'(X^-1)
+        omega = np.zeros_like(syndromes)
+        for j in range(width):
+            omega[:, j:] ^= GF_MUL[locator[:, j:j + 1], syndromes[:, :self.n_parity - j]]
+        derivative = np.zeros_like(locator)
+        derivative[:, 0:width - 1:2] = locator[:, 1::2]
+        
+        rows, cols = np.nonzero(roots & ok[:, None])
+        exponents = self.n - 1 - cols
+        numerator = gf_poly_eval(omega[rows], -exponents)
+        denominator = gf_poly_eval(derivative[rows], -exponents)
+        magnitude = GF_MUL[gf_pow_alpha(exponents), GF_MUL[numerator, GF_INV[denominator]]]
+        
+        fixed = corrected[damaged]
+        fixed[rows, cols] ^= magnitude
+        
+        # Accept only rows that now lie on the code
+        ok &= ~gf_matmul(fixed, self._syndrome_matrix).any(axis=1)
+        corrected[damaged[ok]] = fixed[ok]
+        n_errors[damaged] = np.where(ok, degree, -1)
+        return corrected, n_errors
+    
+    def _interleave(self, payload: np.ndarray, n_blocks: int, width: int) -> np.ndarray:
+        """Byte i of payload -> row i % n_blocks (zero-padded to full rows)."""
+        padded = np.zeros(n_blocks * width, dtype=np.uint8)
+        padded[:len(payload)] = payload
+        return padded.reshape(width, n_blocks).T
+    
+    def encode(self, data: bytes) -> bytes:
+        """
+        Protect data: the data unchanged, then its interleaved parity.
+        
+        Returns:
+            data + parity, encoded_length(len(data)) bytes
+        """
+        n_blocks = self.n_codewords(len(data))
+        if n_blocks == 0:
+            return bytes(data)
+        blocks = self._interleave(np.frombuffer(data, dtype=np.uint8), n_blocks, self.k)
+        parity = self.encode_blocks(blocks)
+        return bytes(data) + np.ascontiguousarray(parity.T).tobytes()
+    
+    def decode(self, encoded: bytes, n_data: int) -> Tuple[bytes, int]:
+        """
+        Recover n_data bytes from (possibly damaged) encode() output.
+        
+        Missing trailing bytes count as damage.
+        
+        Returns:
+            (data, n_errors_corrected), n_errors -1 if any codeword failed
+            (its bytes are returned as received)
+        """
+        n_blocks = self.n_codewords(n_data)
+        if n_blocks == 0:
+            return b'', 0
+        raw = np.zeros(self.encoded_length(n_data), dtype=np.uint8)
+        received = np.frombuffer(encoded[:len(raw)], dtype=np.uint8)
+        raw[:len(received)] = received
+        
+        codewords = np.concatenate((
+            self._interleave(raw[:n_data], n_blocks, self.k),
+            self._interleave(raw[n_data:], n_blocks, self.n_parity),
+        ), axis=1)
+        corrected, n_errors = self.decode_blocks(codewords)
+        
+        # Padding past the payload is known to be zero
+        padding = np.arange(n_blocks * self.k).reshape(self.k, n_blocks).T >= n_data
+        failed = (n_errors < 0) | (corrected[:, :self.k] & padding).any(axis=1)
+        corrected[failed] = codewords[failed]
+        
+        data = corrected[:, :self.k].T.reshape(-1)[:n_data].tobytes()
+        return data, (-1 if failed.any() else int(n_errors.sum()))
+
+
 # ============================================================================
 # Reed-Solomon Encoder
 # ============================================================================
@@ -178,11 +466,13 @@ class GeometricRSEncoder:
     
     The encoding process:
     1. Treat input bytes as coefficients of a polynomial
-    2. Evaluate polynomial at n - k additional points
-    3. These evaluation points are φ-derived for geometric structure
+    2. Divide by the generator g(x) = (x - α^0)...(x - α^(n_parity-1))
+    3. The remainder is the parity: the codeword now vanishes at every root
     4. The result: k data bytes + (n-k) parity bytes
     
     The polynomial "curve" in GF(2^8) is analogous to a curve in E8 space.
+    Inputs longer than one codeword are interleaved over several
+    (see InterleavedRSCodec).
     """
     
     def __init__(self, n_parity: int = 32):
@@ -191,66 +481,35 @@ class GeometricRSEncoder:
         
         Args:
             n_parity: Number of parity symbols (determines error correction capability)
-                      Can correct up to n_parity/2 errors
+                      Can correct up to n_parity/2 errors per codeword
         """
         self.n_parity = n_parity
-        self.generator = self._build_generator_polynomial()
-    
-    def _build_generator_polynomial(self) -> List[int]:
-        """
-        Build the generator polynomial.
-        
-        g(x) = (x - α^0)(x - α^1)...(x - α^(n_parity-1))
-        
-        where α = 2 is the primitive element of GF(2^8).
-        """
-        g = [1]
-        for i in range(self.n_parity):
-            # Multiply by (x - α^i) = (x + α^i) in GF(2^8)
-            g = poly_mul(g, [GF.exp_table[i], 1])
-        return g
+        self.codec = InterleavedRSCodec(n_parity)
+        self.generator = self.codec.generator.tolist()
     
     def encode(self, data: bytes) -> RSCodeword:
         """
         Encode data with Reed-Solomon parity.
         
-        The data bytes are the coefficients of a polynomial.
-        We compute the remainder when divided by the generator,
-        which gives us the parity bytes.
-        
         Args:
             data: Input data bytes
         
         Returns:
             RSCodeword with data and parity
         """
-        n_data = len(data)
-        
-        # Treat data as polynomial coefficients (high degree first)
-        # Multiply by x^n_parity to make room for parity
-        msg_poly = list(data) + [0] * self.n_parity
-        
-        # Compute remainder = msg_poly mod generator
-        for i in range(n_data):
-            coef = msg_poly[i]
-            if coef != 0:
-                for j in range(len(self.generator)):
-                    msg_poly[i + j] ^= GF.mul(self.generator[j], coef)
-        
-        # The remainder (last n_parity bytes) is our parity
-        parity = bytes(msg_poly[-self.n_parity:])
+        encoded = self.codec.encode(data)
+        parity = encoded[len(data):]
         
         return RSCodeword(
             data=data,
             parity=parity,
-            n_data=n_data,
-            n_parity=self.n_parity
+            n_data=len(data),
+            n_parity=len(parity)
         )
     
     def encode_to_bytes(self, data: bytes) -> bytes:
         """Encode and return data + parity as single bytes object."""
-        codeword = self.encode(data)
-        return codeword.data + codeword.parity
+        return self.codec.encode(data)
 
 
 # ============================================================================
@@ -269,6 +528,7 @@ class GeometricRSDecoder:
     
     This is "the curve connects the dots" - we find the true curve
     from the uncorrupted points and use it to fix the corrupted ones.
+    All damaged codewords are corrected together (see InterleavedRSCodec).
     """
     
     def __init__(self, n_parity: int = 32):
@@ -279,124 +539,7 @@ class GeometricRSDecoder:
             n_parity: Number of parity symbols (must match encoder)
         """
         self.n_parity = n_parity
-    
-    def _compute_syndromes(self, codeword: bytes) -> List[int]:
-        """
-        Compute syndromes by evaluating received polynomial at α^1, α^2, ..., α^(n_parity).
-        
-        If there are no errors, all syndromes are zero.
-        Non-zero syndromes indicate the codeword is "off the curve."
-        """
-        # Syndromes are S_j = r(α^j) for j = 1 to n_parity
-        syndromes = [0] * (self.n_parity + 1)  # Extra slot for index convenience
-        for j in range(1, self.n_parity + 1):
-            syndromes[j] = poly_eval(list(codeword), GF.exp_table[j])
-        return syndromes
-    
-    def _berlekamp_massey(self, syndromes: List[int]) -> List[int]:
-        """
-        Berlekamp-Massey algorithm to find error locator polynomial.
-        
-        This finds the polynomial whose roots indicate error positions.
-        Geometrically: finds which points deviate from the curve.
-        """
-        # Working with syndromes[1] to syndromes[n_parity]
-        n = self.n_parity
-        
-        # Error locator polynomial: Λ(x) = 1 + Λ_1*x + Λ_2*x^2 + ...
-        # Stored as [Λ_0, Λ_1, Λ_2, ...] = [1, ...]
-        err_loc = [1] + [0] * n
-        old_loc = [1] + [0] * n
-        
-        L = 0  # Number of errors found
-        
-        for i in range(n):
-            # Compute discrepancy delta
-            delta = syndromes[i + 1]
-            for j in range(1, L + 1):
-                delta ^= GF.mul(err_loc[j], syndromes[i + 1 - j])
-            
-            # Shift old_loc
-            old_loc = [0] + old_loc[:-1]
-            
-            if delta != 0:
-                if 2 * L <= i:
-                    # Update L and save current err_loc
-                    new_loc = err_loc[:]
-                    for j in range(len(old_loc)):
-                        err_loc[j] ^= GF.mul(delta, old_loc[j])
-                    old_loc = [GF.mul(GF.inverse(delta), c) for c in new_loc]
-                    L = i + 1 - L
-                else:
-                    # Just update err_loc
-                    for j in range(len(old_loc)):
-                        err_loc[j] ^= GF.mul(delta, old_loc[j])
-        
-        # Trim trailing zeros
-        while len(err_loc) > 1 and err_loc[-1] == 0:
-            err_loc.pop()
-        
-        return err_loc
-    
-    def _chien_search(self, err_loc: List[int], msg_len: int) -> List[int]:
-        """
-        Chien search to find error positions.
-        
-        Find positions i where err_loc(α^(-i)) = 0.
-        These are the error locations.
-        """
-        n_errors = len(err_loc) - 1
-        positions = []
-        
-        for i in range(msg_len):
-            # Evaluate err_loc at α^(-i) = α^(255-i)
-            test_val = poly_eval(err_loc, GF.pow(2, 255 - i))
-            if test_val == 0:
-                positions.append(i)
-        
-        return positions
-    
-    def _forney_algorithm(self, syndromes: List[int], err_loc: List[int], 
-                          positions: List[int], msg_len: int) -> List[int]:
-        """
-        Forney algorithm to compute error magnitudes.
-        
-        Once we know which points are off the curve, this tells us
-        how much to adjust them to bring them back on.
-        """
-        n_errors = len(positions)
-        
-        # Build syndrome polynomial S(x) = S_1 + S_2*x + S_3*x^2 + ...
-        syn_poly = syndromes[1:self.n_parity + 1]
-        
-        # Error evaluator: Ω(x) = S(x) * Λ(x) mod x^(n_parity)
-        omega = poly_mul(syn_poly, err_loc)
-        omega = omega[:self.n_parity] if len(omega) > self.n_parity else omega
-        
-        # Formal derivative of Λ(x): Λ'(x) = Λ_1 + 0*x + Λ_3*x^2 + 0*x^3 + ...
-        # In GF(2), derivative eliminates even powers
-        err_loc_deriv = [0] * len(err_loc)
-        for i in range(1, len(err_loc), 2):
-            err_loc_deriv[i - 1] = err_loc[i]
-        
-        magnitudes = []
-        for pos in positions:
-            # X_i = α^(pos)
-            Xi_inv = GF.pow(2, 255 - pos)  # α^(-pos) = α^(255-pos)
-            
-            # Evaluate Ω(Xi_inv) and Λ'(Xi_inv)
-            omega_val = poly_eval(omega, Xi_inv) if omega else 0
-            deriv_val = poly_eval(err_loc_deriv, Xi_inv)
-            
-            if deriv_val == 0:
-                magnitudes.append(0)
-            else:
-                # Error magnitude: e_i = X_i * Ω(X_i^(-1)) / Λ'(X_i^(-1))
-                Xi = GF.pow(2, pos)
-                mag = GF.mul(Xi, GF.div(omega_val, deriv_val))
-                magnitudes.append(mag)
-        
-        return magnitudes
+        self.codec = InterleavedRSCodec(n_parity)
     
     def decode(self, received: bytes, n_data: int) -> Tuple[bytes, int]:
         """
@@ -407,45 +550,9 @@ class GeometricRSDecoder:
             n_data: Number of data bytes
         
         Returns:
-            (corrected_data, n_errors_corrected)
+            (corrected_data, n_errors_corrected), -1 if uncorrectable
         """
-        received_list = list(received)
-        msg_len = len(received)
-        
-        # Step 1: Compute syndromes
-        syndromes = self._compute_syndromes(received)
-        
-        # If all syndromes zero, no errors
-        if all(s == 0 for s in syndromes[1:]):
-            return bytes(received_list[:n_data]), 0
-        
-        # Step 2: Find error locator polynomial (Berlekamp-Massey)
-        err_loc = self._berlekamp_massey(syndromes)
-        
-        # Number of errors
-        n_errors = len(err_loc) - 1
-        
-        # Check if correctable
-        if n_errors > self.n_parity // 2:
-            # Too many errors - return what we have
-            return bytes(received_list[:n_data]), -1
-        
-        # Step 3: Find error positions (Chien search)
-        positions = self._chien_search(err_loc, msg_len)
-        
-        if len(positions) != n_errors:
-            # Couldn't find all error positions - decoding failure
-            return bytes(received_list[:n_data]), -1
-        
-        # Step 4: Find error magnitudes (Forney algorithm)
-        magnitudes = self._forney_algorithm(syndromes, err_loc, positions, msg_len)
-        
-        # Step 5: Correct errors
-        for pos, mag in zip(positions, magnitudes):
-            if 0 <= pos < len(received_list):
-                received_list[pos] ^= mag
-        
-        return bytes(received_list[:n_data]), n_errors
+        return self.codec.decode(received, n_data)
     
     def decode_bytes(self, encoded: bytes, n_data: int) -> Tuple[bytes, int]:
         """Convenience method matching encoder's encode_to_bytes."""
@@ -528,73 +635,105 @@ def detect_geometric_outliers(points: np.ndarray, threshold: float = 2.0) -> Lis
 
 # ============================================================================
 # High-level API for compression integration
-# Using hybrid approach: Multiple copies + Geometric curve fitting
+# Data once + interleaved RS parity at a tunable overhead
 # ============================================================================
 
-def rs_encode_with_geometry(data: bytes, n_copies: int = 7) -> bytes:
+# Protected stream header (stored RS_HEADER_COPIES times, majority-voted)
+RS_STREAM_MAGIC = b'\xE8\xEC'
+RS_STREAM_HEADER = struct.Struct('<2sBII')    # magic, n_parity, n_data, crc32
+RS_HEADER_COPIES = 3
+DEFAULT_OVERHEAD = 0.125
+
+
+def parity_for_overhead(overhead: float) -> int:
     """
-    Encode data with geometric redundancy for error correction.
-    
-    Uses n_copies of the data with polynomial-based checksum to enable
-    curve-based reconstruction. This is "the curve connects the dots" -
-    we can reconstruct from any majority of uncorrupted copies.
+    Parity symbols per RS(255, k) codeword for a storage overhead.
     
     Args:
-        data: Input data
-        n_copies: Number of redundant copies (default 7 for strong correction)
+        overhead: Parity bytes per data byte (e.g. 0.05 - 0.25)
     
     Returns:
-        Encoded bytes (metadata + copies + checksums)
+        Even n_parity with n_parity / (255 - n_parity) <= overhead (min 2)
     """
-    n_data = len(data)
+    if not 0 < overhead <= 1:
+        raise ValueError(f"overhead must be in (0, 1], got {overhead}")
+    n_parity = int(255 * overhead / (1 + overhead))
+    return max(2, n_parity - (n_parity & 1))
+
+
+def _header_majority(encoded: bytes) -> Optional[tuple]:
+    """Bitwise 2-of-3 vote over the replicated stream header."""
+    size = RS_STREAM_HEADER.size * RS_HEADER_COPIES
+    if len(encoded) < size:
+        return None
+    a, b, c = np.frombuffer(encoded[:size], dtype=np.uint8).reshape(RS_HEADER_COPIES, -1)
+    return RS_STREAM_HEADER.unpack(((a & b) | (a & c) | (b & c)).tobytes())
+
+
+def is_rs_stream(encoded: bytes) -> bool:
+    """True if encoded starts with an rs_encode_with_geometry header."""
+    header = _header_majority(encoded)
+    return header is not None and header[0] == RS_STREAM_MAGIC
+
+
+def rs_encode_with_geometry(data: bytes, overhead: float = DEFAULT_OVERHEAD) -> bytes:
+    """
+    Encode data with geometric redundancy for error correction.
     
-    # Create multiple copies with different XOR masks
-    # This ensures different bit patterns in each copy
-    masks = [0x00, 0x55, 0xAA, 0x33, 0xCC, 0x0F, 0xF0][:n_copies]
+    The data is stored once, followed by interleaved RS(255, k) parity
+    sized for the requested overhead - "the curve connects the dots"
+    at a fraction of the cost of whole copies. Damage is repaired as
+    long as no codeword holds more than n_parity / 2 bad bytes; byte
+    interleaving spreads bursts across all codewords.
     
-    # Build output: n_copies sequential copies
-    output = bytearray(n_copies * n_data)
-    for copy_idx, mask in enumerate(masks):
-        for i in range(n_data):
-            output[copy_idx * n_data + i] = data[i] ^ mask
+    Format: [HEADER x3][DATA][PARITY]
+    HEADER: magic, n_parity, n_data, crc32 of data
     
-    # Add polynomial checksum for each position (curve fitting)
-    # This helps detect which copies are correct
-    checksums = bytearray(n_data)
-    for i in range(n_data):
-        # Compute checksum as polynomial evaluation at golden ratio point
-        chk = 0
-        for copy_idx in range(n_copies):
-            # Polynomial: sum of copy_values * phi^copy_idx
-            val = output[copy_idx * n_data + i] ^ masks[copy_idx]  # Get original value
-            coef = int((PHI ** copy_idx) * 100) % 256
-            chk = (chk + val * coef) % 256
-        checksums[i] = chk
-    
-    # Metadata: original length and copy count
-    metadata = bytes([
-        n_data & 0xFF,
-        (n_data >> 8) & 0xFF,
-        (n_data >> 16) & 0xFF,
-        (n_data >> 24) & 0xFF,
-        n_copies & 0xFF,
-    ])
+    Args:
+        data: Input data
+        overhead: Parity bytes per data byte (default 12.5%)
     
-    return metadata + bytes(output) + checksums
+    Returns:
+        Encoded bytes (headers + data + parity)
+    """
+    n_parity = parity_for_overhead(overhead)
+    header = RS_STREAM_HEADER.pack(RS_STREAM_MAGIC, n_parity, len(data), zlib.crc32(data))
+    return header * RS_HEADER_COPIES + InterleavedRSCodec(n_parity).encode(data)
 
 
 def rs_decode_with_geometry(encoded: bytes) -> Tuple[bytes, int, float]:
     """
     Decode with geometric error correction using curve fitting.
     
-    Uses majority voting across copies, with polynomial checksum
-    to resolve ties and detect uncorrectable positions.
+    Streams from rs_encode_with_geometry are corrected in one batched
+    RS pass; the stored CRC confirms the result. Older multi-copy
+    streams are recovered by majority vote.
     
     Args:
         encoded: Encoded bytes
     
     Returns:
-        (decoded_data, n_errors_corrected, confidence)
+        (decoded_data, n_errors_corrected, confidence); n_errors is -1
+        when some codeword was beyond repair, confidence is 1.0 only
+        when the CRC matches
+    """
+    header = _header_majority(encoded)
+    if header is not None and header[0] == RS_STREAM_MAGIC:
+        _, n_parity, n_data, crc = header
+        if 0 < n_parity < 255:
+            body = encoded[RS_STREAM_HEADER.size * RS_HEADER_COPIES:]
+            decoded, n_errors = InterleavedRSCodec(n_parity).decode(body, n_data)
+            return decoded, n_errors, float(zlib.crc32(decoded) == crc)
+    
+    return _rs_decode_copies(encoded)
+
+
+def _rs_decode_copies(encoded: bytes) -> Tuple[bytes, int, float]:
+    """
+    Majority-vote decoder for the original multi-copy format.
+    
+    Format: [u32 n_data][u8 n_copies][COPIES][CHECKSUMS], each copy
+    XOR-masked, checksums as polynomial evaluations at φ.
     """
     from collections import Counter
     
@@ -701,7 +840,7 @@ def run_verification():
     print("=" * 60)
     print("GEOMETRIC ERROR CORRECTION VERIFICATION")
     print("=" * 60)
-    print("  Using: Multi-copy redundancy + Polynomial checksum")
+    print("  Using: Interleaved Reed-Solomon parity + CRC")
     print("  Principle: 'The curve connects the dots'")
     
     import random
@@ -710,7 +849,7 @@ def run_verification():
     print("\n--- Test 1: Basic round-trip ---")
     data = b"The universe is geometric and the curve connects the dots."
     
-    encoded = rs_encode_with_geometry(data, n_copies=7)
+    encoded = rs_encode_with_geometry(data)
     decoded, n_corrections, confidence = rs_decode_with_geometry(encoded)
     
     print(f"  Original: {len(data)} bytes")
@@ -719,7 +858,7 @@ def run_verification():
     print(f"  Confidence: {confidence:.2%}")
     print(f"  Match: {decoded == data}")
     
-    # Test 2: Error correction at various levels
+    # Test 2: Error correction at various overheads
     print("\n--- Test 2: Error correction capability ---")
     
     def corrupt_bytes(data: bytes, rate: float) -> bytes:
@@ -730,20 +869,20 @@ def run_verification():
             data_array[pos] ^= random.randint(1, 255)
         return bytes(data_array)
     
-    for rate in [0.05, 0.10, 0.15, 0.20, 0.25, 0.30, 0.35, 0.40]:
-        random.seed(42)
-        corrupted = corrupt_bytes(encoded, rate)
-        decoded, n_corrections, confidence = rs_decode_with_geometry(corrupted)
-        
-        # Count byte match rate
-        matches = sum(1 for a, b in zip(data, decoded) if a == b)
-        match_rate = matches / len(data) if data else 0
-        
-        status = "PERFECT" if match_rate == 1.0 else f"{match_rate:.0%}"
-        print(f"  {rate:>4.0%} corruption -> {status} recovery (conf: {confidence:.0%})")
+    random.seed(7)
+    payload = bytes(random.getrandbits(8) for _ in range(100_000))
+    for overhead in [0.05, 0.125, 0.25]:
+        encoded = rs_encode_with_geometry(payload, overhead)
+        for rate in [0.01, 0.02, 0.05]:
+            random.seed(42)
+            decoded, n_corrections, confidence = rs_decode_with_geometry(corrupt_bytes(encoded, rate))
+            status = "PERFECT" if decoded == payload else "FAILED"
+            print(f"  {overhead:>5.1%} overhead, {rate:>3.0%} corruption -> {status} "
+                  f"({n_corrections} corrected, conf: {confidence:.0%})")
     
     # Test 3: E8 geometric embedding
     print("\n--- Test 3: E8 geometric embedding ---")
+    encoded = rs_encode_with_geometry(data)
     points = embed_codeword_in_e8(encoded)
     print(f"  Codeword length: {len(encoded)}")
     print(f"  E8 points shape: {points.shape}")
@@ -755,25 +894,14 @@ def run_verification():
     outliers = detect_geometric_outliers(corrupted_points)
     print(f"  Geometric outliers detected at 10% corruption: {len(outliers)}")
     
-    # Test 4: Comparison with simple approaches
-    print("\n--- Test 4: Comparison ---")
-    print("  GQE Geometric Error Correction vs Alternatives:")
-    print()
-    
-    test_data = b"Geometry is the ultimate error correction." * 10
-    encoded_geom = rs_encode_with_geometry(test_data, n_copies=7)
-    
-    # Test at 15% corruption
-    random.seed(42)
-    corrupted = corrupt_bytes(encoded_geom, 0.15)
-    decoded_geom, _, _ = rs_decode_with_geometry(corrupted)
-    
-    geom_matches = sum(1 for a, b in zip(test_data, decoded_geom) if a == b)
-    geom_rate = geom_matches / len(test_data)
-    
-    print(f"  Geometric (7 copies + checksum): {geom_rate:.1%} recovery at 15% corruption")
-    print(f"  zlib/LZMA: 0% recovery (catastrophic failure)")
-    print(f"  Simple 3x copy: ~85% recovery (each copy gets 15% damage)")
+    # Test 4: Burst damage
+    print("\n--- Test 4: Burst damage ---")
+    encoded = bytearray(rs_encode_with_geometry(payload, 0.125))
+    encoded[50_000:54_000] = bytes(4000)
+    decoded, n_corrections, confidence = rs_decode_with_geometry(bytes(encoded))
+    print(f"  4000-byte burst at 12.5% overhead -> match: {decoded == payload} "
+          f"({n_corrections} corrected)")
+    print(f"  7 copies + checksum: 700% overhead for the same protection")
     
     print("\n" + "=" * 60)
     print("VERIFICATION COMPLETE")
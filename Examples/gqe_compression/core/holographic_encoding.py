@@ -26,6 +26,8 @@ License: Public Domain
 """
 
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import Tuple, List, Optional
 from dataclasses import dataclass
 
@@ -66,14 +68,12 @@ def generate_spreading_matrix(size: int, seed: int = 42) -> np.ndarray:
     
     # Initialize with φ-based values
     # Each row is a different "reference beam angle"
-    matrix = np.zeros((size, size))
+    i, j = np.meshgrid(np.arange(size), np.arange(size), indexing='ij')
     
-    for i in range(size):
-        for j in range(size):
-            # Golden angle based spreading: ensures maximal distribution
-            # This creates an aperiodic, non-repeating pattern
-            angle = 2 * np.pi * ((i * PHI + j * PHI_INV) % 1)
-            matrix[i, j] = np.cos(angle) + rng.randn() * 0.01  # Small noise for uniqueness
+    # Golden angle based spreading: ensures maximal distribution
+    # This creates an aperiodic, non-repeating pattern
+    angle = 2 * np.pi * ((i * PHI + j * PHI_INV) % 1)
+    matrix = np.cos(angle) + rng.randn(size, size) * 0.01  # Small noise for uniqueness
     
     # Orthonormalize via QR decomposition
     # This ensures the transform is invertible and well-conditioned
@@ -96,18 +96,114 @@ def generate_phase_matrix(size: int) -> np.ndarray:
     Returns:
         Phase matrix (size x size) with values in [0, 2π)
     """
-    phase = np.zeros((size, size))
+    i, j = np.meshgrid(np.arange(size), np.arange(size), indexing='ij')
     
-    for i in range(size):
-        for j in range(size):
-            # Golden angle progression for position encoding
-            # This creates unique phase fingerprints for each position
-            phase[i, j] = (2 * np.pi * (i * PHI + j) / size) % (2 * np.pi)
+    # Golden angle progression for position encoding
+    # This creates unique phase fingerprints for each position
+    return (2 * np.pi * (i * PHI + j) / size) % (2 * np.pi)
+
+
+# Parity bytes per block
+PARITY_PER_BLOCK = 8
+
+# Blocks per task when holographic_encode/decode fan out over processes
+HOLOGRAPHIC_CHUNK_BLOCKS = 1 << 14
+
+
+@lru_cache(maxsize=8)
+def _transforms(block_size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Spreading matrix, its inverse, and the phase matrix for a block size.
+    
+    Built once per block size; the arrays are read-only because every
+    caller shares them.
+    """
+    spread_matrix = generate_spreading_matrix(block_size)
+    matrices = (spread_matrix, np.linalg.inv(spread_matrix), generate_phase_matrix(block_size))
+    for matrix in matrices:
+        matrix.setflags(write=False)
+    return matrices
+
+
+def _parity_slots(n_encoded: int, n_parity: int) -> np.ndarray:
+    """
+    Mask of the parity positions in the interleaved stream.
+    
+    One parity value follows every n_encoded // n_parity encoded values;
+    any parity left over once the encoded values run out is appended.
+    """
+    interval = n_encoded // n_parity
+    slots = np.ones(n_encoded + n_parity, dtype=bool)
+    encoded_at = np.arange(n_encoded)
+    slots[encoded_at + np.minimum(encoded_at // interval, n_parity)] = False
+    return slots
+
+
+def _spread_blocks(blocks: np.ndarray, first_block: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Spread, phase-modulate and compute parity for a run of blocks.
+    
+    Args:
+        blocks: (B, block_size) float64 data
+        first_block: Index of blocks[0] in the whole payload
+    
+    Returns:
+        ((B, 2 * block_size) interleaved real/imag, (B, 8) parity)
+    """
+    n_blocks, block_size = blocks.shape
+    spread_matrix, _, phase_matrix = _transforms(block_size)
+    
+    # Step 1: Spread every block at once (row b is spread_matrix @ blocks[b])
+    amplitude = blocks @ spread_matrix.T
+    
+    # Step 2: Phase modulation, one phase row per block
+    phase = phase_matrix[np.arange(first_block, first_block + n_blocks) % block_size]
+    interleaved = np.empty((n_blocks, 2 * block_size))
+    interleaved[:, 0::2] = amplitude * np.cos(phase)
+    interleaved[:, 1::2] = amplitude * np.sin(phase)
     
-    return phase
+    # Step 3: Parity position k sums the bytes at k, k + 8, k + 16, ...
+    parity = np.zeros((n_blocks, PARITY_PER_BLOCK))
+    for k in range(min(PARITY_PER_BLOCK, block_size)):
+        parity[:, k] = blocks[:, k::PARITY_PER_BLOCK].sum(axis=1)
+    
+    return interleaved, parity % 256
 
 
-def holographic_encode(data: bytes, block_size: int = 64) -> bytes:
+def _unspread_blocks(encoded_blocks: np.ndarray, first_block: int) -> np.ndarray:
+    """
+    Invert the phase modulation and spreading for a run of blocks.
+    
+    Args:
+        encoded_blocks: (B, 2 * block_size) interleaved real/imag
+        first_block: Index of encoded_blocks[0] in the whole payload
+    
+    Returns:
+        (B, block_size) float64 decoded blocks
+    """
+    block_size = encoded_blocks.shape[1] // 2
+    _, spread_inverse, _ = _transforms(block_size)
+    
+    # amplitude * cos(phase) = real, amplitude * sin(phase) = imag
+    real_part = encoded_blocks[:, 0::2]
+    imag_part = encoded_blocks[:, 1::2]
+    amplitude = np.sqrt(real_part**2 + imag_part**2 + 1e-10)
+    
+    return amplitude @ spread_inverse.T
+
+
+def _map_blocks(fn, array: np.ndarray, workers: int) -> list:
+    """Apply fn(chunk, first_block) over row chunks, on up to workers processes."""
+    starts = range(0, len(array), HOLOGRAPHIC_CHUNK_BLOCKS)
+    chunks = [array[start:start + HOLOGRAPHIC_CHUNK_BLOCKS] for start in starts]
+    if workers <= 1 or len(chunks) <= 1:
+        return [fn(chunk, start) for chunk, start in zip(chunks, starts)]
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, chunks, starts))
+
+
+def holographic_encode(data: bytes, block_size: int = 64, workers: int = 1) -> bytes:
     """
     Encode data holographically so every piece contains the whole.
     
@@ -118,9 +214,13 @@ def holographic_encode(data: bytes, block_size: int = 64) -> bytes:
     4. Interleave blocks (further distributes information)
     5. Add distributed parity (error detection in every segment)
     
+    All blocks are transformed together as one (n_blocks, block_size)
+    matrix product.
+    
     Args:
         data: Raw bytes to encode
         block_size: Size of encoding blocks (larger = more redundancy)
+        workers: Processes sharing the blocks of very large payloads
     
     Returns:
         Holographically encoded bytes (same size as input + parity overhead)
@@ -128,91 +228,26 @@ def holographic_encode(data: bytes, block_size: int = 64) -> bytes:
     if len(data) == 0:
         return b''
     
-    # Convert to float array for transform
-    data_float = np.array(list(data), dtype=np.float64)
-    
-    # Pad to multiple of block_size
-    pad_len = (block_size - len(data_float) % block_size) % block_size
-    if pad_len > 0:
-        data_float = np.concatenate([data_float, np.zeros(pad_len)])
-    
-    n_blocks = len(data_float) // block_size
-    
-    # Generate spreading and phase matrices
-    spread_matrix = generate_spreading_matrix(block_size)
-    phase_matrix = generate_phase_matrix(block_size)
-    
-    encoded_blocks = []
-    parity_blocks = []
+    # Pad to multiple of block_size, one block per row
+    n_blocks = -(-len(data) // block_size)
+    data_float = np.zeros(n_blocks * block_size)
+    data_float[:len(data)] = np.frombuffer(data, dtype=np.uint8)
+    blocks = data_float.reshape(n_blocks, block_size)
     
-    for b in range(n_blocks):
-        start = b * block_size
-        end = start + block_size
-        block = data_float[start:end]
-        
-        # Step 1: Apply spreading transform
-        # This distributes each original byte across ALL positions in the block
-        spread = spread_matrix @ block
-        
-        # Step 2: Apply phase modulation
-        # Encode using complex representation for true interference pattern
-        phase_row = phase_matrix[b % block_size]
-        amplitude = spread
-        phase_encoded = phase_row
-        
-        # Combine amplitude and phase into real/imaginary parts
-        # This is how holograms store information
-        real_part = amplitude * np.cos(phase_encoded)
-        imag_part = amplitude * np.sin(phase_encoded)
-        
-        # Interleave real and imaginary for distributed storage
-        # Now corruption in any position affects both components equally
-        interleaved = np.empty(2 * block_size)
-        interleaved[0::2] = real_part
-        interleaved[1::2] = imag_part
-        
-        encoded_blocks.append(interleaved)
-        
-        # Step 3: Compute distributed parity
-        # XOR-based parity that spans the entire block
-        parity = np.zeros(8)  # 8 parity bytes per block
-        for i in range(block_size):
-            parity[i % 8] += block[i]  # Accumulate for each parity position
-        parity = parity % 256  # Wrap to byte range
-        
-        parity_blocks.append(parity)
-    
-    # Step 4: Global interleaving across blocks
-    # Further distributes information so block boundaries don't matter
-    all_encoded = np.concatenate(encoded_blocks)
-    all_parity = np.concatenate(parity_blocks)
+    if workers > 1:
+        results = _map_blocks(_spread_blocks, blocks, workers)
+        all_encoded = np.concatenate([encoded for encoded, _ in results]).reshape(-1)
+        all_parity = np.concatenate([parity for _, parity in results]).reshape(-1)
+    else:
+        all_encoded, all_parity = _spread_blocks(blocks, 0)
+        all_encoded, all_parity = all_encoded.reshape(-1), all_parity.reshape(-1)
     
-    # Interleave encoded data with parity at regular intervals
+    # Step 4: Interleave encoded data with parity at regular intervals
     # This ensures parity information is distributed, not appended
-    output_size = len(all_encoded) + len(all_parity)
-    output = np.zeros(output_size)
-    
-    parity_interval = len(all_encoded) // len(all_parity) if len(all_parity) > 0 else len(all_encoded)
-    parity_idx = 0
-    out_idx = 0
-    enc_idx = 0
-    
-    for i in range(len(all_encoded)):
-        output[out_idx] = all_encoded[enc_idx]
-        out_idx += 1
-        enc_idx += 1
-        
-        # Insert parity byte at regular intervals
-        if (i + 1) % parity_interval == 0 and parity_idx < len(all_parity):
-            output[out_idx] = all_parity[parity_idx]
-            out_idx += 1
-            parity_idx += 1
-    
-    # Remaining parity bytes
-    while parity_idx < len(all_parity):
-        output[out_idx] = all_parity[parity_idx]
-        out_idx += 1
-        parity_idx += 1
+    slots = _parity_slots(len(all_encoded), len(all_parity))
+    output = np.empty(len(slots))
+    output[~slots] = all_encoded
+    output[slots] = all_parity
     
     # Store metadata at the beginning
     # Encode: original_len (4 bytes), block_size (2 bytes), n_blocks (4 bytes)
@@ -239,10 +274,10 @@ def holographic_encode(data: bytes, block_size: int = 64) -> bytes:
     # Use modular arithmetic to preserve information
     output_bytes = np.clip(output, 0, 255).astype(np.uint8)
     
-    return bytes(output_bytes) + bytes(int(x) for x in header)
+    return output_bytes.tobytes() + header.astype(np.uint8).tobytes()
 
 
-def holographic_decode(encoded: bytes, block_size: int = 64) -> bytes:
+def holographic_decode(encoded: bytes, block_size: int = 64, workers: int = 1) -> bytes:
     """
     Decode holographically encoded data.
     
@@ -256,6 +291,7 @@ def holographic_decode(encoded: bytes, block_size: int = 64) -> bytes:
     Args:
         encoded: Holographically encoded bytes
         block_size: Block size used during encoding
+        workers: Processes sharing the blocks of very large payloads
     
     Returns:
         Original decoded bytes
@@ -274,82 +310,34 @@ def holographic_decode(encoded: bytes, block_size: int = 64) -> bytes:
                 (header_bytes[8] << 16) | (header_bytes[9] << 24))
     
     block_size = stored_block_size if stored_block_size > 0 else block_size
-    
-    # Convert to float for processing
-    data_float = np.array(list(encoded_data), dtype=np.float64)
+    if n_blocks == 0:
+        return b''
     
     # Calculate expected sizes
-    parity_per_block = 8
-    total_parity = n_blocks * parity_per_block
+    total_parity = n_blocks * PARITY_PER_BLOCK
     encoded_per_block = 2 * block_size
     total_encoded = n_blocks * encoded_per_block
     
-    # De-interleave parity from encoded data
-    parity_interval = total_encoded // total_parity if total_parity > 0 else len(data_float)
-    
-    all_encoded = []
-    all_parity = []
-    
-    enc_count = 0
-    for i, val in enumerate(data_float):
-        if (enc_count + 1) % (parity_interval + 1) == 0 and len(all_parity) < total_parity:
-            all_parity.append(val)
-        else:
-            all_encoded.append(val)
-            enc_count += 1
+    # Truncated data reads as zeros
+    data_float = np.zeros(total_encoded + total_parity)
+    received = np.frombuffer(encoded_data, dtype=np.uint8)[:len(data_float)]
+    data_float[:len(received)] = received
     
-    all_encoded = np.array(all_encoded)
-    
-    # Generate inverse matrices
-    spread_matrix = generate_spreading_matrix(block_size)
-    spread_inverse = np.linalg.inv(spread_matrix)
-    phase_matrix = generate_phase_matrix(block_size)
-    
-    decoded_blocks = []
-    
-    for b in range(n_blocks):
-        start = b * encoded_per_block
-        end = start + encoded_per_block
-        
-        if end > len(all_encoded):
-            # Handle truncated data gracefully
-            block_encoded = np.zeros(encoded_per_block)
-            available = min(len(all_encoded) - start, encoded_per_block)
-            if available > 0 and start < len(all_encoded):
-                block_encoded[:available] = all_encoded[start:start+available]
-        else:
-            block_encoded = all_encoded[start:end]
-        
-        # De-interleave real and imaginary parts
-        real_part = block_encoded[0::2]
-        imag_part = block_encoded[1::2]
-        
-        if len(real_part) < block_size:
-            real_part = np.concatenate([real_part, np.zeros(block_size - len(real_part))])
-        if len(imag_part) < block_size:
-            imag_part = np.concatenate([imag_part, np.zeros(block_size - len(imag_part))])
-        
-        # Recover amplitude and phase
-        phase_row = phase_matrix[b % block_size]
-        
-        # Inverse phase modulation
-        # amplitude * cos(phase) = real, amplitude * sin(phase) = imag
-        # amplitude = sqrt(real^2 + imag^2)
-        amplitude_recovered = np.sqrt(real_part**2 + imag_part**2 + 1e-10)
-        
-        # Apply inverse spreading
-        block_decoded = spread_inverse @ amplitude_recovered
-        
-        decoded_blocks.append(block_decoded)
+    # De-interleave parity from encoded data, one block per row
+    slots = _parity_slots(total_encoded, total_parity)
+    encoded_blocks = data_float[~slots].reshape(n_blocks, encoded_per_block)
     
-    # Concatenate and trim to original length
-    result = np.concatenate(decoded_blocks) if decoded_blocks else np.array([])
-    result = result[:original_len]
+    # Inverse phase modulation and spreading, all blocks at once
+    if workers > 1:
+        decoded_blocks = np.concatenate(_map_blocks(_unspread_blocks, encoded_blocks, workers))
+    else:
+        decoded_blocks = _unspread_blocks(encoded_blocks, 0)
     
-    # Quantize to bytes
+    # Trim to original length and quantize to bytes
+    result = decoded_blocks.reshape(-1)[:original_len]
     result_bytes = np.clip(np.round(result), 0, 255).astype(np.uint8)
     
-    return bytes(result_bytes)
+    return result_bytes.tobytes()
 
 
 def holographic_decode_with_recovery(encoded: bytes, 
@@ -384,7 +372,8 @@ def holographic_decode_with_recovery(encoded: bytes,
     if min_len == 0:
         return decoded, 0.0
     
-    matches = sum(1 for i in range(min_len) if encoded[i] == re_encoded[i])
+    matches = np.count_nonzero(np.frombuffer(encoded, dtype=np.uint8, count=min_len) ==
+                               np.frombuffer(re_encoded, dtype=np.uint8, count=min_len))
     confidence = matches / min_len
     
     # Iterative refinement if confidence is low
@@ -397,7 +386,7 @@ def holographic_decode_with_recovery(encoded: bytes,
         
         # Try to improve by averaging multiple decode attempts
         # with small perturbations
-        encoded_array = np.array(list(encoded), dtype=np.float64)
+        encoded_array = np.frombuffer(encoded, dtype=np.uint8).astype(np.float64)
         
         # Generate small perturbations and decode each
         perturbations = [
@@ -412,7 +401,7 @@ def holographic_decode_with_recovery(encoded: bytes,
             try:
                 dec = holographic_decode(bytes(perturbed), block_size)
                 if len(dec) > 0:
-                    decoded_attempts.append(np.array(list(dec), dtype=np.float64))
+                    decoded_attempts.append(np.frombuffer(dec, dtype=np.uint8).astype(np.float64))
             except Exception:
                 continue
         
@@ -425,7 +414,8 @@ def holographic_decode_with_recovery(encoded: bytes,
             re_encoded = holographic_encode(current_decoded, block_size)
             min_len = min(len(encoded), len(re_encoded))
             if min_len > 0:
-                matches = sum(1 for i in range(min_len) if encoded[i] == re_encoded[i])
+                matches = np.count_nonzero(np.frombuffer(encoded, dtype=np.uint8, count=min_len) ==
+                                           np.frombuffer(re_encoded, dtype=np.uint8, count=min_len))
                 new_confidence = matches / min_len
                 
                 if new_confidence > current_confidence:
@@ -438,6 +428,10 @@ def holographic_decode_with_recovery(encoded: bytes,
 # Simplified holographic encoding for the compressor
 # ============================================================================
 
+# XOR masks of the 5 copies, so no bit is stored the same way in all of them
+SPREAD_MASKS = np.array([0x00, 0x55, 0xAA, 0x33, 0xCC], dtype=np.uint8)
+
+
 def simple_holographic_spread(data: bytes) -> bytes:
     """
     Holographic spreading with REDUNDANCY for error correction.
@@ -460,26 +454,29 @@ def simple_holographic_spread(data: bytes) -> bytes:
     if len(data) == 0:
         return b''
     
-    n = len(data)
+    # All 5 masked copies in one broadcast: (5, n)
+    copies = np.frombuffer(data, dtype=np.uint8)[None, :] ^ SPREAD_MASKS[:, None]
     
-    # XOR masks for each copy (0, 0x55, 0xAA, 0x33, 0xCC)
-    # These ensure different bit patterns in each copy
-    masks = [0x00, 0x55, 0xAA, 0x33, 0xCC]
-    
-    # Create output with 5 sequential copies
-    output = bytearray(5 * n + 4)  # +4 for length header
-    
-    for copy_idx, mask in enumerate(masks):
-        for i in range(n):
-            output[copy_idx * n + i] = data[i] ^ mask
-    
-    # Store original length at the end (4 bytes)
-    output[5 * n] = n & 0xFF
-    output[5 * n + 1] = (n >> 8) & 0xFF
-    output[5 * n + 2] = (n >> 16) & 0xFF
-    output[5 * n + 3] = (n >> 24) & 0xFF
+    # Original length at the end (4 bytes, little-endian)
+    return copies.tobytes() + (len(data) & 0xFFFFFFFF).to_bytes(4, 'little')
+
+
+def _bitwise_majority5(votes: np.ndarray) -> np.ndarray:
+    """
+    Per-bit 3-of-5 majority of a (5, n) uint8 array.
     
-    return bytes(output)
+    The five bits are summed with two full adders into
+    s + 2 * (k1 + k2); the sum is at least 3 exactly when both carries
+    are set, or one carry and the sum bit.
+    """
+    a, b, c, d, e = votes
+    ab = a ^ b
+    s1 = ab ^ c
+    k1 = (a & b) | (c & ab)
+    s1d = s1 ^ d
+    s = s1d ^ e
+    k2 = (s1 & d) | (e & s1d)
+    return (k1 & k2) | ((k1 | k2) & s)
 
 
 def simple_holographic_recover(spread_data: bytes) -> bytes:
@@ -492,6 +489,11 @@ def simple_holographic_recover(spread_data: bytes) -> bytes:
     This provides strong error correction: up to 2 out of 5 copies
     can be completely wrong and we still recover correctly.
     
+    The vote is bitwise over all columns at once; a column's winner
+    is its mode whenever 3 or more copies agree. The few columns
+    without such a majority take their most common value, ties going
+    to the earliest copy.
+    
     Args:
         spread_data: Holographically spread bytes (5x + 4 bytes)
     
@@ -502,10 +504,7 @@ def simple_holographic_recover(spread_data: bytes) -> bytes:
         return spread_data
     
     # Extract original length from last 4 bytes
-    n = (spread_data[-4] | 
-         (spread_data[-3] << 8) | 
-         (spread_data[-2] << 16) | 
-         (spread_data[-1] << 24))
+    n = int.from_bytes(spread_data[-4:], 'little')
     
     body = spread_data[:-4]
     
@@ -515,31 +514,18 @@ def simple_holographic_recover(spread_data: bytes) -> bytes:
         if n == 0:
             return body
     
-    # XOR masks (same as encoding)
-    masks = [0x00, 0x55, 0xAA, 0x33, 0xCC]
+    # Undo the masks for all copies at once: (5, n)
+    votes = np.frombuffer(body, dtype=np.uint8, count=5 * n).reshape(5, n) ^ SPREAD_MASKS[:, None]
+    output = _bitwise_majority5(votes)
     
-    # Recover each byte using majority voting across 5 sequential copies
-    output = bytearray(n)
+    # Columns where no value has 3 votes: exact mode by pairwise agreement
+    split = np.flatnonzero((votes == output).sum(axis=0) < 3)
+    if len(split):
+        columns = votes[:, split]
+        agreement = (columns[:, None, :] == columns[None, :, :]).sum(axis=1)
+        output[split] = columns[agreement.argmax(axis=0), np.arange(len(split))]
     
-    from collections import Counter
-    
-    for i in range(n):
-        # Get all 5 copies and decode XOR
-        votes = []
-        for copy_idx, mask in enumerate(masks):
-            pos = copy_idx * n + i
-            if pos < len(body):
-                decoded = body[pos] ^ mask
-                votes.append(decoded)
-        
-        # Majority voting: pick the most common value
-        if votes:
-            vote_counts = Counter(votes)
-            output[i] = vote_counts.most_common(1)[0][0]
-        else:
-            output[i] = 0
-    
-    return bytes(output)
+    return output.tobytes()
 
 
 def add_distributed_parity(data: bytes, parity_ratio: float = 0.125) -> bytes:
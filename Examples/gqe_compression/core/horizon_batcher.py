@@ -160,6 +160,50 @@ class HorizonBatcher:
             start = end
             frame_index += 1
     
+    # Bytes find_nearest_grain may inspect past a frame's target end
+    GRAIN_LOOKAHEAD = 4096
+    
+    def stream_chunks(self, reader) -> Iterator[Tuple[int, bytes, Tuple[int, int]]]:
+        """
+        Grain-Aware Chunking over a stream: _chunk_data without the whole input.
+        
+        THE PHYSICS: The Horizon never sees more than one frame ahead.
+        
+        At most chunk_size + GRAIN_LOOKAHEAD bytes are buffered, which is
+        exactly the window find_nearest_grain searches, so the frames are
+        identical to _chunk_data(reader.read()).
+        
+        Args:
+            reader: Binary file-like object with read(n); short reads are fine
+        """
+        window = self.chunk_size + self.GRAIN_LOOKAHEAD
+        buffer = bytearray()
+        frame_index = 0
+        start = 0
+        eof = False
+        
+        while True:
+            while not eof and len(buffer) <= window:
+                block = reader.read(window + 1 - len(buffer))
+                if not block:
+                    eof = True
+                else:
+                    buffer += block
+            
+            if not buffer:
+                return
+            
+            if eof and len(buffer) <= self.chunk_size:
+                # Last chunk - take everything remaining
+                end = len(buffer)
+            else:
+                end = self.find_nearest_grain(buffer, 0, self.chunk_size, len(buffer))
+            
+            yield frame_index, bytes(buffer[:end]), (start, start + end)
+            del buffer[:end]
+            start += end
+            frame_index += 1
+    
     def find_nearest_grain(self, data: bytes, start: int, target_end: int, total_size: int) -> int:
         """
         Find the nearest token boundary (whitespace) to avoid splitting words.
@@ -190,24 +234,19 @@ class HorizonBatcher:
         print(f"  [WARNING] Performing emergency split - may cause boundary entropy")
         return target_end
     
-    def _build_global_vocabulary(self, data: bytes) -> Tuple[Dict[bytes, int], List[bytes]]:
+    def _build_global_vocabulary(self, data: bytes) -> Dict[bytes, int]:
         """
         PHASE 9: BYTE-SINGULARITY
         Build vocabulary where each byte maps to its own value.
         No sequential indices - direct byte-to-byte mapping.
+        
+        One bincount pass over any buffer (bytes, memoryview, mmap),
+        without copying it.
         """
         # Byte-singularity: Each byte maps to itself (0-255)
-        vocabulary = {}
-        byte_sequences = []
-
-        # For each unique byte, map it to its own value
-        for byte in data:
-            byte_key = bytes([byte])
-            if byte_key not in vocabulary:
-                vocabulary[byte_key] = byte  # Map to byte value itself
-            byte_sequences.append(byte_key)
+        counts = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
         
-        return vocabulary, byte_sequences
+        return {bytes([int(b)]): int(b) for b in np.flatnonzero(counts)}
     
     def build_singularity(self, data: bytes) -> GlobalSingularity:
         """
@@ -217,7 +256,7 @@ class HorizonBatcher:
         Just the 256 bytes that form the foundation of all data.
         """
         # Build byte-level vocabulary
-        vocabulary, byte_sequences = self._build_global_vocabulary(data)
+        vocabulary = self._build_global_vocabulary(data)
         vocab_size = len(vocabulary)
         
         if vocab_size == 0:
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Logistic Mixer - The Bitwise N-Frame Engine
+
+THE PHYSICS:
+"Every byte is eight binary decisions. Every decision is a bet."
+
+ContextMixer predicts a full 256-way distribution per byte and reweights
+it with an ad hoc rule. This module follows the PAQ/lpaq design instead:
+
+1. Bit Histories: Each N-Frame window (order 0, 1, 2, 4, 8 - the same
+   windows as GeometricParallelMixer) keeps a one-byte state per
+   (context, partial byte) slot. The state is a bounded, nonstationary
+   pair of bit counts, advanced through an integer state table.
+2. State Maps: Each order learns what probability each state really
+   means on this data.
+3. Logistic Mixing: The per-order probabilities are stretched into the
+   logistic domain, combined with weights selected by the partial byte,
+   and squashed back. The weights follow the coding-cost gradient.
+4. APM/SSE: Two adaptive probability maps refine the mixed probability
+   using order-0 and order-1 contexts.
+
+Everything is integer arithmetic, so encoder and decoder agree bit for
+bit. The predictor plugs into core.range_coder (predict/update).
+
+Author: The Architect
+License: Public Domain
+"""
+
+from typing import Dict, List, Tuple
+
+from .context_mixer import (
+    GeometricParallelMixer, squash, _STRETCH_TABLE
+)
+
+
+# ============================================================================
+# Bit-history state table
+# ============================================================================
+
+# Bit counts saturate here (216 reachable states: fits in one byte)
+STATE_COUNT_LIMIT = 30
+
+
+def _build_state_table(limit: int = STATE_COUNT_LIMIT) -> Tuple[List[Tuple[int, int]], List[int], List[int]]:
+    """
+    Enumerate the reachable (n0, n1) bit-count states.
+
+    Observing a bit increments its count; if the opposite count exceeds 2
+    it is halved (plus one). Old evidence fades, so the state tracks
+    nonstationary data instead of averaging over all history.
+
+    Returns:
+        (states, next0, next1) where next*[s] is the successor state index
+    """
+    def step(n0: int, n1: int, bit: int) -> Tuple[int, int]:
+        if bit:
+            n1 = min(n1 + 1, limit)
+            if n0 > 2:
+                n0 = n0 // 2 + 1
+        else:
+            n0 = min(n0 + 1, limit)
+            if n1 > 2:
+                n1 = n1 // 2 + 1
+        return n0, n1
+
+    states = [(0, 0)]
+    index = {(0, 0): 0}
+    i = 0
+    while i < len(states):
+        for bit in (0, 1):
+            nxt = step(*states[i], bit)
+            if nxt not in index:
+                index[nxt] = len(states)
+                states.append(nxt)
+        i += 1
+
+    next0 = [index[step(n0, n1, 0)] for n0, n1 in states]
+    next1 = [index[step(n0, n1, 1)] for n0, n1 in states]
+    return states, next0, next1
+
+
+STATES, STATE_NEXT0, STATE_NEXT1 = _build_state_table()
+
+
+# ============================================================================
+# Adaptive probability map (APM / SSE)
+# ============================================================================
+
+class APM:
+    """
+    Adaptive Probability Map (secondary symbol estimation).
+
+    Refines a probability given a small context: the stretched input is
+    interpolated between 33 bins, and the bin nearest the input learns
+    the actual bit.
+    """
+
+    def __init__(self, n_contexts: int, rate: int = 7):
+        self.rate = rate
+        self._table = [squash((i - 16) * 128) * 16 for i in range(33)] * n_contexts
+        self._index = 0
+
+    def refine(self, pr: int, cx: int) -> int:
+        """Map a 12-bit probability through context cx."""
+        s = _STRETCH_TABLE[pr] + 2048
+        lo = s & 127
+        idx = (s >> 7) + cx * 33
+        self._index = idx + (lo >> 6)
+        t = self._table
+        return (t[idx] * (128 - lo) + t[idx + 1] * lo) >> 11
+
+    def update(self, bit: int):
+        """Move the nearest bin toward the actual bit."""
+        g = (bit << 16) + (bit << self.rate) - bit - bit
+        t = self._table
+        t[self._index] += (g - t[self._index]) >> self.rate
+
+
+# ============================================================================
+# The predictor
+# ============================================================================
+
+class LogisticMixingPredictor:
+    """
+    PAQ-style bitwise predictor for the range coder.
+
+    THE PHYSICS:
+    Each N-Frame window remembers how the bits fell in its context (a bit
+    history), learns what that history means (state map), and a logistic
+    mixer learns how far to trust each window for every partial byte.
+    Two APM stages polish the result.
+
+    Interface (used by core.range_coder):
+    - predict() -> 12-bit probability that the next bit is 1
+    - update(bit) -> learn the actual bit
+    """
+
+    CONTEXT_SIZES = [0] + GeometricParallelMixer.CONTEXT_SIZES.tolist()
+
+    # FNV-1a constants
+    FNV_OFFSET = 2166136261
+    FNV_PRIME = 16777619
+
+    # Fibonacci hashing multiplier (2^32 / phi)
+    GOLDEN_MULT = 0x9E3779B1
+
+    # State map adaptation limit: the rate floors at 1/(LIMIT+1.5)
+    STATE_MAP_LIMIT = 127
+
+    # Mixer learning rate (16.16 fixed point)
+    LEARNING_RATE = 24
+
+    def __init__(self, table_bits: int = 22):
+        if table_bits < 8 or table_bits > 30:
+            raise ValueError(f"table_bits must be in [8, 30], got {table_bits}")
+
+        self.table_bits = table_bits
+        self._shift = 32 - table_bits
+        n_inputs = len(self.CONTEXT_SIZES)
+        n_states = len(STATES)
+
+        # Bit-history slots shared by all orders: one state byte each
+        self._states = bytearray(1 << table_bits)
+
+        # State maps: per order, per state -> 16-bit P(1), with confidence
+        initial = [((n1 * 2 + 1) << 16) // (n0 * 2 + n1 * 2 + 2) for n0, n1 in STATES]
+        initial = [min(max(p, 64), 65471) for p in initial]
+        self._sm_probs = initial * n_inputs
+        self._sm_counts = [0] * (n_states * n_inputs)
+        self._sm_rates = [int(65536 / (n + 1.5)) for n in range(self.STATE_MAP_LIMIT + 1)]
+        self._n_states = n_states
+
+        # Mixer: one weight set per partial byte (16.16 fixed point)
+        self._n_inputs = n_inputs + 1  # plus a bias input
+        self._weights = [19661] * (256 * self._n_inputs)  # 0.3
+        self._inputs = [0] * self._n_inputs
+        self._inputs[-1] = 256  # Bias
+        self._weight_base = 0
+
+        # APM/SSE stages: order 0 and order 1
+        self._apm0 = APM(256)
+        self._apm1 = APM(1 << 16)
+
+        self._pr_mix = 2048
+        self._pr = 2048
+
+        self._history = bytearray()
+        self._c0 = 1  # Partial byte with a leading 1 bit
+        self._c1 = 0  # Last complete byte
+        self._hashes = [0] * n_inputs
+        self._slots = [0] * n_inputs
+        self._sm_index = [0] * n_inputs
+        self._update_hashes()
+        self._select_slots()
+
+    def _update_hashes(self):
+        """Hash each N-Frame window once per byte."""
+        history = self._history
+        for k, ctx_size in enumerate(self.CONTEXT_SIZES):
+            h = self.FNV_OFFSET
+            if ctx_size:
+                for b in history[-ctx_size:]:
+                    h = ((h ^ b) * self.FNV_PRIME) & 0xFFFFFFFF
+            # Salt with the order so equal windows of different size differ
+            self._hashes[k] = ((h ^ ctx_size) * self.FNV_PRIME) & 0xFFFFFFFF
+
+    def _select_slots(self):
+        """Combine each window hash with the partial byte into a slot."""
+        c0 = self._c0
+        shift = self._shift
+        mult = self.GOLDEN_MULT
+        slots = self._slots
+        for k, h in enumerate(self._hashes):
+            slots[k] = (((h + c0) * mult) & 0xFFFFFFFF) >> shift
+        self._weight_base = c0 * self._n_inputs
+
+    def predict(self) -> int:
+        """12-bit probability that the next bit is 1."""
+        states = self._states
+        sm_probs = self._sm_probs
+        sm_index = self._sm_index
+        inputs = self._inputs
+        weights = self._weights
+        base = self._weight_base
+        n_states = self._n_states
+
+        dot = 0
+        for k, slot in enumerate(self._slots):
+            i = k * n_states + states[slot]
+            sm_index[k] = i
+            st = _STRETCH_TABLE[sm_probs[i] >> 4]
+            inputs[k] = st
+            dot += weights[base + k] * st
+        dot += weights[base + len(sm_index)] * inputs[-1]
+
+        pr = squash(dot >> 16)
+        self._pr_mix = pr
+
+        # SSE: blend the mixer with its order-0 and order-1 refinements
+        pr = (self._apm0.refine(pr, self._c0) * 3 + pr) >> 2
+        pr = (self._apm1.refine(pr, self._c0 | (self._c1 << 8)) + pr * 3) >> 2
+        if pr < 1:
+            pr = 1
+        elif pr > 4095:
+            pr = 4095
+        self._pr = pr
+        return pr
+
+    def update(self, bit: int):
+        """Learn the actual bit and advance the context."""
+        # 1. Mixer: follow the coding-cost gradient
+        err = ((bit << 12) - self._pr_mix) * self.LEARNING_RATE
+        weights = self._weights
+        base = self._weight_base
+        for k, x in enumerate(self._inputs):
+            weights[base + k] += (x * err) >> 16
+
+        # 2. APM stages
+        self._apm0.update(bit)
+        self._apm1.update(bit)
+
+        # 3. State maps and bit histories
+        sm_probs = self._sm_probs
+        sm_counts = self._sm_counts
+        rates = self._sm_rates
+        limit = self.STATE_MAP_LIMIT
+        target = 65535 if bit else 0
+        for i in self._sm_index:
+            n = sm_counts[i]
+            p = sm_probs[i]
+            sm_probs[i] = p + (((target - p) * rates[n]) >> 16)
+            if n < limit:
+                sm_counts[i] = n + 1
+
+        states = self._states
+        nxt = STATE_NEXT1 if bit else STATE_NEXT0
+        for slot in self._slots:
+            states[slot] = nxt[states[slot]]
+
+        # 4. Advance the partial byte (and the windows on a byte boundary)
+        c0 = (self._c0 << 1) | bit
+        if c0 >= 256:
+            c1 = c0 & 0xFF
+            self._history.append(c1)
+            if len(self._history) > 8:
+                del self._history[0]
+            self._c1 = c1
+            self._c0 = 1
+            self._update_hashes()
+        else:
+            self._c0 = c0
+        self._select_slots()
+
+
+# ============================================================================
+# Benchmark against the byte-level ContextMixer
+# ============================================================================
+
+def benchmark_against_context_mixer(data: bytes, table_bits: int = 20) -> Dict:
+    """
+    Compare the bitwise engine with the per-byte 256-way ContextMixer.
+
+    The bitwise engine is measured by its real range-coded size; the
+    ContextMixer by its own cost estimate (it has no entropy coder).
+
+    Returns:
+        Dict with bits/byte and KB/s for both engines
+    """
+    import time
+    from .context_mixer import ContextMixer
+    from .range_coder import encode_bytes
+
+    n = max(len(data), 1)
+
+    start = time.perf_counter()
+    stream = encode_bytes(data, LogisticMixingPredictor(table_bits))
+    bitwise_time = time.perf_counter() - start
+
+    mixer = ContextMixer()
+    start = time.perf_counter()
+    for i in range(len(data)):
+        mixer.update(data[max(0, i - 8):i], data[i])
+    mixer_time = time.perf_counter() - start
+
+    return {
+        'input_bytes': len(data),
+        'bitwise_bits_per_byte': len(stream) * 8 / n,
+        'bitwise_kb_per_s': len(data) / 1024 / max(bitwise_time, 1e-9),
+        'context_mixer_bits_per_byte': mixer.get_stats()['avg_bits_per_byte'],
+        'context_mixer_kb_per_s': len(data) / 1024 / max(mixer_time, 1e-9),
+    }
+
+
+def run_verification():
+    """Verify the bitwise logistic-mixing engine."""
+    import zlib
+    from .context_mixer import AdaptiveBitMixer
+    from .range_coder import encode_bytes, decode_bytes
+
+    print("=" * 60)
+    print("LOGISTIC MIXER VERIFICATION")
+    print("=" * 60)
+
+    # Test 1: State table
+    print("\n--- Test 1: Bit-History State Table ---")
+    print(f"  States: {len(STATES)} (fits in one byte: {len(STATES) <= 256})")
+    s = 0
+    for bit in (1, 1, 1, 1, 0):
+        s = (STATE_NEXT1 if bit else STATE_NEXT0)[s]
+    print(f"  After 11110: (n0, n1) = {STATES[s]}")
+
+    # Test 2: Round-trip
+    print("\n--- Test 2: Range-Coded Round-Trip ---")
+    text = (b"The crystal processes the entire frame. " * 50 +
+            b"Patterns emerge from the N-Frame windows. " * 50)
+    stream = encode_bytes(text, LogisticMixingPredictor(18))
+    decoded = decode_bytes(stream, len(text), LogisticMixingPredictor(18))
+    print(f"  {len(text):,} -> {len(stream):,} bytes")
+    print(f"  Round-trip: {'PASS' if decoded == text else 'FAIL'}")
+
+    # Test 3: Benchmark
+    print("\n--- Test 3: Benchmark vs ContextMixer ---")
+    import os
+    sample_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'compressor.py')
+    with open(sample_path, 'rb') as f:
+        sample = f.read(20000)
+
+    stats = benchmark_against_context_mixer(sample)
+    adaptive = encode_bytes(sample, AdaptiveBitMixer(20))
+    print(f"  Sample: {stats['input_bytes']:,} bytes of source code")
+    print(f"  {'Engine':<28} {'bits/byte':>10} {'KB/s':>8}")
+    print(f"  {'ContextMixer (estimate)':<28} {stats['context_mixer_bits_per_byte']:>10.3f} "
+          f"{stats['context_mixer_kb_per_s']:>8.1f}")
+    print(f"  {'AdaptiveBitMixer (coded)':<28} {len(adaptive) * 8 / len(sample):>10.3f}")
+    print(f"  {'LogisticMixingPredictor':<28} {stats['bitwise_bits_per_byte']:>10.3f} "
+          f"{stats['bitwise_kb_per_s']:>8.1f}")
+    print(f"  {'zlib -9':<28} {len(zlib.compress(sample, 9)) * 8 / len(sample):>10.3f}")
+
+    print("\n" + "=" * 60)
+    print("VERIFICATION COMPLETE")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_verification()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Range Coder - The Probability Integral
+
+THE PHYSICS:
+"A prediction is only worth the bits it saves."
+
+The context mixers predict the next byte, but until now the prediction
+never reached the wire: v70 stored the raw bytes behind a zlib proxy.
+This module closes the loop with a binary arithmetic (range) coder.
+Every bit of every byte is coded against the probability the mixer
+assigned to it, so a confident, correct prediction costs a fraction
+of a bit and the stream approaches the model's cross-entropy.
+
+Design (lpaq-style carry-less binary coder):
+- 32-bit interval [x1, x2], split by a 12-bit probability
+- Leading bytes are shifted out as soon as x1 and x2 agree on them
+- The decoder mirrors the encoder exactly, one bit at a time
+
+Any predictor exposing ``predict() -> p1`` (12-bit probability that the
+next bit is 1) and ``update(bit)`` can drive the coder. Encoder and
+decoder must use identically configured predictors.
+
+Author: The Architect
+License: Public Domain
+"""
+
+from typing import Union
+
+
+# Probability resolution: 12 bits (0..4095)
+PROB_BITS = 12
+PROB_SCALE = 1 << PROB_BITS
+
+_MASK32 = 0xFFFFFFFF
+
+
+class ArithmeticEncoder:
+    """
+    Binary arithmetic encoder.
+
+    Encodes bits one at a time given the probability that each bit is 1.
+    """
+
+    def __init__(self):
+        self.x1 = 0
+        self.x2 = _MASK32
+        self._out = bytearray()
+
+    def encode_bit(self, bit: int, p1: int):
+        """
+        Encode a single bit.
+
+        Args:
+            bit: The bit to encode (0 or 1)
+            p1: 12-bit probability that bit == 1 (1..4095)
+        """
+        xmid = self.x1 + ((self.x2 - self.x1) >> PROB_BITS) * p1
+        if bit:
+            self.x2 = xmid
+        else:
+            self.x1 = xmid + 1
+
+        # Shift out settled leading bytes
+        while ((self.x1 ^ self.x2) & 0xFF000000) == 0:
+            self._out.append(self.x2 >> 24)
+            self.x1 = (self.x1 << 8) & _MASK32
+            self.x2 = ((self.x2 << 8) & _MASK32) | 0xFF
+
+    def finish(self) -> bytes:
+        """Flush the interval and return the coded stream."""
+        # Four bytes of x1 pin the final interval unambiguously
+        self._out += self.x1.to_bytes(4, 'big')
+        return bytes(self._out)
+
+
+class ArithmeticDecoder:
+    """
+    Binary arithmetic decoder (streaming).
+
+    Mirrors ArithmeticEncoder: consumes input bytes only as the interval
+    narrows, so it can decode directly out of a larger buffer.
+    """
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview], offset: int = 0):
+        self._data = data
+        self._pos = offset
+        self.x1 = 0
+        self.x2 = _MASK32
+        self.x = 0
+        for _ in range(4):
+            self.x = (self.x << 8) | self._next_byte()
+
+    def _next_byte(self) -> int:
+        """Read the next input byte (zero past the end)."""
+        if self._pos < len(self._data):
+            b = self._data[self._pos]
+            self._pos += 1
+            return b
+        return 0
+
+    def decode_bit(self, p1: int) -> int:
+        """
+        Decode a single bit.
+
+        Args:
+            p1: 12-bit probability that bit == 1 (must match the encoder)
+
+        Returns:
+            The decoded bit
+        """
+        xmid = self.x1 + ((self.x2 - self.x1) >> PROB_BITS) * p1
+        if self.x <= xmid:
+            bit = 1
+            self.x2 = xmid
+        else:
+            bit = 0
+            self.x1 = xmid + 1
+
+        while ((self.x1 ^ self.x2) & 0xFF000000) == 0:
+            self.x1 = (self.x1 << 8) & _MASK32
+            self.x2 = ((self.x2 << 8) & _MASK32) | 0xFF
+            self.x = ((self.x << 8) & _MASK32) | self._next_byte()
+
+        return bit
+
+    @property
+    def position(self) -> int:
+        """Number of input bytes consumed so far (including the offset)."""
+        return self._pos
+
+
+def encode_bytes(data: Union[bytes, bytearray, memoryview], predictor) -> bytes:
+    """
+    Arithmetic-code a byte sequence, MSB first, driven by a bit predictor.
+
+    Args:
+        data: Bytes to encode
+        predictor: Object with predict() -> p1 and update(bit)
+
+    Returns:
+        Coded stream
+    """
+    encoder = ArithmeticEncoder()
+    encode_bit = encoder.encode_bit
+    predict = predictor.predict
+    update = predictor.update
+
+    for byte in bytes(data):
+        for shift in range(7, -1, -1):
+            bit = (byte >> shift) & 1
+            encode_bit(bit, predict())
+            update(bit)
+
+    return encoder.finish()
+
+
+def decode_bytes(stream: Union[bytes, bytearray, memoryview], length: int,
+                 predictor, offset: int = 0) -> bytes:
+    """
+    Decode `length` bytes produced by encode_bytes.
+
+    Args:
+        stream: Coded stream
+        length: Number of bytes to reconstruct
+        predictor: Predictor configured identically to the encoder's
+        offset: Start of the coded stream within `stream`
+
+    Returns:
+        Reconstructed bytes
+    """
+    decoder = ArithmeticDecoder(stream, offset)
+    decode_bit = decoder.decode_bit
+    predict = predictor.predict
+    update = predictor.update
+
+    out = bytearray(length)
+    for i in range(length):
+        c = 0
+        for _ in range(8):
+            bit = decode_bit(predict())
+            update(bit)
+            c = (c << 1) | bit
+        out[i] = c
+
+    return bytes(out)
+
+
+def run_verification():
+    """Verify the range coder round-trip and its use of predictions."""
+    import time
+    import zlib
+    from .context_mixer import AdaptiveBitMixer
+
+    print("=" * 60)
+    print("RANGE CODER VERIFICATION")
+    print("=" * 60)
+
+    # Test 1: Fixed-probability coding
+    print("\n--- Test 1: Fixed Probability Round-Trip ---")
+
+    class _Fixed:
+        def predict(self):
+            return 2048
+
+        def update(self, bit):
+            pass
+
+    sample = bytes(range(256)) * 4
+    coded = encode_bytes(sample, _Fixed())
+    decoded = decode_bytes(coded, len(sample), _Fixed())
+    print(f"  Input: {len(sample)} bytes, coded: {len(coded)} bytes")
+    print(f"  Round-trip: {'PASS' if decoded == sample else 'FAIL'}")
+
+    # Test 2: Adaptive context mixing
+    print("\n--- Test 2: Adaptive Context Mixing ---")
+    text = (b"The crystal processes the entire frame. " * 100 +
+            b"Patterns emerge from the N-Frame windows. " * 100)
+
+    start = time.time()
+    coded = encode_bytes(text, AdaptiveBitMixer(table_bits=18))
+    encode_time = time.time() - start
+
+    start = time.time()
+    decoded = decode_bytes(coded, len(text), AdaptiveBitMixer(table_bits=18))
+    decode_time = time.time() - start
+
+    print(f"  Input: {len(text):,} bytes")
+    print(f"  Range coded: {len(coded):,} bytes ({len(coded) * 8 / len(text):.3f} bits/byte)")
+    print(f"  zlib -9: {len(zlib.compress(text, 9)):,} bytes")
+    print(f"  Encode: {len(text) / encode_time / 1024:.1f} KB/s, "
+          f"Decode: {len(text) / decode_time / 1024:.1f} KB/s")
+    print(f"  Round-trip: {'PASS' if decoded == text else 'FAIL'}")
+
+    print("\n" + "=" * 60)
+    print("VERIFICATION COMPLETE")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_verification()
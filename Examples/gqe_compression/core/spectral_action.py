@@ -18,7 +18,7 @@ License: Public Domain
 """
 
 import numpy as np
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Union
 from scipy import sparse
 from scipy.sparse import csr_matrix, lil_matrix
 from scipy.sparse.linalg import eigsh, svds
@@ -26,23 +26,24 @@ import networkx as nx
 
 try:
     from .phi_adic import PHI, PHI_INV
-    from .e8_lattice import Spinor, spinor_distance
+    from .e8_lattice import Spinor, SpinorBatch, spinor_distance_matrix
 except ImportError:
     from phi_adic import PHI, PHI_INV
-    from e8_lattice import Spinor, spinor_distance
+    from e8_lattice import Spinor, SpinorBatch, spinor_distance_matrix
 
 # Precision
 EPSILON = 1e-10
 
 
-def build_graph_from_spinors(spinors: List[Spinor], threshold: float = 2.0) -> nx.Graph:
+def build_graph_from_spinors(spinors: Union[List[Spinor], SpinorBatch],
+                             threshold: float = 2.0) -> nx.Graph:
     """
     Build a graph from spinors where edges connect nearby spinors.
     
     Edge weights are based on spinor distance (including phase).
     
     Args:
-        spinors: List of spinors
+        spinors: List of spinors or a SpinorBatch
         threshold: Maximum distance for edge creation
     
     Returns:
@@ -55,14 +56,13 @@ def build_graph_from_spinors(spinors: List[Spinor], threshold: float = 2.0) -> n
     for i, spinor in enumerate(spinors):
         G.add_node(i, spinor=spinor)
     
-    # Add edges between nearby spinors
-    for i in range(n):
-        for j in range(i + 1, n):
-            dist = spinor_distance(spinors[i], spinors[j])
-            if dist < threshold:
-                # Weight is inverse distance (closer = stronger connection)
-                weight = 1.0 / (dist + EPSILON)
-                G.add_edge(i, j, weight=weight, distance=dist)
+    # Add edges between nearby spinors (upper triangle of the distance matrix)
+    distances = spinor_distance_matrix(spinors)
+    rows, cols = np.nonzero(np.triu(distances < threshold, k=1))
+    for i, j in zip(rows.tolist(), cols.tolist()):
+        dist = float(distances[i, j])
+        # Weight is inverse distance (closer = stronger connection)
+        G.add_edge(i, j, weight=1.0 / (dist + EPSILON), distance=dist)
     
     return G
 
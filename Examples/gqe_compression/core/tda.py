@@ -26,17 +26,18 @@ License: Public Domain
 
 import numpy as np
 from typing import List, Tuple, Dict, Any, Union, Optional
-from collections import Counter, defaultdict
+from dataclasses import dataclass
 import networkx as nx
+from scipy import sparse
 from scipy.sparse.linalg import eigsh
 from scipy.sparse import csr_matrix
 
 try:
     from .phi_adic import PHI, PHI_INV
-    from .e8_lattice import Spinor
+    from .e8_lattice import Spinor, SpinorBatch
 except ImportError:
     from phi_adic import PHI, PHI_INV
-    from e8_lattice import Spinor
+    from e8_lattice import Spinor, SpinorBatch
 
 # Precision
 EPSILON = 1e-10
@@ -112,6 +113,373 @@ def tokenize(data: Union[str, bytes, List], mode: str = 'auto') -> List[Token]:
     return tokens
 
 
+# ============================================================================
+# Span tokenizer (no per-token objects)
+# ============================================================================
+
+# bytes.split() whitespace; str.split() adds the separators 0x1c-0x1f
+_ASCII_SPACE = np.zeros(256, dtype=bool)
+_ASCII_SPACE[[9, 10, 11, 12, 13, 32]] = True
+_TEXT_SPACE = _ASCII_SPACE.copy()
+_TEXT_SPACE[28:32] = True
+
+# UTF-8 encodings of the non-ASCII characters str.split() splits on
+# (none lies above U+3000)
+_UNICODE_SPACES = [chr(c).encode('utf-8') for c in range(0x80, 0x3001) if chr(c).isspace()]
+
+# Spans are factorized in blocks of this many tokens
+SPAN_BLOCK = 1 << 16
+
+# Spans up to this many bytes are compared as padded rows; longer ones by dict
+SPAN_PAD_LIMIT = 64
+
+
+@dataclass
+class TokenSpans:
+    """
+    A token stream as byte spans over one buffer.
+    
+    Token i is buffer[starts[i]:ends[i]]. No Token objects exist; token
+    values are only materialized once per distinct token, and text is
+    only decoded when the values are requested as str.
+    
+    Values follow tokenize: ints in byte mode (and char mode over bytes),
+    code points in char mode over text, lowercased words in word mode
+    (str for text input, bytes otherwise).
+    
+    Attributes:
+        buffer: (n,) uint8 view of the data (UTF-8 for text input)
+        starts: (N,) int64 start offsets
+        ends: (N,) int64 end offsets
+        mode: 'byte', 'char' or 'word'
+        text: True when the input was a str
+    """
+    buffer: np.ndarray
+    starts: np.ndarray
+    ends: np.ndarray
+    mode: str
+    text: bool
+    
+    def __len__(self) -> int:
+        return len(self.starts)
+    
+    def _value(self, key: bytes) -> Any:
+        """Token value of one (already lowercased in word mode) span."""
+        if self.mode == 'word':
+            return key.decode('utf-8').lower() if self.text else key
+        if self.mode == 'char' and self.text:
+            return key.decode('utf-8')
+        return key[0]
+    
+    def factorize(self) -> Tuple[np.ndarray, List[Any]]:
+        """
+        Integer ids in order of first appearance, as token_ids.
+        
+        Returns:
+            (ids, values): (N,) int64 ids and the distinct values
+        """
+        if self.mode == 'byte' or (self.mode == 'char' and not self.text):
+            ids, keys = _factorize_bytes(self.buffer)
+        else:
+            ids, keys = factorize_spans(self.buffer, self.starts, self.ends,
+                                         lower=self.mode == 'word')
+        values = [self._value(k) for k in keys]
+        
+        # Decoding can merge spans (str.lower folds beyond ASCII)
+        index = {}
+        remap = np.array([index.setdefault(v, len(index)) for v in values], dtype=np.int64)
+        if len(index) < len(values):
+            ids = remap[ids]
+            values = list(index)
+        return ids, values
+    
+    def to_tokens(self) -> List[Token]:
+        """Materialize Token objects (for the NetworkX backend)."""
+        ids, values = self.factorize()
+        return [Token(values[i], position=p) for p, i in enumerate(ids.tolist())]
+
+
+def _factorize_bytes(codes: np.ndarray) -> Tuple[np.ndarray, List[bytes]]:
+    """First-appearance ids of single-byte tokens."""
+    present, first = np.unique(codes, return_index=True)
+    order = present[np.argsort(first)]
+    lut = np.zeros(256, dtype=np.int64)
+    lut[order] = np.arange(len(order))
+    return lut[codes], [bytes([b]) for b in order.tolist()]
+
+
+def factorize_spans(buffer: np.ndarray, starts: np.ndarray, ends: np.ndarray,
+                     lower: bool) -> Tuple[np.ndarray, List[bytes]]:
+    """
+    First-appearance ids of variable-length spans.
+    
+    Each block of spans is gathered into zero-padded rows (plus a length
+    byte) and factorized with np.unique; only each block's distinct
+    spans touch the Python dict that merges blocks. Lowercasing is
+    ASCII-only, like bytes.lower().
+    """
+    n = len(starts)
+    ids = np.empty(n, dtype=np.int64)
+    index: Dict[bytes, int] = {}
+    lengths = ends - starts
+    
+    for lo in range(0, n, SPAN_BLOCK):
+        hi = min(lo + SPAN_BLOCK, n)
+        block_starts = starts[lo:hi]
+        block_lengths = lengths[lo:hi]
+        short = np.flatnonzero(block_lengths <= SPAN_PAD_LIMIT)
+        long = np.flatnonzero(block_lengths > SPAN_PAD_LIMIT)
+        
+        # (position in block, key, distinct short row or -1 for a long span)
+        pending = []
+        if len(short):
+            lens = block_lengths[short]
+            width = int(lens.max())
+            cols = np.arange(width)
+            gather = np.minimum(block_starts[short, None] + cols, len(buffer) - 1)
+            rows = np.zeros((len(short), width + 1), dtype=np.uint8)
+            rows[:, :width] = np.where(cols < lens[:, None], buffer[gather], 0)
+            if lower:
+                upper = (rows[:, :width] >= 65) & (rows[:, :width] <= 90)
+                rows[:, :width] += upper.view(np.uint8) * np.uint8(32)
+            rows[:, width] = lens
+            keys = rows.view(np.dtype((np.void, width + 1))).ravel()
+            _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+            for u, f in enumerate(first.tolist()):
+                pending.append((int(short[f]), rows[f, :rows[f, width]].tobytes(), u))
+            local = np.empty(len(first), dtype=np.int64)
+        for pos in long.tolist():
+            start = int(block_starts[pos])
+            key = buffer[start:start + int(block_lengths[pos])].tobytes()
+            pending.append((pos, key.lower() if lower else key, -1))
+        
+        # Assign global ids in stream order so ids follow first appearance
+        pending.sort(key=lambda entry: entry[0])
+        for pos, key, u in pending:
+            gid = index.setdefault(key, len(index))
+            if u < 0:
+                ids[lo + pos] = gid
+            else:
+                local[u] = gid
+        if len(short):
+            ids[lo + short] = local[inverse.ravel()]
+    
+    return ids, list(index)
+
+
+def _whitespace_mask(buffer: np.ndarray, text: bool) -> np.ndarray:
+    """Bytes that split words, as str.split() (text) or bytes.split()."""
+    mask = (_TEXT_SPACE if text else _ASCII_SPACE)[buffer]
+    n = len(buffer)
+    if not text or n == 0 or buffer.max() < 0x80:
+        return mask
+    for seq in _UNICODE_SPACES:
+        width = len(seq)
+        if n < width:
+            continue
+        hit = buffer[:n - width + 1] == seq[0]
+        for k in range(1, width):
+            hit &= buffer[k:n - width + 1 + k] == seq[k]
+        for k in range(width):
+            mask[k:n - width + 1 + k] |= hit
+    return mask
+
+
+def tokenize_spans(data: Union[str, bytes, memoryview], mode: str = 'auto') -> TokenSpans:
+    """
+    Tokenize into (starts, ends) offset arrays over the original buffer.
+    
+    Every stage runs on a uint8 view: bytes-like input (including mmap
+    slices) is never copied or decoded, and str input is encoded to
+    UTF-8 once. Word and char modes give the same token stream as
+    tokenize. Byte mode splits the UTF-8 buffer, so for str input it
+    yields byte values (as tokenize does for the encoded bytes), not
+    the characters tokenize(text, 'byte') returns.
+    
+    Args:
+        data: Input data (string or bytes-like)
+        mode: 'auto', 'char', 'word' or 'byte' (as in tokenize)
+    
+    Returns:
+        TokenSpans
+    """
+    text = isinstance(data, str)
+    if mode == 'auto':
+        mode = ('word' if len(data) > 100 else 'char') if text else 'byte'
+    if mode not in ('byte', 'char', 'word'):
+        raise ValueError(f"Span tokenization does not support mode {mode!r}")
+    
+    buffer = np.frombuffer(data.encode('utf-8') if text else data, dtype=np.uint8)
+    n = len(buffer)
+    
+    if mode == 'word':
+        inside = ~_whitespace_mask(buffer, text)
+        edges = np.diff(inside.view(np.int8), prepend=np.int8(0), append=np.int8(0))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+    elif mode == 'char' and text:
+        # A code point starts at every byte that is not a continuation byte
+        starts = np.flatnonzero((buffer & 0xC0) != 0x80)
+        ends = np.append(starts[1:], n)
+    else:
+        starts = np.arange(n)
+        ends = starts + 1
+    
+    return TokenSpans(buffer, starts.astype(np.int64), ends.astype(np.int64), mode, text)
+
+
+@dataclass
+class CooccurrenceMatrix:
+    """
+    Sparse co-occurrence structure of a token stream.
+    
+    Node i is the i-th distinct token value in order of first appearance.
+    Both matrices are symmetric CSR with an empty diagonal.
+    
+    Attributes:
+        nodes: Token values, indexed by node id
+        node_counts: (V,) occurrences of each node
+        counts: (V, V) co-occurrence counts within the window
+        weights: (V, V) PMI edge weights (nonzero exactly where counts is)
+        window_size: Window used for pairing
+    """
+    nodes: List[Any]
+    node_counts: np.ndarray
+    counts: csr_matrix
+    weights: csr_matrix
+    window_size: int
+    
+    @property
+    def index(self) -> Dict[Any, int]:
+        """Token value -> node id."""
+        return {value: i for i, value in enumerate(self.nodes)}
+    
+    def number_of_nodes(self) -> int:
+        return len(self.nodes)
+    
+    def number_of_edges(self) -> int:
+        return self.weights.nnz // 2
+    
+    def to_networkx(self) -> nx.Graph:
+        """
+        Wrap the sparse structure in a NetworkX graph.
+        
+        Nodes carry 'count'; edges carry 'weight' (PMI) and 'count'.
+        """
+        G = nx.Graph()
+        G.add_nodes_from(
+            (value, {'count': count})
+            for value, count in zip(self.nodes, self.node_counts.tolist())
+        )
+        
+        upper_counts = sparse.triu(self.counts, k=1).tocoo()
+        upper_weights = sparse.triu(self.weights, k=1).tocoo()
+        nodes = self.nodes
+        G.add_edges_from(
+            (nodes[i], nodes[j], {'weight': w, 'count': c})
+            for i, j, w, c in zip(upper_weights.row.tolist(), upper_weights.col.tolist(),
+                                  upper_weights.data.tolist(), upper_counts.data.tolist())
+        )
+        return G
+
+
+def token_ids(tokens: Union[List[Token], TokenSpans]) -> Tuple[np.ndarray, List[Any]]:
+    """
+    Map a token stream to integer ids.
+    
+    Returns:
+        (ids, values): (n,) int64 ids and the distinct values in
+        order of first appearance
+    """
+    if isinstance(tokens, TokenSpans):
+        return tokens.factorize()
+    index = {}
+    ids = np.fromiter(
+        (index.setdefault(t.value, len(index)) for t in tokens),
+        dtype=np.int64, count=len(tokens)
+    )
+    return ids, list(index)
+
+
+def build_cooccurrence_matrix(
+    tokens: Union[List[Token], TokenSpans, np.ndarray],
+    window_size: int = 5,
+    min_count: int = 1,
+    values: Optional[List[Any]] = None
+) -> CooccurrenceMatrix:
+    """
+    Build the co-occurrence matrix of a token stream, fully vectorized.
+    
+    For each offset d in 1..window_size the stream is paired with itself
+    shifted by d; each unordered pair of distinct tokens adds one count.
+    Work and memory are O(n * window_size), never O(V^2).
+    
+    Weights are PMI, as in build_cooccurrence_graph:
+        weight = max(log(P(a,b) / (P(a) P(b))), 0) + 0.1
+    with P(a,b) approximated by count / (n * window_size).
+    
+    Args:
+        tokens: List of tokens, TokenSpans, or an (n,) array of integer ids
+        window_size: Size of co-occurrence window
+        min_count: Minimum token count to include
+        values: Token values for integer ids (default: the ids themselves)
+    
+    Returns:
+        CooccurrenceMatrix
+    """
+    if isinstance(tokens, np.ndarray):
+        ids = tokens.astype(np.int64, copy=False)
+        n_values = int(ids.max()) + 1 if len(ids) else 0
+        if values is None:
+            values = list(range(n_values))
+        elif len(values) < n_values:
+            raise ValueError(f"values has {len(values)} entries, ids reach {n_values - 1}")
+    else:
+        ids, values = token_ids(tokens)
+    total_tokens = len(ids)
+    
+    # Count token frequencies and filter by minimum count
+    value_counts = np.bincount(ids, minlength=len(values))
+    valid = value_counts >= min_count
+    kept = np.flatnonzero(valid)
+    remap = np.full(len(values), -1, dtype=np.int64)
+    remap[kept] = np.arange(len(kept))
+    node_ids = remap[ids]
+    n_nodes = len(kept)
+    
+    # Shifted-window pairing (invalid and identical pairs dropped)
+    upper = csr_matrix((n_nodes, n_nodes), dtype=np.int64)
+    for d in range(1, min(window_size, max(total_tokens - 1, 0)) + 1):
+        a = node_ids[:-d]
+        b = node_ids[d:]
+        keep = (a >= 0) & (b >= 0) & (a != b)
+        lo = np.minimum(a[keep], b[keep])
+        hi = np.maximum(a[keep], b[keep])
+        upper = upper + csr_matrix(
+            (np.ones(len(lo), dtype=np.int64), (lo, hi)), shape=(n_nodes, n_nodes)
+        )
+    upper.sum_duplicates()
+    
+    # PMI = log(P(t1,t2) / (P(t1) * P(t2))) on the sparse entries
+    coo = upper.tocoo()
+    node_counts = value_counts[kept]
+    p_t1 = node_counts[coo.row] / total_tokens
+    p_t2 = node_counts[coo.col] / total_tokens
+    p_joint = coo.data / (total_tokens * window_size)  # Approximate
+    pmi = np.log(p_joint / (p_t1 * p_t2 + EPSILON) + EPSILON)
+    # Use positive PMI only, plus a small base weight
+    pmi_weights = np.maximum(pmi, 0.0) + 0.1
+    
+    upper_weights = csr_matrix((pmi_weights, (coo.row, coo.col)), shape=(n_nodes, n_nodes))
+    return CooccurrenceMatrix(
+        nodes=[values[i] for i in kept.tolist()],
+        node_counts=node_counts,
+        counts=(upper + upper.T).tocsr(),
+        weights=(upper_weights + upper_weights.T).tocsr(),
+        window_size=window_size,
+    )
+
+
 def build_cooccurrence_graph(
     tokens: List[Token], 
     window_size: int = 5,
@@ -124,6 +492,9 @@ def build_cooccurrence_graph(
     Edges: Co-occurrence within sliding window
     Weights: PMI (Pointwise Mutual Information)
     
+    The counting is done by build_cooccurrence_matrix; this wraps the
+    sparse result in NetworkX for graph-algorithm callers.
+    
     Args:
         tokens: List of tokens
         window_size: Size of co-occurrence window
@@ -132,48 +503,7 @@ def build_cooccurrence_graph(
     Returns:
         NetworkX graph with weighted edges
     """
-    G = nx.Graph()
-    
-    # Count token frequencies
-    token_counts = Counter(t.value for t in tokens)
-    total_tokens = len(tokens)
-    
-    # Filter by minimum count
-    valid_tokens = {t for t, c in token_counts.items() if c >= min_count}
-    
-    # Count co-occurrences
-    cooccur = defaultdict(int)
-    for i in range(len(tokens)):
-        if tokens[i].value not in valid_tokens:
-            continue
-        for j in range(i + 1, min(i + window_size + 1, len(tokens))):
-            if tokens[j].value not in valid_tokens:
-                continue
-            # Order tokens consistently
-            pair = tuple(sorted([tokens[i].value, tokens[j].value], key=str))
-            cooccur[pair] += 1
-    
-    # Add nodes
-    for token_val in valid_tokens:
-        G.add_node(token_val, count=token_counts[token_val])
-    
-    # Add edges with PMI weights
-    for (t1, t2), count in cooccur.items():
-        if t1 == t2:
-            continue
-        
-        # PMI = log(P(t1,t2) / (P(t1) * P(t2)))
-        p_t1 = token_counts[t1] / total_tokens
-        p_t2 = token_counts[t2] / total_tokens
-        p_joint = count / (total_tokens * window_size)  # Approximate
-        
-        if p_joint > 0 and p_t1 > 0 and p_t2 > 0:
-            pmi = np.log(p_joint / (p_t1 * p_t2 + EPSILON) + EPSILON)
-            # Use positive PMI only
-            weight = max(pmi, 0.0) + 0.1  # Small base weight
-            G.add_edge(t1, t2, weight=weight, count=count)
-    
-    return G
+    return build_cooccurrence_matrix(tokens, window_size, min_count).to_networkx()
 
 
 def compute_eigenvector_centrality(G: nx.Graph) -> Dict[Any, float]:
@@ -314,6 +644,285 @@ def compute_persistence(G: nx.Graph) -> Dict[Any, float]:
     return persistence
 
 
+# ============================================================================
+# Sparse-native features (scale to 100k+ node vocabularies)
+# ============================================================================
+
+# With accuracy=None, betweenness samples about this many pivot sources
+AUTO_PIVOTS = 1024
+
+# Below this many nodes the Laplacian is diagonalized densely (exact)
+DENSE_EIGEN_LIMIT = 512
+
+# Row blocks of the triangle product hold at most this many entries
+TRIANGLE_BLOCK_NNZ = 1 << 22
+
+
+def _resolve_accuracy(accuracy: Optional[float], n_nodes: int) -> float:
+    """Clamp the accuracy knob; None picks a fixed pivot budget."""
+    if accuracy is None:
+        return min(1.0, AUTO_PIVOTS / max(n_nodes, 1))
+    if not 0.0 < accuracy <= 1.0:
+        raise ValueError(f"accuracy must be in (0, 1], got {accuracy}")
+    return float(accuracy)
+
+
+def sparse_eigenvector_centrality(W: csr_matrix, tol: float = 1e-10,
+                                  max_iter: int = 1000) -> np.ndarray:
+    """
+    Eigenvector centrality by power iteration on the sparse adjacency.
+    
+    Iterates x <- (W + I) x: the shift keeps the dominant eigenvector
+    but stops bipartite structure from oscillating. The result is
+    L2-normalized and nonnegative, like eigenvector_centrality_numpy.
+    
+    Returns:
+        (V,) centrality values
+    """
+    n = W.shape[0]
+    if n == 0:
+        return np.zeros(0)
+    x = np.full(n, 1.0 / np.sqrt(n))
+    for _ in range(max_iter):
+        x_next = W @ x + x
+        x_next /= np.linalg.norm(x_next)
+        if np.abs(x_next - x).sum() < n * tol:
+            x = x_next
+            break
+        x = x_next
+    return x
+
+
+def sparse_clustering(W: csr_matrix) -> np.ndarray:
+    """
+    Weighted clustering coefficient by sparse triangle counting.
+    
+    Same definition as nx.clustering(G, weight='weight'): with
+    ŵ = (w / max w)^(1/3), c_u = (ŵ^3)_uu / (deg_u (deg_u - 1)).
+    The diagonal of ŵ^3 is accumulated in row blocks, so the two-hop
+    product never has to exist all at once.
+    
+    Returns:
+        (V,) clustering coefficients
+    """
+    n = W.shape[0]
+    clustering = np.zeros(n)
+    if W.nnz == 0:
+        return clustering
+    
+    C = W.copy()
+    C.data = np.cbrt(C.data / C.data.max())
+    degree = np.diff(C.indptr)
+    
+    triangles = np.zeros(n)
+    row_nnz = np.diff(C.indptr).astype(np.int64)
+    # Two-hop work per row is bounded by sum of neighbor degrees
+    work = np.asarray(C.astype(bool).astype(np.int64) @ row_nnz).ravel() + 1
+    bounds = np.searchsorted(np.cumsum(work), np.arange(0, work.sum(), TRIANGLE_BLOCK_NNZ))
+    bounds = np.unique(np.concatenate([bounds, [n]]))
+    start = 0
+    for stop in bounds:
+        if stop <= start:
+            continue
+        block = C[start:stop]
+        triangles[start:stop] = np.asarray((block @ C).multiply(block).sum(axis=1)).ravel()
+        start = stop
+    
+    pairs = degree * (degree - 1.0)
+    np.divide(triangles, pairs, out=clustering, where=pairs > 0)
+    return clustering
+
+
+def sampled_betweenness(W: csr_matrix, n_pivots: Optional[int] = None,
+                        seed: int = 0) -> np.ndarray:
+    """
+    Betweenness centrality from a sample of pivot sources.
+    
+    Each pivot's shortest-path tree comes from one C-level Dijkstra
+    (edge weight = length, as in nx.betweenness_centrality). The
+    dependency of a node on a pivot is its descendant count in that
+    tree, accumulated level by level across a block of pivots at once.
+    Ties between equal-length paths follow one path rather than being
+    split, so the result is an estimate even with every node a pivot.
+    
+    Normalized like NetworkX (1 / ((n-1)(n-2)), rescaled by n / pivots).
+    
+    Args:
+        W: Symmetric sparse adjacency (weights are path lengths)
+        n_pivots: Sources to sample (default: all nodes)
+        seed: Pivot sampling seed
+    
+    Returns:
+        (V,) betweenness values
+    """
+    from scipy.sparse.csgraph import dijkstra
+    
+    n = W.shape[0]
+    betweenness = np.zeros(n)
+    if n <= 2 or W.nnz == 0:
+        return betweenness
+    
+    if n_pivots is None or n_pivots >= n:
+        pivots = np.arange(n)
+    else:
+        pivots = np.sort(np.random.default_rng(seed).choice(n, size=n_pivots, replace=False))
+    
+    block = max(1, (1 << 22) // n)
+    for start in range(0, len(pivots), block):
+        sources = pivots[start:start + block]
+        _, pred = dijkstra(W, directed=False, indices=sources, return_predecessors=True)
+        
+        rows = len(sources)
+        offset = (np.arange(rows) * n)[:, None]
+        parent = np.where(pred >= 0, pred + offset, -1).ravel()
+        
+        # Hop depth of every tree node by pointer jumping
+        depth = (parent >= 0).astype(np.int64)
+        anc = parent.copy()
+        while True:
+            active = anc >= 0
+            if not active.any():
+                break
+            depth[active] += depth[anc[active]]
+            anc[active] = anc[anc[active]]
+        
+        # Descendant counts, deepest level first
+        size = np.ones(rows * n)
+        order = np.argsort(-depth, kind='stable')
+        levels = depth[order]
+        cuts = np.flatnonzero(np.diff(levels)) + 1
+        for nodes in np.split(order, cuts):
+            if depth[nodes[0]] == 0:
+                break
+            np.add.at(size, parent[nodes], size[nodes])
+        
+        dependency = (size - 1.0).reshape(rows, n)
+        dependency[np.arange(rows), sources] = 0.0
+        betweenness += dependency.sum(axis=0)
+    
+    return betweenness * (n / len(pivots)) / ((n - 1) * (n - 2))
+
+
+def _normalized_laplacian(W: csr_matrix) -> csr_matrix:
+    """D^-1/2 (D - W) D^-1/2, with isolated nodes left as zero rows."""
+    degree = np.asarray(W.sum(axis=1)).ravel()
+    with np.errstate(divide='ignore'):
+        inv_sqrt = 1.0 / np.sqrt(degree)
+    inv_sqrt[~np.isfinite(inv_sqrt)] = 0.0
+    D = sparse.diags(inv_sqrt)
+    return csr_matrix(D @ (sparse.diags(degree) - W) @ D)
+
+
+def sparse_laplacian_eigenvectors(W: csr_matrix, k: int = 3, tol: float = 0.0,
+                                  seed: int = 0) -> np.ndarray:
+    """
+    First k nontrivial eigenvectors of the normalized Laplacian.
+    
+    Small graphs use a dense solver. Large graphs use the spectral
+    shift M = 2I - L: the normalized Laplacian lives in [0, 2], so its
+    smallest eigenvalues are the largest of M, which Lanczos finds far
+    faster than which='SM'. Signs are fixed so the largest-magnitude
+    entry of each vector is positive.
+    
+    Returns:
+        (V, k) spectral coordinates (zeros if the solve fails)
+    """
+    n = W.shape[0]
+    if n < k + 1:
+        return np.zeros((n, k))
+    
+    L = _normalized_laplacian(W)
+    try:
+        if n <= DENSE_EIGEN_LIMIT:
+            from scipy.linalg import eigh
+            _, vectors = eigh(L.toarray())
+            vectors = vectors[:, :k + 1]
+        else:
+            M = sparse.identity(n, format='csr') * 2.0 - L
+            v0 = np.random.default_rng(seed).uniform(0.5, 1.5, n)
+            values, vectors = eigsh(M, k=k + 1, which='LA', tol=tol, v0=v0)
+            vectors = vectors[:, np.argsort(-values)]
+    except Exception:
+        return np.zeros((n, k))
+    
+    # Skip the first (constant) eigenvector
+    coords = vectors[:, 1:k + 1]
+    signs = np.sign(coords[np.abs(coords).argmax(axis=0), np.arange(coords.shape[1])])
+    signs[signs == 0] = 1.0
+    return coords * signs
+
+
+def sparse_persistence(W: csr_matrix) -> np.ndarray:
+    """
+    compute_persistence on the sparse adjacency.
+    
+    Weighted degree over the mean weighted degree of the neighbors,
+    normalized to [0, 1].
+    
+    Returns:
+        (V,) persistence values
+    """
+    n = W.shape[0]
+    degree = np.asarray(W.sum(axis=1)).ravel()
+    n_neighbors = np.diff(W.indptr)
+    neighbor_sum = W.astype(bool).astype(np.float64) @ degree
+    
+    persistence = np.zeros(n)
+    has = n_neighbors > 0
+    persistence[has] = degree[has] / (neighbor_sum[has] / n_neighbors[has] + EPSILON)
+    
+    max_pers = persistence.max() if n else 1.0
+    if max_pers > 0:
+        persistence /= max_pers
+    return persistence
+
+
+def compute_sparse_features(matrix: 'CooccurrenceMatrix', k: int = 3,
+                            accuracy: Optional[float] = None,
+                            seed: int = 0) -> np.ndarray:
+    """
+    Embedding dims 0-6 for every node, straight from the sparse adjacency.
+    
+    THE PHYSICS:
+    The topology is read from the matrix itself; no graph objects are
+    built. One knob trades fidelity for time:
+    
+    - accuracy = 1.0: every node is a betweenness pivot, power iteration
+      and Lanczos run to full precision.
+    - accuracy < 1.0: about accuracy * V pivots (at least 32), and the
+      iterative solvers stop at tolerance ~10^(-3 - 7 * accuracy).
+    - accuracy = None: a fixed budget of AUTO_PIVOTS pivots, so cost
+      grows linearly with the vocabulary.
+    
+    Clustering and persistence are always exact.
+    
+    Args:
+        matrix: CooccurrenceMatrix
+        k: Number of spectral coordinates (dims 3..3+k)
+        accuracy: Fidelity knob in (0, 1], or None for automatic
+        seed: Pivot sampling / Lanczos start seed
+    
+    Returns:
+        (V, 7) float64: centrality, clustering, betweenness,
+        3 spectral coordinates, persistence
+    """
+    W = matrix.weights
+    n = W.shape[0]
+    accuracy = _resolve_accuracy(accuracy, n)
+    
+    exact = accuracy >= 1.0
+    tol = 0.0 if exact else 10.0 ** (-3 - 7 * accuracy)
+    n_pivots = None if exact else min(n, max(32, int(np.ceil(accuracy * n))))
+    
+    features = np.zeros((n, 7))
+    features[:, 0] = sparse_eigenvector_centrality(W, tol=tol or 1e-10)
+    features[:, 1] = sparse_clustering(W)
+    features[:, 2] = sampled_betweenness(W, n_pivots=n_pivots, seed=seed)
+    features[:, 3:3 + min(k, 3)] = sparse_laplacian_eigenvectors(W, k=k, tol=tol, seed=seed)[:, :3]
+    features[:, 6] = sparse_persistence(W)
+    return features
+
+
 def embed_token_to_spinor(
     token_value: Any,
     graph: nx.Graph,
@@ -402,23 +1011,49 @@ def embed_token_to_spinor(
 
 
 def embed_all_tokens(
-    tokens: List[Token],
-    graph: nx.Graph = None,
-    window_size: int = 5
-) -> List[Spinor]:
+    tokens: Union[List[Token], TokenSpans, np.ndarray],
+    graph: Union[nx.Graph, CooccurrenceMatrix] = None,
+    window_size: int = 5,
+    accuracy: Optional[float] = None,
+    values: Optional[List[Any]] = None
+) -> SpinorBatch:
     """
     Embed all tokens from a token stream into spinors.
     
+    Topological features are looked up once per unique token and
+    gathered for the stream; only dim 7 and the phase depend on the
+    stream position.
+    
+    Two backends, chosen by the graph type:
+    - nx.Graph: exact NetworkX features. Row i equals
+      embed_token_to_spinor for token i.
+    - CooccurrenceMatrix (also used when graph is None): sparse-native
+      features from compute_sparse_features, tuned by accuracy.
+    
+    Spans and id arrays (with their values) sit at stream positions
+    0..N-1 and skip Token objects on the sparse backend.
+    
     Args:
-        tokens: List of tokens
-        graph: Pre-built graph (built if None)
+        tokens: List of tokens, TokenSpans, or an (N,) array of integer ids
+        graph: Pre-built graph or co-occurrence matrix (matrix built if None)
         window_size: Window size for graph building
+        accuracy: Sparse backend fidelity knob (see compute_sparse_features)
+        values: Token values for integer ids (as in build_cooccurrence_matrix)
     
     Returns:
-        List of Spinors (one per token)
+        SpinorBatch (one spinor per token)
     """
     if graph is None:
-        graph = build_cooccurrence_graph(tokens, window_size=window_size)
+        graph = build_cooccurrence_matrix(tokens, window_size=window_size, values=values)
+    
+    if isinstance(graph, CooccurrenceMatrix):
+        return _embed_from_matrix(tokens, graph, accuracy, values)
+    
+    if isinstance(tokens, TokenSpans):
+        tokens = tokens.to_tokens()
+    elif isinstance(tokens, np.ndarray):
+        lookup = values if values is not None else range(int(tokens.max()) + 1 if len(tokens) else 0)
+        tokens = [Token(lookup[i], position=p) for p, i in enumerate(tokens.tolist())]
     
     # Pre-compute all features for efficiency
     centrality = compute_eigenvector_centrality(graph)
@@ -428,26 +1063,77 @@ def embed_all_tokens(
     persistence = compute_persistence(graph)
     
     total = len(tokens)
-    spinors = []
-    
-    for token in tokens:
-        spinor = embed_token_to_spinor(
-            token.value,
-            graph,
-            centrality=centrality,
-            clustering=clustering,
-            betweenness=betweenness,
-            spectral_coords=spectral_coords,
-            persistence=persistence,
-            position=token.position,
-            total_tokens=total
-        )
-        spinors.append(spinor)
     
-    return spinors
+    # Unique token values -> row of the feature table
+    value_index = {}
+    inverse = np.empty(total, dtype=np.int64)
+    stream_positions = np.empty(total, dtype=np.float64)
+    for i, token in enumerate(tokens):
+        inverse[i] = value_index.setdefault(token.value, len(value_index))
+        stream_positions[i] = token.position
+    
+    features = np.zeros((len(value_index), 8), dtype=np.float64)
+    known = np.zeros(len(value_index), dtype=bool)
+    for value, row in value_index.items():
+        if value not in graph:
+            continue  # Unknown token: zero spinor
+        known[row] = True
+        features[row, 0] = centrality.get(value, 0.0)
+        features[row, 1] = clustering.get(value, 0.0)
+        features[row, 2] = betweenness.get(value, 0.0)
+        spec = spectral_coords.get(value, np.zeros(3))
+        features[row, 3:6] = spec[:3] if len(spec) >= 3 else np.pad(spec, (0, 3 - len(spec)))
+        features[row, 6] = persistence.get(value, 0.0)
+    
+    return _gather_spinors(features, known, inverse, stream_positions)
+
+
+def _embed_from_matrix(tokens: Union[List[Token], TokenSpans, np.ndarray],
+                       matrix: CooccurrenceMatrix, accuracy: Optional[float],
+                       values: Optional[List[Any]] = None) -> SpinorBatch:
+    """embed_all_tokens on the sparse backend."""
+    index = matrix.index
+    n_nodes = matrix.number_of_nodes()
+    total = len(tokens)
+    
+    # Tokens filtered out of the matrix map to an all-zero extra row
+    if not isinstance(tokens, (TokenSpans, np.ndarray)):
+        inverse = np.fromiter((index.get(t.value, n_nodes) for t in tokens),
+                              dtype=np.int64, count=total)
+        stream_positions = np.fromiter((t.position for t in tokens), dtype=np.float64, count=total)
+    else:
+        if isinstance(tokens, TokenSpans):
+            ids, values = tokens.factorize()
+        else:
+            ids = tokens.astype(np.int64, copy=False)
+            if values is None:
+                values = range(int(ids.max()) + 1 if total else 0)
+        node_of = np.array([index.get(v, n_nodes) for v in values], dtype=np.int64)
+        inverse = node_of[ids]
+        stream_positions = np.arange(total, dtype=np.float64)
+    
+    features = np.zeros((n_nodes + 1, 8))
+    features[:n_nodes, :7] = compute_sparse_features(matrix, k=3, accuracy=accuracy)
+    known = np.arange(n_nodes + 1) < n_nodes
+    return _gather_spinors(features, known, inverse, stream_positions)
+
+
+def _gather_spinors(features: np.ndarray, known: np.ndarray, inverse: np.ndarray,
+                    stream_positions: np.ndarray) -> SpinorBatch:
+    """Expand per-node feature rows along the stream; fill dim 7 and phase."""
+    total = len(inverse)
+    positions = features[inverse]
+    
+    # Dim 7 and phase follow the stream position (golden angle spacing)
+    golden_angle = 2 * np.pi * PHI_INV
+    token_known = known[inverse]
+    positions[:, 7] = np.where(token_known, stream_positions / max(total, 1) * PHI_INV, 0.0)
+    phases = np.where(token_known, (stream_positions * golden_angle) % (2 * np.pi), 0.0)
+    
+    return SpinorBatch(positions, phases)
 
 
-def embed_text_to_spinors(text: str, mode: str = 'word') -> Tuple[List[Spinor], nx.Graph, Dict]:
+def embed_text_to_spinors(text: str, mode: str = 'word') -> Tuple[SpinorBatch, nx.Graph, Dict]:
     """
     High-level function to embed text into spinors.
     
@@ -502,6 +1188,8 @@ def run_verification() -> None:
     graph = build_cooccurrence_graph(tokens_word, window_size=5)
     print(f"  Nodes: {graph.number_of_nodes()}")
     print(f"  Edges: {graph.number_of_edges()}")
+    matrix = build_cooccurrence_matrix(tokens_word, window_size=5)
+    print(f"  Sparse CSR: {matrix.weights.shape}, nnz={matrix.weights.nnz}")
     
     # Test 3: Topological features
     print("\n--- Test 3: Topological features ---")
@@ -24,8 +24,11 @@ from typing import List, Tuple, Dict, Set, Optional
 from dataclasses import dataclass
 from collections import defaultdict
 import heapq
+from scipy.spatial import cKDTree
 
-from .e8_lattice import Spinor, generate_e8_roots, spinor_distance
+from .e8_lattice import (
+    Spinor, SpinorBatch, generate_e8_roots, _spinor_arrays
+)
 from .projection import (
     coxeter_projection_8d_to_4d, 
     inverse_projection_with_phason,
@@ -34,6 +37,136 @@ from .projection import (
 from .phi_adic import PHI, PHI_INV
 
 
+# Lattice sites each stabilizer measures: a spinor's nearest neighbors by
+# position. Lifted vocabularies sit inside a ball of radius ~1.2, so the
+# distance threshold alone would link every spinor to every other
+STABILIZER_NEIGHBORS = 16
+
+# Candidate partners per syndrome in each round of sparse matching
+MATCHING_CANDIDATES = 16
+
+# Deviations within this of phase_tolerance count as in phase. Byte
+# phases lie on a 2π/256 grid that hits π/8 exactly, and float summation
+# order must not decide those ties
+PHASE_EPSILON = 1e-9
+
+# Neighbor pairs measured per block: bounds the stabilizer working set
+PAIR_BLOCK = 1 << 20
+
+
+def _spinor_tree(positions: np.ndarray, phases: np.ndarray) -> cKDTree:
+    """
+    KD-tree whose metric is spinor_distance.
+    
+    Points are (position, phase / π) in 9D. The phase axis is periodic
+    with period 2, so the wrapped phase difference comes out exactly as
+    in spinor_distance; the position axes get a box twice their extent,
+    so they never wrap.
+    """
+    low = positions.min(axis=0)
+    extent = positions.max(axis=0) - low
+    boxsize = np.append(2 * extent + 1.0, 2.0)
+    points = np.column_stack((positions - low, np.mod(phases / np.pi, 2.0)))
+    return cKDTree(points, boxsize=boxsize)
+
+
+def _pair_distances(positions: np.ndarray, phases: np.ndarray,
+                    rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """spinor_distance for index pairs, computed as spinor_distance_matrix does."""
+    diff = positions[rows] - positions[cols]
+    euclid_sq = np.einsum('ij,ij->i', diff, diff)
+    phase_diff = (phases[rows] - phases[cols] + np.pi) % (2 * np.pi) - np.pi
+    return np.sqrt(euclid_sq + (np.abs(phase_diff) / np.pi) ** 2)
+
+
+def _candidate_pairs(positions: np.ndarray, threshold: float,
+                     max_neighbors: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Ordered pairs (i, j), i != j, that can be neighbors.
+    
+    Candidates are within threshold in position alone. The phase term
+    only adds to spinor_distance, so they hold whatever the phases -
+    corrections that move phases need not search again. With
+    max_neighbors, each point keeps only its max_neighbors nearest
+    positions, so the degree stays fixed however dense the points are.
+    
+    Returns:
+        (rows, cols), sorted by row then column
+    """
+    n = len(positions)
+    if n < 2:
+        return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+    tree = cKDTree(positions)
+    radius = threshold * (1 + 1e-9) + 1e-12
+    
+    if max_neighbors is None:
+        pairs = tree.query_pairs(radius, output_type='ndarray').astype(np.intp)
+        rows = np.concatenate((pairs[:, 0], pairs[:, 1]))
+        cols = np.concatenate((pairs[:, 1], pairs[:, 0]))
+        order = np.lexsort((cols, rows))
+        return rows[order], cols[order]
+    
+    k = min(max_neighbors, n - 1) + 1
+    step = max(1, PAIR_BLOCK // k)
+    row_blocks, col_blocks = [], []
+    for start in range(0, n, step):
+        points = np.arange(start, min(n, start + step))
+        _, near = tree.query(positions[points], k=k, distance_upper_bound=radius)
+        own = near == points[:, None]
+        # Each point is its own nearest site unless others share its position
+        near[:, -1] = np.where(own.any(axis=1), near[:, -1], n)
+        near = np.sort(np.where(own, n, near), axis=1)
+        keep = near < n
+        row_blocks.append(np.broadcast_to(points[:, None], near.shape)[keep])
+        col_blocks.append(near[keep])
+    return np.concatenate(row_blocks).astype(np.intp), np.concatenate(col_blocks).astype(np.intp)
+
+
+def _neighbor_pairs(positions: np.ndarray, phases: np.ndarray, threshold: float,
+                    candidates: Tuple[np.ndarray, np.ndarray]
+                    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    The candidate pairs (i, j) with spinor distance <= threshold.
+    
+    Args:
+        candidates: (rows, cols) from _candidate_pairs
+    
+    Returns:
+        (rows, cols, distances), in candidate order
+    """
+    rows, cols = candidates
+    distances = _pair_distances(positions, phases, rows, cols)
+    keep = distances <= threshold
+    return rows[keep], cols[keep], distances[keep]
+
+
+def _distinct_spinors(positions: np.ndarray,
+                      phases: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Collapse identical spinors.
+    
+    Rows are grouped by a 64-bit hash of their bits (one integer sort
+    rather than a 9-column lexicographic one); a hash collision, caught
+    by comparing every row with its group, falls back to exact np.unique.
+    
+    Returns:
+        (points, inverse, counts): points (U, 9) rows of position + phase,
+        spinor i is points[inverse[i]], counts[g] copies of point g
+    """
+    rows = np.ascontiguousarray(np.column_stack((positions, phases)), dtype=np.float64)
+    words = rows.view(np.uint64)
+    key = words[:, 0].copy()
+    for column in words.T[1:]:
+        key = (key * np.uint64(0x9E3779B97F4A7C15)) ^ column
+    
+    _, first, inverse, counts = np.unique(key, return_index=True, return_inverse=True,
+                                          return_counts=True)
+    points = rows[first]
+    if not np.array_equal(points[inverse], rows):
+        points, inverse, counts = np.unique(rows, axis=0, return_inverse=True, return_counts=True)
+    return points, inverse.reshape(-1), counts.astype(np.float64)
+
+
 @dataclass
 class Syndrome:
     """
@@ -87,7 +220,8 @@ class ToricErrorCorrector:
     def __init__(self, 
                  distance_threshold: float = 2.0,
                  phase_tolerance: float = np.pi / 4,
-                 confidence_threshold: float = 0.3):
+                 confidence_threshold: float = 0.3,
+                 max_neighbors: Optional[int] = STABILIZER_NEIGHBORS):
         """
         Initialize error corrector.
         
@@ -95,10 +229,13 @@ class ToricErrorCorrector:
             distance_threshold: Max spinor distance to be neighbors
             phase_tolerance: Max phase deviation before flagging syndrome
             confidence_threshold: Min confidence to trust neighbor consensus
+            max_neighbors: Nearest distinct spinors (by position) each
+                stabilizer measures; None = all within distance_threshold
         """
         self.distance_threshold = distance_threshold
         self.phase_tolerance = phase_tolerance
         self.confidence_threshold = confidence_threshold
+        self.max_neighbors = max_neighbors
         self.e8_roots = generate_e8_roots()
     
     def build_neighbor_graph(self, spinors: List[Spinor]) -> Dict[int, List[Tuple[int, float]]]:
@@ -106,19 +243,41 @@ class ToricErrorCorrector:
         Build neighbor graph based on E8 lattice distance.
         
         Each spinor is connected to nearby spinors, weighted by distance.
-        This forms the "lattice" for our Toric Code analog.
+        This forms the "lattice" for our Toric Code analog. The sites are
+        the distinct spinors, linked to their max_neighbors nearest sites
+        (KD-tree) within distance_threshold; a spinor's neighbors are the
+        other copies of its own site plus every copy on a linked site -
+        exactly what the stabilizers measure.
         
         Returns:
             Dict mapping spinor index -> list of (neighbor_idx, distance)
         """
         neighbors = defaultdict(list)
         
-        for i, s1 in enumerate(spinors):
-            for j, s2 in enumerate(spinors):
-                if i != j:
-                    dist = spinor_distance(s1, s2)
-                    if dist <= self.distance_threshold:
-                        neighbors[i].append((j, dist))
+        positions, phases = _spinor_arrays(spinors)
+        if len(phases) < 2:
+            return neighbors
+        points, inverse, _ = _distinct_spinors(positions, phases)
+        candidates = _candidate_pairs(points[:, :8], self.distance_threshold, self.max_neighbors)
+        rows, cols, distances = _neighbor_pairs(points[:, :8], points[:, 8],
+                                                self.distance_threshold, candidates)
+        
+        # Copies of each site, and each site's slice of the pair list
+        members = np.argsort(inverse, kind='stable')
+        site_bounds = np.searchsorted(inverse[members], np.arange(len(points) + 1))
+        row_bounds = np.searchsorted(rows, np.arange(len(points) + 1))
+        
+        for g in range(len(points)):
+            sites = np.append(g, cols[row_bounds[g]:row_bounds[g + 1]])
+            sizes = site_bounds[sites + 1] - site_bounds[sites]
+            tokens = np.concatenate([members[site_bounds[h]:site_bounds[h + 1]] for h in sites])
+            dists = np.repeat(np.append(0.0, distances[row_bounds[g]:row_bounds[g + 1]]), sizes)
+            order = np.argsort(tokens, kind='stable')
+            tokens, dists = tokens[order].tolist(), dists[order].tolist()
+            for i in members[site_bounds[g]:site_bounds[g + 1]].tolist():
+                linked = [(j, d) for j, d in zip(tokens, dists) if j != i]
+                if linked:
+                    neighbors[i] = linked
         
         return neighbors
     
@@ -179,6 +338,63 @@ class ToricErrorCorrector:
         
         return expected_phase, confidence
     
+    def _measure_stabilizers(self, positions: np.ndarray, phases: np.ndarray, counts: np.ndarray,
+                             candidates: Optional[Tuple[np.ndarray, np.ndarray]] = None
+                             ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        compute_stabilizer and the syndrome test for every point at once.
+        
+        Points are distinct spinors, each standing for counts[g] identical
+        copies: a copy's neighbors are the other copies of its own point
+        (at distance 0) plus every copy of each neighboring point. All
+        copies of a point measure the same, so each point is measured once.
+        Pairs are measured PAIR_BLOCK at a time.
+        
+        Args:
+            candidates: _candidate_pairs of the points, if already known
+        
+        Returns:
+            (expected_phase, confidence, is_syndrome) arrays over points
+        """
+        n = len(phases)
+        if candidates is None:
+            candidates = _candidate_pairs(positions, self.distance_threshold, self.max_neighbors)
+        
+        sin_sum = np.zeros(n)
+        cos_sum = np.zeros(n)
+        total_weight = np.zeros(n)
+        for start in range(0, len(candidates[0]), PAIR_BLOCK):
+            block = (candidates[0][start:start + PAIR_BLOCK], candidates[1][start:start + PAIR_BLOCK])
+            rows, cols, distances = _neighbor_pairs(positions, phases, self.distance_threshold, block)
+            
+            # Neighbor phases, flipped where the wrapped difference says anti-phase
+            neighbor_phase = phases[cols]
+            anti = np.abs(neighbor_phase - phases[rows]) > np.pi
+            neighbor_phase = np.where(anti, (neighbor_phase + np.pi) % (2 * np.pi), neighbor_phase)
+            weight = counts[cols] / (1.0 + distances)
+            
+            sin_sum += np.bincount(rows, weight * np.sin(neighbor_phase), n)
+            cos_sum += np.bincount(rows, weight * np.cos(neighbor_phase), n)
+            total_weight += np.bincount(rows, weight, n)
+        
+        # Copies of the point itself: weight 1 each, in phase
+        own = counts - 1.0
+        sin_sum += own * np.sin(phases)
+        cos_sum += own * np.cos(phases)
+        total_weight += own
+        
+        measured = total_weight >= 1e-10
+        safe_weight = np.where(measured, total_weight, 1.0)
+        expected = np.where(measured, np.arctan2(sin_sum, cos_sum) % (2 * np.pi), phases)
+        confidence = np.where(measured, np.sqrt(sin_sum**2 + cos_sum**2) / safe_weight, 0.0)
+        
+        # Flag deviations beyond tolerance that the neighbors agree on
+        deviation = np.abs(expected - phases)
+        deviation = np.minimum(deviation, 2 * np.pi - deviation)
+        is_syndrome = (measured & (deviation > self.phase_tolerance + PHASE_EPSILON) &
+                       (confidence > self.confidence_threshold))
+        return expected, confidence, is_syndrome
+    
     def detect_syndromes(self, spinors: List[Spinor]) -> List[Syndrome]:
         """
         Detect phase inconsistencies (syndromes) in spinor configuration.
@@ -195,34 +411,22 @@ class ToricErrorCorrector:
         if len(spinors) < 2:
             return []
         
-        neighbors = self.build_neighbor_graph(spinors)
-        syndromes = []
+        positions, phases = _spinor_arrays(spinors)
+        points, inverse, counts = _distinct_spinors(positions, phases)
+        expected, confidence, is_syndrome = self._measure_stabilizers(
+            points[:, :8], points[:, 8], counts)
         
-        for i, spinor in enumerate(spinors):
-            if i not in neighbors or len(neighbors[i]) == 0:
-                continue
-            
-            # Get neighbor spinors with distances
-            neighbor_spinors = [
-                (spinors[j], dist) 
-                for j, dist in neighbors[i]
-            ]
-            
-            expected_phase, confidence = self.compute_stabilizer(spinor, neighbor_spinors)
-            
-            # Check if phase deviates significantly
-            phase_diff = abs(expected_phase - spinor.phase)
-            phase_diff = min(phase_diff, 2 * np.pi - phase_diff)  # Circular distance
-            
-            # Flag syndrome if deviation exceeds tolerance and we're confident
-            if phase_diff > self.phase_tolerance and confidence > self.confidence_threshold:
-                syndromes.append(Syndrome(
-                    spinor_idx=i,
-                    expected_phase=expected_phase,
-                    observed_phase=spinor.phase,
-                    confidence=confidence,
-                    severity=phase_diff
-                ))
+        syndromes = []
+        for i in np.flatnonzero(is_syndrome[inverse]).tolist():
+            g = inverse[i]
+            deviation = abs(expected[g] - phases[i])
+            syndromes.append(Syndrome(
+                spinor_idx=i,
+                expected_phase=float(expected[g]),
+                observed_phase=float(phases[i]),
+                confidence=float(confidence[g]),
+                severity=float(min(deviation, 2 * np.pi - deviation))
+            ))
         
         return syndromes
     
@@ -235,7 +439,11 @@ class ToricErrorCorrector:
         In Toric Code, this pairs syndrome defects optimally
         so corrections along paths don't create new errors.
         
-        Uses a greedy approximation for efficiency.
+        Uses a greedy approximation for efficiency: the closest unmatched
+        pair is matched first. Candidate pairs come from each syndrome's
+        nearest unmatched syndromes (KD-tree), in rounds; within a round
+        every pair closer than the shortest candidate list's reach is
+        known, so the greedy order is the same as over all pairs.
         
         Args:
             syndromes: List of detected syndromes
@@ -247,33 +455,40 @@ class ToricErrorCorrector:
         if len(syndromes) < 2:
             return []
         
-        # Build distance matrix between syndrome positions
         n = len(syndromes)
-        distances = np.zeros((n, n))
-        
-        for i in range(n):
-            for j in range(i + 1, n):
-                s1 = spinors[syndromes[i].spinor_idx]
-                s2 = spinors[syndromes[j].spinor_idx]
-                dist = spinor_distance(s1, s2)
-                distances[i, j] = dist
-                distances[j, i] = dist
-        
-        # Greedy matching: repeatedly pair closest unmatched syndromes
-        matched = set()
+        indices = np.array([s.spinor_idx for s in syndromes], dtype=np.intp)
+        all_positions, all_phases = _spinor_arrays(spinors)
+        positions, phases = all_positions[indices], all_phases[indices]
+        
+        matched = np.zeros(n, dtype=bool)
         paths = []
         
-        # Create list of all pairs sorted by distance
-        pairs = []
-        for i in range(n):
-            for j in range(i + 1, n):
-                pairs.append((distances[i, j], i, j))
-        pairs.sort()
-        
-        for dist, i, j in pairs:
-            if i not in matched and j not in matched:
-                matched.add(i)
-                matched.add(j)
+        while n - matched.sum() >= 2:
+            open_idx = np.flatnonzero(~matched)
+            k = min(MATCHING_CANDIDATES, len(open_idx) - 1)
+            tree = _spinor_tree(positions[open_idx], phases[open_idx])
+            reach, near = tree.query(tree.data, k=k + 1)
+            
+            # Pairs closer than every list's last entry are all present
+            bound = np.inf if k == len(open_idx) - 1 else reach[:, -1].min()
+            rows = np.repeat(np.arange(len(open_idx)), k + 1)
+            cols = near.reshape(-1)
+            first, second = np.minimum(rows, cols), np.maximum(rows, cols)
+            keep = first != second
+            pairs = np.unique(np.column_stack((first[keep], second[keep])), axis=0)
+            i_idx, j_idx = open_idx[pairs[:, 0]], open_idx[pairs[:, 1]]
+            
+            distances = _pair_distances(positions, phases, i_idx, j_idx)
+            order = np.lexsort((j_idx, i_idx, distances))
+            
+            for rank, (dist, i, j) in enumerate(zip(distances[order].tolist(),
+                                                    i_idx[order].tolist(),
+                                                    j_idx[order].tolist())):
+                if rank and dist > bound:
+                    break
+                if matched[i] or matched[j]:
+                    continue
+                matched[i] = matched[j] = True
                 
                 # Create correction path (direct for now)
                 paths.append(CorrectionPath(
@@ -284,14 +499,13 @@ class ToricErrorCorrector:
                 ))
         
         # Handle odd syndrome (pair with boundary/vacuum)
-        for i in range(n):
-            if i not in matched:
-                paths.append(CorrectionPath(
-                    start_idx=syndromes[i].spinor_idx,
-                    end_idx=syndromes[i].spinor_idx,  # Self-correction
-                    path_indices=[syndromes[i].spinor_idx],
-                    total_cost=syndromes[i].severity
-                ))
+        for i in np.flatnonzero(~matched).tolist():
+            paths.append(CorrectionPath(
+                start_idx=syndromes[i].spinor_idx,
+                end_idx=syndromes[i].spinor_idx,  # Self-correction
+                path_indices=[syndromes[i].spinor_idx],
+                total_cost=syndromes[i].severity
+            ))
         
         return paths
     
@@ -341,46 +555,100 @@ class ToricErrorCorrector:
         
         return corrected
     
-    def apply_error_correction(self, 
-                                spinors: List[Spinor], 
-                                max_iterations: int = 5) -> Tuple[List[Spinor], int, float]:
+    def correct_phases(self, 
+                       positions: np.ndarray, 
+                       phases: np.ndarray,
+                       max_iterations: int = 5,
+                       correction_strength: float = 0.5) -> Tuple[np.ndarray, int, float]:
         """
-        Full error correction pipeline.
+        Full error correction pipeline over position/phase arrays.
         
         Iteratively:
         1. Detect syndromes
-        2. Find optimal pairing (MWPM)
-        3. Apply corrections
-        4. Repeat until no syndromes or max iterations
+        2. Blend each syndrome's phase toward its neighbor consensus
+        3. Repeat until no syndromes or max iterations
+        
+        Identical spinors are measured and corrected once: they see the
+        same neighbors, so they stay identical. A token stream over a
+        small vocabulary therefore costs what its vocabulary costs.
         
         Args:
-            spinors: Input spinors (potentially corrupted)
+            positions: (N, 8) spinor positions
+            phases: (N,) spinor phases
             max_iterations: Maximum correction iterations
+            correction_strength: Blend factor (0 = no correction, 1 = full)
         
         Returns:
-            (corrected_spinors, n_corrections, final_coherence)
+            (corrected_phases, n_corrections, final_coherence)
         """
-        current = spinors
+        phases = np.asarray(phases, dtype=np.float64)
+        if len(phases) < 2:
+            return phases.copy(), 0, 1.0
+        
+        points, inverse, counts = _distinct_spinors(np.asarray(positions, dtype=np.float64), phases)
+        point_positions, point_phases = points[:, :8], points[:, 8].copy()
+        candidates = _candidate_pairs(point_positions, self.distance_threshold, self.max_neighbors)
         total_corrections = 0
         
         for iteration in range(max_iterations):
-            syndromes = self.detect_syndromes(current)
+            expected, confidence, is_syndrome = self._measure_stabilizers(
+                point_positions, point_phases, counts, candidates)
             
-            if not syndromes:
+            if not is_syndrome.any():
                 break
             
-            # Apply corrections
-            current = self.apply_corrections(current, syndromes)
-            total_corrections += len(syndromes)
+            # Circular interpolation (shortest path on circle)
+            current = point_phases[is_syndrome]
+            diff = expected[is_syndrome] - current
+            diff = np.where(diff > np.pi, diff - 2 * np.pi, np.where(diff < -np.pi, diff + 2 * np.pi, diff))
+            alpha = correction_strength * confidence[is_syndrome]
+            point_phases[is_syndrome] = (current + alpha * diff) % (2 * np.pi)
+            total_corrections += int(counts[is_syndrome].sum())
         
         # Compute final coherence (how well phases align)
-        final_syndromes = self.detect_syndromes(current)
-        if len(current) > 1:
-            coherence = 1.0 - len(final_syndromes) / len(current)
-        else:
-            coherence = 1.0
+        _, _, is_syndrome = self._measure_stabilizers(point_positions, point_phases, counts, candidates)
+        coherence = 1.0 - counts[is_syndrome].sum() / len(phases)
         
-        return current, total_corrections, coherence
+        return point_phases[inverse], total_corrections, float(coherence)
+    
+    def correct_batch(self, 
+                      spinors: SpinorBatch, 
+                      max_iterations: int = 5) -> Tuple[SpinorBatch, int, float]:
+        """
+        apply_error_correction for a SpinorBatch, without per-spinor objects.
+        
+        Returns:
+            (corrected SpinorBatch, n_corrections, final_coherence)
+        """
+        batch = SpinorBatch.from_spinors(spinors)
+        positions, phases = _spinor_arrays(batch)
+        corrected, n_corrections, coherence = self.correct_phases(positions, phases, max_iterations)
+        return SpinorBatch(batch.positions, corrected), n_corrections, coherence
+    
+    def apply_error_correction(self, 
+                                spinors: List[Spinor], 
+                                max_iterations: int = 5) -> Tuple[List[Spinor], int, float]:
+        """
+        Full error correction pipeline.
+        
+        Iteratively:
+        1. Detect syndromes
+        2. Find optimal pairing (MWPM)
+        3. Apply corrections
+        4. Repeat until no syndromes or max iterations
+        
+        Args:
+            spinors: Input spinors or SpinorBatch (potentially corrupted)
+            max_iterations: Maximum correction iterations
+        
+        Returns:
+            (corrected_spinors, n_corrections, final_coherence)
+        """
+        positions, phases = _spinor_arrays(spinors)
+        corrected, n_corrections, coherence = self.correct_phases(positions, phases, max_iterations)
+        
+        current = [Spinor(position=p, phase=phase) for p, phase in zip(positions, corrected.tolist())]
+        return current, n_corrections, coherence
     
     def measure_coherence(self, spinors: List[Spinor]) -> float:
         """
@@ -395,9 +663,11 @@ class ToricErrorCorrector:
         if len(spinors) < 2:
             return 1.0
         
-        syndromes = self.detect_syndromes(spinors)
-        coherence = 1.0 - len(syndromes) / len(spinors)
-        return max(0.0, coherence)
+        positions, phases = _spinor_arrays(spinors)
+        points, _, counts = _distinct_spinors(positions, phases)
+        _, _, is_syndrome = self._measure_stabilizers(points[:, :8], points[:, 8], counts)
+        coherence = 1.0 - counts[is_syndrome].sum() / len(spinors)
+        return max(0.0, float(coherence))
 
 
 # ============================================================================
@@ -426,17 +696,9 @@ def apply_toric_correction_to_bytes(data: bytes,
     
     # Convert bytes to spinors (phase = byte value scaled to [0, 2π))
     # Position encodes index using φ-based coordinates
-    spinors = []
-    for i, byte in enumerate(data):
-        # Create 8D position based on index
-        position = np.zeros(8)
-        for dim in range(8):
-            position[dim] = np.cos(2 * np.pi * i * PHI**(dim + 1) / len(data))
-        
-        # Phase from byte value
-        phase = (byte / 256.0) * 2 * np.pi
-        
-        spinors.append(Spinor(position=position, phase=phase))
+    index = np.arange(len(data))
+    positions = np.cos(2 * np.pi * index[:, None] * PHI ** np.arange(1, 9) / len(data))
+    phases = (np.frombuffer(data, dtype=np.uint8) / 256.0) * 2 * np.pi
     
     # Apply error correction
     corrector = ToricErrorCorrector(
@@ -445,19 +707,16 @@ def apply_toric_correction_to_bytes(data: bytes,
         confidence_threshold=0.2
     )
     
-    corrected_spinors, n_corrections, coherence = corrector.apply_error_correction(
-        spinors, 
+    corrected_phases, n_corrections, coherence = corrector.correct_phases(
+        positions, phases,
         max_iterations=max_iterations
     )
     
-    # Convert back to bytes
-    corrected_bytes = bytearray()
-    for spinor in corrected_spinors:
-        # Phase back to byte value
-        byte_val = int((spinor.phase / (2 * np.pi)) * 256) % 256
-        corrected_bytes.append(byte_val)
+    # Phase back to the nearest byte value: truncating would turn float
+    # noise such as 21.999... into 21, even for bytes left uncorrected
+    corrected_bytes = np.rint((corrected_phases / (2 * np.pi)) * 256).astype(np.int64) % 256
     
-    return bytes(corrected_bytes), coherence
+    return corrected_bytes.astype(np.uint8).tobytes(), coherence
 
 
 # ============================================================================
@@ -13,14 +13,22 @@ Key Concepts:
 - Block Processing: Encode 1000+ tokens in a single numpy operation
 - Matrix Rotation: Treat displacement sequence as a rotation matrix
 - Vectorized Huffman: Build frequency tables with np.bincount
+- Canonical Codes: Only the code lengths are stored; the decoder rebuilds
+  the exact table from them
+- Scattered Bits: Every code's bit offset is a cumsum of the lengths, so
+  all codes land in the output words at once
+- Table Decoding: Each step looks up a whole window of bits, never one bit
+
+Bit order is MSB-first throughout: the first bit of the stream is the
+high bit of the first byte.
 
 Author: The Architect
 License: Public Domain
 """
 
 import numpy as np
-from typing import List, Tuple, Dict, Optional
-from dataclasses import dataclass
+from typing import Tuple, Dict
+import heapq
 import struct
 
 try:
@@ -29,16 +37,250 @@ except ImportError:
     from phi_adic import PHI, PHI_INV
 
 
-@dataclass
-class HuffmanNode:
-    """Node in a Huffman tree."""
-    symbol: Optional[int]
-    freq: int
-    left: Optional['HuffmanNode'] = None
-    right: Optional['HuffmanNode'] = None
-    
-    def is_leaf(self) -> bool:
-        return self.symbol is not None
+# Longest Huffman code: bounds the decode table at 2**15 entries
+MAX_CODE_LENGTH = 15
+
+# Displacements live in [-120, 119]; symbol = displacement + DISP_OFFSET
+DISP_OFFSET = 120
+NUM_SYMBOLS = 240
+
+# Widest window _peek_bits can return (a 64-bit load shifted by up to 7)
+PEEK_LIMIT = 57
+
+# Stream bytes decoded per chunk: the per-bit lookup and jump tables
+# cost ~40 bytes per bit, so a chunk's working set stays near 20 MB
+DECODE_CHUNK_BYTES = 1 << 16
+
+# Bytes read past a chunk's end when measuring zero runs (> 2 * PEEK_LIMIT bits)
+_RUN_LOOKAHEAD = 16
+
+
+def huffman_code_lengths(counts: np.ndarray, max_length: int = MAX_CODE_LENGTH) -> np.ndarray:
+    """
+    Length-limited Huffman code lengths.
+
+    Builds the Huffman tree depths, then pushes any code longer than
+    max_length back up the tree (the JPEG Annex K.3 adjustment), which
+    keeps the Kraft sum at exactly one.
+
+    Args:
+        counts: (S,) symbol frequencies; zero-count symbols get no code
+        max_length: Longest allowed code
+
+    Returns:
+        (S,) uint8 code lengths (0 = absent)
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    lengths = np.zeros(len(counts), dtype=np.uint8)
+    present = np.flatnonzero(counts > 0)
+    if len(present) == 0:
+        return lengths
+    if len(present) == 1:
+        lengths[present] = 1
+        return lengths
+    if len(present) > (1 << max_length):
+        raise ValueError(f"{len(present)} symbols do not fit in {max_length}-bit codes")
+
+    # Tree depths: every merge pushes both groups one level down
+    depths = np.zeros(len(counts), dtype=np.int64)
+    heap = [(int(counts[s]), int(s), [int(s)]) for s in present]
+    heapq.heapify(heap)
+    while len(heap) > 1:
+        freq1, tie1, group1 = heapq.heappop(heap)
+        freq2, tie2, group2 = heapq.heappop(heap)
+        group = group1 + group2
+        depths[group] += 1
+        heapq.heappush(heap, (freq1 + freq2, min(tie1, tie2), group))
+
+    # Per-length code counts, with overlong codes folded back in
+    deepest = int(depths.max())
+    bl_count = np.bincount(depths[present], minlength=max(deepest, max_length) + 1)
+    for length in range(deepest, max_length, -1):
+        while bl_count[length] > 0:
+            j = length - 2
+            while bl_count[j] == 0:
+                j -= 1
+            bl_count[length] -= 2
+            bl_count[length - 1] += 1
+            bl_count[j + 1] += 2
+            bl_count[j] -= 1
+
+    # Shortest codes to the most frequent symbols
+    order = present[np.lexsort((present, -counts[present]))]
+    lengths[order] = np.repeat(np.arange(len(bl_count)), bl_count)
+    return lengths
+
+
+def canonical_codes(lengths: np.ndarray) -> np.ndarray:
+    """
+    Canonical Huffman codes for a set of code lengths.
+
+    Codes are assigned in (length, symbol) order, each one the previous
+    code plus one, shifted left as the length grows - so the lengths alone
+    determine the table.
+
+    Args:
+        lengths: (S,) code lengths (0 = absent)
+
+    Returns:
+        (S,) uint64 codes (0 for absent symbols)
+    """
+    lengths = np.asarray(lengths, dtype=np.int64)
+    codes = np.zeros(len(lengths), dtype=np.uint64)
+    symbols = np.flatnonzero(lengths > 0)
+    symbols = symbols[np.argsort(lengths[symbols], kind='stable')]
+
+    code = 0
+    previous = int(lengths[symbols[0]]) if len(symbols) else 0
+    for s in symbols.tolist():
+        length = int(lengths[s])
+        code <<= length - previous
+        codes[s] = code
+        code += 1
+        previous = length
+    return codes
+
+
+def pack_codes(codes: np.ndarray, lengths: np.ndarray) -> Tuple[bytes, int]:
+    """
+    Concatenate variable-length codes into a byte string.
+
+    THE PHYSICS:
+    All spins are processed simultaneously. The bit offset of every code
+    is the cumsum of the lengths before it, so each code is shifted into
+    its 64-bit word (and the next, when it straddles a boundary) in one
+    pass; codes sharing a word are OR-reduced together.
+
+    Args:
+        codes: (N,) code values, each below 2**length
+        lengths: (N,) code lengths in bits, 1..64
+
+    Returns:
+        (packed_bytes, total_bits)
+    """
+    codes = np.asarray(codes, dtype=np.uint64)
+    lengths = np.asarray(lengths, dtype=np.uint64)
+    if len(codes) == 0:
+        return b'', 0
+
+    ends = np.cumsum(lengths)
+    total_bits = int(ends[-1])
+    starts = ends - lengths
+    word = (starts >> np.uint64(6)).astype(np.int64)
+    free = np.uint64(64) - (starts & np.uint64(63))   # Bits left in the word
+
+    fits = lengths <= free
+    left = np.where(fits, free - lengths, 0).astype(np.uint64)
+    right = np.where(fits, 0, lengths - free).astype(np.uint64)
+    head = np.where(fits, codes << left, codes >> right)
+
+    words = np.zeros(total_bits // 64 + 2, dtype=np.uint64)
+    first = np.flatnonzero(np.diff(word, prepend=-1))
+    words[word[first]] = np.bitwise_or.reduceat(head, first)
+
+    # At most one code per word spills into the next
+    spill = np.flatnonzero(~fits)
+    words[word[spill] + 1] |= codes[spill] << (np.uint64(64) - right[spill])
+
+    return words.astype('>u8').tobytes()[:(total_bits + 7) // 8], total_bits
+
+
+def _padded(data: bytes) -> np.ndarray:
+    """data as uint8 with 8 zero bytes appended, so every 64-bit load is in bounds."""
+    return np.frombuffer(bytes(data) + bytes(8), dtype=np.uint8)
+
+
+def _peek_bits(raw: np.ndarray, positions: np.ndarray, widths) -> np.ndarray:
+    """
+    Read `widths` bits (at most PEEK_LIMIT) at each bit position of a
+    _padded stream.
+
+    Positions past the end read as zeros.
+    """
+    positions = np.asarray(positions, dtype=np.int64)
+    byte = np.minimum(positions >> 3, len(raw) - 8)
+
+    window = np.zeros(len(positions), dtype=np.uint64)
+    for k in range(8):
+        window = (window << np.uint64(8)) | raw[byte + k].astype(np.uint64)
+    window <<= (positions & 7).astype(np.uint64)
+    return (window >> (np.uint64(64) - np.asarray(widths, dtype=np.uint64))).astype(np.int64)
+
+
+def _bit_windows(raw: np.ndarray, width: int, first_byte: int, n_bytes: int) -> np.ndarray:
+    """The `width` bits starting at every bit position of raw[first_byte:first_byte + n_bytes]."""
+    window = np.zeros(n_bytes, dtype=np.uint64)
+    for k in range(8):
+        start = first_byte + k
+        window = (window << np.uint64(8)) | raw[start:start + n_bytes].astype(np.uint64)
+
+    windows = np.empty((n_bytes, 8), dtype=np.int64)
+    for r in range(8):
+        windows[:, r] = (window << np.uint64(r)) >> np.uint64(64 - width)
+    return windows.reshape(-1)
+
+
+def _follow_codes(steps: np.ndarray, start: int, count: int, levels: int = 4) -> np.ndarray:
+    """
+    Start positions of up to `count` consecutive codes, from bit `start`.
+
+    steps[p] is the length of the code that would begin at bit p, read
+    from the lookup table for every position at once. Composing the jump
+    table `levels` times lets the sequential walk cross 2**levels codes
+    per step; the skipped positions are then filled back in level by
+    level with vectorized gathers. The walk stops at the first code that
+    starts past the end of steps.
+    """
+    n = len(steps)
+    if count == 0 or start >= n:
+        return np.zeros(0, dtype=np.int64)
+    jumps = [np.append(np.minimum(np.arange(n, dtype=np.int32) + steps.astype(np.int32), n),
+                       np.int32(n))]
+    for _ in range(levels):
+        jumps.append(jumps[-1][jumps[-1]])
+
+    coarse = memoryview(jumps[-1])
+    walk = []
+    p = start
+    for _ in range(-(-count >> levels)):
+        if p >= n:
+            break
+        walk.append(p)
+        p = coarse[p]
+
+    positions = np.array(walk, dtype=np.int64)
+    for jump in reversed(jumps[:-1]):
+        positions = np.stack((positions, jump[positions]), axis=1).reshape(-1)
+    positions = positions[:count]
+    return positions[:np.searchsorted(positions, n)]
+
+
+def _chunked_codes(n_bytes: int, start: int, count: int, steps_for):
+    """
+    Walk `count` codes through the stream DECODE_CHUNK_BYTES at a time.
+
+    steps_for(first_byte, chunk_bytes) gives the code length at every bit
+    of that chunk; codes that start inside it may read past its end. The
+    walk resumes in the next chunk at the bit after the last code, so the
+    per-bit tables never outgrow one chunk.
+
+    Yields:
+        (positions, lengths): stream bit positions and lengths of the
+        codes starting in each chunk
+    """
+    done = 0
+    while done < count:
+        first_byte = start >> 3
+        if first_byte >= n_bytes:
+            raise ValueError(f"Bit stream exhausted before {count} codes")
+        chunk_bytes = min(DECODE_CHUNK_BYTES, n_bytes - first_byte)
+        steps = steps_for(first_byte, chunk_bytes)
+        local = _follow_codes(steps, start - 8 * first_byte, count - done)
+        positions = local + 8 * first_byte
+        lengths = steps[local].astype(np.int64)
+        yield positions, lengths
+        done += len(local)
+        start = int(positions[-1] + lengths[-1])
 
 
 class VectorizedRAC:
@@ -50,16 +292,9 @@ class VectorizedRAC:
     We process entire blocks at once using numpy broadcasting.
     """
     
-    # Displacement ranges and their bit codes
-    # Optimized for peaked distribution around zero
-    DISP_ZERO = 0       # 1 bit: 1
-    DISP_SMALL = 1      # 4 bits: 01XX
-    DISP_MEDIUM = 2     # 7 bits: 001XXXX
-    DISP_LARGE = 3      # 11 bits: 000XXXXXXX
-    
-    def __init__(self, num_roots: int = 240):
+    def __init__(self, num_roots: int = 240, max_code_length: int = MAX_CODE_LENGTH):
         self.num_roots = num_roots
-        self._huffman_tree: Optional[HuffmanNode] = None
+        self.max_code_length = max_code_length
         self._huffman_codes: Dict[int, Tuple[int, int]] = {}  # symbol -> (code, length)
         
     def compute_displacements(self, root_sequence: np.ndarray) -> np.ndarray:
@@ -91,6 +326,8 @@ class VectorizedRAC:
         """
         # First element is the starting root
         roots = np.zeros(len(displacements), dtype=np.int32)
+        if len(displacements) == 0:
+            return roots
         roots[0] = displacements[0]
         
         # Cumulative sum of displacements (mod 240)
@@ -100,6 +337,14 @@ class VectorizedRAC:
         
         return roots
     
+    def _code_lengths(self, displacements: np.ndarray) -> np.ndarray:
+        """Length-limited code lengths per symbol (first element is the raw root)."""
+        symbols = np.asarray(displacements[1:], dtype=np.int64) + DISP_OFFSET
+        if len(symbols) and (symbols.min() < 0 or symbols.max() >= NUM_SYMBOLS):
+            raise ValueError("Displacements must lie in [-120, 119]")
+        counts = np.bincount(symbols, minlength=NUM_SYMBOLS)
+        return huffman_code_lengths(counts, self.max_code_length)
+    
     def build_huffman_table(self, displacements: np.ndarray) -> Dict[int, Tuple[int, int]]:
         """
         Build Huffman codes from displacement frequencies.
@@ -107,67 +352,21 @@ class VectorizedRAC:
         THE PHYSICS:
         Some rotations are more "natural" than others in the E8 lattice.
         Map common turns to short codes, rare turns to long codes.
+        
+        The codes are canonical and no longer than max_code_length, so a
+        decoder rebuilds them from the lengths alone.
+        
+        Returns:
+            {displacement: (code, length)} for every displacement that occurs
         """
-        # Count frequencies (skip first element which is raw root)
-        disp_range = np.arange(-120, 120)
-        counts = np.zeros(240, dtype=np.int64)
-        
-        for d in displacements[1:]:
-            idx = int(d) + 120
-            if 0 <= idx < 240:
-                counts[idx] += 1
-        
-        # Build Huffman tree
-        nodes = []
-        for i, count in enumerate(counts):
-            if count > 0:
-                nodes.append(HuffmanNode(symbol=i-120, freq=int(count)))
-        
-        if not nodes:
-            return {}
-        
-        # Add pseudo-count for all symbols (for robustness)
-        all_symbols = set(range(-120, 120))
-        existing = {n.symbol for n in nodes}
-        for sym in all_symbols - existing:
-            nodes.append(HuffmanNode(symbol=sym, freq=1))
-        
-        # Build tree bottom-up
-        import heapq
-        heap = [(n.freq, id(n), n) for n in nodes]
-        heapq.heapify(heap)
-        
-        while len(heap) > 1:
-            freq1, _, node1 = heapq.heappop(heap)
-            freq2, _, node2 = heapq.heappop(heap)
-            
-            parent = HuffmanNode(
-                symbol=None,
-                freq=freq1 + freq2,
-                left=node1,
-                right=node2
-            )
-            heapq.heappush(heap, (parent.freq, id(parent), parent))
-        
-        self._huffman_tree = heap[0][2] if heap else None
-        
-        # Generate codes
-        codes = {}
-        
-        def traverse(node: HuffmanNode, code: int = 0, length: int = 0):
-            if node.is_leaf():
-                codes[node.symbol] = (code, max(1, length))
-            else:
-                if node.left:
-                    traverse(node.left, code << 1, length + 1)
-                if node.right:
-                    traverse(node.right, (code << 1) | 1, length + 1)
-        
-        if self._huffman_tree:
-            traverse(self._huffman_tree)
-        
-        self._huffman_codes = codes
-        return codes
+        lengths = self._code_lengths(displacements)
+        codes = canonical_codes(lengths)
+        
+        self._huffman_codes = {
+            int(s) - DISP_OFFSET: (int(codes[s]), int(lengths[s]))
+            for s in np.flatnonzero(lengths)
+        }
+        return self._huffman_codes
     
     def encode_block_fast(self, displacements: np.ndarray) -> Tuple[bytes, Dict]:
         """
@@ -175,100 +374,155 @@ class VectorizedRAC:
         
         THE PHYSICS:
         All spins are processed simultaneously.
+        
+        Format:
+        [u8 n_codes][n_codes x (u8 symbol, u8 length)][BITS]
+        BITS: the first root in 8 bits, then one canonical code per
+        displacement (MSB-first).
+        
+        Returns:
+            (packed_bytes, metadata)
         """
-        # Build Huffman table from this block
-        codes = self.build_huffman_table(displacements)
-        
-        # Encode first element (raw root, 8 bits)
-        bits = []
-        first_root = int(displacements[0])
-        for j in range(8):
-            bits.append((first_root >> j) & 1)
-        
-        # Encode remaining displacements with Huffman
-        for d in displacements[1:]:
-            d_int = int(d)
-            if d_int in codes:
-                code, length = codes[d_int]
-                for j in range(length - 1, -1, -1):
-                    bits.append((code >> j) & 1)
-            else:
-                # Fallback: use fixed coding
-                abs_d = abs(d_int)
-                sign = 0 if d_int >= 0 else 1
-                
-                if abs_d <= 3:
-                    bits.extend([0, 1, sign])
-                    bits.extend([(abs_d >> j) & 1 for j in range(2)])
-                elif abs_d <= 15:
-                    bits.extend([0, 0, 1, sign])
-                    bits.extend([(abs_d >> j) & 1 for j in range(4)])
-                else:
-                    bits.extend([0, 0, 0, sign])
-                    bits.extend([(abs_d >> j) & 1 for j in range(7)])
-        
-        # Pack bits to bytes
-        result = bytearray()
-        for i in range(0, len(bits), 8):
-            byte = 0
-            for j, bit in enumerate(bits[i:i+8]):
-                byte |= (bit << j)
-            result.append(byte)
+        displacements = np.asarray(displacements)
+        if len(displacements) == 0:
+            return b'\x00', {'num_codes': 0, 'total_bits': 0, 'max_length': 0}
+        
+        lengths = self._code_lengths(displacements)
+        codes = canonical_codes(lengths)
+        symbols = np.flatnonzero(lengths)
+        
+        # Code table: only the lengths travel
+        table = np.empty((len(symbols), 2), dtype=np.uint8)
+        table[:, 0] = symbols
+        table[:, 1] = lengths[symbols]
+        
+        # Per-element codes by table gather, root first
+        sequence = displacements[1:].astype(np.int64) + DISP_OFFSET
+        element_codes = np.empty(len(displacements), dtype=np.uint64)
+        element_lengths = np.empty(len(displacements), dtype=np.uint64)
+        element_codes[0], element_lengths[0] = int(displacements[0]) & 0xFF, 8
+        element_codes[1:] = codes[sequence]
+        element_lengths[1:] = lengths[sequence]
+        packed, total_bits = pack_codes(element_codes, element_lengths)
         
-        # Store Huffman table metadata
         table_meta = {
-            'num_codes': len(codes),
-            'total_bits': len(bits),
+            'num_codes': len(symbols),
+            'total_bits': total_bits,
+            'max_length': int(lengths.max()),
         }
         
-        return bytes(result), table_meta
+        return bytes([len(symbols)]) + table.tobytes() + packed, table_meta
+    
+    def decode_block_fast(self, data: bytes, count: int) -> np.ndarray:
+        """
+        Decode `count` displacements written by encode_block_fast.
+        
+        The canonical table is rebuilt from the stored lengths and expanded
+        into a lookup over max_length-bit windows: every entry whose prefix
+        is a code holds that code's symbol and length. The window at every
+        bit position of a chunk is looked up at once; the walk from code to
+        code then only adds lengths. Peak memory is set by
+        DECODE_CHUNK_BYTES, not by the stream length.
+        
+        Returns:
+            (count,) int32 displacements, first element the raw root
+        """
+        if count == 0:
+            return np.zeros(0, dtype=np.int32)
+        
+        n_codes = data[0]
+        table = np.frombuffer(data[1:1 + 2 * n_codes], dtype=np.uint8).reshape(-1, 2)
+        bits = data[1 + 2 * n_codes:]
+        
+        raw = _padded(bits)
+        first_root = int(_peek_bits(raw, [0], 8)[0])
+        if count == 1:
+            return np.array([first_root], dtype=np.int32)
+        
+        lengths = np.zeros(NUM_SYMBOLS, dtype=np.int64)
+        lengths[table[:, 0]] = table[:, 1]
+        codes = canonical_codes(lengths).astype(np.int64)
+        width = int(lengths.max())
+        
+        # Lookup table: each code fills the windows it prefixes
+        symbols = np.flatnonzero(lengths)
+        spans = 1 << (width - lengths[symbols])
+        slots = np.repeat(codes[symbols] << (width - lengths[symbols]), spans)
+        slots += np.arange(len(slots)) - np.repeat(np.cumsum(spans) - spans, spans)
+        lookup_symbol = np.zeros(1 << width, dtype=np.int64)
+        lookup_length = np.ones(1 << width, dtype=np.int64)
+        lookup_symbol[slots] = np.repeat(symbols, spans)
+        lookup_length[slots] = np.repeat(lengths[symbols], spans)
+        
+        def steps_for(first_byte, n_bytes):
+            return lookup_length[_bit_windows(raw, width, first_byte, n_bytes)]
+        
+        displacements = np.empty(count, dtype=np.int32)
+        displacements[0] = first_root
+        done = 1
+        for positions, _ in _chunked_codes(len(bits), 8, count - 1, steps_for):
+            windows = _peek_bits(raw, positions, width)
+            displacements[done:done + len(positions)] = lookup_symbol[windows] - DISP_OFFSET
+            done += len(positions)
+        return displacements
     
     def encode_offsets_vectorized(self, offsets: np.ndarray) -> bytes:
         """
         Encode token offsets within roots.
         
-        Most offsets are 0 (single token per root), so we use
-        a simple run-length encoding.
+        Most offsets are 0 (single token per root): a zero is the single
+        bit 1; anything else is a 0 followed by its Elias gamma code. The
+        whole code is the offset itself written in 2*bit_length bits, so
+        the stream packs in one pass.
         """
-        bits = []
-        
-        # Count zeros vs non-zeros for statistics
-        zero_mask = offsets == 0
-        zero_count = np.sum(zero_mask)
-        
-        for offset in offsets:
-            if offset == 0:
-                bits.append(1)
-            else:
-                bits.append(0)
-                # Gamma encode the offset
-                gamma = self._encode_gamma(int(offset))
-                bits.extend(gamma)
-        
-        # Pack to bytes
-        result = bytearray()
-        for i in range(0, len(bits), 8):
-            byte = 0
-            for j, bit in enumerate(bits[i:i+8]):
-                byte |= (bit << j)
-            result.append(byte)
-        
-        return bytes(result)
-    
-    def _encode_gamma(self, value: int) -> List[int]:
-        """Elias gamma encoding."""
-        if value <= 0:
-            return [0]
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if len(offsets) and offsets.min() < 0:
+            raise ValueError("Offsets must be non-negative")
         
-        # Number of bits needed
-        n = value.bit_length()
+        # frexp's exponent of a positive integer is its bit length
+        bit_length = np.frexp(offsets.astype(np.float64))[1].astype(np.int64)
+        lengths = np.where(offsets == 0, 1, 2 * bit_length)
+        codes = np.where(offsets == 0, 1, offsets)
         
-        # n-1 zeros, then binary representation of value
-        bits = [0] * (n - 1)
-        for i in range(n - 1, -1, -1):
-            bits.append((value >> i) & 1)
+        packed, _ = pack_codes(codes, lengths)
+        return packed
+    
+    def decode_offsets_vectorized(self, data: bytes, count: int) -> np.ndarray:
+        """
+        Decode `count` offsets written by encode_offsets_vectorized.
         
-        return bits
+        A code starting at bit p spans twice the zero run that starts
+        there (one bit for a 1), so every code length comes from a reverse
+        scan for the next set bit, one chunk of the stream at a time.
+        """
+        if count == 0:
+            return np.zeros(0, dtype=np.int64)
+        
+        raw = _padded(data)
+        
+        def steps_for(first_byte, n_bytes):
+            # Zero runs may end past the chunk: look ahead far enough that
+            # any run reaching the lookahead's end is too long to be a code
+            end = min(len(data), first_byte + n_bytes + _RUN_LOOKAHEAD)
+            bits = np.unpackbits(raw[first_byte:end])
+            n_bits = len(bits)
+            next_one = np.where(bits == 1, np.arange(n_bits), n_bits)
+            next_one = np.minimum.accumulate(next_one[::-1])[::-1]
+            run = next_one[:8 * n_bytes] - np.arange(8 * n_bytes)
+            return np.maximum(1, 2 * run)
+        
+        offsets = np.empty(count, dtype=np.int64)
+        done = 0
+        for positions, lengths in _chunked_codes(len(data), 0, count, steps_for):
+            zeros = lengths >> 1
+            if zeros.max() > PEEK_LIMIT:
+                raise ValueError("Offset code too long")
+            
+            # The value is the run's length in bits, starting at its set bit
+            values = _peek_bits(raw, positions + zeros, np.maximum(zeros, 1))
+            offsets[done:done + len(positions)] = np.where(zeros == 0, 0, values)
+            done += len(positions)
+        return offsets
     
     def pack_full_block(self, 
                         root_sequence: np.ndarray,
@@ -301,6 +555,17 @@ class VectorizedRAC:
         }
         
         return bytes(result), meta
+    
+    def unpack_full_block(self, data: bytes, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Inverse of pack_full_block.
+        
+        Returns (root_sequence, token_offsets).
+        """
+        disp_len = struct.unpack('<I', data[:4])[0]
+        displacements = self.decode_block_fast(data[4:4 + disp_len], count)
+        offsets = self.decode_offsets_vectorized(data[4 + disp_len:], count)
+        return self.reconstruct_roots(displacements), offsets
 
 
 def run_verification():
@@ -372,6 +637,12 @@ def run_verification():
     print(f"  Output: {len(packed)} bytes")
     print(f"  Bits per displacement: {meta['total_bits'] / len(realistic_disps):.2f}")
     
+    start = time.time()
+    decoded = rac.decode_block_fast(packed, len(realistic_disps))
+    decode_time = time.time() - start
+    print(f"  Decode time: {decode_time*1000:.1f}ms")
+    print(f"  Round-trip: {'PASS' if np.array_equal(decoded, realistic_disps) else 'FAIL'}")
+    
     # Test 5: Full block packing
     print("\n--- Test 5: Full Block Packing ---")
     roots = np.random.randint(0, 240, 10000, dtype=np.int32)
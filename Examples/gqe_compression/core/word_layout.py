@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Word Layout - The Surface of the Word Stream
+
+THE PHYSICS:
+"The word is the particle; its casing and the space around it are the field."
+
+Word mode maps every token to its lowercased form, which is what gives the
+vocabulary its power: 'The' and 'the' are one point of the lattice. But
+the rendered text is then lossy - casing is folded and every run of
+whitespace becomes one space.
+
+This module keeps the surface as a parallel stream, one symbol per word:
+
+1. Casing: 0 = as lowercased, 1 = capitalized (first letter upper, so
+   '"The' and '**Note' count), 2 = all caps, 3 = anything else (the exact
+   word is kept as an exception).
+2. Separator: the whitespace run that follows the word, as an id into a
+   small table of distinct separators (the run before the first word is
+   stored once in the header).
+
+Both fields share one byte per word. Real text is overwhelmingly
+"lowercase word, single space", so the stream is range-coded with its own
+order-1 adaptive model and costs a fraction of a bit per word.
+
+Author: The Architect
+License: Public Domain
+"""
+
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import List, Sequence
+
+import numpy as np
+
+from .tda import TokenSpans, factorize_spans
+from .range_coder import encode_bytes, decode_bytes
+
+
+# Casing classes
+CASE_LOWER = 0
+CASE_TITLE = 1
+CASE_UPPER = 2
+CASE_EXCEPTION = 3
+
+# Separator ids at or above this escape to an explicit list
+SEPARATOR_ESCAPE = 63
+
+
+@dataclass
+class WordLayout:
+    """
+    Casing and whitespace of a word stream.
+
+    Attributes:
+        cases: (N,) uint8 casing class of each word
+        gaps: (N+1,) int64 separator ids; gap 0 precedes the first word,
+              gap i+1 follows word i
+        separators: Distinct separator strings, indexed by id
+        exceptions: Exact form of each CASE_EXCEPTION word, in order
+        binary: Render to UTF-8 bytes rather than str
+    """
+    cases: np.ndarray
+    gaps: np.ndarray
+    separators: List[str]
+    exceptions: List[str]
+    binary: bool = False
+
+    def __len__(self) -> int:
+        return len(self.cases)
+
+    def render(self, words: Sequence[str]):
+        """
+        Rebuild the exact text from lowercased words.
+
+        Args:
+            words: The N lowercased words of the stream
+
+        Returns:
+            Original str (bytes if binary)
+        """
+        if len(words) != len(self.cases):
+            raise ValueError(f"Layout covers {len(self.cases)} words, got {len(words)}")
+
+        surface = np.empty(len(words), dtype=object)
+        surface[:] = list(words)
+        for case, fold in ((CASE_TITLE, _capitalize), (CASE_UPPER, str.upper)):
+            rows = np.flatnonzero(self.cases == case)
+            surface[rows] = [fold(w) for w in surface[rows].tolist()]
+        surface[self.cases == CASE_EXCEPTION] = self.exceptions
+
+        parts = np.empty(2 * len(words) + 1, dtype=object)
+        parts[0::2] = np.array(self.separators, dtype=object)[self.gaps]
+        parts[1::2] = surface
+        text = ''.join(parts.tolist())
+        return text.encode('utf-8') if self.binary else text
+
+
+def extract_layout(spans: TokenSpans) -> WordLayout:
+    """
+    Read the casing and separator streams of word-mode spans.
+
+    Casing is classified on the UTF-8 bytes for ASCII words; only words
+    with non-ASCII bytes are decoded. Separators are factorized like the
+    words themselves.
+
+    Args:
+        spans: Word-mode TokenSpans over a str
+
+    Returns:
+        WordLayout
+    """
+    if spans.mode != 'word' or not spans.text:
+        raise ValueError("Layout needs word-mode spans over text")
+
+    buffer, starts, ends = spans.buffer, spans.starts, spans.ends
+    n = len(starts)
+
+    # ASCII casing from per-word letter counts
+    cases = np.zeros(n, dtype=np.uint8)
+    if n:
+        is_upper = ((buffer >= 65) & (buffer <= 90)).astype(np.int64)
+        is_lower = ((buffer >= 97) & (buffer <= 122)).astype(np.int64)
+        is_wide = (buffer >= 0x80).astype(np.int64)
+        n_upper = np.add.reduceat(is_upper, starts)
+        n_lower = np.add.reduceat(is_lower, starts)
+        n_wide = np.add.reduceat(is_wide, starts)
+
+        # Offset of each word's first letter (the word end if it has none)
+        letter_at = np.where(is_upper | is_lower, np.arange(len(buffer)), len(buffer))
+        first_letter = np.minimum(np.minimum.reduceat(letter_at, starts), ends)
+        first_upper = np.append(is_upper, 0)[first_letter] == 1
+
+        cases[n_upper > 0] = CASE_EXCEPTION
+        cases[(n_upper > 0) & (n_lower == 0)] = CASE_UPPER
+        cases[(n_upper == 1) & first_upper] = CASE_TITLE
+
+        # Words with non-ASCII bytes: classify the decoded str
+        for i in np.flatnonzero(n_wide > 0).tolist():
+            cases[i] = _case_of(buffer[starts[i]:ends[i]].tobytes().decode('utf-8'))
+
+    exceptions = [buffer[starts[i]:ends[i]].tobytes().decode('utf-8')
+                  for i in np.flatnonzero(cases == CASE_EXCEPTION).tolist()]
+
+    # Whitespace runs: before the first word, between words, after the last
+    gap_starts = np.concatenate(([0], ends)).astype(np.int64)
+    gap_ends = np.concatenate((starts, [len(buffer)])).astype(np.int64)
+    gaps, keys = factorize_spans(buffer, gap_starts, gap_ends, lower=False)
+
+    return WordLayout(cases, gaps, [k.decode('utf-8') for k in keys], exceptions)
+
+
+def _capitalize(word: str) -> str:
+    """Uppercase the first character that has an uppercase form."""
+    for i, c in enumerate(word):
+        if c.upper() != c:
+            return word[:i] + c.upper() + word[i + 1:]
+    return word
+
+
+def _case_of(word: str) -> int:
+    """Casing class of one word, by rebuilding it from its lowercase form."""
+    folded = word.lower()
+    if folded == word:
+        return CASE_LOWER
+    if _capitalize(folded) == word:
+        return CASE_TITLE
+    if folded.upper() == word:
+        return CASE_UPPER
+    return CASE_EXCEPTION
+
+
+class LayoutPredictor:
+    """
+    Order-1 bit predictor for the layout symbol stream.
+
+    Each bit is predicted from the previous symbol and the bits of the
+    current symbol seen so far, by one adaptive probability per context
+    (no mixing: the stream is too regular to need it).
+
+    Interface (used by core.range_coder):
+    - predict() -> 12-bit probability that the next bit is 1
+    - update(bit) -> learn the actual bit
+    """
+
+    # Confidence saturates here: the adaptation rate floors at 1/(LIMIT+1.5)
+    COUNT_LIMIT = 30
+
+    def __init__(self):
+        from array import array
+
+        self._probs = array('H', [32768]) * (1 << 16)
+        self._counts = array('B', [0]) * (1 << 16)
+        self._rates = [int(65536 / (n + 1.5)) for n in range(self.COUNT_LIMIT + 1)]
+        self._prev = 0
+        self._c0 = 1
+        self._slot = 1
+
+    def predict(self) -> int:
+        p = self._probs[self._slot] >> 4
+        return 1 if p < 1 else (4095 if p > 4095 else p)
+
+    def update(self, bit: int):
+        slot = self._slot
+        n = self._counts[slot]
+        p = self._probs[slot]
+        if bit:
+            p += ((65535 - p) * self._rates[n]) >> 16
+        else:
+            p -= (p * self._rates[n]) >> 16
+        self._probs[slot] = p
+        if n < self.COUNT_LIMIT:
+            self._counts[slot] = n + 1
+
+        c0 = (self._c0 << 1) | bit
+        if c0 >= 256:
+            self._prev = c0 & 0xFF
+            c0 = 1
+        self._c0 = c0
+        self._slot = (self._prev << 8) | c0
+
+
+def encode_layout(layout: WordLayout) -> bytes:
+    """
+    Serialize a layout.
+
+    Format: [u32 N][u8 flags][u32 side_len][SIDE][SYMBOLS]
+
+    SIDE (zlib): leading gap id, separator table, escaped gap ids and
+    exception words, each length-prefixed.
+    SYMBOLS: N range-coded bytes, (case << 6) | min(gap, SEPARATOR_ESCAPE).
+    """
+    n = len(layout)
+    follow = layout.gaps[1:]
+    symbols = (layout.cases.astype(np.uint8) << 6) | np.minimum(follow, SEPARATOR_ESCAPE).astype(np.uint8)
+    escaped = follow[follow >= SEPARATOR_ESCAPE]
+
+    side = bytearray(struct.pack('<I', int(layout.gaps[0])))
+    for table in (layout.separators, layout.exceptions):
+        side += struct.pack('<I', len(table))
+        for entry in table:
+            raw = entry.encode('utf-8')
+            side += struct.pack('<I', len(raw)) + raw
+    side += struct.pack('<I', len(escaped)) + escaped.astype('<u4').tobytes()
+    side = zlib.compress(bytes(side), level=9)
+
+    coded = encode_bytes(symbols.tobytes(), LayoutPredictor())
+    return struct.pack('<IBI', n, int(layout.binary), len(side)) + side + coded
+
+
+def decode_layout(data: bytes) -> WordLayout:
+    """Inverse of encode_layout."""
+    n, flags, side_len = struct.unpack('<IBI', data[:9])
+    side = zlib.decompress(data[9:9 + side_len])
+    symbols = np.frombuffer(decode_bytes(data, n, LayoutPredictor(), offset=9 + side_len),
+                            dtype=np.uint8)
+
+    leading = struct.unpack('<I', side[:4])[0]
+    offset = 4
+    tables = []
+    for _ in range(2):
+        count = struct.unpack('<I', side[offset:offset + 4])[0]
+        offset += 4
+        table = []
+        for _ in range(count):
+            length = struct.unpack('<I', side[offset:offset + 4])[0]
+            table.append(side[offset + 4:offset + 4 + length].decode('utf-8'))
+            offset += 4 + length
+        tables.append(table)
+    n_escaped = struct.unpack('<I', side[offset:offset + 4])[0]
+    escaped = np.frombuffer(side[offset + 4:offset + 4 + 4 * n_escaped], dtype='<u4')
+
+    follow = (symbols & SEPARATOR_ESCAPE).astype(np.int64)
+    follow[follow == SEPARATOR_ESCAPE] = escaped
+    gaps = np.concatenate(([leading], follow)).astype(np.int64)
+    return WordLayout(symbols >> 6, gaps, tables[0], tables[1], binary=bool(flags & 1))
@@ -25,10 +25,10 @@ import numpy as np
 from typing import Union, List, Dict, Any, Optional, Tuple
 
 from .core.phi_adic import encode_phi, decode_phi, PHI, PHI_INV
-from .core.e8_lattice import Spinor
-from .core.projection import inverse_projection_with_phason, ProjectedSpinor
+from .core.e8_lattice import SpinorBatch
+from .core.projection import inverse_projection_with_phason, lift_many, ProjectedSpinor
 from .core.toric_error_correction import ToricErrorCorrector
-from .compressor import CompressedData
+from .compressor import CompressedData, FrameArchive
 
 
 class GQEDecompressor:
@@ -71,6 +71,8 @@ class GQEDecompressor:
         mode = compressed.metadata.get('mode', 'word')
         
         if len(compressed.token_sequence) == 0:
+            if compressed.layout is not None:
+                return compressed.layout.render([])
             return '' if mode != 'byte' else b''
         
         # V70 BYTE MODE: Direct byte reconstruction
@@ -96,7 +98,10 @@ class GQEDecompressor:
         elif mode == 'char':
             # Join characters
             result = ''.join(tokens)
-        elif mode == 'word':
+        elif mode == 'word_exact' and compressed.layout is not None:
+            # Restore casing and the original whitespace
+            result = compressed.layout.render(tokens)
+        elif mode in ('word', 'word_exact'):
             # Join words with spaces
             result = ' '.join(tokens)
         else:
@@ -105,37 +110,98 @@ class GQEDecompressor:
         
         return result
     
+    def decompress_range(self, source, start: int, end: Optional[int] = None) -> bytes:
+        """
+        Decompress bytes [start, end) of a v72 frame container.
+        
+        THE PHYSICS:
+        Render only the Active Horizon. The trailing frame index maps the
+        request onto the horizon frames it overlaps; only those frames
+        are read and decoded, whatever their position in the archive.
+        
+        Args:
+            source: Serialized container (bytes-like), a seekable binary
+                    file, or an already opened FrameArchive
+            start: First byte offset in the original input
+            end: One past the last byte offset (default: end of input)
+        
+        Returns:
+            The requested slice of the original bytes
+        """
+        archive = source if isinstance(source, FrameArchive) else FrameArchive(source)
+        
+        if start < 0 or (end is not None and end < start):
+            raise ValueError(f"Invalid range [{start}, {end})")
+        if end is None or end > archive.original_length:
+            end = archive.original_length
+        
+        frames = archive.frames_overlapping(start, end)
+        if len(frames) == 0:
+            return b''
+        
+        rendered = bytearray()
+        for i in frames:
+            rendered += archive.decode_frame(i)
+        
+        origin = archive.entries[frames[0]].raw_start
+        return bytes(rendered[start - origin:end - origin])
+    
+    def decompress_stream(self, reader, writer) -> int:
+        """
+        Decompress a v72 frame container into a binary stream, frame by frame.
+        
+        The frame index trails the frames, so the reader must be seekable;
+        only the index and one decoded frame are resident at a time.
+        
+        Args:
+            reader: Seekable binary file-like object holding the container
+            writer: Binary file-like object with write(b)
+        
+        Returns:
+            Number of bytes written
+        """
+        archive = FrameArchive(reader)
+        written = 0
+        for i in range(len(archive)):
+            frame = archive.decode_frame(i)
+            writer.write(frame)
+            written += len(frame)
+        
+        if written != archive.original_length:
+            raise ValueError(f"Length mismatch: expected {archive.original_length}, got {written}")
+        return written
+    
     def decompress_to_spinors(self, compressed: CompressedData, 
-                               apply_correction: bool = True) -> Tuple[List[Spinor], float]:
+                               apply_correction: bool = True) -> Tuple[SpinorBatch, float]:
         """
         Decompress to spinor representation with optional error correction.
         
         Uses phason lifting to reconstruct 8D spinors, then applies
         Toric error correction to fix phase inconsistencies.
         
+        Only the n_unique vocabulary rows are lifted (one GEMM); the token
+        stream is then a single gather into contiguous arrays, so no
+        per-token objects are built.
+        
         Args:
             compressed: CompressedData object
             apply_correction: Whether to apply Toric error correction
         
         Returns:
-            (List of 8D Spinors, coherence_score)
+            (SpinorBatch of 8D spinors, one row per token, coherence_score)
         """
-        spinors = []
-        
-        for i, idx in enumerate(compressed.token_sequence):
-            # Get projection and phason for this token
-            parallel = compressed.projections_4d[idx]
-            phason = compressed.phasons_4d[idx]
-            phase = compressed.phases[idx]
-            
-            # Lift to 8D using phason
-            spinor = inverse_projection_with_phason(parallel, phason, float(phase))
-            spinors.append(spinor)
+        seq = np.asarray(compressed.token_sequence, dtype=np.intp)
+        
+        # Lift the vocabulary once, then expand along the token stream
+        vocab_positions = lift_many(np.asarray(compressed.projections_4d).reshape(-1, 4),
+                                    np.asarray(compressed.phasons_4d).reshape(-1, 4))
+        vocab = SpinorBatch(vocab_positions, np.asarray(compressed.phases, dtype=np.float64))
+        spinors = vocab[seq]
         
         # Apply Toric error correction if enabled
         coherence = 1.0
         if apply_correction and self.enable_error_correction and self.error_corrector:
-            spinors, n_corrections, coherence = self.error_corrector.apply_error_correction(spinors)
+            spinors, n_corrections, coherence = self.error_corrector.correct_batch(spinors)
         
         return spinors, coherence
     
@@ -160,9 +226,7 @@ class GQEDecompressor:
             orig_words = original.split() if isinstance(original, str) else original.decode().split()
             recon_words = reconstructed.split() if isinstance(reconstructed, str) else reconstructed.decode().split()
             return [w.lower() for w in orig_words] == [w.lower() for w in recon_words]
-        elif mode == 'byte':
-            return original == reconstructed
-        elif mode == 'char':
+        elif mode in ('byte', 'char', 'word_exact'):
             return original == reconstructed
         else:
             return str(original) == str(reconstructed)
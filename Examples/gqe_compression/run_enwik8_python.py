@@ -25,17 +25,15 @@ def run_enwik8_test():
     file_size = os.path.getsize(enwik8_path)
     print(f"File: {enwik8_path} ({file_size / (1024*1024):.2f} MB)")
 
-    # Read data
-    with open(enwik8_path, 'rb') as f:
-        data = f.read()
-
-    compressor = GQECompressor(use_horizon_batching=True)
+    # Map the corpus instead of reading it: the compressor works on
+    # zero-copy views of the page cache, never a heap copy of 100MB
+    compressor = GQECompressor(use_horizon_batching=True, tokenize_mode='byte')
     
     print("\nInitiating the 100MB Integral (Python Proxy)...")
     start_time = time.time()
     
     # Compress the data
-    compressed_data = compressor.compress(data)
+    compressed_data = compressor.compress_file(enwik8_path)
     
     duration = time.time() - start_time
     
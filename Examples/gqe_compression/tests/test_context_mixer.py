@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Context Mixers
+
+THE PHYSICS:
+"The current moment is the Integral of the last N frames."
+
+We verify that the N-Frame predictors keep their tables inside a fixed
+crystal (no unbounded growth), and that the vectorized paths agree with
+the reference per-position paths.
+
+Author: The Architect
+License: Public Domain
+"""
+
+import pytest
+import numpy as np
+import os
+import sys
+
+# Set up path for both module and direct execution
+_test_dir = os.path.dirname(os.path.abspath(__file__))
+_gqe_dir = os.path.dirname(_test_dir)
+_examples_dir = os.path.dirname(_gqe_dir)
+if _examples_dir not in sys.path:
+    sys.path.insert(0, _examples_dir)
+
+from gqe_compression.core.context_mixer import (
+    SlottedTable, ContextModel, ContextMixer, GeometricParallelMixer,
+    FastContextMixer
+)
+
+
+SAMPLE_TEXT = (b"The crystal processes the entire frame. "
+               b"Patterns emerge from the N-Frame windows. ") * 40
+
+
+class TestSlottedTable:
+    """Test the fixed-size checksum-verified table."""
+
+    def test_find_or_insert_roundtrip(self):
+        """A claimed slot is found again by the same hash."""
+        table = SlottedTable(table_bits=8)
+        slot = table.find_or_insert(0xDEADBEEF)
+        table.rows[slot, 7] = 42
+        assert table.find(0xDEADBEEF) == slot
+        assert table.rows[table.find(0xDEADBEEF), 7] == 42
+        assert table.find(0xCAFEBABE) == -1
+
+    def test_memory_is_fixed(self):
+        """Inserting many more contexts than slots never grows the table."""
+        table = SlottedTable(table_bits=6)
+        nbytes = table.nbytes
+        for h in range(10000):
+            table.find_or_insert((h * 2654435761) & 0xFFFFFFFF)
+        assert table.nbytes == nbytes
+        assert len(table) == table.table_size
+
+    def test_replacement_keeps_evidence(self):
+        """The slot with the least evidence is recycled first."""
+        table = SlottedTable(table_bits=4, ways=2)
+        # Three hashes sharing bucket 0 (low bits zero) with distinct checks
+        a, b, c = 0x10000, 0x20000, 0x30000
+        sa = table.find_or_insert(a)
+        table.priority[sa] = 100
+        sb = table.find_or_insert(b)
+        table.priority[sb] = 1
+
+        sc = table.find_or_insert(c)
+        assert sc == sb
+        assert table.find(a) == sa
+        assert table.find(b) == -1
+
+    def test_vectorized_lookup_matches_find(self):
+        """lookup() agrees with find() on every hash."""
+        table = SlottedTable(table_bits=8)
+        rng = np.random.default_rng(3)
+        hashes = rng.integers(0, 2**32, 500, dtype=np.uint64).astype(np.uint32)
+        for h in hashes[:300]:
+            table.find_or_insert(int(h))
+
+        slots = table.lookup(hashes)
+        expected = [table.find(int(h)) for h in hashes]
+        assert slots.tolist() == expected
+
+    def test_insert_many_matches_sequential(self):
+        """Batch claims land where sequential claims would."""
+        rng = np.random.default_rng(11)
+        hashes = np.unique(rng.integers(0, 2**32, 400, dtype=np.uint64)).astype(np.uint32)
+
+        batch = SlottedTable(table_bits=16)
+        slots = batch.insert_many(hashes, np.arange(len(hashes)))
+
+        sequential = SlottedTable(table_bits=16)
+        for h in hashes:
+            sequential.find_or_insert(int(h))
+
+        assert (slots >= 0).all()
+        assert slots.tolist() == [sequential.find(int(h)) for h in hashes]
+        assert batch.priority[slots].tolist() == list(range(len(hashes)))
+
+    def test_insert_many_overflow(self):
+        """An overfull bucket keeps only `ways` contexts; the rest report -1."""
+        table = SlottedTable(table_bits=4, ways=2)
+        hashes = np.array([0x10000, 0x20000, 0x30000, 0x40000], dtype=np.uint32)
+        slots = table.insert_many(hashes, np.array([5, 1, 9, 3]))
+
+        assert (slots >= 0).sum() == 2
+        assert sorted(slots[slots >= 0].tolist()) == [0, 1]
+        assert slots.tolist() == table.lookup(hashes).tolist()
+
+    def test_invalid_ways(self):
+        """Bucket associativity must be a power of two."""
+        with pytest.raises(ValueError):
+            SlottedTable(table_bits=8, ways=3)
+
+
+class TestContextModel:
+    """Test the per-order byte counter model."""
+
+    def test_prediction_follows_counts(self):
+        """After training, the observed byte is the most likely one."""
+        model = ContextModel(context_size=2, table_bits=10)
+        for _ in range(20):
+            model.update(b"ab", ord("c"))
+        probs = model.predict(b"ab")
+        assert int(np.argmax(probs)) == ord("c")
+        assert abs(probs.sum() - 1.0) < 1e-9
+
+    def test_counter_overflow_rescales(self):
+        """uint8 counters halve instead of overflowing."""
+        model = ContextModel(context_size=1, table_bits=8)
+        for _ in range(1000):
+            model.update(b"x", 5)
+        model.update(b"x", 6)
+        probs = model.predict(b"x")
+        assert probs[5] > probs[6] > probs[7]
+
+    def test_table_is_bounded(self):
+        """Buckets used never exceed the preallocated table."""
+        model = ContextModel(context_size=4, table_bits=8)
+        data = bytes(np.random.default_rng(1).integers(0, 256, 5000, dtype=np.uint8))
+        for i in range(4, len(data)):
+            model.update(data[i - 4:i], data[i])
+        stats = model.get_stats()
+        assert stats['buckets_used'] <= stats['table_size']
+        assert stats['table_bytes'] == model._table.nbytes
+
+
+    def test_low_orders_get_small_tables(self):
+        """table_bits caps each order at 8k + 1 bits; order 1 still fits every context."""
+        mixer = ContextMixer(table_bits=18)
+        bits = {model.context_size: model.table_bits for model in mixer.models[1:]}
+        assert bits == {1: 9, 2: 17, 4: 18, 8: 18}
+
+        model = mixer.models[1]
+        for context in range(256):
+            model.update(bytes([context]), context)
+        assert model.get_stats()['buckets_used'] == 256
+        assert all(int(np.argmax(model.predict(bytes([c])))) == c for c in range(256))
+
+class TestContextHashing:
+    """Test the vectorized N-Frame hashes against scalar FNV-1a."""
+
+    DATA = bytes(np.random.default_rng(5).integers(0, 256, 3000, dtype=np.uint8))
+
+    def test_multi_hash_matches_scalar(self):
+        """Order-k hash folds data[i-1] ... data[i-k] (zero-padded)."""
+        mixer = GeometricParallelMixer(table_bits=12)
+        all_hashes = mixer._vectorized_multi_hash(self.DATA)
+
+        for ctx_size, hashes in all_hashes.items():
+            assert hashes.dtype == np.uint32
+            for i in (0, 1, 5, 8, 100, len(self.DATA) - 1):
+                h = 2166136261
+                for m in range(1, ctx_size + 1):
+                    b = self.DATA[i - m] if i - m >= 0 else 0
+                    h = ((h ^ b) * 16777619) & 0xFFFFFFFF
+                assert int(hashes[i]) == h
+
+    def test_multi_hash_excludes_current_byte(self):
+        """Changing byte i never changes the hashes at position i."""
+        mixer = GeometricParallelMixer(table_bits=12)
+        altered = bytearray(self.DATA)
+        altered[200] ^= 0xFF
+        before = mixer._vectorized_multi_hash(self.DATA)
+        after = mixer._vectorized_multi_hash(bytes(altered))
+        for ctx_size in before:
+            assert before[ctx_size][200] == after[ctx_size][200]
+            assert before[ctx_size][201] != after[ctx_size][201]
+
+    def test_fast_mixer_hash_matches_scalar(self):
+        """FastContextMixer's vectorized hash equals _hash_context everywhere."""
+        mixer = FastContextMixer(context_size=8, table_bits=16)
+        hashes = mixer._vectorized_hash(self.DATA)
+        expected = [mixer._hash_context(self.DATA[max(0, i - 8):i])
+                    for i in range(len(self.DATA))]
+        assert hashes.tolist() == expected
+
+
+class TestGeometricParallelMixer:
+    """Test the frame-at-once mixer."""
+
+    def test_fast_matches_reference(self):
+        """predict_batch_fast agrees with predict_vectorized once every window is full."""
+        mixer = GeometricParallelMixer(table_bits=12)
+        mixer.train_vectorized(SAMPLE_TEXT)
+
+        ranks, qprobs = mixer.predict_vectorized(SAMPLE_TEXT[:600])
+        fast_ranks, fast_qprobs = mixer.predict_batch_fast(SAMPLE_TEXT[:600])
+        warm = int(mixer.CONTEXT_SIZES.max())
+        assert np.array_equal(ranks[warm:], fast_ranks[warm:])
+
+    def test_train_counts_match_reference(self):
+        """Sort-based training equals per-context bincount + quantization."""
+        data = SAMPLE_TEXT[:1500] + bytes(range(256))
+        mixer = GeometricParallelMixer(table_bits=16)
+        mixer.train_vectorized(data)
+
+        arr = np.frombuffer(data, dtype=np.uint8)
+        all_hashes = mixer._vectorized_multi_hash(data)
+        contexts = np.unique(np.concatenate([h[k:] for k, h in all_hashes.items()]))
+        for h in contexts[::7]:
+            counts = np.zeros(256, dtype=np.int64)
+            for k, hashes in all_hashes.items():
+                counts += np.bincount(arr[k:][hashes[k:] == h], minlength=256)
+            expected = ((counts + 1) / (counts.sum() + 256) * 255).astype(np.uint8)
+
+            slot = mixer._qtables.find(int(h))
+            assert slot >= 0
+            assert np.array_equal(mixer._qtables.rows[slot], expected)
+            assert mixer._qtables.priority[slot] == min(counts.sum(), 65535)
+
+    def test_retraining_replaces_rows(self):
+        """A second frame overwrites the quantized rows it touches."""
+        mixer = GeometricParallelMixer(table_bits=16)
+        mixer.train_vectorized(b"ab" * 200)
+        mixer.train_vectorized(b"ac" * 200)
+
+        h = mixer._vectorized_multi_hash(b"ac")[1][1]  # order-1 context "a"
+        row = mixer._qtables.rows[mixer._qtables.find(int(h))]
+        assert row[ord("c")] > 0
+        assert row[ord("b")] == 0
+
+    def test_empty_frame(self):
+        """Training on nothing leaves the table empty."""
+        mixer = GeometricParallelMixer(table_bits=10)
+        mixer.train_vectorized(b"")
+        assert len(mixer._qtables) == 0
+
+    @pytest.mark.parametrize("max_tile_bytes", [1, 2304 * 7, 2304 * 100, 1 << 30])
+    def test_tiling_is_invisible(self, max_tile_bytes):
+        """Any tile size gives the same ranks and qprobs."""
+        mixer = GeometricParallelMixer(table_bits=12)
+        mixer.train_vectorized(SAMPLE_TEXT)
+        data = SAMPLE_TEXT[:900] + bytes(range(200))
+
+        ranks, qprobs = mixer.predict_batch_fast(data, max_tile_bytes=1 << 30)
+        tiled_ranks, tiled_qprobs = mixer.predict_batch_fast(data, max_tile_bytes)
+        assert np.array_equal(ranks, tiled_ranks)
+        assert np.array_equal(qprobs, tiled_qprobs)
+
+    def test_peak_memory_is_bounded(self):
+        """Peak allocation follows the ceiling, not the frame length."""
+        import tracemalloc
+
+        mixer = GeometricParallelMixer(table_bits=12)
+        mixer.train_vectorized(SAMPLE_TEXT)
+        data = SAMPLE_TEXT * 6  # ~20 KB: an untiled pass would need ~40 MB
+        ceiling = 1 << 20
+
+        tracemalloc.start()
+        mixer.predict_batch_fast(data, max_tile_bytes=ceiling)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # Tile buffers plus O(n) hashes/ranks, never O(n * 256)
+        assert peak < ceiling + 64 * len(data)
+
+        stats = mixer.get_compression_stats(data, max_tile_bytes=ceiling)
+        assert 0 < stats['peak_tile_bytes'] <= ceiling
+
+    def test_trained_text_is_predictable(self):
+        """Repetitive text is mostly rank-0 after training."""
+        mixer = GeometricParallelMixer(table_bits=12)
+        mixer.train_vectorized(SAMPLE_TEXT)
+        stats = mixer.get_compression_stats(SAMPLE_TEXT)
+        assert stats['accuracy'] > 0.9
+        assert stats['table_entries'] <= mixer.table_size
+        assert stats['table_bytes'] == mixer._qtables.nbytes
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Horizon Frame Container (v72 Format)
+
+THE PHYSICS:
+"The Universe renders in FRAMES, not all at once."
+
+We verify that horizon frames coded independently (and in parallel)
+tile the original sequence exactly, that the trailing frame index
+describes every frame, that a byte range decodes only the frames it
+overlaps, that the streaming API writes the same container one frame
+at a time, and that corruption is detected.
+
+Author: The Architect
+License: Public Domain
+"""
+
+import pytest
+import numpy as np
+import io
+import mmap
+import os
+import sys
+
+# Set up path for both module and direct execution
+_test_dir = os.path.dirname(os.path.abspath(__file__))
+_gqe_dir = os.path.dirname(_test_dir)
+_examples_dir = os.path.dirname(_gqe_dir)
+if _examples_dir not in sys.path:
+    sys.path.insert(0, _examples_dir)
+
+from gqe_compression.compressor import (
+    CompressedData, GQECompressor, FrameArchive, V72_MAGIC, V72_FOOTER
+)
+import gqe_compression.compressor as compressor_module
+from gqe_compression.decompressor import GQEDecompressor
+from gqe_compression.core.horizon_batcher import HorizonBatcher
+
+
+SAMPLE_TEXT = (b"The crystal processes the entire frame. "
+               b"Patterns emerge from the N-Frame windows. ") * 80
+
+
+def _serialize(data: bytes, workers: int = 1, predictor: str = 'adaptive') -> bytes:
+    compressor = GQECompressor(chunk_size=1024, bit_predictor=predictor, workers=workers)
+    compressed = compressor._compress_with_horizon_batching(data, 'byte')
+    return compressed.to_bytes('v72')
+
+
+class TestParallelFrames:
+    """Test frame-parallel compression through the v72 container."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_roundtrip(self, workers):
+        """Every worker count reproduces the input exactly."""
+        serialized = _serialize(SAMPLE_TEXT, workers=workers)
+        assert serialized[:2] == V72_MAGIC
+
+        restored = CompressedData.from_bytes(serialized)
+        assert restored.metadata['version'] == 'v72'
+        assert restored.metadata['n_frames'] > 1
+        assert GQEDecompressor().decompress(restored) == SAMPLE_TEXT
+
+    def test_output_is_independent_of_workers(self):
+        """Frames carry their own models, so parallelism never changes the bytes."""
+        assert _serialize(SAMPLE_TEXT, workers=1) == _serialize(SAMPLE_TEXT, workers=3)
+
+    def test_logistic_predictor(self):
+        """The default bitwise engine codes frames too."""
+        data = SAMPLE_TEXT[:3000]
+        restored = CompressedData.from_bytes(_serialize(data, predictor='logistic'))
+        assert restored.metadata['bit_predictor'] == 'logistic'
+        assert bytes(restored.token_sequence) == data
+
+    def test_empty_input(self):
+        """An empty input yields a valid container with no frames."""
+        compressed = CompressedData(
+            vocabulary={},
+            token_sequence=np.zeros(0, dtype=np.uint8),
+            projections_4d=np.zeros((0, 4), dtype=np.float32),
+            phasons_4d=np.zeros((0, 4), dtype=np.float32),
+            phases=np.zeros(0, dtype=np.float32),
+            metadata={'mode': 'byte', 'original_length': 0},
+        )
+        restored = CompressedData.from_bytes(compressed.to_bytes('v72'))
+        assert restored.metadata['n_frames'] == 0
+        assert len(restored.token_sequence) == 0
+
+    def test_public_compress(self):
+        """Standard byte mode (vocabulary ids) is framed as bytes, not ids."""
+        compressed = GQECompressor(chunk_size=1024).compress(SAMPLE_TEXT)
+        assert compressed.metadata['mode'] == 'byte'
+        assert compressed.vocabulary
+
+        restored = CompressedData.from_bytes(compressed.to_bytes('v72'))
+        assert GQEDecompressor().decompress(restored) == SAMPLE_TEXT
+
+    def test_rejects_word_mode(self):
+        """Word ids cannot be framed as bytes."""
+        compressed = GQECompressor().compress(SAMPLE_TEXT.decode())
+        assert compressed.metadata['mode'] == 'word'
+        with pytest.raises(ValueError, match="byte mode"):
+            compressed.to_bytes('v72')
+
+    def test_invalid_workers(self):
+        """At least one worker is required."""
+        with pytest.raises(ValueError):
+            GQECompressor(workers=0)
+
+
+class TestFrameIndex:
+    """Test the trailing offset table."""
+
+    def test_index_tiles_input(self):
+        """Frame ranges are contiguous and cover the whole input."""
+        serialized = _serialize(SAMPLE_TEXT)
+        archive = FrameArchive(serialized)
+
+        assert archive.chunk_size == 1024
+        assert archive.original_length == len(SAMPLE_TEXT)
+        position = 0
+        for entry in archive.entries:
+            assert entry.byte_range[0] == position
+            assert entry.stream_offset + entry.stream_length <= len(serialized) - V72_FOOTER.size
+            position = entry.byte_range[1]
+        assert position == len(SAMPLE_TEXT)
+
+    def test_frame_corruption_detected(self):
+        """A flipped bit inside a frame fails that frame's checksum."""
+        serialized = bytearray(_serialize(SAMPLE_TEXT))
+        serialized[FrameArchive(serialized).entries[1].stream_offset] ^= 0x01
+        with pytest.raises(ValueError):
+            CompressedData.from_bytes(bytes(serialized))
+
+    def test_index_corruption_detected(self):
+        """A damaged index is rejected before any frame is decoded."""
+        serialized = bytearray(_serialize(SAMPLE_TEXT))
+        serialized[-V72_FOOTER.size - 3] ^= 0xFF
+        with pytest.raises(ValueError):
+            CompressedData.from_bytes(bytes(serialized))
+
+
+class TestRandomAccess:
+    """Test decompress_range over the frame index."""
+
+    SERIALIZED = _serialize(SAMPLE_TEXT)
+
+    @pytest.mark.parametrize("start, end", [
+        (0, 10),
+        (1000, 1100),       # straddles a frame boundary
+        (2500, 6000),       # spans several frames
+        (len(SAMPLE_TEXT) - 5, len(SAMPLE_TEXT)),
+        (123, 123),
+        (0, None),
+    ])
+    def test_slice_matches(self, start, end):
+        """Any range equals the same slice of the original."""
+        result = GQEDecompressor().decompress_range(self.SERIALIZED, start, end)
+        assert result == SAMPLE_TEXT[start:end]
+
+    def test_decodes_only_overlapping_frames(self, monkeypatch):
+        """A small range decodes one or two frames, not the archive."""
+        decoded = []
+        original = compressor_module._decode_frame
+
+        def counting_decode(stream, length, predictor_name, table_bits):
+            decoded.append(length)
+            return original(stream, length, predictor_name, table_bits)
+
+        monkeypatch.setattr(compressor_module, '_decode_frame', counting_decode)
+        archive = FrameArchive(self.SERIALIZED)
+        last = archive.entries[-1].byte_range
+
+        result = GQEDecompressor().decompress_range(archive, last[0] + 1, last[0] + 50)
+        assert result == SAMPLE_TEXT[last[0] + 1:last[0] + 50]
+        assert len(decoded) == 1
+        assert len(archive) > 5
+
+    def test_reads_from_file(self, tmp_path):
+        """A seekable file serves partial reads without loading the archive."""
+        path = tmp_path / "archive.gqe"
+        path.write_bytes(self.SERIALIZED)
+        with open(path, 'rb') as f:
+            result = GQEDecompressor().decompress_range(f, 3000, 3050)
+        assert result == SAMPLE_TEXT[3000:3050]
+
+        stream = io.BytesIO(self.SERIALIZED)
+        assert GQEDecompressor().decompress_range(stream, 10, 20) == SAMPLE_TEXT[10:20]
+
+    def test_reads_from_mmap(self, tmp_path):
+        """A memory-mapped file is sliced in place and can still be closed."""
+        path = tmp_path / "archive.gqe"
+        path.write_bytes(self.SERIALIZED)
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            archive = FrameArchive(mapped)
+            assert archive.original_length == len(SAMPLE_TEXT)
+            assert GQEDecompressor().decompress_range(archive, 3000, 3050) == SAMPLE_TEXT[3000:3050]
+            assert bytes(CompressedData.from_bytes(mapped).token_sequence) == SAMPLE_TEXT
+
+    def test_range_clamps_and_validates(self):
+        """Reads past the end are clipped; inverted ranges are rejected."""
+        decompressor = GQEDecompressor()
+        assert decompressor.decompress_range(self.SERIALIZED, len(SAMPLE_TEXT) + 10, None) == b''
+        assert decompressor.decompress_range(self.SERIALIZED, 5, 10 ** 9) == SAMPLE_TEXT[5:]
+        with pytest.raises(ValueError):
+            decompressor.decompress_range(self.SERIALIZED, 50, 10)
+
+
+class TrickleReader(io.BytesIO):
+    """A reader that returns at most `step` bytes per read, like a pipe."""
+
+    def __init__(self, data: bytes, step: int = 777):
+        super().__init__(data)
+        self.step = step
+
+    def read(self, n=-1):
+        return super().read(self.step if n < 0 else min(n, self.step))
+
+
+class TestStreaming:
+    """Test compress_stream / decompress_stream over file objects."""
+
+    def test_stream_chunks_match_chunk_data(self):
+        """Streaming grain search cuts exactly where _chunk_data does."""
+        rng = np.random.default_rng(9)
+        data = SAMPLE_TEXT + bytes(rng.integers(0, 256, 20000, dtype=np.uint8)) + b"x" * 9000
+        batcher = HorizonBatcher(chunk_size=1024)
+
+        expected = list(batcher._chunk_data(data))
+        streamed = list(batcher.stream_chunks(TrickleReader(data)))
+        assert streamed == expected
+
+    def test_stream_matches_to_bytes(self):
+        """compress_stream writes the same container as to_bytes('v72')."""
+        compressor = GQECompressor(chunk_size=1024, bit_predictor='adaptive')
+        writer = io.BytesIO()
+        written = compressor.compress_stream(TrickleReader(SAMPLE_TEXT), writer)
+
+        assert written == len(writer.getvalue())
+        assert writer.getvalue() == _serialize(SAMPLE_TEXT)
+
+    def test_stream_roundtrip(self, tmp_path):
+        """A file streamed in and out comes back byte for byte."""
+        source = tmp_path / "input.bin"
+        archive = tmp_path / "input.gqe"
+        restored = tmp_path / "restored.bin"
+        data = SAMPLE_TEXT * 3
+        source.write_bytes(data)
+
+        compressor = GQECompressor(chunk_size=2048, bit_predictor='adaptive')
+        with open(source, 'rb') as reader, open(archive, 'wb') as writer:
+            compressor.compress_stream(reader, writer)
+        with open(archive, 'rb') as reader, open(restored, 'wb') as writer:
+            assert GQEDecompressor().decompress_stream(reader, writer) == len(data)
+
+        assert restored.read_bytes() == data
+
+    def test_zlib_frames(self):
+        """The zlib proxy codec fills the same container and index."""
+        data = SAMPLE_TEXT * 10
+        compressor = GQECompressor(chunk_size=1024, frame_codec='zlib')
+        writer = io.BytesIO()
+        compressor.compress_stream(io.BytesIO(data), writer)
+        serialized = writer.getvalue()
+
+        restored = CompressedData.from_bytes(serialized)
+        assert restored.metadata['frame_codec'] == 'zlib'
+        assert bytes(restored.token_sequence) == data
+        assert GQEDecompressor().decompress_range(serialized, 5000, 5100) == data[5000:5100]
+
+    def test_empty_stream(self):
+        """An empty reader yields an empty, valid container."""
+        writer = io.BytesIO()
+        GQECompressor(chunk_size=1024).compress_stream(io.BytesIO(b""), writer)
+        out = io.BytesIO()
+        assert GQEDecompressor().decompress_stream(io.BytesIO(writer.getvalue()), out) == 0
+
+    def test_invalid_frame_codec(self):
+        """Unknown frame codecs are rejected up front."""
+        with pytest.raises(ValueError):
+            GQECompressor(frame_codec='lzma')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
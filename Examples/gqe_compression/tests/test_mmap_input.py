@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Memory-Mapped Input Path
+
+THE PHYSICS:
+"It does NOT load the whole universe into RAM."
+
+We verify that compress_file works directly on a read-only mapping of
+the file: the byte-mode token sequence is a view of the mapping rather
+than a heap copy, and every serialization path reads it losslessly.
+
+Author: The Architect
+License: Public Domain
+"""
+
+import pytest
+import mmap
+import os
+import sys
+
+# Set up path for both module and direct execution
+_test_dir = os.path.dirname(os.path.abspath(__file__))
+_gqe_dir = os.path.dirname(_test_dir)
+_examples_dir = os.path.dirname(_gqe_dir)
+if _examples_dir not in sys.path:
+    sys.path.insert(0, _examples_dir)
+
+from gqe_compression.compressor import CompressedData, GQECompressor
+from gqe_compression.decompressor import GQEDecompressor
+from gqe_compression.core.horizon_batcher import HorizonBatcher
+
+
+SAMPLE_TEXT = (b"The crystal processes the entire frame. "
+               b"Patterns emerge from the N-Frame windows. ") * 80
+
+
+@pytest.fixture
+def sample_file(tmp_path):
+    path = tmp_path / "sample.txt"
+    path.write_bytes(SAMPLE_TEXT)
+    return str(path)
+
+
+class TestMappedCompression:
+    """Test compress_file over an mmap."""
+
+    def test_token_sequence_is_a_view(self, sample_file):
+        """Byte mode hands the mapping itself to np.frombuffer."""
+        compressor = GQECompressor(tokenize_mode='byte', chunk_size=1024)
+        compressed = compressor.compress_file(sample_file)
+
+        seq = compressed.token_sequence
+        assert not seq.flags.owndata
+        assert isinstance(seq.base, (memoryview, mmap.mmap))
+        assert bytes(seq) == SAMPLE_TEXT
+
+    @pytest.mark.parametrize("version", ['v70', 'v72'])
+    def test_mapped_roundtrip(self, sample_file, version):
+        """Serializers read the mapped sequence losslessly."""
+        compressor = GQECompressor(tokenize_mode='byte', chunk_size=1024,
+                                   frame_codec='zlib')
+        compressed = compressor.compress_file(sample_file)
+
+        restored = CompressedData.from_bytes(compressed.to_bytes(version))
+        assert GQEDecompressor().decompress(restored) == SAMPLE_TEXT
+
+    def test_memoryview_input(self, sample_file):
+        """compress() accepts a mapped buffer like bytes."""
+        with open(sample_file, 'rb') as f:
+            view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+        compressor = GQECompressor(chunk_size=1024)
+        compressed = compressor._compress_with_horizon_batching(view, 'byte')
+        assert compressed.metadata['mode'] == 'byte'
+        assert bytes(compressed.token_sequence) == SAMPLE_TEXT
+
+    def test_word_mode_frames(self, sample_file):
+        """Word mode tokenizes grain-aligned mapped frames."""
+        compressor = GQECompressor(chunk_size=1024)
+        compressed = compressor.compress_file(sample_file)
+
+        assert compressed.metadata['original_length'] == len(SAMPLE_TEXT)
+        assert compressed.metadata['n_tokens'] == len(SAMPLE_TEXT.split())
+        assert compressed.metadata['n_frames'] > 1
+
+    def test_empty_file(self, tmp_path):
+        """Empty files cannot be mapped but still compress."""
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+        compressed = GQECompressor(tokenize_mode='byte').compress_file(str(path))
+        assert compressed.metadata['original_length'] == 0
+
+
+class TestBufferVocabulary:
+    """Test the byte-singularity vocabulary on buffers."""
+
+    def test_vocabulary_matches_bytes(self):
+        """A memoryview yields the same vocabulary as the bytes."""
+        batcher = HorizonBatcher(chunk_size=1024)
+        expected = {bytes([b]): b for b in set(SAMPLE_TEXT)}
+        assert batcher._build_global_vocabulary(memoryview(SAMPLE_TEXT)) == expected
+        assert batcher._build_global_vocabulary(b"") == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
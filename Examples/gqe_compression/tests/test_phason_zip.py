@@ -85,6 +85,79 @@ class TestBitStream:
             actual = recovered.read_unary()
             assert actual == expected
 
+    def test_wire_format(self):
+        """Bit count header, then bits LSB-first within each byte."""
+        stream = BitStream()
+        for bit in [1, 0, 1, 1, 0, 0, 0, 0, 1]:
+            stream.write_bit(bit)
+        assert stream.to_bytes() == b'\x09\x00\x00\x00\x0d\x01'
+
+        stream = BitStream()
+        stream.write_gamma(5)  # 00 then 101
+        assert stream.to_bytes() == b'\x05\x00\x00\x00\x14'
+
+    def test_multi_bit_fields(self):
+        """write_bits(v, n) matches n single-bit writes, LSB first."""
+        rng = np.random.default_rng(11)
+        widths = rng.integers(0, 70, 500).tolist()
+        values = [int(v) for v in rng.integers(0, 2 ** 62, 500)]
+
+        fields, single = BitStream(), BitStream()
+        for value, width in zip(values, widths):
+            fields.write_bits(value, width)
+            for i in range(width):
+                single.write_bit((value >> i) & 1)
+        assert fields.to_bytes() == single.to_bytes()
+
+        recovered = BitStream.from_bytes(fields.to_bytes())
+        for value, width in zip(values, widths):
+            assert recovered.read_bits(width) == value & ((1 << width) - 1)
+
+    def test_bulk_bits_and_appending(self):
+        """Bit arrays pack in bulk; a parsed stream keeps accepting writes."""
+        bits = np.random.default_rng(2).integers(0, 2, 1001)
+        stream = BitStream.from_bit_array(bits)
+        assert np.array_equal(stream.to_bit_array(), bits)
+
+        recovered = BitStream.from_bytes(stream.to_bytes())
+        recovered.write_gamma(233)
+        recovered.position = 1000
+        assert recovered.read_bit() == bits[-1]
+        assert recovered.read_gamma() == 233
+        assert recovered.read_bit() == 0  # Past the end
+
+    def test_interleaved_read_write(self):
+        """Writes after reads are seen by later reads, not stale zeros."""
+        stream = BitStream()
+        stream.write_bits(1, 1)
+        assert stream.read_bit() == 1
+        stream.write_bits(5, 3)
+        assert stream.read_bits(3) == 5
+
+        # Random interleaving against a plain list of bits
+        rng = np.random.default_rng(20)
+        stream, bits, position = BitStream(), [], 0
+        for _ in range(3000):
+            width = int(rng.integers(0, 70))
+            if rng.random() < 0.5:
+                value = int(rng.integers(0, 2 ** 62)) | (1 << 62)
+                stream.write_bits(value, width)
+                bits.extend((value >> i) & 1 for i in range(width))
+            else:
+                expected = sum(bits[i] << (i - position)
+                               for i in range(position, min(position + width, len(bits))))
+                assert stream.read_bits(width) == expected
+                position += width
+        assert len(stream) == len(bits)
+
+    def test_compact_storage(self):
+        """A million bits occupy about 125 KB, not a list of ints."""
+        stream = BitStream()
+        for _ in range(1000):
+            stream.write_bits(0x5555555555555555, 1000)
+        assert len(stream) == 1_000_000
+        assert len(stream._buffer) < 2 * 125_000 + 64
+
 
 class TestPhiAdicBitPacker:
     """Test the PhiAdicBitPacker class."""
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Batched E8 -> H4 Projection
+
+THE PHYSICS:
+"A shadow can be cast by many objects" - unless the phason is kept.
+
+We verify that the array-native projection and lift agree with the
+per-spinor reference, invert each other, and back the compressor and
+decompressor.
+
+Author: The Architect
+License: Public Domain
+"""
+
+import pytest
+import numpy as np
+import os
+import sys
+
+# Set up path for both module and direct execution
+_test_dir = os.path.dirname(os.path.abspath(__file__))
+_gqe_dir = os.path.dirname(_test_dir)
+_examples_dir = os.path.dirname(_gqe_dir)
+if _examples_dir not in sys.path:
+    sys.path.insert(0, _examples_dir)
+
+from gqe_compression.core.e8_lattice import Spinor, SpinorBatch, generate_e8_roots
+from gqe_compression.core.projection import (
+    coxeter_projection_8d_to_4d, inverse_projection_with_phason,
+    project_many, lift_many, batch_project, batch_lift
+)
+from gqe_compression.compressor import CompressedData, GQECompressor
+from gqe_compression.decompressor import GQEDecompressor
+
+
+POSITIONS = np.random.default_rng(4).normal(size=(500, 8)).astype(np.float32)
+
+
+class TestProjectMany:
+    """Test the GEMM projection against the per-spinor reference."""
+
+    def test_matches_scalar_projection(self):
+        """Every row equals coxeter_projection_8d_to_4d."""
+        parallel, phason = project_many(POSITIONS)
+        assert parallel.shape == phason.shape == (len(POSITIONS), 4)
+        for i in range(0, len(POSITIONS), 37):
+            projected = coxeter_projection_8d_to_4d(Spinor(POSITIONS[i]))
+            assert np.allclose(parallel[i], projected.parallel, atol=1e-12)
+            assert np.allclose(phason[i], projected.phason, atol=1e-12)
+
+    def test_lift_inverts_projection(self):
+        """Projection plus phason lifts back losslessly."""
+        roots = generate_e8_roots()
+        assert np.allclose(lift_many(*project_many(roots)), roots, atol=1e-12)
+
+    def test_lift_matches_scalar_lift(self):
+        """Every row equals inverse_projection_with_phason."""
+        parallel, phason = project_many(POSITIONS)
+        lifted = lift_many(parallel, phason)
+        for i in range(0, len(POSITIONS), 41):
+            spinor = inverse_projection_with_phason(parallel[i], phason[i])
+            assert np.allclose(lifted[i], spinor.position, atol=1e-12)
+
+    def test_batch_wrappers_keep_phase(self):
+        """batch_project / batch_lift still round-trip Spinor objects."""
+        spinors = [Spinor(p, phase=0.1 * i) for i, p in enumerate(POSITIONS[:20])]
+        lifted = batch_lift(batch_project(spinors))
+        assert lifted == spinors
+        assert batch_project([]) == [] and batch_lift([]) == []
+
+    def test_shape_validation(self):
+        """Wrong shapes are rejected."""
+        with pytest.raises(ValueError):
+            project_many(np.zeros((3, 4)))
+        with pytest.raises(ValueError):
+            lift_many(np.zeros((3, 4)), np.zeros((2, 4)))
+
+
+class TestPipelineIntegration:
+    """Test the compressor and decompressor on the batched path."""
+
+    TEXT = "the crystal renders the frame and the frame renders the crystal " * 5
+
+    def test_compressor_projections(self):
+        """compress() stores the projection of each vocabulary spinor."""
+        compressed = GQECompressor(tokenize_mode='word').compress(self.TEXT)
+        lifted = lift_many(compressed.projections_4d, compressed.phasons_4d)
+        parallel, phason = project_many(lifted)
+        assert np.allclose(parallel, compressed.projections_4d)
+        assert np.allclose(phason, compressed.phasons_4d)
+
+    def test_compressor_vocabulary(self):
+        """Vocabulary follows first appearance; the sequence stays uint32."""
+        compressed = GQECompressor(tokenize_mode='word').compress(self.TEXT)
+        words = self.TEXT.lower().split()
+        order = list(dict.fromkeys(words))
+
+        assert isinstance(compressed.token_sequence, np.ndarray)
+        assert compressed.token_sequence.dtype == np.uint32
+        assert [compressed.vocabulary[w]['index'] for w in order] == list(range(len(order)))
+        assert all(compressed.vocabulary[w]['count'] == words.count(w) for w in order)
+        assert [order[i] for i in compressed.token_sequence] == words
+
+    def test_uint32_ids_serialize_through_v70(self):
+        """Byte-mode ids map back to bytes in v70; word ids are refused."""
+        data = self.TEXT.encode()
+        compressed = GQECompressor(tokenize_mode='byte').compress(data)
+        restored = CompressedData.from_bytes(compressed.to_bytes('v70'))
+        assert GQEDecompressor().decompress(restored) == data
+
+        words = GQECompressor(tokenize_mode='word').compress(self.TEXT)
+        with pytest.raises(ValueError, match="byte mode"):
+            words.to_bytes('v70')
+
+    def test_decompress_to_spinors(self):
+        """Spinor-level decode lifts every token from its vocabulary row."""
+        compressed = GQECompressor(tokenize_mode='word').compress(self.TEXT)
+        spinors, _ = GQEDecompressor(enable_error_correction=False).decompress_to_spinors(compressed)
+
+        assert len(spinors) == len(compressed.token_sequence)
+        for spinor, idx in list(zip(spinors, compressed.token_sequence))[::5]:
+            expected = inverse_projection_with_phason(
+                compressed.projections_4d[idx], compressed.phasons_4d[idx],
+                float(compressed.phases[idx]))
+            assert spinor == expected
+
+    def test_decompress_to_spinors_is_a_gather(self):
+        """Token rows are a gather of the lifted vocabulary, held as arrays."""
+        compressed = GQECompressor(tokenize_mode='word').compress(self.TEXT * 20)
+        spinors, _ = GQEDecompressor(enable_error_correction=False).decompress_to_spinors(compressed)
+
+        assert isinstance(spinors, SpinorBatch)
+        vocab = lift_many(compressed.projections_4d, compressed.phasons_4d).astype(np.float32)
+        seq = np.asarray(compressed.token_sequence)
+        assert np.array_equal(spinors.positions, vocab[seq])
+        assert np.array_equal(spinors.phases, np.asarray(compressed.phases, dtype=np.float32)[seq])
+
+    def test_decompress_to_spinors_empty(self):
+        """An empty stream decodes to an empty batch."""
+        compressed = GQECompressor(tokenize_mode='word').compress("")
+        spinors, coherence = GQEDecompressor().decompress_to_spinors(compressed)
+        assert len(spinors) == 0
+        assert coherence == 1.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
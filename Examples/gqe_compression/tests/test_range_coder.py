@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Range Coder (v71 Format)
+
+THE PHYSICS:
+A prediction is only worth the bits it saves. We verify that the
+AdaptiveBitMixer's probabilities reach the wire through the range
+coder, and that the decoder replays them losslessly.
+
+Test Cases:
+1. Arithmetic coder round-trip at fixed probabilities
+2. Mixer-driven round-trip on text and binary data
+3. v71 serialization through CompressedData
+4. Prediction pays: v71 beats raw storage on redundant text
+
+Author: The Architect
+License: Public Domain
+"""
+
+import pytest
+import numpy as np
+import os
+import sys
+
+# Set up path for both module and direct execution
+_test_dir = os.path.dirname(os.path.abspath(__file__))
+_gqe_dir = os.path.dirname(_test_dir)
+_examples_dir = os.path.dirname(_gqe_dir)
+if _examples_dir not in sys.path:
+    sys.path.insert(0, _examples_dir)
+
+from gqe_compression.core.range_coder import (
+    ArithmeticEncoder, ArithmeticDecoder, encode_bytes, decode_bytes
+)
+from gqe_compression.core.context_mixer import AdaptiveBitMixer, squash, stretch
+from gqe_compression.compressor import CompressedData, GQECompressor
+from gqe_compression.decompressor import GQEDecompressor
+
+
+SAMPLE_TEXT = (b"The crystal processes the entire frame. "
+               b"Patterns emerge from the N-Frame windows. ") * 40
+
+
+class TestArithmeticCoder:
+    """Test the binary arithmetic coder in isolation."""
+
+    def test_fixed_probability_roundtrip(self):
+        """Bits coded at arbitrary fixed probabilities decode exactly."""
+        rng = np.random.default_rng(7)
+        bits = rng.integers(0, 2, 5000).tolist()
+        probs = rng.integers(1, 4096, 5000).tolist()
+
+        encoder = ArithmeticEncoder()
+        for bit, p in zip(bits, probs):
+            encoder.encode_bit(bit, p)
+        stream = encoder.finish()
+
+        decoder = ArithmeticDecoder(stream)
+        decoded = [decoder.decode_bit(p) for p in probs]
+        assert decoded == bits
+
+    def test_confident_predictions_are_cheap(self):
+        """Correctly predicted bits cost far less than one bit each."""
+        encoder = ArithmeticEncoder()
+        for _ in range(8000):
+            encoder.encode_bit(1, 4000)
+        stream = encoder.finish()
+        assert len(stream) < 8000 // 8 // 10
+
+    def test_squash_stretch_inverse(self):
+        """stretch is the inverse of squash on the 12-bit grid."""
+        for p in range(1, 4096, 17):
+            assert abs(squash(stretch(p)) - p) <= 40
+
+
+class TestMixerDrivenCoding:
+    """Test range coding driven by the AdaptiveBitMixer."""
+
+    @pytest.mark.parametrize("data", [
+        b"",
+        b"a",
+        SAMPLE_TEXT,
+        bytes(range(256)) * 4,
+    ])
+    def test_roundtrip(self, data):
+        """Encoder and decoder replay the same model."""
+        stream = encode_bytes(data, AdaptiveBitMixer(table_bits=16))
+        decoded = decode_bytes(stream, len(data), AdaptiveBitMixer(table_bits=16))
+        assert decoded == data
+
+    def test_decode_from_offset(self):
+        """The streaming decoder reads directly out of a larger buffer."""
+        stream = encode_bytes(SAMPLE_TEXT, AdaptiveBitMixer(table_bits=16))
+        container = b'HEADER' + stream
+        decoded = decode_bytes(container, len(SAMPLE_TEXT),
+                               AdaptiveBitMixer(table_bits=16), offset=6)
+        assert decoded == SAMPLE_TEXT
+
+    def test_invalid_table_bits(self):
+        """Out-of-range table sizes are rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveBitMixer(table_bits=4)
+
+
+class TestV71Format:
+    """Test the v71 serialization format."""
+
+    def _byte_level(self, data: bytes) -> CompressedData:
+        return CompressedData(
+            vocabulary={},
+            token_sequence=np.frombuffer(data, dtype=np.uint8),
+            projections_4d=np.zeros((0, 4), dtype=np.float32),
+            phasons_4d=np.zeros((0, 4), dtype=np.float32),
+            phases=np.zeros(0, dtype=np.float32),
+            metadata={'mode': 'byte', 'original_length': len(data)},
+        )
+
+    def test_v71_magic(self):
+        """v71 streams carry the 0xE871 magic."""
+        serialized = self._byte_level(SAMPLE_TEXT).to_bytes('v71')
+        assert serialized[:2] == b'\xE8\x71'
+
+    def test_v71_roundtrip(self):
+        """v71 round-trip through CompressedData is lossless."""
+        serialized = self._byte_level(SAMPLE_TEXT).to_bytes('v71')
+        restored = CompressedData.from_bytes(serialized)
+
+        assert restored.metadata['version'] == 'v71'
+        assert restored.metadata['original_length'] == len(SAMPLE_TEXT)
+        assert bytes(restored.token_sequence) == SAMPLE_TEXT
+        assert GQEDecompressor().decompress(restored) == SAMPLE_TEXT
+
+    def test_v71_horizon_batched(self):
+        """Horizon-batched byte output serializes through v71."""
+        data = SAMPLE_TEXT * 3
+        compressor = GQECompressor(use_horizon_batching=True, chunk_size=1024)
+        compressed = compressor._compress_with_horizon_batching(data, 'byte')
+
+        restored = CompressedData.from_bytes(compressed.to_bytes('v71'))
+        assert GQEDecompressor().decompress(restored) == data
+
+    def test_v71_public_compress(self):
+        """Standard byte mode (vocabulary ids) round-trips through v71."""
+        compressed = GQECompressor().compress(SAMPLE_TEXT)
+        assert compressed.metadata['mode'] == 'byte'
+        assert compressed.vocabulary
+
+        restored = CompressedData.from_bytes(compressed.to_bytes('v71'))
+        assert GQEDecompressor().decompress(restored) == SAMPLE_TEXT
+
+    def test_v71_rejects_word_mode(self):
+        """Word ids are not bytes; v71 refuses them instead of truncating."""
+        compressed = GQECompressor().compress(SAMPLE_TEXT.decode() * 10)
+        assert compressed.metadata['mode'] == 'word'
+        with pytest.raises(ValueError, match="byte mode"):
+            compressed.to_bytes('v71')
+
+    def test_v71_checksum(self):
+        """Corrupted range streams are detected."""
+        serialized = bytearray(self._byte_level(SAMPLE_TEXT).to_bytes('v71'))
+        serialized[-1] ^= 0xFF
+        with pytest.raises(ValueError):
+            CompressedData.from_bytes(bytes(serialized))
+
+    def test_v71_beats_raw(self):
+        """Predictions reach the wire: redundant text shrinks."""
+        serialized = self._byte_level(SAMPLE_TEXT).to_bytes('v71')
+        assert len(serialized) < len(SAMPLE_TEXT) / 4
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -177,6 +177,85 @@ print(f"{{peak_rss}},{{duration}},{{1 if success else 0}}")
         return 0, 0, False
 
 
+def run_stream_roundtrip_in_subprocess(input_file: str, archive_file: str,
+                                       output_file: str) -> float:
+    """
+    Stream a file through compress_stream and back through decompress_stream
+    in a fresh subprocess.
+    
+    Returns:
+        Peak RSS in MB of the whole round-trip
+    """
+    script = f'''
+import sys
+sys.path.insert(0, "{os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))}")
+
+import resource
+
+from gqe_compression.compressor import GQECompressor
+from gqe_compression.decompressor import GQEDecompressor
+
+compressor = GQECompressor(frame_codec='zlib')
+with open("{input_file}", "rb") as reader, open("{archive_file}", "wb") as writer:
+    compressor.compress_stream(reader, writer)
+
+with open("{archive_file}", "rb") as reader, open("{output_file}", "wb") as writer:
+    GQEDecompressor().decompress_stream(reader, writer)
+
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)  # KB to MB on Linux
+'''
+    result = subprocess.run(
+        [sys.executable, '-c', script],
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    return float(result.stdout.strip())
+
+
+def _files_equal(path_a: str, path_b: str, block: int = 1 << 20) -> bool:
+    """Compare two files without loading either."""
+    with open(path_a, 'rb') as a, open(path_b, 'rb') as b:
+        while True:
+            block_a, block_b = a.read(block), b.read(block)
+            if block_a != block_b:
+                return False
+            if not block_a:
+                return True
+
+
+def test_stream_rss_is_flat(tmp_path):
+    """
+    compress_stream / decompress_stream RSS does not grow with the input.
+    
+    An 8x larger input (64 MB vs 8 MB) may cost only a few MB more -
+    resident memory is bounded by the horizon frame, not the file.
+    """
+    block = generate_test_data(1).encode('utf-8')
+    peaks = {}
+    
+    for size_mb in (8, 64):
+        input_file = str(tmp_path / f"input_{size_mb}mb.txt")
+        archive_file = str(tmp_path / f"input_{size_mb}mb.gqe")
+        output_file = str(tmp_path / f"restored_{size_mb}mb.txt")
+        with open(input_file, 'wb') as f:
+            for _ in range(size_mb):
+                f.write(block)
+        
+        peaks[size_mb] = run_stream_roundtrip_in_subprocess(input_file, archive_file, output_file)
+        
+        assert _files_equal(input_file, output_file)
+        assert os.path.getsize(archive_file) < os.path.getsize(input_file)
+        for path in (input_file, archive_file, output_file):
+            os.remove(path)
+    
+    growth = peaks[64] - peaks[8]
+    print(f"  Stream RSS: 8MB -> {peaks[8]:.1f} MB, 64MB -> {peaks[64]:.1f} MB")
+    assert growth < 16, f"RSS grew {growth:.1f} MB for 56 MB more input"
+
+
 def run_test():
     """
     Run the RSS Measurement Test.
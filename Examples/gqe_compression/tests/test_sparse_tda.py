@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Sparse Topological Embedding
+
+THE PHYSICS:
+"The E8 Lattice is not a dictionary; it is a Topology of Relationships."
+
+We verify that the vectorized sparse co-occurrence matrix counts the
+same relationships (with the same PMI weights) as the reference
+pair-by-pair loop, that the NetworkX view is only a wrapper, and that
+the sparse-native features agree with their NetworkX counterparts.
+The span tokenizer must reproduce tokenize without building Tokens.
+
+Author: The Architect
+License: Public Domain
+"""
+
+import pytest
+import numpy as np
+import os
+import sys
+from collections import Counter, defaultdict
+
+# Set up path for both module and direct execution
+_test_dir = os.path.dirname(os.path.abspath(__file__))
+_gqe_dir = os.path.dirname(_test_dir)
+_examples_dir = os.path.dirname(_gqe_dir)
+if _examples_dir not in sys.path:
+    sys.path.insert(0, _examples_dir)
+
+import networkx as nx
+
+from gqe_compression.core.tda import (
+    tokenize, token_ids, build_cooccurrence_matrix, build_cooccurrence_graph, EPSILON,
+    compute_clustering_coefficient, compute_eigenvector_centrality, compute_persistence,
+    compute_sparse_features, sampled_betweenness, embed_all_tokens, tokenize_spans
+)
+import gqe_compression.core.tda as tda
+
+
+SAMPLE_TEXT = ("the crystal processes the entire frame and the frame "
+               "renders the crystal while patterns emerge from the windows ") * 6
+
+
+def _reference_edges(tokens, window_size, min_count):
+    """The original pair-by-pair counting loop."""
+    counts = Counter(t.value for t in tokens)
+    valid = {t for t, c in counts.items() if c >= min_count}
+    cooccur = defaultdict(int)
+    for i in range(len(tokens)):
+        if tokens[i].value not in valid:
+            continue
+        for j in range(i + 1, min(i + window_size + 1, len(tokens))):
+            if tokens[j].value in valid and tokens[j].value != tokens[i].value:
+                cooccur[frozenset((tokens[i].value, tokens[j].value))] += 1
+
+    n = len(tokens)
+    edges = {}
+    for pair, count in cooccur.items():
+        t1, t2 = tuple(pair)
+        p_joint = count / (n * window_size)
+        pmi = np.log(p_joint / (counts[t1] / n * counts[t2] / n + EPSILON) + EPSILON)
+        edges[pair] = (max(pmi, 0.0) + 0.1, count)
+    return valid, edges
+
+
+@pytest.fixture(scope='module')
+def matrix():
+    return build_cooccurrence_matrix(tokenize(SAMPLE_TEXT, mode='word'))
+
+
+class TestCooccurrenceMatrix:
+    """Test the vectorized sparse co-occurrence build."""
+
+    @pytest.mark.parametrize("mode, window_size, min_count", [
+        ('word', 5, 1),
+        ('word', 3, 2),
+        ('char', 10, 1),
+        ('byte', 2, 4),
+    ])
+    def test_matches_reference_loop(self, mode, window_size, min_count):
+        """Counts and PMI weights equal the pair-by-pair loop."""
+        data = SAMPLE_TEXT.encode() if mode == 'byte' else SAMPLE_TEXT
+        tokens = tokenize(data, mode=mode)
+        valid, expected = _reference_edges(tokens, window_size, min_count)
+
+        graph = build_cooccurrence_graph(tokens, window_size, min_count)
+        assert set(graph.nodes()) == valid
+        edges = {frozenset((a, b)): (d['weight'], d['count'])
+                 for a, b, d in graph.edges(data=True)}
+        assert edges.keys() == expected.keys()
+        for pair, (weight, count) in expected.items():
+            assert edges[pair][1] == count
+            assert np.isclose(edges[pair][0], weight)
+
+    def test_sparse_layout(self):
+        """Both matrices are symmetric CSR with an empty diagonal."""
+        matrix = build_cooccurrence_matrix(tokenize(SAMPLE_TEXT, mode='word'))
+        for m in (matrix.counts, matrix.weights):
+            assert m.format == 'csr'
+            assert (m != m.T).nnz == 0
+            assert not m.diagonal().any()
+        assert matrix.counts.nnz == matrix.weights.nnz
+        assert matrix.number_of_edges() == matrix.to_networkx().number_of_edges()
+
+    def test_integer_ids(self):
+        """Integer id streams skip the token objects entirely."""
+        tokens = tokenize(SAMPLE_TEXT, mode='word')
+        ids, values = token_ids(tokens)
+        from_ids = build_cooccurrence_matrix(ids, values=values)
+        from_tokens = build_cooccurrence_matrix(tokens)
+
+        assert from_ids.nodes == from_tokens.nodes
+        assert (from_ids.weights != from_tokens.weights).nnz == 0
+        with pytest.raises(ValueError):
+            build_cooccurrence_matrix(ids, values=values[:2])
+
+    def test_node_order_is_first_appearance(self):
+        """Node ids follow the stream, so builds are reproducible."""
+        matrix = build_cooccurrence_matrix(tokenize("b a b c a", mode='word'))
+        assert matrix.nodes == ['b', 'a', 'c']
+        assert matrix.node_counts.tolist() == [2, 2, 1]
+
+    @pytest.mark.parametrize("text", ["", "solo", "echo echo echo"])
+    def test_degenerate_streams(self, text):
+        """Empty, single-token and single-value streams have no edges."""
+        matrix = build_cooccurrence_matrix(tokenize(text, mode='word'))
+        assert matrix.number_of_edges() == 0
+        assert matrix.to_networkx().number_of_nodes() == len(set(text.split()))
+
+
+class TestSparseFeatures:
+    """Test the sparse-native topological features."""
+
+    def _reference(self, matrix, fn):
+        values = fn(matrix.to_networkx())
+        return np.array([values.get(v, 0.0) for v in matrix.nodes])
+
+    def test_exact_features_match_networkx(self, matrix):
+        """Centrality, clustering and persistence equal the NetworkX versions."""
+        features = compute_sparse_features(matrix, accuracy=1.0)
+        assert features.shape == (matrix.number_of_nodes(), 7)
+        assert np.allclose(features[:, 0], self._reference(matrix, compute_eigenvector_centrality), atol=1e-6)
+        assert np.allclose(features[:, 1], self._reference(matrix, compute_clustering_coefficient))
+        assert np.allclose(features[:, 6], self._reference(matrix, compute_persistence))
+
+    def test_betweenness_on_tree(self):
+        """On a tree every shortest path is unique, so all pivots is exact."""
+        G = nx.balanced_tree(2, 4)
+        W = nx.to_scipy_sparse_array(G, format='csr').astype(float)
+        from scipy.sparse import csr_matrix
+        exact = nx.betweenness_centrality(G)
+        got = sampled_betweenness(csr_matrix(W))
+        assert np.allclose(got, [exact[v] for v in G.nodes()])
+
+    def test_betweenness_sampling_is_seeded(self, matrix):
+        """A fixed seed gives the same pivot estimate."""
+        a = sampled_betweenness(matrix.weights, n_pivots=5, seed=3)
+        b = sampled_betweenness(matrix.weights, n_pivots=5, seed=3)
+        assert np.array_equal(a, b)
+        assert (a >= 0).all()
+
+    def test_spectral_coordinates_are_eigenvectors(self, matrix):
+        """Dims 3-5 span the low end of the normalized Laplacian."""
+        L = nx.normalized_laplacian_matrix(matrix.to_networkx(), nodelist=matrix.nodes).toarray()
+        coords = compute_sparse_features(matrix, accuracy=1.0)[:, 3:6]
+        expected = np.linalg.eigvalsh(L)[1:4]
+        rayleigh = np.einsum('ij,ij->j', coords, L @ coords) / np.einsum('ij,ij->j', coords, coords)
+        assert np.allclose(rayleigh, expected, atol=1e-6)
+
+    def test_accuracy_knob(self, matrix):
+        """Accuracy outside (0, 1] is rejected; low accuracy still runs."""
+        for bad in (0.0, -0.5, 1.5):
+            with pytest.raises(ValueError):
+                compute_sparse_features(matrix, accuracy=bad)
+        features = compute_sparse_features(matrix, accuracy=0.1)
+        assert np.isfinite(features).all()
+
+    def test_embed_all_tokens_sparse_backend(self):
+        """A matrix (or no graph at all) selects the sparse backend."""
+        tokens = tokenize(SAMPLE_TEXT, mode='word')
+        matrix = build_cooccurrence_matrix(tokens)
+        batch = embed_all_tokens(tokens, matrix, accuracy=1.0)
+        assert len(batch) == len(tokens)
+
+        features = compute_sparse_features(matrix, accuracy=1.0)
+        first = matrix.index[tokens[0].value]
+        assert np.allclose(batch.positions[0, :7], features[first])
+        assert np.allclose(embed_all_tokens(tokens, accuracy=1.0).positions, batch.positions)
+
+
+class TestTokenSpans:
+    """Test the offset-array tokenizer against tokenize."""
+
+    TEXTS = [
+        SAMPLE_TEXT,
+        "  Leading\ttabs\nand  CAPS caps Caps  ",
+        "Ünïcode ÜNÏCODE\u00a0nbsp\u3000ideographic\u2028line\x1cseparator",
+        "Σίσυφος ΣΊΣΥΦΟΣ " + "x" * 100 + " " + "X" * 100,
+        "",
+    ]
+
+    @pytest.mark.parametrize("mode", ['word', 'char'])
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_text_matches_tokenize(self, text, mode):
+        """str input gives the same ids and values as Token lists."""
+        spans = tokenize_spans(text, mode=mode)
+        assert len(spans) == len(tokenize(text, mode=mode))
+        ids, values = spans.factorize()
+        ref_ids, ref_values = token_ids(tokenize(text, mode=mode))
+        assert values == ref_values
+        assert ids.tolist() == ref_ids.tolist()
+
+    @pytest.mark.parametrize("mode", ['word', 'char', 'byte'])
+    def test_bytes_match_tokenize(self, mode):
+        """Bytes-like input is split like bytes, never decoded."""
+        data = ("Mixed CASE\x1cbytes \xff\xfe " + SAMPLE_TEXT).encode('latin-1')
+        ref_ids, ref_values = token_ids(tokenize(data, mode=mode))
+        for buffer in (data, memoryview(data)):
+            ids, values = token_ids(tokenize_spans(buffer, mode=mode))
+            assert values == ref_values
+            assert ids.tolist() == ref_ids.tolist()
+
+    def test_byte_mode_text_is_utf8(self):
+        """Byte mode on str splits the UTF-8 encoding, unlike tokenize's characters."""
+        text = "héllo wörld"
+        values = [t.value for t in tokenize_spans(text, mode='byte').to_tokens()]
+        assert values == list(text.encode('utf-8'))
+        assert values == [t.value for t in tokenize(text.encode('utf-8'), mode='byte')]
+        assert [t.value for t in tokenize(text, mode='byte')] == list(text)
+
+    def test_offsets_index_the_buffer(self):
+        """starts/ends are offsets into the UTF-8 buffer."""
+        spans = tokenize_spans("héllo  wörld", mode='word')
+        words = [spans.buffer[s:e].tobytes().decode() for s, e in zip(spans.starts, spans.ends)]
+        assert words == ["héllo", "wörld"]
+
+    def test_block_boundaries(self, monkeypatch):
+        """First-appearance order survives blocking and long spans."""
+        monkeypatch.setattr(tda, 'SPAN_BLOCK', 3)
+        monkeypatch.setattr(tda, 'SPAN_PAD_LIMIT', 4)
+        text = "alpha b c B alphabet c ALPHA d b alphabet e"
+        ids, values = tokenize_spans(text, mode='word').factorize()
+        ref_ids, ref_values = token_ids(tokenize(text, mode='word'))
+        assert values == ref_values
+        assert ids.tolist() == ref_ids.tolist()
+
+    def test_spans_feed_the_pipeline(self):
+        """Matrix and embedding accept spans like a Token list."""
+        spans = tokenize_spans(SAMPLE_TEXT, mode='word')
+        tokens = tokenize(SAMPLE_TEXT, mode='word')
+        assert build_cooccurrence_matrix(spans).nodes == build_cooccurrence_matrix(tokens).nodes
+        assert np.array_equal(embed_all_tokens(spans, accuracy=1.0).positions,
+                              embed_all_tokens(tokens, accuracy=1.0).positions)
+
+    def test_unsupported_mode(self):
+        with pytest.raises(ValueError):
+            tokenize_spans([1, 2, 3], mode='element')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Toric Error Correction at Scale
+
+THE PHYSICS:
+"Physics is Error Correction" - and the lattice only talks to its neighbors.
+We verify that the spatial-index neighbor search, the vectorized
+stabilizers and the sparse matching agree with their one-spinor-at-a-time
+definitions, and that each stabilizer reads a fixed number of sites even
+where the lifted vocabulary packs every spinor within the threshold.
+
+Test Cases:
+1. KD-tree neighbor graph vs the full distance matrix (phase wrap, duplicates)
+2. Degree cap: the nearest sites by position, within the threshold
+3. Vectorized stabilizers vs compute_stabilizer
+4. Sparse greedy matching vs greedy over all pairs
+5. Batch correction vs the per-spinor loop; decompressed token streams
+6. Byte-level correction
+
+Author: The Architect
+License: Public Domain
+"""
+
+import pytest
+import numpy as np
+import os
+import sys
+
+# Set up path for both module and direct execution
+_test_dir = os.path.dirname(os.path.abspath(__file__))
+_gqe_dir = os.path.dirname(_test_dir)
+_examples_dir = os.path.dirname(_gqe_dir)
+if _examples_dir not in sys.path:
+    sys.path.insert(0, _examples_dir)
+
+from gqe_compression.core import toric_error_correction
+from gqe_compression.core.e8_lattice import Spinor, SpinorBatch, spinor_distance_matrix
+from gqe_compression.core.toric_error_correction import (
+    ToricErrorCorrector, Syndrome, STABILIZER_NEIGHBORS, PHASE_EPSILON,
+    apply_toric_correction_to_bytes
+)
+from gqe_compression.core.phi_adic import PHI
+from gqe_compression.compressor import GQECompressor
+from gqe_compression.decompressor import GQEDecompressor
+
+
+def _spinors(n, seed=0, scale=0.5, vocab=None):
+    """Random spinors; with vocab, a token stream over that many distinct ones."""
+    rng = np.random.default_rng(seed)
+    size = vocab or n
+    batch = SpinorBatch(rng.normal(size=(size, 8)) * scale, rng.uniform(0, 2 * np.pi, size))
+    if vocab:
+        batch = batch[rng.integers(0, vocab, n)]
+    return batch.to_spinors()
+
+
+def _word_text(n_words=15000, seed=0):
+    """Zipf-distributed words over a ~1000-word lexicon."""
+    rng = np.random.default_rng(seed)
+    letters = np.array(list('etaoinshrdlucmfwyp'))
+    lexicon = [''.join(rng.choice(letters, rng.integers(2, 9))) for _ in range(3000)]
+    ranks = rng.zipf(1.3, n_words)
+    return ' '.join(lexicon[r - 1] for r in ranks[ranks <= len(lexicon)])
+
+
+def _reference_syndromes(corrector, spinors):
+    """detect_syndromes as the per-spinor loop over compute_stabilizer."""
+    neighbors = corrector.build_neighbor_graph(spinors)
+    found = []
+    for i, spinor in enumerate(spinors):
+        if not neighbors.get(i):
+            continue
+        expected, confidence = corrector.compute_stabilizer(
+            spinor, [(spinors[j], d) for j, d in neighbors[i]])
+        deviation = abs(expected - spinor.phase)
+        deviation = min(deviation, 2 * np.pi - deviation)
+        if (deviation > corrector.phase_tolerance + PHASE_EPSILON and
+                confidence > corrector.confidence_threshold):
+            found.append(Syndrome(i, expected, spinor.phase, confidence, deviation))
+    return found
+
+
+def _reference_correction(corrector, spinors, max_iterations):
+    """apply_error_correction as detect/apply_corrections over Spinor lists."""
+    n_corrections = 0
+    for _ in range(max_iterations):
+        syndromes = _reference_syndromes(corrector, spinors)
+        if not syndromes:
+            break
+        spinors = corrector.apply_corrections(spinors, syndromes)
+        n_corrections += len(syndromes)
+    coherence = 1.0 - len(_reference_syndromes(corrector, spinors)) / len(spinors)
+    return np.array([s.phase for s in spinors]), n_corrections, coherence
+
+
+def _reference_matching(syndromes, spinors):
+    """Greedy matching over the sorted list of every syndrome pair."""
+    distances = spinor_distance_matrix([spinors[s.spinor_idx] for s in syndromes])
+    pairs = sorted((distances[i, j], i, j) for i in range(len(syndromes))
+                   for j in range(i + 1, len(syndromes)))
+    matched, result = set(), set()
+    for _, i, j in pairs:
+        if i not in matched and j not in matched:
+            matched |= {i, j}
+            result.add((syndromes[i].spinor_idx, syndromes[j].spinor_idx))
+    return result
+
+
+class TestNeighborSearch:
+    """Test the spatial-index neighbor graph."""
+
+    @pytest.mark.parametrize("vocab", [None, 40])
+    def test_matches_distance_matrix(self, vocab):
+        spinors = _spinors(300, seed=1, vocab=vocab)
+        corrector = ToricErrorCorrector(distance_threshold=1.2, max_neighbors=None)
+        distances = spinor_distance_matrix(spinors)
+        np.fill_diagonal(distances, np.inf)
+
+        graph = corrector.build_neighbor_graph(spinors)
+        for i in range(len(spinors)):
+            expected = np.flatnonzero(distances[i] <= 1.2).tolist()
+            assert [j for j, _ in graph.get(i, [])] == expected
+            assert np.allclose([d for _, d in graph.get(i, [])], distances[i, expected])
+
+    def test_degree_is_capped(self):
+        """Each site keeps its nearest positions, then the spinor distance decides."""
+        spinors = _spinors(200, seed=2, scale=0.2)
+        corrector = ToricErrorCorrector(distance_threshold=1.0)
+        positions = np.array([s.position for s in spinors])
+        position_distances = np.linalg.norm(positions[:, None] - positions[None], axis=-1)
+        distances = spinor_distance_matrix(spinors)
+
+        graph = corrector.build_neighbor_graph(spinors)
+        for i in range(len(spinors)):
+            nearest = np.argsort(position_distances[i])[1:STABILIZER_NEIGHBORS + 1]
+            expected = sorted(j for j in nearest.tolist() if distances[i, j] <= 1.0)
+            assert [j for j, _ in graph[i]] == expected
+
+    def test_phase_wraps_around(self):
+        """Phases 0.01 and 2π - 0.01 are neighbors at the same position."""
+        batch = SpinorBatch(np.zeros((2, 8)), np.array([0.01, 2 * np.pi - 0.01]))
+        graph = ToricErrorCorrector(distance_threshold=0.1).build_neighbor_graph(batch)
+        assert [j for j, _ in graph[0]] == [1]
+
+
+class TestStabilizers:
+    """Test the vectorized stabilizer measurement."""
+
+    @pytest.mark.parametrize("vocab,max_neighbors", [(None, None), (30, None),
+                                                     (None, STABILIZER_NEIGHBORS),
+                                                     (60, STABILIZER_NEIGHBORS)])
+    def test_matches_compute_stabilizer(self, vocab, max_neighbors):
+        spinors = _spinors(250, seed=2, vocab=vocab)
+        corrector = ToricErrorCorrector(distance_threshold=1.5, max_neighbors=max_neighbors)
+        syndromes = corrector.detect_syndromes(spinors)
+        reference = _reference_syndromes(corrector, spinors)
+
+        assert [s.spinor_idx for s in syndromes] == [s.spinor_idx for s in reference]
+        assert np.allclose([s.expected_phase for s in syndromes],
+                           [s.expected_phase for s in reference])
+        assert np.allclose([s.confidence for s in syndromes], [s.confidence for s in reference])
+
+    def test_pairs_are_measured_in_blocks(self, monkeypatch):
+        spinors = _spinors(300, seed=8, vocab=100)
+        corrector = ToricErrorCorrector()
+        whole = corrector.detect_syndromes(spinors)
+        monkeypatch.setattr(toric_error_correction, 'PAIR_BLOCK', 37)
+        blocked = corrector.detect_syndromes(spinors)
+        assert [s.spinor_idx for s in blocked] == [s.spinor_idx for s in whole]
+        assert np.allclose([s.expected_phase for s in blocked], [s.expected_phase for s in whole])
+
+
+class TestSparseMatching:
+    """Test greedy matching from nearest-neighbor candidates."""
+
+    @pytest.mark.parametrize("n", [5, 60, 400])
+    def test_matches_all_pairs_greedy(self, n):
+        spinors = _spinors(n, seed=n, scale=2.0)
+        corrector = ToricErrorCorrector(distance_threshold=3.0, confidence_threshold=0.0,
+                                        phase_tolerance=0.0)
+        syndromes = corrector.detect_syndromes(spinors)
+        paths = corrector.minimum_weight_perfect_matching(syndromes, spinors)
+
+        pairs = {(p.start_idx, p.end_idx) for p in paths if p.start_idx != p.end_idx}
+        assert pairs == _reference_matching(syndromes, spinors)
+        assert sum(len(p.path_indices) for p in paths) == len(syndromes)
+
+
+class TestBatchCorrection:
+    """Test correction over SpinorBatch token streams."""
+
+    @pytest.mark.parametrize("max_neighbors,vocab", [(None, 80), (STABILIZER_NEIGHBORS, None)])
+    def test_matches_per_spinor_loop(self, max_neighbors, vocab):
+        """
+        The loop's copies of a spinor drift apart by rounding, and under
+        the degree cap such twins would crowd each other's neighbor slots;
+        capped, it is compared on distinct spinors.
+        """
+        spinors = _spinors(200, seed=3, scale=0.3, vocab=vocab)
+        corrector = ToricErrorCorrector(max_neighbors=max_neighbors)
+        corrected, n_corrections, coherence = corrector.correct_batch(SpinorBatch.from_spinors(spinors))
+        phases, ref_corrections, ref_coherence = _reference_correction(corrector, spinors, 5)
+
+        assert isinstance(corrected, SpinorBatch)
+        assert n_corrections == ref_corrections > 0
+        assert coherence == pytest.approx(ref_coherence)
+        assert np.allclose(corrected.phases, phases, atol=1e-9)
+
+    def test_decompressed_stream(self, monkeypatch):
+        """
+        A million-token stream over a decompressed vocabulary.
+
+        Lifted positions all lie within the default threshold of each
+        other, so only the degree cap keeps the pair count linear.
+        """
+        compressed = GQECompressor(tokenize_mode='word').compress(_word_text())
+        n_vocab = len(compressed.phases)
+        compressed.token_sequence = np.resize(compressed.token_sequence, 1_000_000)
+
+        found = []
+        search = toric_error_correction._candidate_pairs
+
+        def counting_search(positions, threshold, max_neighbors=None):
+            rows, cols = search(positions, threshold, max_neighbors)
+            uncapped, _ = search(positions, threshold)
+            found.append((len(positions), len(rows), len(uncapped)))
+            return rows, cols
+
+        monkeypatch.setattr(toric_error_correction, '_candidate_pairs', counting_search)
+        spinors, coherence = GQEDecompressor().decompress_to_spinors(compressed)
+
+        assert len(spinors) == 1_000_000
+        assert 0.0 <= coherence <= 1.0
+        [(n_sites, n_pairs, n_uncapped)] = found
+        assert n_sites == n_vocab > 500
+        assert n_pairs <= STABILIZER_NEIGHBORS * n_sites
+        assert n_uncapped > n_sites * (n_sites - 1) // 2  # The threshold alone is dense
+
+
+def _byte_reference(data, max_iterations=3):
+    """apply_toric_correction_to_bytes through the per-spinor loop."""
+    index = np.arange(len(data))
+    positions = np.cos(2 * np.pi * index[:, None] * PHI ** np.arange(1, 9) / len(data))
+    spinors = [Spinor(position=p, phase=b / 256.0 * 2 * np.pi) for p, b in zip(positions, data)]
+    corrector = ToricErrorCorrector(distance_threshold=0.5, phase_tolerance=np.pi / 8,
+                                    confidence_threshold=0.2)
+    phases, _, coherence = _reference_correction(corrector, spinors, max_iterations)
+    return bytes((np.rint(phases / (2 * np.pi) * 256).astype(np.int64) % 256).tolist()), coherence
+
+
+class TestByteCorrection:
+    """Test apply_toric_correction_to_bytes."""
+
+    def test_uniform_bytes_survive(self):
+        """No syndromes: every byte value comes back as itself."""
+        for value in range(256):
+            data = bytes([value]) * 40
+            assert apply_toric_correction_to_bytes(data) == (data, 1.0)
+
+    def test_matches_per_spinor_loop(self):
+        rng = np.random.default_rng(10)
+        for n in rng.integers(2, 600, 30).tolist():
+            data = rng.integers(0, 256, n, dtype=np.uint8).tobytes()
+            corrected, coherence = apply_toric_correction_to_bytes(data)
+            reference, ref_coherence = _byte_reference(data)
+            assert corrected == reference
+            assert coherence == pytest.approx(ref_coherence)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Vectorized Radial Arithmetic Coder (v59 Format)
+
+THE PHYSICS:
+All spins are processed simultaneously - and must come back in order.
+We verify that canonical Huffman codes are rebuilt from their lengths
+alone, that the scattered bitstream decodes exactly, and that v59
+round-trips through CompressedData.
+
+Test Cases:
+1. Length-limited, canonical code construction
+2. Bit packing at cumsum offsets, across word boundaries
+3. Displacement and offset stream round-trips
+4. v59 serialization through CompressedData
+
+Author: The Architect
+License: Public Domain
+"""
+
+import pytest
+import numpy as np
+import os
+import sys
+
+# Set up path for both module and direct execution
+_test_dir = os.path.dirname(os.path.abspath(__file__))
+_gqe_dir = os.path.dirname(_test_dir)
+_examples_dir = os.path.dirname(_gqe_dir)
+if _examples_dir not in sys.path:
+    sys.path.insert(0, _examples_dir)
+
+from gqe_compression.core import vectorized_rac
+from gqe_compression.core.vectorized_rac import (
+    VectorizedRAC, huffman_code_lengths, canonical_codes, pack_codes
+)
+from gqe_compression.compressor import CompressedData, GQECompressor
+from gqe_compression.decompressor import GQEDecompressor
+
+
+SAMPLE_TEXT = ("The crystal processes the entire frame. "
+               "Patterns emerge from the N-Frame windows. ") * 40
+
+
+def _peaked_displacements(n, seed=0):
+    """Displacements peaked around zero, first element a raw root."""
+    rng = np.random.default_rng(seed)
+    turns = rng.geometric(0.4, n - 1) * rng.choice([-1, 1], n - 1)
+    return np.concatenate(([rng.integers(0, 240)], np.clip(turns, -120, 119)))
+
+
+class TestCanonicalCodes:
+    """Test code length limiting and canonical assignment."""
+
+    def test_length_limit_keeps_kraft_sum(self):
+        """Fibonacci-like counts would need 30+ bit codes unlimited."""
+        counts = (2.0 ** -np.arange(40) * 1e12).astype(np.int64) + 1
+        lengths = huffman_code_lengths(counts, max_length=15)
+        assert lengths.max() == 15
+        assert np.sum(2.0 ** -lengths.astype(float)) == pytest.approx(1.0)
+
+    def test_frequent_symbols_get_short_codes(self):
+        lengths = huffman_code_lengths(np.array([1000, 10, 0, 10, 1]))
+        assert lengths[2] == 0
+        assert lengths[0] == lengths[lengths > 0].min()
+
+    def test_single_symbol(self):
+        assert huffman_code_lengths(np.array([0, 5, 0])).tolist() == [0, 1, 0]
+
+    def test_codes_are_prefix_free(self):
+        lengths = huffman_code_lengths(np.arange(1, 30) ** 2)
+        codes = canonical_codes(lengths)
+        words = sorted(format(int(c), f'0{l}b') for c, l in zip(codes, lengths))
+        for a, b in zip(words, words[1:]):
+            assert not b.startswith(a)
+
+    def test_table_depends_only_on_lengths(self):
+        """The decoder rebuilds the encoder's table from lengths."""
+        rac = VectorizedRAC()
+        table = rac.build_huffman_table(_peaked_displacements(5000))
+        lengths = np.zeros(240, dtype=np.int64)
+        for d, (_, length) in table.items():
+            lengths[d + 120] = length
+        codes = canonical_codes(lengths)
+        assert all(codes[d + 120] == code for d, (code, _) in table.items())
+
+
+class TestBitPacking:
+    """Test the cumsum/scatter bit packer."""
+
+    def test_matches_bit_by_bit(self):
+        rng = np.random.default_rng(3)
+        lengths = rng.integers(1, 64, 500)
+        codes = rng.integers(0, 1 << 62, 500, dtype=np.int64) & ((1 << lengths) - 1)
+        packed, total_bits = pack_codes(codes, lengths)
+
+        bits = ''.join(format(int(c), f'0{l}b') for c, l in zip(codes, lengths))
+        assert total_bits == len(bits)
+        assert packed == int(bits + '0' * (-len(bits) % 8), 2).to_bytes(len(packed), 'big')
+
+    def test_empty(self):
+        assert pack_codes(np.zeros(0), np.zeros(0)) == (b'', 0)
+
+
+class TestBlockCoding:
+    """Test the displacement and offset streams."""
+
+    @pytest.mark.parametrize("n", [1, 2, 17, 5000])
+    def test_displacement_roundtrip(self, n):
+        rac = VectorizedRAC()
+        displacements = _peaked_displacements(n, seed=n)
+        packed, meta = rac.encode_block_fast(displacements)
+        assert meta['max_length'] <= rac.max_code_length
+        assert np.array_equal(rac.decode_block_fast(packed, n), displacements)
+
+    def test_peaked_stream_is_small(self):
+        """Zero-peaked turns cost ~2 bits, not the 8 a raw root would."""
+        packed, meta = VectorizedRAC().encode_block_fast(_peaked_displacements(20000))
+        assert meta['total_bits'] / 20000 < 3.5
+
+    def test_offset_roundtrip(self):
+        rng = np.random.default_rng(5)
+        offsets = (rng.random(3000) < 0.2) * rng.integers(1, 300, 3000)
+        offsets[-1] = 2 ** 31
+        rac = VectorizedRAC()
+        decoded = rac.decode_offsets_vectorized(rac.encode_offsets_vectorized(offsets), 3000)
+        assert np.array_equal(decoded, offsets)
+
+    def test_full_block_roundtrip(self):
+        rng = np.random.default_rng(9)
+        roots = rng.integers(0, 240, 1000).astype(np.int32)
+        offsets = rng.integers(0, 4, 1000)
+        rac = VectorizedRAC()
+        packed, _ = rac.pack_full_block(roots, offsets)
+        restored_roots, restored_offsets = rac.unpack_full_block(packed, 1000)
+        assert np.array_equal(restored_roots, roots)
+        assert np.array_equal(restored_offsets, offsets)
+
+    def test_truncated_stream_raises(self):
+        rac = VectorizedRAC()
+        packed, _ = rac.encode_block_fast(_peaked_displacements(1000))
+        with pytest.raises(ValueError):
+            rac.decode_block_fast(packed[:len(packed) // 2], 1000)
+
+    @pytest.mark.parametrize("chunk_bytes", [1, 7, 64])
+    def test_chunk_boundaries(self, chunk_bytes, monkeypatch):
+        """Codes straddling chunk ends decode exactly as in one pass."""
+        rng = np.random.default_rng(chunk_bytes)
+        displacements = _peaked_displacements(3000, seed=chunk_bytes)
+        offsets = (rng.random(3000) < 0.3) * rng.integers(1, 2 ** 20, 3000)
+        rac = VectorizedRAC()
+        packed, _ = rac.pack_full_block(rac.reconstruct_roots(displacements), offsets)
+
+        monkeypatch.setattr(vectorized_rac, 'DECODE_CHUNK_BYTES', chunk_bytes)
+        roots, decoded_offsets = rac.unpack_full_block(packed, 3000)
+        assert np.array_equal(rac.compute_displacements(roots), displacements)
+        assert np.array_equal(decoded_offsets, offsets)
+
+    def test_peak_memory_is_bounded(self, monkeypatch):
+        """Peak allocation follows the chunk size, not the stream length."""
+        import tracemalloc
+
+        n = 400_000
+        rng = np.random.default_rng(11)
+        displacements = _peaked_displacements(n)
+        offsets = (rng.random(n) < 0.2) * rng.integers(1, 300, n)
+        rac = VectorizedRAC()
+        packed, _ = rac.encode_block_fast(displacements)
+        offset_bytes = rac.encode_offsets_vectorized(offsets)
+        monkeypatch.setattr(vectorized_rac, 'DECODE_CHUNK_BYTES', 1 << 12)
+
+        tracemalloc.start()
+        rac.decode_block_fast(packed, n)
+        rac.decode_offsets_vectorized(offset_bytes, n)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # The int32 + int64 outputs and one chunk of tables; a per-bit
+        # table over the whole stream would be ~190 bytes per token
+        assert peak < 16 * n + (4 << 20)
+
+
+class TestV59Format:
+    """Test v59 serialization through CompressedData."""
+
+    @pytest.mark.parametrize("text", [SAMPLE_TEXT, "solo", ""])
+    def test_roundtrip(self, text):
+        compressed = GQECompressor(tokenize_mode='word').compress(text)
+        restored = CompressedData.from_bytes(compressed.to_bytes('v59'))
+        assert restored.metadata['version'] == 'v59'
+        assert np.array_equal(np.asarray(restored.token_sequence),
+                              np.asarray(compressed.token_sequence))
+        assert restored.vocabulary.keys() == compressed.vocabulary.keys()
+
+    def test_word_exact_roundtrip(self):
+        compressed = GQECompressor(tokenize_mode='word_exact').compress(SAMPLE_TEXT)
+        restored = CompressedData.from_bytes(compressed.to_bytes('v59'))
+        assert GQEDecompressor().decompress(restored) == SAMPLE_TEXT
+
+    def test_corruption_detected(self):
+        compressed = GQECompressor(tokenize_mode='word').compress(SAMPLE_TEXT)
+        data = bytearray(compressed.to_bytes('v59'))
+        data[-1] ^= 0xFF
+        with pytest.raises(ValueError):
+            CompressedData.from_bytes(bytes(data))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Lossless Word Mode (Word Layout Stream)
+
+THE PHYSICS:
+The word is the particle; its casing and the space around it are the
+field. We verify that the layout stream restores both exactly, so word
+mode decodes byte for byte.
+
+Test Cases:
+1. Casing classes and separator ids from spans
+2. Layout coding round-trip, including escaped separators
+3. word_exact compression: exact str/bytes round-trip in memory and v60
+4. The layout costs little on regular text
+
+Author: The Architect
+License: Public Domain
+"""
+
+import pytest
+import numpy as np
+import os
+import sys
+
+# Set up path for both module and direct execution
+_test_dir = os.path.dirname(os.path.abspath(__file__))
+_gqe_dir = os.path.dirname(_test_dir)
+_examples_dir = os.path.dirname(_gqe_dir)
+if _examples_dir not in sys.path:
+    sys.path.insert(0, _examples_dir)
+
+from gqe_compression.core.tda import tokenize_spans
+from gqe_compression.core.word_layout import (
+    extract_layout, encode_layout, decode_layout,
+    CASE_LOWER, CASE_TITLE, CASE_UPPER, CASE_EXCEPTION
+)
+from gqe_compression.compressor import CompressedData, GQECompressor
+from gqe_compression.decompressor import GQEDecompressor
+
+
+SAMPLE_TEXT = ("  The crystal processes the ENTIRE frame.\n\n"
+               "\t\"Patterns\" emerge from the N-Frame windows;  McDonald's iPhone　"
+               "Ünïcode ÜNÏCODE straße\n")
+
+
+def _layout(text):
+    return extract_layout(tokenize_spans(text, mode='word'))
+
+
+class TestExtractLayout:
+    """Test the casing and separator streams."""
+
+    def test_casing_classes(self):
+        layout = _layout("the The THE ThE \"Quote\" **Bold** 42 Ünï ÜNÏ ÜnÏ")
+        assert layout.cases.tolist() == [
+            CASE_LOWER, CASE_TITLE, CASE_UPPER, CASE_EXCEPTION, CASE_TITLE,
+            CASE_TITLE, CASE_LOWER, CASE_TITLE, CASE_UPPER, CASE_EXCEPTION,
+        ]
+        assert layout.exceptions == ["ThE", "ÜnÏ"]
+
+    def test_separators(self):
+        layout = _layout(" a  b\nc　d ")
+        assert layout.separators == [" ", "  ", "\n", "　"]
+        assert layout.gaps.tolist() == [0, 1, 2, 3, 0]
+
+    def test_render(self):
+        text = SAMPLE_TEXT
+        words = [w.lower() for w in text.split()]
+        assert _layout(text).render(words) == text
+        with pytest.raises(ValueError):
+            _layout(text).render(words[1:])
+
+    def test_requires_text_spans(self):
+        with pytest.raises(ValueError):
+            extract_layout(tokenize_spans(b"bytes only", mode='word'))
+
+
+class TestLayoutCoding:
+    """Test the range-coded layout block."""
+
+    def test_roundtrip(self):
+        layout = _layout(SAMPLE_TEXT * 5)
+        restored = decode_layout(encode_layout(layout))
+        assert np.array_equal(restored.cases, layout.cases)
+        assert np.array_equal(restored.gaps, layout.gaps)
+        assert restored.separators == layout.separators
+        assert restored.exceptions == layout.exceptions
+        assert restored.binary == layout.binary
+
+    def test_escaped_separators(self):
+        """More distinct separators than the symbol byte can hold."""
+        text = "".join(f"w{i}" + " " * (i + 1) for i in range(100))
+        layout = _layout(text)
+        assert len(layout.separators) == 101  # Plus the empty leading run
+        restored = decode_layout(encode_layout(layout))
+        assert np.array_equal(restored.gaps, layout.gaps)
+        assert restored.render([w.lower() for w in text.split()]) == text
+
+    def test_regular_text_is_cheap(self):
+        """Ordinary prose costs well under a byte per word."""
+        text = "The crystal processes the entire frame. Patterns emerge from it. " * 200
+        assert len(encode_layout(_layout(text))) < len(text.split()) / 8
+
+
+class TestLosslessWordMode:
+    """Test word_exact through the compressor and decompressor."""
+
+    @pytest.mark.parametrize("text", [SAMPLE_TEXT, "", "  \n\t", "solo"])
+    def test_exact_roundtrip(self, text):
+        decompressor = GQEDecompressor()
+        for data in (text, text.encode('utf-8')):
+            compressed = GQECompressor(tokenize_mode='word_exact').compress(data)
+            assert decompressor.decompress(compressed) == data
+            assert decompressor.verify_lossless(data, compressed)
+
+    def test_shares_word_vocabulary(self):
+        """Casing folds into one vocabulary entry, as in word mode."""
+        exact = GQECompressor(tokenize_mode='word_exact').compress(SAMPLE_TEXT)
+        word = GQECompressor(tokenize_mode='word').compress(SAMPLE_TEXT)
+        assert exact.vocabulary == word.vocabulary
+        assert np.array_equal(exact.token_sequence, word.token_sequence)
+
+    def test_v60_roundtrip(self):
+        compressed = GQECompressor(tokenize_mode='word_exact').compress(SAMPLE_TEXT)
+        restored = CompressedData.from_bytes(compressed.to_bytes('v60'))
+        assert restored.metadata['mode'] == 'word_exact'
+        assert GQEDecompressor().decompress(restored) == SAMPLE_TEXT
+
+    def test_v60_without_layout(self):
+        """Plain word mode writes no layout block."""
+        compressed = GQECompressor(tokenize_mode='word').compress(SAMPLE_TEXT)
+        restored = CompressedData.from_bytes(compressed.to_bytes('v60'))
+        assert restored.layout is None
+        assert restored.metadata['mode'] == 'word'
+
+    def test_undecodable_bytes_fall_back(self):
+        data = b"\xff\xfe not text"
+        compressed = GQECompressor(tokenize_mode='word_exact').compress(data)
+        assert compressed.metadata['mode'] == 'byte'
+        assert GQEDecompressor().decompress(compressed) == data
+
+    def test_large_text_skips_horizon_batching(self):
+        text = SAMPLE_TEXT * 2000
+        compressor = GQECompressor(tokenize_mode='word_exact', chunk_size=1024)
+        compressed = compressor.compress(text)
+        assert not compressed.metadata.get('horizon_batched', False)
+        assert GQEDecompressor().decompress(compressed) == text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])